@@ -0,0 +1,4 @@
+"""
+Standalone performance benchmarks. These are not collected by pytest; run them directly,
+e.g. ``python -m benchmarks.thought_generation``.
+"""
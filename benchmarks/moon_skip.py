@@ -0,0 +1,235 @@
+"""
+Times skipping moons in synthetic clans of a few sizes, and what else a clan of that size
+spends time on: saving and loading the cats, rebuilding the inheritance and setting up a
+patrol. The clans have relationships, mates and families. The moons are broken down by
+the profiling timers, per stage of one_moon and one_moon_cat and per hot helper.
+
+    python -m benchmarks.moon_skip
+    python -m benchmarks.moon_skip --sizes 25 100 --save baseline.json
+    python -m benchmarks.moon_skip --compare baseline.json --threshold 0.25
+
+--save writes the timings to a json baseline. --compare runs the benchmark again and
+prints every timing next to the baseline's, and exits with 1 if any of them got slower
+by more than the threshold (and by more than a millisecond, so the tiny stages don't
+trip over noise).
+
+Moons in the bigger clans take a long while, use --sizes to leave them out. The
+benchmark clan is saved in the saves folder and deleted again afterwards.
+"""
+
+import argparse
+import platform
+import shutil
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from random import sample, seed
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+import ujson
+
+from benchmarks.synthetic import add_families, make_synthetic_cats
+from scripts import events
+from scripts.cat.cats import Cat
+from scripts.cat.enums import CatRank
+from scripts.cat.save_load import close_save_backend, save_cache, save_cats
+from scripts.cat.sprites.load_sprites import sprites
+from scripts.cat_relations.inheritance2 import inheritance_db
+from scripts.clan import Afterlife, Clan
+from scripts.clan_package.settings import set_clan_setting
+from scripts.events_module.patrol.patrol import Patrol
+from scripts.game_structure import game
+from scripts.game_structure.game.save_load import save_writer
+from scripts.game_structure.game.switches import (
+    Switch,
+    switch_get_value,
+    switch_set_value,
+)
+from scripts.game_structure.load_cat import load_cats
+from scripts.housekeeping import profiling
+from scripts.housekeeping.datadir import get_save_dir, setup_data_dir
+
+CLAN_NAME = "benchmarkMoonSkipClan"
+CLAN_SIZES = (25, 100, 500, 2000)
+MOONS = 5
+"""Moons skipped per clan. Every fifth moon autosaves."""
+THRESHOLD = 0.2
+NOISE_FLOOR = 0.001
+"""Seconds a timing has to grow by before it counts as slower"""
+
+
+def _make_clan(size: int):
+    if not sprites.clan_symbols:
+        sprites.load_symbols(make_groups=False)
+    game.just_died.clear()
+    game.dead_cats_to_grieve.clear()
+    cats = make_synthetic_cats(size)
+    add_families(cats)
+    game.starclan = Afterlife()
+    game.dark_forest = Afterlife()
+    game.clan = Clan(
+        name=CLAN_NAME,
+        leader=cats[0],
+        deputy=cats[1],
+        medicine_cat=cats[2],
+        camp_bg="camp1",
+        game_mode="expanded",
+        starting_members=cats[3:],
+    )
+    game.clan.create_clan()
+    game.clan.herb_supply.start_storage(15)
+    set_clan_setting("autosave", True)
+    save_writer.wait()
+
+
+def _timed(function: Callable, *args) -> float:
+    start = perf_counter()
+    function(*args)
+    return perf_counter() - start
+
+
+def _save_cats():
+    save_cats(CLAN_NAME, Cat, game)
+    save_writer.wait()
+
+
+def _patrol_setup():
+    cats = [
+        cat
+        for cat in Cat.all_cats_list
+        if cat.status.alive_in_player_clan
+        and cat.status.rank == CatRank.WARRIOR
+        and not cat.not_working()
+    ]
+    Patrol().setup_patrol(sample(cats, min(3, len(cats))), "hunting")
+
+
+def run(size: int, moons: int = MOONS) -> Dict[str, float]:
+    """:return: seconds per measurement, per moon for one_moon and its stages"""
+    clan_list = switch_get_value(Switch.clan_list)
+    clan_name = switch_get_value(Switch.clan_name)
+    current_clan = Path(get_save_dir()) / "currentclan.txt"
+    current_clan_text = current_clan.read_text() if current_clan.exists() else None
+    results = {}
+    seed(size)
+    try:
+        # the game's warnings would drown out the results
+        with redirect_stdout(StringIO()):
+            start = perf_counter()
+            _make_clan(size)
+            results["make clan"] = perf_counter() - start
+            switch_set_value(Switch.clan_list, [CLAN_NAME])
+            switch_set_value(Switch.clan_name, CLAN_NAME)
+
+            profiling.start()
+            try:
+                moon_time = sum(_timed(events.one_moon) for _ in range(moons))
+            finally:
+                profiling.stop()
+            save_writer.wait()
+            results["one_moon"] = moon_time / moons
+            for name, stats in sorted(profiling.timers.items()):
+                if name != "one_moon":
+                    results[name.replace(".", ": ", 1)] = stats.total / moons
+            results["one_moon: rest"] = profiling.timers["one_moon"].own / moons
+
+            results["save_cats"] = _timed(_save_cats)
+            results["load_inheritances"] = _timed(inheritance_db.load_inheritances, Cat)
+            results["patrol setup"] = _timed(_patrol_setup)
+            results["load_cats"] = _timed(load_cats)
+    finally:
+        save_writer.wait()
+        # forget what was saved, the next clan is saved to the same folder
+        close_save_backend()
+        save_cache.reset()
+        shutil.rmtree(Path(get_save_dir()) / CLAN_NAME, ignore_errors=True)
+        if current_clan_text is None:
+            current_clan.unlink(missing_ok=True)
+        else:
+            current_clan.write_text(current_clan_text)
+        switch_set_value(Switch.clan_list, clan_list)
+        switch_set_value(Switch.clan_name, clan_name)
+    return results
+
+
+def compare(baseline: dict, results: dict, threshold: float = THRESHOLD) -> List[tuple]:
+    """
+    :param baseline: results of an earlier run, as saved by --save
+    :param results: results of this run, in the same form
+    :return: (size, measurement, baseline seconds, seconds) of everything that got
+        slower than the threshold allows
+    """
+    slower = []
+    for size, timings in results["sizes"].items():
+        before = baseline["sizes"].get(size, {})
+        for name, seconds in timings.items():
+            old = before.get(name)
+            if old is None:
+                continue
+            if seconds > old * (1 + threshold) and seconds - old > NOISE_FLOOR:
+                slower.append((size, name, old, seconds))
+    return slower
+
+
+def _print_results(results: dict, baseline: Optional[dict], slower: List[tuple]):
+    slower_names = {(size, name) for size, name, _, _ in slower}
+    for size, timings in results["sizes"].items():
+        print(f"\n{size} cats, {results['moons']} moons")
+        before = (baseline or {"sizes": {}})["sizes"].get(size, {})
+        for name, seconds in timings.items():
+            line = f"{name:>36} {seconds * 1000:>10.2f} ms"
+            old = before.get(name)
+            if old:
+                line += f" {old * 1000:>10.2f} ms {(seconds / old - 1) * 100:>+7.1f}%"
+            if (size, name) in slower_names:
+                line += "  SLOWER"
+            print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.moon_skip",
+        description="Time moon skips and saving in synthetic clans.",
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=CLAN_SIZES, help="clan sizes to time"
+    )
+    parser.add_argument("--moons", type=int, default=MOONS, help="moons per clan")
+    parser.add_argument("--save", metavar="FILE", help="write the timings to FILE")
+    parser.add_argument(
+        "--compare", metavar="FILE", help="compare the timings to the baseline in FILE"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="how much slower counts as a regression, 0.2 is 20%%",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as read_file:
+            baseline = ujson.loads(read_file.read())
+
+    setup_data_dir()
+    results = {
+        "moons": args.moons,
+        "python": platform.python_version(),
+        "sizes": {str(size): run(size, args.moons) for size in args.sizes},
+    }
+    slower = compare(baseline, results, args.threshold) if baseline else []
+    _print_results(results, baseline, slower)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as write_file:
+            write_file.write(ujson.dumps(results, indent=2))
+    if slower:
+        print(f"\n{len(slower)} timings are more than {args.threshold:.0%} slower")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Measures how much memory a clan's relationships take when they are kept sparse in a
+RelationshipStore, compared to materializing a Relationship object for every pair.
+
+    python -m benchmarks.relationship_memory
+"""
+
+import tracemalloc
+from random import randint, sample
+
+from benchmarks.synthetic import make_synthetic_cats
+
+CLAN_SIZES = (100, 500, 2000)
+EAGER_LIMIT = 500
+NON_NEUTRAL_PER_CAT = 30
+
+
+def _build_sparse(cats):
+    for cat in cats:
+        cat.relationships.clear()
+    for cat in cats:
+        friends = set(sample(cats, min(NON_NEUTRAL_PER_CAT, len(cats))))
+        for other in cats:
+            if other is cat:
+                continue
+            if other in friends:
+                cat.relationships.add_record(
+                    other, like=randint(1, 60), comfort=randint(0, 40)
+                )
+            else:
+                cat.relationships.add_record(other)
+
+
+def _materialize(cats):
+    for cat in cats:
+        for _ in cat.relationships.values():
+            pass
+
+
+def run(size: int) -> dict:
+    cats = make_synthetic_cats(size, relationships_per_cat=0)
+    results = {"cats": size, "pairs": size * (size - 1)}
+
+    tracemalloc.start()
+    _build_sparse(cats)
+    results["sparse"] = tracemalloc.get_traced_memory()[0]
+
+    if size <= EAGER_LIMIT:
+        _materialize(cats)
+        results["eager"] = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return results
+
+
+def main():
+    print(f"{'cats':>6} {'pairs':>10} {'sparse (MB)':>12} {'eager (MB)':>11}")
+    for size in CLAN_SIZES:
+        result = run(size)
+        eager = (
+            f"{result['eager'] / 2**20:>11.1f}" if "eager" in result else f"{'-':>11}"
+        )
+        print(
+            f"{result['cats']:>6} {result['pairs']:>10}"
+            f" {result['sparse'] / 2**20:>12.1f} {eager}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compares answering "which cats like X at least 40" for every cat in the clan by looping
+over Relationship objects against a column scan of the NumPy relationship matrix.
+
+    python -m benchmarks.relationship_queries
+"""
+
+from time import perf_counter
+
+from benchmarks.synthetic import make_synthetic_cats
+from scripts.cat_relations import relationship_matrix
+from scripts.cat_relations.enums import RelType
+
+CLAN_SIZES = (200, 1000)
+THRESHOLD = 40
+
+
+def _loop(cats):
+    for target in cats:
+        [
+            cat.ID
+            for cat in cats
+            if target.ID in cat.relationships
+            and cat.relationships[target.ID].like >= THRESHOLD
+        ]
+
+
+def _matrix(cats):
+    matrix = relationship_matrix.active_matrix
+    for target in cats:
+        matrix.cats_towards(target.ID, RelType.LIKE, minimum=THRESHOLD)
+
+
+def run(size: int) -> dict:
+    cats = make_synthetic_cats(size)
+    results = {"cats": size}
+
+    start = perf_counter()
+    _loop(cats)
+    results["loop"] = perf_counter() - start
+
+    relationship_matrix.enable(cats)
+    start = perf_counter()
+    _matrix(cats)
+    results["matrix"] = perf_counter() - start
+    relationship_matrix.disable()
+    return results
+
+
+def main():
+    if not relationship_matrix.numpy_available():
+        print("numpy is not installed, nothing to compare")
+        return
+    print(f"{'cats':>6} {'loop (s)':>10} {'matrix (s)':>11} {'speedup':>8}")
+    for size in CLAN_SIZES:
+        result = run(size)
+        print(
+            f"{result['cats']:>6} {result['loop']:>10.3f} {result['matrix']:>11.3f}"
+            f" {result['loop'] / result['matrix']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Compares saving a clan's relationships as one json file per cat (the old format) with
+the packed relationship save, both for a first full write and for the incremental
+write of a typical autosave where only some relationships changed.
+
+    python -m benchmarks.relationship_save
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+from random import sample
+from time import perf_counter
+
+from benchmarks.synthetic import make_synthetic_cats
+from scripts.cat_relations.relationship_save import RelationshipPack
+from scripts.game_structure.game.save_load import safe_save
+
+CLAN_SIZES = (100, 300, 1000)
+CHANGED_PER_CAT = 5
+
+
+def _all_pairs(cats):
+    for cat in cats:
+        for other in cats:
+            if other is not cat and other.ID not in cat.relationships:
+                cat.relationships.add_record(other)
+
+
+def _save_json(directory: Path, cats):
+    for f in directory.glob("*.json"):
+        f.unlink()
+    for cat in cats:
+        safe_save(
+            f"{directory}/{cat.ID}_relations.json",
+            list(cat.relationships.iter_save_dicts()),
+        )
+
+
+def _change_some(cats):
+    for cat in cats:
+        for cat_ID in sample(list(cat.relationships), CHANGED_PER_CAT):
+            relationship = cat.relationships[cat_ID]
+            relationship.like += 5
+            relationship.log.append("benchmark")
+
+
+def run(size: int) -> dict:
+    cats = make_synthetic_cats(size)
+    _all_pairs(cats)
+    results = {"cats": size}
+    directory = Path(tempfile.mkdtemp())
+    try:
+        json_dir = directory / "json"
+        json_dir.mkdir()
+        start = perf_counter()
+        _save_json(json_dir, cats)
+        results["json"] = perf_counter() - start
+
+        pack = RelationshipPack()
+        pack_dir = directory / "packed"
+        start = perf_counter()
+        pack.save(pack_dir, cats)
+        results["packed_full"] = perf_counter() - start
+
+        _change_some(cats)
+        start = perf_counter()
+        pack.save(pack_dir, cats)
+        results["packed_incremental"] = perf_counter() - start
+    finally:
+        shutil.rmtree(directory)
+    return results
+
+
+def main():
+    print(f"{'cats':>6} {'json (s)':>10} {'packed (s)':>11} {'incremental (s)':>16}")
+    for size in CLAN_SIZES:
+        result = run(size)
+        print(
+            f"{result['cats']:>6} {result['json']:>10.3f}"
+            f" {result['packed_full']:>11.3f} {result['packed_incremental']:>16.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
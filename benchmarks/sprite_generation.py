@@ -0,0 +1,119 @@
+"""
+Times generate_sprite for living, StarClan, Dark Forest and Unknown Residence cats that
+all wear an accessory and have a missing part scar, so dead cats need their lineart
+recolored. "cold" empties the sprite caches before every sprite, "warm" draws the same
+cats again with everything cached.
+
+Also compares recoloring Unknown Residence's gradient lineart with a mask against
+copying it pixel by pixel, which is how it used to be done.
+
+    python -m benchmarks.sprite_generation
+"""
+
+from random import choice, seed
+from time import perf_counter
+
+import pygame
+
+from benchmarks.synthetic import reset_cats
+from scripts.cat.cats import Cat
+from scripts.cat.enums import CatGroup
+from scripts.cat.pelts import Pelt
+from scripts.cat.sprites.display_sprites import (
+    clear_sprite_caches,
+    generate_sprite,
+    recolor_lineart,
+)
+from scripts.cat.sprites.load_sprites import sprites
+
+CATS_PER_GROUP = 200
+GROUPS = {
+    "living": None,
+    "StarClan": CatGroup.STARCLAN_ID,
+    "Dark Forest": CatGroup.DARK_FOREST_ID,
+    "Unknown Residence": CatGroup.UNKNOWN_RESIDENCE_ID,
+}
+
+
+def _make_cats(afterlife_ID) -> list:
+    cats = []
+    for _ in range(CATS_PER_GROUP):
+        cat = Cat(moons=choice((8, 30, 120)))
+        cat.pelt.accessory = [choice(Pelt.plant_accessories + Pelt.wild_accessories)]
+        cat.pelt.scars = [choice(Pelt.missing_part_scars)]
+        cat.pelt.opacity = 100
+        if afterlife_ID:
+            cat.dead = True
+            cat.status.send_to_afterlife(afterlife_ID)
+        cats.append(cat)
+    return cats
+
+
+def _time_sprites(cats, cold: bool) -> float:
+    start = perf_counter()
+    for cat in cats:
+        if cold:
+            clear_sprite_caches()
+        generate_sprite(cat)
+    return perf_counter() - start
+
+
+def _recolor_per_pixel(sprite_name: str, source_name: str) -> pygame.Surface:
+    sprite = sprites.sprites[sprite_name]
+    source = sprites.sprites[source_name]
+    out = sprite.copy()
+    width, height = sprite.get_size()
+    for x in range(width):
+        for y in range(height):
+            if sprite.get_at((x, y)) == pygame.Color(0, 0, 0):
+                out.set_at((x, y), source.get_at((x, y)))
+    return out
+
+
+def _time_gradient_recolor() -> dict:
+    names = [
+        f"{sprites.PLANT_DATA['spritesheet']}{accessory}{pose}"
+        for accessory in Pelt.plant_accessories
+        for pose in range(3)
+    ]
+    results = {"sprites": len(names)}
+
+    start = perf_counter()
+    for name in names:
+        _recolor_per_pixel(name, f"line_ur_gradient{name[-1]}")
+    results["per pixel"] = perf_counter() - start
+
+    clear_sprite_caches()
+    start = perf_counter()
+    for name in names:
+        recolor_lineart(name, source_name=f"line_ur_gradient{name[-1]}")
+    results["mask"] = perf_counter() - start
+    return results
+
+
+def main():
+    seed(0)
+    sprites.load_all()
+    print(f"{'cats':>18} {'cold (ms/cat)':>14} {'warm (ms/cat)':>14}")
+    for group, afterlife_ID in GROUPS.items():
+        reset_cats()
+        cats = _make_cats(afterlife_ID)
+        cold = _time_sprites(cats, cold=True)
+        clear_sprite_caches()
+        _time_sprites(cats, cold=False)
+        warm = _time_sprites(cats, cold=False)
+        print(
+            f"{group:>18} {cold / len(cats) * 1000:>14.3f}"
+            f" {warm / len(cats) * 1000:>14.3f}"
+        )
+
+    result = _time_gradient_recolor()
+    print(
+        f"\nUnknown Residence lineart, {result['sprites']} sprites:"
+        f" per pixel {result['per pixel']:.3f} s, mask {result['mask']:.3f} s"
+        f" ({result['per pixel'] / result['mask']:.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Times what main.load_data does for a saved clan, up to the start screen being shown,
+for clans of a few sizes where a good part of the cats are dead.
+
+Also times reading every dead cat's history on demand, from the history archive and
+from the old one-file-per-cat format, since that's what lazy loading defers.
+
+    python -m benchmarks.startup
+
+The benchmark clan is saved in the saves folder and deleted again afterwards.
+"""
+
+import shutil
+from pathlib import Path
+from random import random
+from time import perf_counter
+
+import ujson
+
+from benchmarks.synthetic import make_synthetic_cats
+from scripts.cat.cats import Cat
+from scripts.cat.history_archive import ARCHIVE_FILE, INDEX_FILE, history_archive
+from scripts.cat.save_load import save_cats
+from scripts.cat.sprites.load_sprites import sprites
+from scripts.clan import Afterlife, Clan, clan_class
+from scripts.game_structure import game
+from scripts.game_structure.audio.audio_manager import AudioManager
+from scripts.game_structure.game.save_load import save_writer
+from scripts.game_structure.game.switches import (
+    Switch,
+    switch_get_value,
+    switch_set_value,
+)
+from scripts.game_structure.load_cat import load_cats, version_convert
+from scripts.housekeeping.datadir import get_save_dir, setup_data_dir
+from scripts.screens import all_screens
+from scripts.screens.enums import GameScreen
+import scripts.screens.screens_core.screens_core
+
+CLAN_NAME = "benchmarkStartupClan"
+CLAN_SIZES = (200, 500, 1000)
+DEAD_SHARE = 0.6
+
+
+def _make_clan(size: int):
+    if not sprites.clan_symbols:
+        # making a clan needs the clan symbol sprites
+        sprites.load_all()
+    game.just_died.clear()
+    game.dead_cats_to_grieve.clear()
+    cats = make_synthetic_cats(size)
+    game.clan = Clan(
+        name=CLAN_NAME,
+        leader=cats[0],
+        deputy=cats[1],
+        medicine_cat=cats[2],
+        camp_bg="camp1",
+        starting_members=cats[3:],
+    )
+    game.clan.create_clan()
+    for cat in cats[3:]:
+        if not cat.dead and random() < DEAD_SHARE:
+            cat.die()
+            cat.history.add_death("died in the benchmark")
+    save_cats(CLAN_NAME, Cat, game)
+    game.clan.save_clan()
+    save_writer.wait()
+
+
+def _load_data() -> dict:
+    """The clan loading part of main.load_data, then the start screen."""
+    stages = {}
+
+    if not getattr(game, "audio", None):
+        game.audio = AudioManager()
+        game.audio.disabled = True
+        game.audio.muted = True
+
+    start = perf_counter()
+    sprites.load_all()
+    stages["sprites"] = perf_counter() - start
+
+    start = perf_counter()
+    game.starclan = Afterlife()
+    game.dark_forest = Afterlife()
+    load_cats()
+    stages["load cats"] = perf_counter() - start
+
+    start = perf_counter()
+    version_info = clan_class.load_clan()
+    version_convert(version_info)
+    game.load_events()
+    stages["clan"] = perf_counter() - start
+
+    start = perf_counter()
+    scripts.screens.screens_core.screens_core.rebuild_core()
+    all_screens.get_screen(GameScreen.START).screen_switches()
+    stages["first screen"] = perf_counter() - start
+
+    stages["total"] = sum(stages.values())
+    return stages
+
+
+def _dead_histories() -> float:
+    dead = [cat for cat in Cat.all_cats.values() if cat.dead]
+    start = perf_counter()
+    for cat in dead:
+        cat.load_history()
+    return perf_counter() - start
+
+
+def _convert_to_history_files():
+    """Rewrites the clan's history archive as one file per cat."""
+    history_dir = Path(get_save_dir()) / CLAN_NAME / "history"
+    for cat in Cat.all_cats.values():
+        with open(
+            history_dir / f"{cat.ID}_history.json", "w", encoding="utf-8"
+        ) as write_file:
+            write_file.write(ujson.dumps(cat.history.make_dict(), indent=4))
+    history_archive.close()
+    (history_dir / ARCHIVE_FILE).unlink()
+    (history_dir / INDEX_FILE).unlink()
+
+
+def run(size: int) -> dict:
+    clan_list = switch_get_value(Switch.clan_list)
+    clan_name = switch_get_value(Switch.clan_name)
+    current_clan = Path(get_save_dir()) / "currentclan.txt"
+    current_clan_text = current_clan.read_text() if current_clan.exists() else None
+    try:
+        _make_clan(size)
+        switch_set_value(Switch.clan_list, [CLAN_NAME])
+        switch_set_value(Switch.clan_name, CLAN_NAME)
+
+        results = _load_data()
+        results["cats"] = len(Cat.all_cats)
+        results["dead histories"] = _dead_histories()
+
+        _convert_to_history_files()
+        load_cats()
+        results["dead histories (files)"] = _dead_histories()
+    finally:
+        save_writer.wait()
+        history_archive.close()
+        shutil.rmtree(Path(get_save_dir()) / CLAN_NAME, ignore_errors=True)
+        if current_clan_text is None:
+            current_clan.unlink(missing_ok=True)
+        else:
+            current_clan.write_text(current_clan_text)
+        switch_set_value(Switch.clan_list, clan_list)
+        switch_set_value(Switch.clan_name, clan_name)
+    return results
+
+
+def main():
+    setup_data_dir()
+    print(
+        f"{'cats':>6} {'sprites (s)':>12} {'load cats (s)':>14} {'clan (s)':>9}"
+        f" {'screen (s)':>11} {'total (s)':>10}"
+        f" {'dead histories (s)':>19} {'as files (s)':>13}"
+    )
+    for size in CLAN_SIZES:
+        result = run(size)
+        print(
+            f"{result['cats']:>6} {result['sprites']:>12.3f}"
+            f" {result['load cats']:>14.3f} {result['clan']:>9.3f}"
+            f" {result['first screen']:>11.3f} {result['total']:>10.3f}"
+            f" {result['dead histories']:>19.3f}"
+            f" {result['dead histories (files)']:>13.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compares reading the common Status properties from the cached values against
+recomputing them from group_history each time, as Status used to.
+
+    python -m benchmarks.status_properties
+"""
+
+from collections import defaultdict
+from itertools import groupby
+from time import perf_counter
+
+from benchmarks.synthetic import make_synthetic_cats
+from scripts.cat.enums import CatGroup, CatRank
+from scripts.cat.status import Status
+from scripts.game_structure import game
+
+CLAN_SIZES = (200, 1000)
+HISTORY_LENGTH = 12
+READS = 50
+
+
+def _recomputed(status: Status):
+    history = status.group_history
+    rank = CatRank(history[-1]["rank"])
+    group = game.used_group_IDs.get(history[-1]["group"]) or CatGroup.NONE
+    group == CatGroup.PLAYER_CLAN
+    [k for k, _ in groupby(Status.social_lookup[r["rank"]] for r in history)][-1]
+    groups = []
+    for record in history:
+        if record["group"] not in groups:
+            groups.append(record["group"])
+    ranks = defaultdict(int)
+    for record in history:
+        ranks[record["rank"]] += record["moons_as"]
+    return rank
+
+
+def _cached(status: Status):
+    rank = status.rank
+    status.group
+    status.alive_in_player_clan
+    status.social
+    status.all_groups
+    status.all_ranks
+    return rank
+
+
+def run(size: int) -> dict:
+    cats = make_synthetic_cats(size)
+    for cat in cats:
+        for _ in range(HISTORY_LENGTH):
+            cat.status.increase_current_moons_as()
+            cat.status._change_rank(
+                CatRank.ELDER if cat.status.rank == CatRank.WARRIOR else CatRank.WARRIOR
+            )
+    statuses = [cat.status for cat in cats]
+    results = {"cats": size}
+
+    for name, read in (("recomputed", _recomputed), ("cached", _cached)):
+        start = perf_counter()
+        for _ in range(READS):
+            for status in statuses:
+                read(status)
+        results[name] = perf_counter() - start
+    return results
+
+
+def main():
+    print(f"{'cats':>6} {'recomputed (s)':>15} {'cached (s)':>11} {'speedup':>8}")
+    for size in CLAN_SIZES:
+        result = run(size)
+        print(
+            f"{result['cats']:>6} {result['recomputed']:>15.3f}"
+            f" {result['cached']:>11.3f}"
+            f" {result['recomputed'] / result['cached']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Helpers for building throwaway clans of an arbitrary size for benchmarking.
+"""
+
+import os
+from random import choice, randint, random, sample, seed, shuffle
+from typing import List
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from scripts.cat.cats import Cat, create_cat
+from scripts.cat.enums import CatRank
+from scripts.cat.status import Status
+from scripts.cat_relations.inheritance2 import inheritance_db
+
+RANK_WEIGHTS = (
+    [CatRank.KITTEN] * 2
+    + [CatRank.APPRENTICE] * 2
+    + [CatRank.WARRIOR] * 6
+    + [CatRank.ELDER]
+    + [CatRank.MEDICINE_APPRENTICE, CatRank.MEDIATOR]
+)
+
+
+def reset_cats():
+    """Forget every cat created so far."""
+    Cat.all_cats.clear()
+    Cat.all_cats_list.clear()
+    Status.clear_group_pools()
+
+
+def make_synthetic_cats(
+    amount: int, relationships_per_cat: int = 30, rng_seed: int = 0
+) -> List[Cat]:
+    """
+    Creates a clan-sized pile of living cats with a leader, deputy and medicine cat.
+    Every cat gets a handful of non-empty relationships towards random clanmates.
+    :param amount: how many cats to make
+    :param relationships_per_cat: how many relationships each cat gets
+    :param rng_seed: seed for the random module, so runs are comparable
+    """
+    seed(rng_seed)
+    reset_cats()
+
+    cats = [
+        create_cat(CatRank.LEADER),
+        create_cat(CatRank.DEPUTY),
+        create_cat(CatRank.MEDICINE_CAT),
+    ]
+    cats.extend(create_cat(choice(RANK_WEIGHTS)) for _ in range(amount - len(cats)))
+    Cat.all_cats_list.extend(cats)
+
+    for cat in cats:
+        cat.relationships.clear()
+        others = sample(cats, min(relationships_per_cat + 1, len(cats)))
+        for other in others:
+            if other is cat:
+                continue
+            relationship = cat.create_one_relationship(other)
+            relationship.like = randint(0, 60)
+            relationship.comfort = randint(0, 40)
+            relationship.trust = randint(0, 40)
+            relationship.respect = randint(0, 40)
+
+    return cats
+
+
+def add_families(cats: List[Cat], mated_share: float = 0.4, adopted_share: float = 0.1):
+    """
+    Pairs up some of the grown cats as mates and gives every young cat a pair of them as
+    parents, so kin checks have families to look through.
+    :param cats: cats made by make_synthetic_cats
+    :param mated_share: how many of the grown cats get a mate
+    :param adopted_share: how many young cats also get an adoptive parent
+    """
+    grown = [cat for cat in cats if cat.moons >= 12]
+    young = [cat for cat in cats if cat.moons < 12]
+    shuffle(grown)
+    pairs = []
+    for i in range(0, int(len(grown) * mated_share) - 1, 2):
+        cat, mate = grown[i], grown[i + 1]
+        cat.mate.append(mate.ID)
+        mate.mate.append(cat.ID)
+        for a, b in ((cat, mate), (mate, cat)):
+            relationship = a.create_one_relationship(b)
+            relationship.mates = True
+            relationship.romance = randint(40, 80)
+        pairs.append((cat, mate))
+
+    if pairs:
+        for cat in young:
+            parent1, parent2 = choice(pairs)
+            cat.parent1, cat.parent2 = parent1.ID, parent2.ID
+            if random() < adopted_share:
+                cat.adoptive_parents.append(choice(grown).ID)
+    inheritance_db.load_inheritances(Cat)
@@ -0,0 +1,63 @@
+"""
+Compares thought selection through the precompiled ThoughtIndex against filtering the raw
+thought files for every cat, the way each moon skip used to.
+
+    python -m benchmarks.thought_generation
+"""
+
+from time import perf_counter
+
+from benchmarks.synthetic import make_synthetic_cats
+from scripts.cat.enums import CatThought
+from scripts.events_module.thoughts import generate_thoughts
+from scripts.game_structure.localization import load_lang_resource
+
+CLAN_SIZES = (50, 200, 1000)
+
+
+def _raw_filter(cat, other_cat):
+    raw = []
+    for path in generate_thoughts._get_thought_paths(CatThought.WHILE_ALIVE, cat):
+        raw.extend(load_lang_resource(path))
+    return generate_thoughts._filter_list(raw, cat, other_cat)
+
+
+def _indexed(cat, other_cat):
+    return generate_thoughts._load_group(CatThought.WHILE_ALIVE, cat, other_cat)
+
+
+def run(size: int) -> dict:
+    cats = make_synthetic_cats(size)
+    pairs = [
+        (cat, generate_thoughts.get_other_cat_for_thought(None, cat)) for cat in cats
+    ]
+
+    results = {"cats": size}
+    for label, func in (("raw", _raw_filter), ("indexed", _indexed)):
+        func(*pairs[0])  # warm up the resource cache / index
+        start = perf_counter()
+        for cat, other_cat in pairs:
+            func(cat, other_cat)
+        results[label] = perf_counter() - start
+
+    start = perf_counter()
+    for cat in cats:
+        cat.get_new_thought()
+    results["get_new_thought"] = perf_counter() - start
+    return results
+
+
+def main():
+    print(
+        f"{'cats':>6} {'raw (s)':>10} {'indexed (s)':>12} {'speedup':>8} {'full (s)':>10}"
+    )
+    for size in CLAN_SIZES:
+        result = run(size)
+        print(
+            f"{result['cats']:>6} {result['raw']:>10.3f} {result['indexed']:>12.3f}"
+            f" {result['raw'] / result['indexed']:>7.1f}x {result['get_new_thought']:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
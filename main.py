@@ -5,11 +5,13 @@ import init  # isort: skip
 # Load game
 import logging
 import threading
+from time import perf_counter
 
 import pygame
 
 import scripts.game_structure.screen_settings
 from scripts.cat.sprites.load_sprites import sprites
+from scripts.cat.sprites.prewarm import sprite_prewarmer
 from scripts.clan import Afterlife, clan_class
 
 from scripts.debug_console import debug_mode
@@ -17,7 +19,7 @@ from scripts.game_input import INPUT_ACTION_PRESSED
 from scripts.game_structure import constants, game
 from scripts.game_structure.audio.audio_manager import AudioManager
 from scripts.game_structure.discord_rpc import _DiscordRPC
-from scripts.game_structure.game.save_load import read_clans
+from scripts.game_structure.game.save_load import read_clans, save_writer
 from scripts.game_structure.game.settings import game_setting_get
 from scripts.game_structure.game.switches import (
     Switch,
@@ -32,6 +34,7 @@ from scripts.game_input import controller_manager, keyboard_manager
 from scripts.screens import all_screens
 from scripts.screens.enums import GameScreen
 from scripts.ui.windows.save_check import SaveCheckWindow
+from scripts.ui.windows.save_error import SaveErrorWindow
 from scripts.housekeeping.quit_game import quit_game
 
 # P Y G A M E
@@ -186,6 +189,7 @@ else:
 
 while 1:
     time_delta = clock.tick(fps) / 1000.0
+    frame_start = perf_counter()
 
     if switch_get_value(Switch.switch_clan):
         load_game()
@@ -257,6 +261,11 @@ while 1:
 
     MANAGER.update(time_delta)
 
+    # report autosaves that failed while being written in the background
+    save_error = save_writer.poll_error()
+    if save_error:
+        SaveErrorWindow(save_error)
+
     # update
     game.update_game()
     if game.switch_screens:
@@ -277,3 +286,6 @@ while 1:
 
     if not game.audio.disabled and not game.audio.muted:
         game.audio.start()
+
+    # use what's left of the frame to rebuild sprites that changed
+    sprite_prewarmer.update(frame_start, fps)
@@ -0,0 +1,45 @@
+from random import choice
+from typing import Dict, Iterator, List, Optional
+
+
+class CatPool:
+    """An unordered set of cat IDs that supports O(1) add, discard and random choice."""
+
+    __slots__ = ("_ids", "_positions")
+
+    def __init__(self):
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, cat_ID: str) -> bool:
+        return cat_ID in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def add(self, cat_ID: str):
+        if cat_ID in self._positions:
+            return
+        self._positions[cat_ID] = len(self._ids)
+        self._ids.append(cat_ID)
+
+    def discard(self, cat_ID: str):
+        """Removes the ID by swapping the last ID into its slot, so nothing needs shifting."""
+        position = self._positions.pop(cat_ID, None)
+        if position is None:
+            return
+        last_ID = self._ids.pop()
+        if position < len(self._ids):
+            self._ids[position] = last_ID
+            self._positions[last_ID] = position
+
+    def clear(self):
+        self._ids.clear()
+        self._positions.clear()
+
+    def random_ID(self) -> Optional[str]:
+        """Returns a random ID from the pool, or None if the pool is empty."""
+        return choice(self._ids) if self._ids else None
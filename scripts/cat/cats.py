@@ -6,16 +6,19 @@ from __future__ import annotations
 
 import bisect
 import itertools
+import logging
 import os.path
 import sys
 from random import choice, randint, sample, random, randrange
-from typing import Dict, List, Any, Union, Callable, Optional, TYPE_CHECKING
+from collections import OrderedDict
+from typing import Dict, List, Any, Union, Callable, Optional, Tuple, TYPE_CHECKING
 
 import i18n
 import ujson  # type: ignore
 
 import scripts.game_structure.localization as pronouns
 from scripts.cat import save_load, pronouns
+from scripts.cat.faded_cat import FadedCat
 from scripts.cat.enums import (
     CatAge,
     CatRank,
@@ -35,9 +38,10 @@ from scripts.events_module.thoughts.generate_thoughts import (
     new_thought,
     get_other_cat_for_thought,
 )
-from scripts.cat_relations.inheritance import Inheritance
+from scripts.cat.clan_roster import ConditionDict, clan_roster
 from scripts.cat_relations.inheritance2 import inheritance_db
 from scripts.cat_relations.relationship import Relationship
+from scripts.cat_relations.relationship_store import RelationshipStore
 from scripts.cat_relations.enums import RelType, RelTier, rel_type_tiers
 from scripts.clan_package.settings import get_clan_setting
 from scripts.conditions import (
@@ -50,25 +54,34 @@ from scripts.conditions import (
 from scripts.event_class import Single_Event
 from scripts.events_module.generate_events import GenerateEvents
 from scripts.game_structure import image_cache, constants, game
-from scripts.game_structure.game.save_load import safe_save
+from scripts.game_structure.game.save_load import safe_save, safe_remove
 from scripts.game_structure.game.settings import game_setting_get
 from scripts.game_structure.game.switches import switch_get_value, Switch
 from scripts.game_structure.localization import load_lang_resource
 from scripts.game_structure.screen_settings import screen
 from scripts.housekeeping.datadir import get_save_dir
-from scripts.cat.sprites.display_sprites import update_sprite, update_mask
+from scripts.cat.sprites.display_sprites import update_sprite, get_click_mask
 from scripts.events_module.text_adjust import (
     event_text_adjust,
     leader_ceremony_text_adjust,
 )
 from scripts.events_module.event_filters import get_personality_compatibility
-from scripts.clan_package.get_clan_cats import find_alive_cats_with_rank
+from scripts.clan_package.get_clan_cats import (
+    find_alive_cats_with_rank,
+    get_alive_clan_cats,
+)
 
-import scripts.game_structure.screen_settings
 
 if TYPE_CHECKING:
     import pygame
 
+    from scripts.cat.save_backend import SaveBackend
+
+logger = logging.getLogger(__name__)
+
+FADED_CATS_KEPT = 256
+"""Faded Cat objects load_faded_cat keeps around, the least recently used are dropped."""
+
 
 class Cat:
     """The cat class."""
@@ -121,6 +134,8 @@ class Cat:
 
     all_cats_list: List[Cat] = []
     ordered_cat_list: List[Cat] = []
+    _faded_cats: "OrderedDict[str, Tuple[FadedCat, Cat]]" = OrderedDict()
+    """faded cat ID -> (the record it was made from, the faded cat)"""
 
     # DEBUG SETTINGS
     disable_random = False
@@ -202,7 +217,7 @@ class Cat:
         self.patrol_with_mentor = 0
         self.apprentice = []
         self.former_apprentices = []
-        self.relationships: Dict[str, Relationship] = {}
+        self.relationships = RelationshipStore(self)
         self.mate = []
         self.previous_mates = []
         self._pronouns: Dict[str, List[Dict[str, Union[str, int]]]] = {}
@@ -238,7 +253,6 @@ class Cat:
         self.favourite = False
 
         self.specsuffix_hidden = specsuffix_hidden
-        self.inheritance = None
 
         # setting ID
         if ID is None:
@@ -359,12 +373,14 @@ class Cat:
 
         # Private Sprite
         self._sprite: Optional["pygame.Surface"] = None
-        self._sprite_mask: Optional["pygame.Mask"] = None
         self._sprite_working: bool = self.not_working()
         """used to store whether we should be displaying sick sprite or not"""
 
         # SAVE CAT INTO ALL_CATS DICTIONARY IN CATS-CLASS
         self.all_cats[self.ID] = self
+        self.status.register(self.ID)
+        clan_roster.file_age(self.ID, self.age)
+        clan_roster.file_conditions(self.ID, self.is_ill(), self.is_injured())
 
         if self.ID is not None and self.ID != "0":
             Cat.insert_cat(self)
@@ -389,7 +405,6 @@ class Cat:
         self.status = Status(**status) if status else Status()
         self._pronouns = {}  # Needs to be set as a dict
         self.moons = moons
-        self.inheritance = None  # This should never be used, but just for safety
         self.name = Name(prefix=prefix, suffix=suffix, cat=self)
 
         self.init_moons_age(moons)
@@ -505,6 +520,45 @@ class Cat:
     def dead(self) -> bool:
         return bool(self.status.group.is_afterlife())
 
+    @property
+    def age(self) -> Optional[CatAge]:
+        return self._age
+
+    @age.setter
+    def age(self, value: Optional[CatAge]):
+        self._age = value
+        if self.status.cat_ID is not None:
+            clan_roster.file_age(self.status.cat_ID, value)
+
+    @property
+    def illnesses(self) -> ConditionDict:
+        return self._illnesses
+
+    @illnesses.setter
+    def illnesses(self, value: dict):
+        self._illnesses = ConditionDict(self, value)
+        self._illnesses.changed()
+
+    @property
+    def injuries(self) -> ConditionDict:
+        return self._injuries
+
+    @injuries.setter
+    def injuries(self, value: dict):
+        self._injuries = ConditionDict(self, value)
+        self._injuries.changed()
+
+    @property
+    def relationships(self) -> RelationshipStore:
+        """This cat's relationships towards other cats, keyed by the other cat's ID"""
+        return self._relationships
+
+    @relationships.setter
+    def relationships(self, value: Dict[str, Relationship]):
+        if not isinstance(value, RelationshipStore):
+            value = RelationshipStore(self, value)
+        self._relationships = value
+
     @dead.setter
     def dead(self, die: bool):
         if die:
@@ -556,11 +610,8 @@ class Cat:
 
     @property
     def dead_for(self) -> int:
-        return sum(
-            entry.get("moons_as")
-            for entry in self.status.group_history
-            if entry.get("group")
-            in (
+        return self.status.moons_in_groups(
+            (
                 CatGroup.STARCLAN_ID,
                 CatGroup.UNKNOWN_RESIDENCE_ID,
                 CatGroup.DARK_FOREST_ID,
@@ -1131,26 +1182,9 @@ class Cat:
             )
             return
 
-        history_directory = f"{get_save_dir()}/{clanname}/history/"
-        cat_history_directory = history_directory + self.ID + "_history.json"
-
-        if not os.path.exists(cat_history_directory):
-            self._history = History(
-                beginning={},
-                mentor_influence={},
-                app_ceremony={},
-                lead_ceremony=None,
-                possible_history={},
-                died_by=[],
-                scar_events=[],
-                murder={},
-                cat=self,
-            )
-            return
         try:
-            with open(cat_history_directory, "r", encoding="utf-8") as read_file:
-                history_data = ujson.loads(read_file.read())
-
+            history_data = save_load.get_save_backend(clanname).load_history(self.ID)
+            if history_data is not None:
                 self._history = History(
                     beginning=(
                         history_data["beginning"] if "beginning" in history_data else {}
@@ -1198,19 +1232,36 @@ class Cat:
                 f"empty. Default history info was given. Close game without saving if you have save information "
                 f"you'd like to preserve!"
             )
+            return
 
-    def save_history(self, history_dir):
-        """Save this cat's history.
+        if history_data is None:
+            self._history = History(
+                beginning={},
+                mentor_influence={},
+                app_ceremony={},
+                lead_ceremony=None,
+                possible_history={},
+                died_by=[],
+                scar_events=[],
+                murder={},
+                cat=self,
+            )
+
+    def save_history(self, backend: "SaveBackend") -> bool:
+        """Hand this cat's history to the save backend, if it changed since it was last
+        saved. It's written by the next backend.flush_histories().
 
-        :param history_dir: Directory to save cat's history to
-        :type history_dir: str
+        :param backend: The save backend of the cat's clan
+        :return: whether the history changed
         """
-        if not os.path.exists(history_dir):
-            os.makedirs(history_dir)
+        history_text = ujson.dumps(self.history.make_dict())
+        if save_load.save_cache.histories.get(self.ID) == history_text:
+            return False
 
-        history_dict = self.history.make_dict()
         try:
-            safe_save(f"{history_dir}/{self.ID}_history.json", history_dict)
+            backend.add_history(self.ID, history_text)
+            save_load.save_cache.histories[self.ID] = history_text
+            return True
         except:
             self.history = History(
                 beginning={},
@@ -1225,6 +1276,7 @@ class Cat:
             )
 
             print(f"WARNING: saving history of cat #{self.ID} didn't work")
+            return False
 
     def generate_lead_ceremony(self):
         """Create a leader ceremony and add it to the history"""
@@ -1595,9 +1647,9 @@ class Cat:
             )
 
         if self.status.is_other_clancat and not self.dead:
-            cat_list = other_clan_cats.copy() if other_clan_cats else []
+            cat_list = other_clan_cats if other_clan_cats else []
         else:
-            cat_list = self.all_cats_list.copy()
+            cat_list = None
 
         if not other_cat:
             other_cat = get_other_cat_for_thought(
@@ -1623,10 +1675,8 @@ class Cat:
         """Randomly choose a cat of the Clan and have an interaction with them."""
         cats_to_choose = [
             iter_cat
-            for iter_cat in Cat.all_cats.values()
-            if iter_cat.ID != self.ID
-            and iter_cat.status.alive_in_player_clan
-            and iter_cat.age != CatAge.NEWBORN
+            for iter_cat in get_alive_clan_cats(Cat)
+            if iter_cat.ID != self.ID and iter_cat.age != CatAge.NEWBORN
         ]
         # if there are no cats to interact, stop
         if not cats_to_choose:
@@ -2202,27 +2252,17 @@ class Cat:
                 )
                 self.get_ill(illness_name)
 
-    def save_condition(self):
-        # save conditions for each cat
-        clanname = None
-        if switch_get_value(Switch.clan_name) != "":
-            clanname = switch_get_value(Switch.clan_name)
-        elif len(switch_get_value(Switch.clan_list)) > 0:
-            clanname = switch_get_value(Switch.clan_list)[0]
-        elif game.clan is not None:
-            clanname = game.clan.name
-
-        condition_directory = get_save_dir() + "/" + clanname + "/conditions"
-        condition_file_path = condition_directory + "/" + self.ID + "_conditions.json"
-
+    def get_condition_dict(self) -> Optional[dict]:
+        """
+        :return: the conditions that should be saved for this cat, or None if there
+            are none to save
+        """
         if (
             (not self.is_ill() and not self.is_injured() and not self.is_disabled())
             or self.dead
             or self.status.is_outsider
         ):
-            if os.path.exists(condition_file_path):
-                os.remove(condition_file_path)
-            return
+            return None
 
         conditions = {}
 
@@ -2235,7 +2275,29 @@ class Cat:
         if self.is_disabled():
             conditions["permanent conditions"] = self.permanent_condition
 
+        return conditions
+
+    def save_condition(self):
+        # save conditions for each cat
+        clanname = None
+        if switch_get_value(Switch.clan_name) != "":
+            clanname = switch_get_value(Switch.clan_name)
+        elif len(switch_get_value(Switch.clan_list)) > 0:
+            clanname = switch_get_value(Switch.clan_list)[0]
+        elif game.clan is not None:
+            clanname = game.clan.name
+
+        condition_directory = get_save_dir() + "/" + clanname + "/conditions"
+        condition_file_path = condition_directory + "/" + self.ID + "_conditions.json"
+
+        conditions = self.get_condition_dict()
+        if conditions is None:
+            safe_remove(condition_file_path)
+            save_load.save_cache.conditions[self.ID] = None
+            return
+
         safe_save(condition_file_path, conditions)
+        save_load.save_cache.conditions[self.ID] = ujson.dumps(conditions, indent=4)
 
     def load_conditions(self):
         if switch_get_value(Switch.clan_name) != "":
@@ -2246,11 +2308,15 @@ class Cat:
         condition_directory = get_save_dir() + "/" + clanname + "/conditions/"
         condition_cat_directory = condition_directory + self.ID + "_conditions.json"
         if not os.path.exists(condition_cat_directory):
+            save_load.save_cache.conditions[self.ID] = None
             return
 
         try:
             with open(condition_cat_directory, "r", encoding="utf-8") as read_file:
                 rel_data = ujson.loads(read_file.read())
+                save_load.save_cache.conditions[self.ID] = ujson.dumps(
+                    rel_data, indent=4
+                )
                 self.illnesses = rel_data.get("illnesses", {})
                 self.injuries = rel_data.get("injuries", {})
                 self.permanent_condition = rel_data.get("permanent conditions", {})
@@ -2503,7 +2569,8 @@ class Cat:
         if self.ID not in other_cat.previous_mates:
             other_cat.previous_mates.append(self.ID)
 
-        inheritance_db.load_inheritances(Cat)
+        inheritance_db.update_inheritance(self)
+        inheritance_db.update_inheritance(other_cat)
 
     def set_mate(self, other_cat: Cat):
         """Sets up a mate relationship between self and other_cat."""
@@ -2518,7 +2585,8 @@ class Cat:
         if self.ID in other_cat.previous_mates:
             other_cat.previous_mates.remove(self.ID)
 
-        inheritance_db.load_inheritances(Cat)
+        inheritance_db.update_inheritance(self)
+        inheritance_db.update_inheritance(other_cat)
 
         # Set starting relationship values
         if not self.dead:
@@ -2544,7 +2612,7 @@ class Cat:
     def unset_adoptive_parent(self, other_cat: Cat):
         """Unset the adoptive parent from self"""
         self.adoptive_parents.remove(other_cat.ID)
-        inheritance_db.load_inheritances(Cat)
+        inheritance_db.update_inheritance(self)
         if not self.dead:
             if other_cat.ID not in self.relationships:
                 self.create_one_relationship(other_cat)
@@ -2564,7 +2632,7 @@ class Cat:
     def set_adoptive_parent(self, other_cat: Cat):
         """Sets up a parent-child relationship between self and other_cat."""
         self.adoptive_parents.append(other_cat.ID)
-        inheritance_db.load_inheritances(Cat)
+        inheritance_db.update_inheritance(self)
 
         # Set starting relationship values
         if not self.dead:
@@ -2583,11 +2651,6 @@ class Cat:
             other_relationship.comfort += 20
             other_relationship.trust += 10
 
-    def create_inheritance_new_cat(self):
-        """Creates the inheritance class for a new cat."""
-        # set the born status to true, just for safety
-        self.inheritance = Inheritance(self, True)
-
     def create_one_relationship(self, other_cat: Cat):
         """Create a new relationship between current cat and other cat. Returns: Relationship"""
         if other_cat.ID in self.relationships:
@@ -2617,8 +2680,8 @@ class Cat:
             # if they are not within the same group
             if self.status.group_ID != inter_cat.status.group_ID:
                 continue
-            inter_cat.relationships[self.ID] = Relationship(inter_cat, self)
-            self.relationships[inter_cat.ID] = Relationship(self, inter_cat)
+            inter_cat.relationships.add_record(self)
+            self.relationships.add_record(inter_cat)
 
     def init_all_relationships(self):
         """Create Relationships to all current Clancats."""
@@ -2686,8 +2749,7 @@ class Cat:
                 if siblings and like < 30:
                     like = 30
 
-                rel = Relationship(
-                    cat_from=self,
+                self.relationships.add_record(
                     cat_to=the_cat,
                     mates=mates,
                     family=related,
@@ -2697,16 +2759,6 @@ class Cat:
                     comfort=comfort,
                     trust=trust,
                 )
-                self.relationships[the_cat.ID] = rel
-
-    def save_relationship_of_cat(self, relationship_dir):
-        # save relationships for each cat
-
-        rel = []
-        for r in self.relationships.values():
-            rel.append(r.to_dict())
-
-        safe_save(f"{relationship_dir}/{self.ID}_relations.json", rel)
 
     def load_relationship_of_cat(self):
         if switch_get_value(Switch.clan_name) != "":
@@ -2718,13 +2770,43 @@ class Cat:
         relation_cat_directory = relation_directory + self.ID + "_relations.json"
 
         self.relationships = {}
+        backend = save_load.get_save_backend(clanname)
+        if backend.has_relationships():
+            rows = backend.take_relationship_rows(self.ID)
+            if rows is None:
+                self._init_missing_relationships()
+                return
+            missing = []
+            for cat_to_ID, mates, family, values, log in rows:
+                cat_to = self.all_cats.get(cat_to_ID)
+                if cat_to is None or cat_to_ID == self.ID:
+                    missing.append(cat_to_ID)
+                    continue
+                romance, like, respect, trust, comfort = values
+                self.relationships.add_record(
+                    cat_to=cat_to,
+                    mates=mates,
+                    family=family,
+                    romance=romance,
+                    like=like,
+                    respect=respect,
+                    trust=trust,
+                    comfort=comfort,
+                    log=log,
+                )
+            # neutral relationships aren't necessarily saved
+            for cat_to in self.all_cats.values():
+                if cat_to is not self and cat_to.ID not in self.relationships:
+                    self.relationships.add_record(cat_to)
+            # this is exactly what's saved, so only the missing cats need writing back
+            self.relationships.mark_saved()
+            self.relationships.mark_changed(missing)
+            return
+
+        # saves from before the packed format: one json file per cat
         if os.path.exists(relation_directory):
             if not os.path.exists(relation_cat_directory):
-                self.init_all_relationships()
-                for cat in Cat.all_cats.values():
-                    if cat == self:
-                        continue
-                    cat.create_one_relationship(self)
+                self._init_missing_relationships()
                 return
             try:
                 with open(relation_cat_directory, "r", encoding="utf-8") as read_file:
@@ -2781,8 +2863,7 @@ class Cat:
                                     rel["trust"] = -old_rel["jealousy"]
 
                         # create relationship
-                        new_rel = Relationship(
-                            cat_from=self,
+                        self.relationships.add_record(
                             cat_to=cat_to,
                             mates=rel["mates"] or False,
                             family=rel["family"] or False,
@@ -2793,13 +2874,20 @@ class Cat:
                             trust=rel["trust"] or 0,
                             log=rel["log"],
                         )
-                        self.relationships[rel["cat_to_id"]] = new_rel
 
             except KeyError:
                 print(
                     f"WARNING: There was an error reading the relationship file of cat #{self}."
                 )
 
+    def _init_missing_relationships(self):
+        """Gives a cat without saved relationships a fresh set, both ways."""
+        self.init_all_relationships()
+        for cat in Cat.all_cats.values():
+            if cat == self or self.ID in cat.relationships:
+                continue
+            cat.relationships.add_record(self)
+
     @staticmethod
     def mediate_relationship(mediator, cat1, cat2, allow_romantic, sabotage=False):
         # Gather some important info
@@ -2984,12 +3072,15 @@ class Cat:
             return ob if (ob := Cat.load_faded_cat(ID)) else None
 
     @staticmethod
-    def load_faded_cat(cat: str):
-        """Loads a faded cat, returning the cat object. This object is saved nowhere else."""
-
+    def fetch_faded_record(cat_ID: str) -> Optional[FadedCat]:
+        """
+        The saved record of a faded cat, for when a whole Cat isn't needed. Records are
+        only read once, so this is cheap to call again.
+        :return: the record, or None if there's no faded cat with this ID
+        """
         # just preventing any attempts to load something that isn't a cat ID
-        if not cat.isdigit():
-            return
+        if not cat_ID.isdigit():
+            return None
 
         try:
             # todo: why can't this be `get_switch(Switch.clan_name)`?
@@ -2998,63 +3089,51 @@ class Cat:
                 if game.clan is None
                 else game.clan.name
             )
+            return save_load.get_save_backend(clan).get_faded_cat(cat_ID)
+        except (OSError, ValueError, IndexError):
+            # IndexError: there's no clan to load from
+            logger.exception("Failed to load the faded cat %s", cat_ID)
+            return None
 
-            with open(
-                get_save_dir() + "/" + clan + "/faded_cats/" + cat + ".json",
-                "r",
-                encoding="utf-8",
-            ) as read_file:
-                cat_info = ujson.loads(read_file.read())
-                # If loading cats is attempted before the Clan is loaded, we would need to use this.
-
-        except (
-            AttributeError
-        ):  # NOPE, cats are always loaded before the Clan, so doesn't make sense to throw an error
-            with open(
-                get_save_dir()
-                + "/"
-                + switch_get_value(Switch.clan_list)[0]
-                + "/faded_cats/"
-                + cat
-                + ".json",
-                "r",
-                encoding="utf-8",
-            ) as read_file:
-                cat_info = ujson.loads(read_file.read())
-        except:
-            print("ERROR: in loading faded cat")
+    @staticmethod
+    def load_faded_cat(cat: str):
+        """
+        Loads a faded cat, returning the cat object. The same object is handed out
+        again while the faded cat's record stays the same.
+        """
+        record = Cat.fetch_faded_record(cat)
+        if record is None:
+            if cat.isdigit():
+                print("ERROR: in loading faded cat")
             return False
 
-        if isinstance(cat_info["status"], str):
-            status_dict = {"rank": cat_info["status"]}
-        else:
-            status_dict = cat_info["status"]
+        cached = Cat._faded_cats.get(cat)
+        if cached is not None and cached[0] is record:
+            Cat._faded_cats.move_to_end(cat)
+            return cached[1]
 
         cat_ob = Cat(
-            ID=cat_info["ID"],
-            prefix=cat_info["name_prefix"],
-            suffix=cat_info["name_suffix"],
-            status_dict=status_dict,
-            moons=cat_info["moons"],
+            ID=record.ID,
+            prefix=record.name_prefix,
+            suffix=record.name_suffix,
+            status_dict=record.status_dict(),
+            moons=record.moons,
             faded=True,
         )
-        if cat_info["parent1"]:
-            cat_ob.parent1 = cat_info["parent1"]
-        if cat_info["parent2"]:
-            cat_ob.parent2 = cat_info["parent2"]
-        cat_ob.faded_offspring = cat_info["faded_offspring"]
-        cat_ob.adoptive_parents = (
-            cat_info["adoptive_parents"] if "adoptive_parents" in cat_info else []
-        )
+        cat_ob.parent1 = record.parent1
+        cat_ob.parent2 = record.parent2
+        cat_ob.faded_offspring = list(record.faded_offspring)
+        cat_ob.adoptive_parents = list(record.adoptive_parents)
         cat_ob.faded = True
 
-        if cat_info.get("df"):
-            cat_ob.status.send_to_afterlife(target_ID=CatGroup.DARK_FOREST_ID)
-        elif isinstance(cat_info["status"], str):
-            cat_ob.status.send_to_afterlife(target_ID=CatGroup.STARCLAN_ID)
+        if record.afterlife_ID:
+            cat_ob.status.send_to_afterlife(target_ID=record.afterlife_ID)
 
-        cat_ob.dead_for = cat_info["dead_for"] if "dead_for" in cat_info else 1
+        cat_ob.dead_for = record.dead_for
 
+        Cat._faded_cats[cat] = (record, cat_ob)
+        if len(Cat._faded_cats) > FADED_CATS_KEPT:
+            Cat._faded_cats.popitem(last=False)
         return cat_ob
 
     # ---------------------------------------------------------------------------- #
@@ -3215,11 +3294,10 @@ class Cat:
             return self._sprite
 
         # Update the sprite
-        if self.pelt.rebuild_sprite or self.not_working() != self._sprite_working:
+        if self.sprite_outdated:
             self.pelt.rebuild_sprite = False
             self._sprite_working = self.not_working()
             update_sprite(self)
-            update_mask(self)
         return self._sprite
 
     @sprite.setter
@@ -3227,18 +3305,18 @@ class Cat:
         self._sprite = new_sprite
 
     @property
-    def sprite_mask(self):
-        if (
-            scripts.game_structure.screen_settings.screen_scale
-            != self.pelt.screen_scale
-        ):
-            self.pelt.screen_scale = scripts.game_structure.screen_settings.screen_scale
-            update_mask(self)
-        return self._sprite_mask
+    def sprite_outdated(self) -> bool:
+        """Whether the sprite will be rebuilt the next time it's used"""
+        return not self.faded and (
+            self.pelt.rebuild_sprite or self.not_working() != self._sprite_working
+        )
 
-    @sprite_mask.setter
-    def sprite_mask(self, val):
-        self._sprite_mask = val
+    @property
+    def sprite_mask(self) -> Optional["pygame.Mask"]:
+        if self.faded or self.dead:
+            # should never need a mask since they can't appear on the Clan screen
+            return None
+        return get_click_mask(self.sprite)
 
     # ---------------------------------------------------------------------------- #
     #                                  other                                       #
@@ -0,0 +1,225 @@
+"""
+Live indexes of the registered cats by group, rank, age and conditions, so that finding
+e.g. the working medicine cats of the Clan only looks at the cats that could match,
+instead of at every cat that ever lived.
+
+Status files its cat under its group and rank whenever they change, Cat files its age
+and the cat's ConditionDicts tell the roster when it becomes ill or injured, or heals.
+The indexes hold IDs, the cats themselves are in Cat.all_cats.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from scripts.cat.cat_pool import CatPool
+from scripts.cat.enums import CatAge, CatRank
+
+
+class _Filing:
+    """What a cat is filed under"""
+
+    __slots__ = ("group_ID", "rank", "age")
+
+    def __init__(
+        self, group_ID: Optional[str], rank: CatRank, age: Optional[CatAge] = None
+    ):
+        self.group_ID = group_ID
+        self.rank = rank
+        self.age = age
+
+
+class ClanRoster:
+    __slots__ = ("groups", "_ranks", "_ages", "_ill", "_injured", "_filed")
+
+    def __init__(self):
+        self.groups: Dict[Optional[str], CatPool] = defaultdict(CatPool)
+        """IDs of every registered cat, keyed by the group_ID they currently belong to"""
+        self._ranks: Dict[Tuple[Optional[str], CatRank], Dict[str, None]] = defaultdict(
+            dict
+        )
+        """(group_ID, rank) -> IDs, the dicts are used as ordered sets"""
+        self._ages: Dict[
+            Tuple[Optional[str], Optional[CatAge]], Dict[str, None]
+        ] = defaultdict(dict)
+        """(group_ID, age) -> IDs"""
+        self._ill: Dict[str, None] = {}
+        self._injured: Dict[str, None] = {}
+        self._filed: Dict[str, _Filing] = {}
+
+    def __contains__(self, cat_ID: str) -> bool:
+        return cat_ID in self._filed
+
+    # FILING
+    def file_status(self, cat_ID: str, group_ID: Optional[str], rank: CatRank):
+        """Files the cat under its current group and rank, moving it if they changed."""
+        filing = self._filed.get(cat_ID)
+        if filing is None:
+            filing = self._filed[cat_ID] = _Filing(group_ID, rank)
+            self.groups[group_ID].add(cat_ID)
+            self._ranks[(group_ID, rank)][cat_ID] = None
+            self._ages[(group_ID, None)][cat_ID] = None
+            return
+        if filing.group_ID == group_ID and filing.rank == rank:
+            return
+
+        self._ranks[(filing.group_ID, filing.rank)].pop(cat_ID, None)
+        self._ranks[(group_ID, rank)][cat_ID] = None
+        if filing.group_ID != group_ID:
+            self.groups[filing.group_ID].discard(cat_ID)
+            self.groups[group_ID].add(cat_ID)
+            self._ages[(filing.group_ID, filing.age)].pop(cat_ID, None)
+            self._ages[(group_ID, filing.age)][cat_ID] = None
+        filing.group_ID = group_ID
+        filing.rank = rank
+
+    def file_age(self, cat_ID: str, age: Optional[CatAge]):
+        """Files the cat under its current age, if the cat is registered."""
+        filing = self._filed.get(cat_ID)
+        if filing is None or filing.age == age:
+            return
+        self._ages[(filing.group_ID, filing.age)].pop(cat_ID, None)
+        self._ages[(filing.group_ID, age)][cat_ID] = None
+        filing.age = age
+
+    def file_conditions(self, cat_ID: str, ill: bool, injured: bool):
+        for flagged, is_flagged in ((self._ill, ill), (self._injured, injured)):
+            if is_flagged:
+                flagged[cat_ID] = None
+            else:
+                flagged.pop(cat_ID, None)
+
+    def remove(self, cat_ID: str):
+        """Forgets the cat, used when it's removed from the game entirely."""
+        filing = self._filed.pop(cat_ID, None)
+        self._ill.pop(cat_ID, None)
+        self._injured.pop(cat_ID, None)
+        if filing is None:
+            return
+        self.groups[filing.group_ID].discard(cat_ID)
+        self._ranks[(filing.group_ID, filing.rank)].pop(cat_ID, None)
+        self._ages[(filing.group_ID, filing.age)].pop(cat_ID, None)
+
+    def clear(self):
+        """Forgets every cat, used when every cat is being unloaded."""
+        self.groups.clear()
+        self._ranks.clear()
+        self._ages.clear()
+        self._ill.clear()
+        self._injured.clear()
+        self._filed.clear()
+
+    # QUERIES
+    def count(self, group_ID: Optional[str]) -> int:
+        pool = self.groups.get(group_ID)
+        return len(pool) if pool else 0
+
+    def in_group(self, group_ID: Optional[str]) -> List[str]:
+        pool = self.groups.get(group_ID)
+        return list(pool) if pool else []
+
+    def with_rank(self, group_ID: Optional[str], ranks: Iterable[CatRank]) -> List[str]:
+        """:return: the IDs of the cats in the group that hold any of the ranks"""
+        found = []
+        for rank in ranks:
+            filed = self._ranks.get((group_ID, rank))
+            if filed:
+                found.extend(filed)
+        return found
+
+    def with_age(
+        self, group_ID: Optional[str], ages: Iterable[Optional[CatAge]]
+    ) -> List[str]:
+        """:return: the IDs of the cats in the group that are any of the ages"""
+        found = []
+        for age in ages:
+            filed = self._ages.get((group_ID, age))
+            if filed:
+                found.extend(filed)
+        return found
+
+    def ill(self, group_ID: Optional[str]) -> List[str]:
+        """:return: the IDs of the cats in the group that have an illness"""
+        return [i for i in self._ill if self._in_group(i, group_ID)]
+
+    def injured(self, group_ID: Optional[str]) -> List[str]:
+        """:return: the IDs of the cats in the group that have an injury"""
+        return [i for i in self._injured if self._in_group(i, group_ID)]
+
+    def unwell(self, group_ID: Optional[str]) -> List[str]:
+        """:return: the IDs of the cats in the group that are ill or injured"""
+        return [
+            i for i in {**self._ill, **self._injured} if self._in_group(i, group_ID)
+        ]
+
+    def _in_group(self, cat_ID: str, group_ID: Optional[str]) -> bool:
+        filing = self._filed.get(cat_ID)
+        return filing is not None and filing.group_ID == group_ID
+
+
+clan_roster = ClanRoster()
+
+
+class ConditionDict(dict):
+    """
+    A cat's illnesses or injuries, which tells the clan roster whenever the cat gets its
+    first one or loses its last one. Copies are plain dicts.
+    """
+
+    __slots__ = ("_cat",)
+
+    def __init__(self, cat, *args, **kwargs):
+        """:param Cat cat: the cat whose conditions these are"""
+        self._cat = cat
+        super().__init__(*args, **kwargs)
+
+    def __reduce_ex__(self, protocol):
+        return dict, (dict(self),)
+
+    def changed(self):
+        """Tells the clan roster whether the cat is ill and injured now."""
+        cat_ID = self._cat.status.cat_ID
+        if cat_ID is not None:
+            clan_roster.file_conditions(
+                cat_ID, bool(self._cat.illnesses), bool(self._cat.injuries)
+            )
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if len(self) == 1:
+            self.changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        if not self:
+            self.changed()
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        self.changed()
+        return self
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        if not self:
+            self.changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        if not self:
+            self.changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self.changed()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.changed()
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        if len(self) == 1:
+            self.changed()
+        return value
@@ -0,0 +1,75 @@
+"""
+The saved record of a faded cat. Faded cats only keep what relation tracking needs, so
+most code that looks one up needs no more than this, and doesn't have to build a whole
+Cat for it.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import ujson
+
+from scripts.cat.enums import CatGroup
+
+
+@dataclass(frozen=True, slots=True)
+class FadedCat:
+    """
+    A faded cat's record, as SaveBackend.get_faded_cat hands it out. The same record is
+    shared by everyone who asks for that cat, so it can't be changed.
+    """
+
+    ID: str
+    name_prefix: str
+    name_suffix: str
+    moons: int
+    dead_for: int
+    parent1: Optional[str]
+    parent2: Optional[str]
+    adoptive_parents: Tuple[str, ...]
+    faded_offspring: Tuple[str, ...]
+    afterlife_ID: Optional[str]
+    """the afterlife older saves didn't keep in the status, if any"""
+    _status: str
+    """the saved status as json, see status_dict()"""
+
+    @classmethod
+    def from_record(cls, record: dict) -> "FadedCat":
+        """:param record: the dict Cat.get_save_dict(faded=True) made"""
+        status = record["status"]
+        if record.get("df"):
+            afterlife_ID = CatGroup.DARK_FOREST_ID
+        elif isinstance(status, str):
+            afterlife_ID = CatGroup.STARCLAN_ID
+        else:
+            afterlife_ID = None
+        return cls(
+            ID=record["ID"],
+            name_prefix=record["name_prefix"],
+            name_suffix=record["name_suffix"],
+            moons=record["moons"],
+            dead_for=record.get("dead_for", 1),
+            parent1=record["parent1"] or None,
+            parent2=record["parent2"] or None,
+            adoptive_parents=tuple(record.get("adoptive_parents", ())),
+            faded_offspring=tuple(record["faded_offspring"]),
+            afterlife_ID=afterlife_ID,
+            _status=ujson.dumps(
+                {"rank": status} if isinstance(status, str) else status
+            ),
+        )
+
+    @property
+    def mate(self) -> Tuple[str, ...]:
+        """Faded cats have no mates, they're broken up when a cat fades."""
+        return ()
+
+    def get_parents(self) -> Tuple[str, ...]:
+        """:return: the blood and adoptive parents"""
+        return tuple(p for p in (self.parent1, self.parent2) if p) + (
+            self.adoptive_parents
+        )
+
+    def status_dict(self) -> dict:
+        """:return: a fresh copy of the saved status, for Status(**status_dict)"""
+        return ujson.loads(self._status)
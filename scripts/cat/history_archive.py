@@ -0,0 +1,272 @@
+"""
+Single-file storage for cat histories.
+
+A clan's histories are kept in two files inside its history folder:
+
+- histories.jsonl: append-only, one {"ID": ..., "history": {...}} record per line. A
+  changed history is appended again, the older line becomes garbage that's dropped the
+  next time the archive is compacted.
+- histories_index.json: cat ID -> [offset, length] of that cat's current line.
+
+The index is read once per clan, after that loading a history is a seek and a read on
+an already open file, so histories of cats nobody looks at (mostly dead ones) never
+cost anything at startup.
+
+The old format (one {ID}_history.json file per cat) is still read for cats that aren't
+in the archive yet, and is moved into it the next time that cat's history is saved.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Set, Tuple, Union
+
+import ujson
+
+from scripts.game_structure.game.save_load import (
+    run_file_operation,
+    safe_remove,
+    save_writer,
+)
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FILE = "histories.jsonl"
+INDEX_FILE = "histories_index.json"
+LEGACY_SUFFIX = "_history.json"
+
+COMPACT_MIN_BYTES = 1 << 20
+"""Below this size, garbage in the archive is never worth compacting away"""
+
+
+def _record_line(cat_ID: str, history_text: str) -> bytes:
+    return f'{{"ID":{ujson.dumps(cat_ID)},"history":{history_text}}}\n'.encode("utf-8")
+
+
+class HistoryArchive:
+    """
+    In-memory index of a clan's history archive: where in histories.jsonl each cat's
+    history is, plus the histories that were saved but may not be on disk yet.
+    """
+
+    def __init__(self):
+        self.directory: Optional[Path] = None
+        self._entries: Dict[str, Tuple[int, int]] = {}
+        self._size = 0
+        self._garbage = 0
+        self._legacy_IDs: Set[str] = set()
+        self._pending: Dict[str, str] = {}
+        """cat ID -> history json, added since the last flush"""
+        self._unwritten: Dict[str, str] = {}
+        """what the last flush wrote, which a background save may still be writing"""
+        self._reader: Optional[BinaryIO] = None
+
+    def close(self):
+        """Forgets the currently opened archive."""
+        if self._reader is not None:
+            self._reader.close()
+        self.__init__()
+
+    def forget_saved_state(self):
+        """
+        Called after a save failed. The archive is read again from disk the next time
+        it's used, and what the last flush wrote is written again by the next one.
+        """
+        pending = {**self._unwritten, **self._pending}
+        self.close()
+        self._pending = pending
+
+    def __contains__(self, cat_ID: str) -> bool:
+        return (
+            cat_ID in self._pending
+            or cat_ID in self._entries
+            or cat_ID in self._legacy_IDs
+        )
+
+    # ---------------------------------------------------------------------------- #
+    #                                    loading                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def open(self, directory: Union[str, Path]):
+        """Reads the index of the archive in directory, if it isn't the one already open."""
+        directory = Path(directory)
+        if directory == self.directory:
+            return
+        self.close()
+        self.directory = directory
+        if not directory.exists():
+            return
+        # the index has to match what's on disk
+        save_writer.wait()
+
+        archive_path = directory / ARCHIVE_FILE
+        if archive_path.exists():
+            self._size = archive_path.stat().st_size
+            try:
+                self._read_index(directory)
+            except (OSError, ValueError, TypeError):
+                logger.exception("Could not read history index in %s", directory)
+                self._entries = self._scan_archive(archive_path)
+            self._garbage = self._size - sum(
+                length + 1 for _, length in self._entries.values()
+            )
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(LEGACY_SUFFIX):
+                    self._legacy_IDs.add(entry.name[: -len(LEGACY_SUFFIX)])
+
+    def _read_index(self, directory: Path):
+        index_path = directory / INDEX_FILE
+        if not index_path.exists():
+            # the archive was written but the index wasn't, rebuild it
+            self._entries = self._scan_archive(directory / ARCHIVE_FILE)
+            return
+        with open(index_path, "r", encoding="utf-8") as read_file:
+            index = ujson.loads(read_file.read())
+        for cat_ID, (offset, length) in index.items():
+            if offset + length < self._size:
+                self._entries[cat_ID] = (offset, length)
+
+    @staticmethod
+    def _scan_archive(path: Path) -> Dict[str, Tuple[int, int]]:
+        entries = {}
+        offset = 0
+        with open(path, "rb") as read_file:
+            for line in read_file:
+                try:
+                    entries[ujson.loads(line)["ID"]] = (offset, len(line) - 1)
+                except (ValueError, KeyError, TypeError):
+                    pass
+                offset += len(line)
+        return entries
+
+    def read(self, directory: Union[str, Path], cat_ID: str) -> Optional[dict]:
+        """
+        :return: the saved history of the cat, or None if it has none
+        :raises ValueError: if the saved history can't be parsed
+        """
+        self.open(directory)
+        text = self._pending.get(cat_ID)
+        if text is None:
+            text = self._unwritten.get(cat_ID)
+        if text is not None:
+            return ujson.loads(text)
+
+        entry = self._entries.get(cat_ID)
+        if entry is None:
+            if cat_ID not in self._legacy_IDs:
+                return None
+            with open(
+                self.directory / f"{cat_ID}{LEGACY_SUFFIX}", "r", encoding="utf-8"
+            ) as read_file:
+                return ujson.loads(read_file.read())
+
+        return ujson.loads(self._read_line(entry))["history"]
+
+    def _read_line(self, entry: Tuple[int, int]) -> bytes:
+        if self._reader is None:
+            # anything in the index has been queued for writing, make sure it's there
+            save_writer.wait()
+            self._reader = open(self.directory / ARCHIVE_FILE, "rb")
+        elif save_writer.is_busy():
+            save_writer.wait()
+        offset, length = entry
+        self._reader.seek(offset)
+        return self._reader.read(length)
+
+    # ---------------------------------------------------------------------------- #
+    #                                    saving                                    #
+    # ---------------------------------------------------------------------------- #
+
+    def add(self, cat_ID: str, history_text: str):
+        """Stores a changed history. It's written to disk by the next flush."""
+        self._pending[cat_ID] = history_text
+
+    def flush(self, directory: Union[str, Path]):
+        """Writes every history added since the last flush."""
+        if not self._pending:
+            return
+        directory = Path(directory)
+        pending, self._pending = self._pending, {}
+        self.open(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        for cat_ID in pending:
+            entry = self._entries.get(cat_ID)
+            if entry is not None:
+                self._garbage += entry[1] + 1
+
+        if self._size > COMPACT_MIN_BYTES and self._garbage * 2 > self._size:
+            self._write_full(directory, pending)
+        else:
+            self._write_changes(directory, pending)
+
+        run_file_operation(
+            _replace_file,
+            directory / INDEX_FILE,
+            ujson.dumps({i: list(entry) for i, entry in self._entries.items()}),
+        )
+
+        for cat_ID in pending.keys() & self._legacy_IDs:
+            safe_remove(directory / f"{cat_ID}{LEGACY_SUFFIX}")
+            self._legacy_IDs.discard(cat_ID)
+
+    def _write_changes(self, directory: Path, pending: Dict[str, str]):
+        lines = []
+        offset = self._size
+        for cat_ID, history_text in pending.items():
+            line = _record_line(cat_ID, history_text)
+            self._entries[cat_ID] = (offset, len(line) - 1)
+            offset += len(line)
+            lines.append(line)
+        run_file_operation(_append_file, directory / ARCHIVE_FILE, b"".join(lines))
+        self._size = offset
+        self._unwritten = pending
+
+    def _write_full(self, directory: Path, pending: Dict[str, str]):
+        histories = {
+            cat_ID: ujson.dumps(self.read(directory, cat_ID))
+            for cat_ID in self._entries
+            if cat_ID not in pending
+        }
+        histories.update(pending)
+        if self._reader is not None:
+            # the file is about to be replaced
+            self._reader.close()
+            self._reader = None
+
+        lines = []
+        self._entries = {}
+        offset = 0
+        for cat_ID, history_text in histories.items():
+            line = _record_line(cat_ID, history_text)
+            self._entries[cat_ID] = (offset, len(line) - 1)
+            offset += len(line)
+            lines.append(line)
+        run_file_operation(_replace_file, directory / ARCHIVE_FILE, b"".join(lines))
+        self._size = offset
+        self._garbage = 0
+        # the new offsets aren't valid until the file has been replaced
+        self._unwritten = histories
+
+
+def _replace_file(path: Path, data: Union[str, bytes]):
+    temp_path = path.with_name(path.name + ".tmp")
+    mode = "wb" if isinstance(data, bytes) else "w"
+    encoding = None if isinstance(data, bytes) else "utf-8"
+    with open(temp_path, mode, encoding=encoding) as write_file:
+        write_file.write(data)
+        write_file.flush()
+        os.fsync(write_file.fileno())
+    os.replace(temp_path, path)
+
+
+def _append_file(path: Path, data: bytes):
+    with open(path, "ab") as write_file:
+        write_file.write(data)
+        write_file.flush()
+        os.fsync(write_file.fileno())
+
+
+history_archive = HistoryArchive()
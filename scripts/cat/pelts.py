@@ -4,7 +4,6 @@ from re import sub
 
 import i18n
 
-import scripts.game_structure.screen_settings
 from scripts.cat.enums import CatAge
 from scripts.cat.sprites.load_sprites import sprites
 from scripts.game_structure import constants
@@ -247,7 +246,6 @@ class Pelt:
         )
         self.tint = tint
         self.white_patches_tint = white_patches_tint
-        self.screen_scale = scripts.game_structure.screen_settings.screen_scale
 
         # converting old pose numbers into names
         if any(
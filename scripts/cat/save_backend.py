@@ -0,0 +1,176 @@
+"""
+Where a clan's cats, faded cats, histories and relationships are stored.
+
+Every clan save uses one SaveBackend. JsonSaveBackend (scripts/cat/save_load.py) is the
+folder of json files clans have always been saved as, SqliteSaveBackend
+(scripts/cat/sqlite_save.py) keeps the same data in indexed tables of a single clan.db.
+A clan uses sqlite if its folder has a clan.db, see save_load.get_save_backend.
+
+Conditions, events, clan.json and the other clan files are json files either way.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+
+from scripts.cat.faded_cat import FadedCat
+from scripts.cat_relations.relationship_save import SavedRow
+
+if TYPE_CHECKING:
+    from scripts.cat.cats import Cat
+
+FADED_CACHE_SIZE = 4096
+"""Faded cat records kept in memory, the least recently used ones are dropped."""
+
+
+class SaveBackend(ABC):
+    """
+    Storage of one clan's cats, faded cats, histories and relationships.
+
+    Saving may happen in the background (see background_save), so what a backend was
+    asked to write isn't necessarily on disk yet. Faded cats and histories that were
+    saved are kept in memory until the next save, so reading them back always works.
+
+    Faded cats are also kept as FadedCat records once they were read, up to
+    FADED_CACHE_SIZE of them, so looking up the same faded cat again is a dict lookup.
+    """
+
+    name = ""
+
+    def __init__(self, clanname: str):
+        self.clanname = clanname
+        self._pending_faded: Dict[str, dict] = {}
+        self._unwritten_faded: Dict[str, dict] = {}
+        self._faded_records: "OrderedDict[str, Optional[FadedCat]]" = OrderedDict()
+
+    def close(self):
+        """Releases anything the backend keeps open."""
+
+    def forget_saved_state(self):
+        """
+        Called after a save failed, when it's unknown what of it is on disk. What was
+        saved but may not have been written is written again by the next save, which
+        writes everything instead of only the changes.
+        """
+        self._pending_faded = {**self._unwritten_faded, **self._pending_faded}
+        self._unwritten_faded = {}
+
+    @contextmanager
+    def saving(self):
+        """
+        Groups the writes of one save. Backends that can write a whole save at once
+        hold their writes back until the block ends.
+        """
+        yield
+
+    # ---------------------------------------------------------------------------- #
+    #                                     cats                                     #
+    # ---------------------------------------------------------------------------- #
+
+    @abstractmethod
+    def load_cat_records(self) -> list:
+        """
+        :return: the saved record of every cat that isn't faded
+        :raises FileNotFoundError: if the clan has no saved cats
+        """
+
+    @abstractmethod
+    def save_cat_records(self, records: Dict[str, str], changed_IDs: Set[str]) -> int:
+        """
+        :param records: cat ID -> json text of the record, for every cat
+        :param changed_IDs: IDs whose record was added, changed or removed since the
+            last save
+        :return: how many files or rows were written
+        """
+
+    # ---------------------------------------------------------------------------- #
+    #                                  faded cats                                  #
+    # ---------------------------------------------------------------------------- #
+
+    @abstractmethod
+    def faded_cat_IDs(self) -> List[str]:
+        """:return: the IDs of every saved faded cat"""
+
+    def load_faded_cat(self, cat_ID: str) -> Optional[dict]:
+        """:return: the saved record of a faded cat, or None if there's none"""
+        record = self._pending_faded.get(cat_ID)
+        if record is None:
+            record = self._unwritten_faded.get(cat_ID)
+        if record is not None:
+            return record
+        return self._read_faded_cat(cat_ID)
+
+    def get_faded_cat(self, cat_ID: str) -> Optional[FadedCat]:
+        """
+        :return: the faded cat, or None if there's none. It's only read the first time.
+        :raises OSError, ValueError: if the saved record can't be read
+        """
+        if cat_ID in self._faded_records:
+            self._faded_records.move_to_end(cat_ID)
+            return self._faded_records[cat_ID]
+
+        record = self.load_faded_cat(cat_ID)
+        faded_cat = FadedCat.from_record(record) if record is not None else None
+        self._faded_records[cat_ID] = faded_cat
+        if len(self._faded_records) > FADED_CACHE_SIZE:
+            self._faded_records.popitem(last=False)
+        return faded_cat
+
+    def save_faded_cat(self, cat_ID: str, record: dict):
+        """Stores a faded cat's record. It's written by the next flush_faded_cats()."""
+        self._pending_faded[cat_ID] = record
+        self._faded_records.pop(cat_ID, None)
+
+    def flush_faded_cats(self):
+        if not self._pending_faded:
+            return
+        pending, self._pending_faded = self._pending_faded, {}
+        self._write_faded_cats(pending)
+        self._unwritten_faded = pending
+
+    @abstractmethod
+    def _read_faded_cat(self, cat_ID: str) -> Optional[dict]:
+        """:return: the faded cat's record as saved on disk, or None if there's none"""
+
+    @abstractmethod
+    def _write_faded_cats(self, records: Dict[str, dict]):
+        """Writes the records of faded cats, by cat ID."""
+
+    # ---------------------------------------------------------------------------- #
+    #                                   histories                                  #
+    # ---------------------------------------------------------------------------- #
+
+    @abstractmethod
+    def load_history(self, cat_ID: str) -> Optional[dict]:
+        """
+        :return: the saved history of a cat, or None if it has none
+        :raises ValueError: if the saved history can't be parsed
+        """
+
+    @abstractmethod
+    def add_history(self, cat_ID: str, history_text: str):
+        """Stores a changed history. It's written by the next flush_histories()."""
+
+    @abstractmethod
+    def flush_histories(self):
+        """Writes the histories stored with add_history()."""
+
+    # ---------------------------------------------------------------------------- #
+    #                                 relationships                                #
+    # ---------------------------------------------------------------------------- #
+
+    @abstractmethod
+    def has_relationships(self) -> bool:
+        """Whether relationships can be loaded with take_relationship_rows."""
+
+    @abstractmethod
+    def take_relationship_rows(self, cat_ID: str) -> Optional[List[SavedRow]]:
+        """:return: the saved relationships of a cat, or None if it has none"""
+
+    @abstractmethod
+    def save_relationships(self, cats: Iterable["Cat"]):
+        """
+        Saves the relationships of all living cats, and marks them as saved. Only
+        writes what changed since the last save, where possible.
+        """
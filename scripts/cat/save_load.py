@@ -1,10 +1,16 @@
 import os
+import zlib
 from pathlib import Path
-from typing import TYPE_CHECKING, Type, List
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Set, Type, List
 
 import ujson
 
-from scripts.game_structure.game.save_load import safe_save
+from scripts.cat.history_archive import history_archive
+from scripts.cat.save_backend import SaveBackend
+from scripts.cat.sqlite_save import SqliteSaveBackend, get_db_path, has_sqlite_save
+from scripts.cat_relations.relationship_save import SavedRow, relationship_pack
+from scripts.game_structure.game.save_load import safe_save, safe_remove, save_writer
 from scripts.game_structure.game.settings.settings import game_setting_get
 from scripts.housekeeping.datadir import get_save_dir
 
@@ -18,55 +24,242 @@ faded_ids = []
 cat_to_fade = []
 """Cats who have been faded since the last save"""
 
+CAT_SHARD_DIR = "clan_cats"
+CAT_SHARD_COUNT = 32
+"""clan_cats is split over this many files, so a save only rewrites the ones that changed"""
+
+
+def get_cat_shard(cat_ID: str) -> int:
+    return zlib.crc32(cat_ID.encode("utf-8")) % CAT_SHARD_COUNT
+
+
+def get_cat_shard_path(clanname: str, shard: int) -> Path:
+    return Path(get_save_dir()) / clanname / CAT_SHARD_DIR / f"cats_{shard:02}.json"
+
+
+class CatSaveCache:
+    """
+    What the last save (or load) wrote for each cat, as json text. A save compares
+    against this to find out which records actually changed and only writes those.
+    """
+
+    def __init__(self):
+        self.clanname: Optional[str] = None
+        self.records: Dict[str, str] = {}
+        """cat ID -> clan_cats record"""
+        self.shards_on_disk: Set[int] = set()
+        self.conditions: Dict[str, Optional[str]] = {}
+        """cat ID -> conditions file contents, or None if the cat has no conditions file"""
+        self.histories: Dict[str, str] = {}
+        self.last_stats: Dict[str, dict] = {}
+        """timings and counts of the last save, per stage"""
+        self.writer_failures = save_writer.failures
+        """failed background saves when this was last known to match what's on disk"""
+
+    def reset(self, clanname: Optional[str] = None):
+        self.__init__()
+        self.clanname = clanname
+
+
+save_cache = CatSaveCache()
+
 
 def save_cats(clanname, cat_class: Type["Cat"], game: "Game"):
-    """Save the cat data."""
+    """Save the cat data. Only records that changed since the last save are written."""
 
     directory = Path(get_save_dir()) / clanname
-    history_dir = directory / "history"
-    relationships_dir = directory / "relationships"
+    condition_dir = directory / "conditions"
+    backend = get_save_backend(clanname)
 
     if not directory.exists():
         directory.mkdir(parents=True)
 
-    # Delete all existing relationship files
-    if not relationships_dir.exists():
-        relationships_dir.mkdir()
-    for f in relationships_dir.glob("*.json"):
-        f.unlink()
+    if save_cache.clanname != clanname:
+        save_cache.reset(clanname)
+
+    # only changes are written on top of the last save, so it has to be on disk
+    save_writer.wait()
+    if save_cache.writer_failures != save_writer.failures:
+        _forget_saved_state(clanname, backend)
+
+    stats = {}
+    try:
+        # sqlite writes everything below as one transaction once the block ends
+        with backend.saving():
+            start = perf_counter()
+            faded_count = len(cat_to_fade)
+            # Fades cat and saves them, if needed
+            save_faded_cats(clanname, cat_class, game)
+            stats["faded"] = {"seconds": perf_counter() - start, "written": faded_count}
+
+            all_cats = list(cat_class.all_cats.values())
+
+            start = perf_counter()
+            records = {}
+            changed_IDs = set()
+            for inter_cat in all_cats:
+                text = ujson.dumps(inter_cat.get_save_dict(), indent=4)
+                records[inter_cat.ID] = text
+                if save_cache.records.get(inter_cat.ID) != text:
+                    changed_IDs.add(inter_cat.ID)
+            changed = len(changed_IDs)
+            # faded or otherwise removed since the last save
+            changed_IDs.update(save_cache.records.keys() - records.keys())
+            written = backend.save_cat_records(records, changed_IDs)
+            save_cache.records = records
+            stats["cats"] = {
+                "seconds": perf_counter() - start,
+                "cats": len(all_cats),
+                "changed": changed,
+                "written": written,
+            }
+
+            start = perf_counter()
+            written = 0
+            for inter_cat in all_cats:
+                conditions = inter_cat.get_condition_dict()
+                text = ujson.dumps(conditions, indent=4) if conditions else None
+                if inter_cat.ID in save_cache.conditions:
+                    if save_cache.conditions[inter_cat.ID] == text:
+                        continue
+                elif text is None:
+                    # nothing known about this cat yet, remove any stale file
+                    safe_remove(condition_dir / f"{inter_cat.ID}_conditions.json")
+                    save_cache.conditions[inter_cat.ID] = None
+                    continue
+                condition_path = condition_dir / f"{inter_cat.ID}_conditions.json"
+                if text is None:
+                    safe_remove(condition_path)
+                else:
+                    safe_save(condition_path, text)
+                save_cache.conditions[inter_cat.ID] = text
+                written += 1
+            stats["conditions"] = {
+                "seconds": perf_counter() - start,
+                "cats": len(all_cats),
+                "written": written,
+            }
+
+            start = perf_counter()
+            written = 0
+            for inter_cat in all_cats:
+                # a history that hasn't been loaded since the last save can't have changed
+                if inter_cat._history is None:
+                    continue
+                if inter_cat.save_history(backend):
+                    written += 1
+                # after saving, dump the history info
+                inter_cat.history = None
+            backend.flush_histories()
+            stats["history"] = {"seconds": perf_counter() - start, "written": written}
+
+            start = perf_counter()
+            # only writes the relationships that changed since the last save
+            backend.save_relationships(all_cats)
+            stats["relationships"] = {"seconds": perf_counter() - start}
+    except Exception:
+        # it's unknown what of this save made it to disk
+        _forget_saved_state(clanname, backend)
+        raise
+
+    stats["total"] = {
+        "seconds": sum(stage["seconds"] for stage in stats.values()),
+        "cats": len(all_cats),
+    }
+    save_cache.last_stats = stats
+
+
+def _forget_saved_state(clanname, backend: SaveBackend):
+    """After a failed save, makes the next one write everything again."""
+    save_cache.reset(clanname)
+    backend.forget_saved_state()
+
+
+def _write_cat_shards(clanname: str, records: Dict[str, str], shards: Set[int]):
+    if not shards:
+        return
+
+    shard_dir = Path(get_save_dir()) / clanname / CAT_SHARD_DIR
+    shard_dir.mkdir(exist_ok=True)
+
+    by_shard: Dict[int, List[str]] = {shard: [] for shard in shards}
+    for cat_ID, text in records.items():
+        shard = get_cat_shard(cat_ID)
+        if shard in by_shard:
+            by_shard[shard].append(text)
+
+    for shard, texts in by_shard.items():
+        safe_save(get_cat_shard_path(clanname, shard), f"[{','.join(texts)}]")
+        save_cache.shards_on_disk.add(shard)
 
-    save_faded_cats(clanname, cat_class, game)  # Fades cat and saves them, if needed
+    # the single-file format has been replaced by the shards
+    safe_remove(Path(get_save_dir()) / clanname / "clan_cats.json")
 
-    clan_cats = []
-    for inter_cat in cat_class.all_cats.values():
-        cat_data = inter_cat.get_save_dict()
-        clan_cats.append(cat_data)
 
-        inter_cat.save_condition()
+def load_cat_records(clanname) -> list:
+    """
+    Reads the saved cat records of a clan.
+    :raises FileNotFoundError: if the clan has no saved cats
+    """
+    save_cache.reset(clanname)
+    records = get_save_backend(clanname).load_cat_records()
+    for record in records:
+        save_cache.records[record["ID"]] = ujson.dumps(record, indent=4)
+    return records
 
-        if inter_cat.history:
-            inter_cat.save_history(history_dir)
-            # after saving, dump the history info
-            inter_cat.history = None
-        if not inter_cat.dead:
-            inter_cat.save_relationship_of_cat(relationships_dir)
 
-    safe_save(f"{get_save_dir()}/{clanname}/clan_cats.json", clan_cats)
+def _read_cat_shards(clanname) -> list:
+    """
+    Reads the saved cat records of a clan from the clan_cats shards or, for saves that
+    haven't been converted yet, from clan_cats.json.
+    :raises FileNotFoundError: if the clan has neither
+    """
+    old_path = Path(get_save_dir()) / clanname / "clan_cats.json"
+    # clan_cats.json is only removed once every shard has been written, so while it
+    # exists it's the complete copy
+    if (
+        old_path.exists()
+        or not (Path(get_save_dir()) / clanname / CAT_SHARD_DIR).exists()
+    ):
+        with open(old_path, "r", encoding="utf-8") as read_file:
+            return ujson.loads(read_file.read())
+
+    cat_data = []
+    for shard in range(CAT_SHARD_COUNT):
+        shard_path = get_cat_shard_path(clanname, shard)
+        if not shard_path.exists():
+            continue
+        with open(shard_path, "r", encoding="utf-8") as read_file:
+            records = ujson.loads(read_file.read())
+        save_cache.shards_on_disk.add(shard)
+        cat_data.extend(records)
+    return cat_data
+
+
+def get_condition_file_IDs(clanname) -> Set[str]:
+    """IDs of the cats that have a saved conditions file."""
+    condition_dir = Path(get_save_dir()) / clanname / "conditions"
+    if not condition_dir.exists():
+        return set()
+    return {
+        name[: -len("_conditions.json")]
+        for name in os.listdir(condition_dir)
+        if name.endswith("_conditions.json")
+    }
 
 
 def save_faded_cats(clanname, cat_class: Type["Cat"], game: "Game"):
     """Deals with fades cats, if needed, adding them as faded"""
     global cat_to_fade
 
-    fade_cat_dir = Path(get_save_dir()) / clanname / "faded_cats"
-
-    if cat_to_fade:
-        if not fade_cat_dir.exists():
-            fade_cat_dir.mkdir()
+    backend = get_save_backend(clanname)
 
     copy_of_info = ""
     for cat in cat_to_fade:
-        inter_cat = cat_class.all_cats[cat]
+        inter_cat = cat_class.all_cats.get(cat)
+        if inter_cat is None:
+            # the cat isn't in this clan (anymore), there's nothing to fade
+            continue
 
         # Add ID to list of faded cats.
         faded_ids.append(cat)
@@ -94,9 +287,7 @@ def save_faded_cats(clanname, cat_class: Type["Cat"], game: "Game"):
             )
 
         # SAVE TO ITS OWN LITTLE FILE. This is a trimmed-down version for relation keeping only.
-        cat_data = inter_cat.get_save_dict(faded=True)
-        cat_path = fade_cat_dir / f"{cat}.json"
-        safe_save(cat_path, cat_data)
+        backend.save_faded_cat(cat, inter_cat.get_save_dict(faded=True))
 
         # Remove the cat from the active cats lists
         game.clan.remove_cat(
@@ -104,6 +295,7 @@ def save_faded_cats(clanname, cat_class: Type["Cat"], game: "Game"):
         )  # todo: when catdirectory is added, this dependency injection can be removed
 
     cat_to_fade = []
+    backend.flush_faded_cats()
 
     # Save the copies, flush the file.
     if game_setting_get("save_faded_copy"):
@@ -134,26 +326,22 @@ def add_faded_offspring_to_faded_cat(clanname, parent: str, offspring: str):
     """In order to siblings to work correctly, and not to lose relation info on fading, we have to keep track of
     both active and faded cat's faded offpsring. This will add a faded offspring to a faded parents file.
     """
-    faded_parent_path = (
-        Path(get_save_dir()) / clanname / "faded_cats" / (parent + ".json")
-    )
+    backend = get_save_backend(clanname)
     try:
-        with open(
-            faded_parent_path,
-            "r",
-            encoding="utf-8",
-        ) as read_file:
-            cat_info = ujson.loads(read_file.read())
+        cat_info = backend.load_faded_cat(parent)
     except IOError:
         print("ERROR loading faded cat (file read error)")
         return False
     except ujson.JSONDecodeError:
         print("ERROR: loading faded cat (invalid JSON)")
         return False
+    if cat_info is None:
+        print("ERROR loading faded cat (no saved record)")
+        return False
 
     cat_info["faded_offspring"].append(offspring)
 
-    safe_save(faded_parent_path, cat_info)
+    backend.save_faded_cat(parent, cat_info)
 
     return True
 
@@ -168,9 +356,149 @@ def get_faded_ids():
 
 def load_faded_cat_ids(clanname):
     global faded_ids
-    fade_cat_dir = Path(get_save_dir()) / clanname / "faded_cats"
-    if not fade_cat_dir.exists():
-        faded_ids = []
-        return
-    faded_ids = [f.stem for f in fade_cat_dir.glob("*.json")]
-    return
+    faded_ids = get_save_backend(clanname).faded_cat_IDs()
+
+
+class JsonSaveBackend(SaveBackend):
+    """
+    The folder of json files: clan_cats shards, one file per faded cat, the history
+    archive and the packed relationship save.
+    """
+
+    name = "json"
+
+    def __init__(self, clanname: str):
+        super().__init__(clanname)
+        self.directory = Path(get_save_dir()) / clanname
+
+    def close(self):
+        history_archive.close()
+        relationship_pack.close()
+
+    def forget_saved_state(self):
+        super().forget_saved_state()
+        history_archive.forget_saved_state()
+        # without an open pack, the next save writes all relationships
+        relationship_pack.close()
+
+    def load_cat_records(self) -> list:
+        return _read_cat_shards(self.clanname)
+
+    def save_cat_records(self, records: Dict[str, str], changed_IDs: Set[str]) -> int:
+        dirty_shards = {get_cat_shard(cat_ID) for cat_ID in changed_IDs}
+        dirty_shards.update(
+            shard
+            for shard in range(CAT_SHARD_COUNT)
+            if shard not in save_cache.shards_on_disk
+        )
+        _write_cat_shards(self.clanname, records, dirty_shards)
+        return len(dirty_shards)
+
+    def faded_cat_IDs(self) -> List[str]:
+        fade_cat_dir = self.directory / "faded_cats"
+        if not fade_cat_dir.exists():
+            return []
+        return [f.stem for f in fade_cat_dir.glob("*.json")]
+
+    def _read_faded_cat(self, cat_ID: str) -> Optional[dict]:
+        path = self.directory / "faded_cats" / f"{cat_ID}.json"
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as read_file:
+            return ujson.loads(read_file.read())
+
+    def _write_faded_cats(self, records: Dict[str, dict]):
+        for cat_ID, record in records.items():
+            safe_save(self.directory / "faded_cats" / f"{cat_ID}.json", record)
+
+    def load_history(self, cat_ID: str) -> Optional[dict]:
+        return history_archive.read(self.directory / "history", cat_ID)
+
+    def add_history(self, cat_ID: str, history_text: str):
+        history_archive.add(cat_ID, history_text)
+
+    def flush_histories(self):
+        history_archive.flush(self.directory / "history")
+
+    def has_relationships(self) -> bool:
+        return relationship_pack.open(self.directory / "relationships")
+
+    def take_relationship_rows(self, cat_ID: str) -> Optional[List[SavedRow]]:
+        return relationship_pack.take_rows(cat_ID)
+
+    def save_relationships(self, cats: Iterable["Cat"]):
+        relationship_pack.save(self.directory / "relationships", cats)
+
+
+_save_backend: Optional[SaveBackend] = None
+
+
+def get_save_backend(clanname) -> SaveBackend:
+    """The backend the given clan is saved with. A clan with a clan.db uses sqlite."""
+    global _save_backend
+    if _save_backend is None or _save_backend.clanname != clanname:
+        close_save_backend()
+        if has_sqlite_save(clanname):
+            _save_backend = SqliteSaveBackend(clanname)
+        else:
+            _save_backend = JsonSaveBackend(clanname)
+    return _save_backend
+
+
+def close_save_backend():
+    """Releases the backend of the clan that was loaded last."""
+    global _save_backend
+    if _save_backend is not None:
+        _save_backend.close()
+        _save_backend = None
+
+
+def convert_save_backend(clanname, cat_class: Type["Cat"], to_sqlite: bool) -> bool:
+    """
+    Copies the cats, faded cats, histories and relationships of the loaded clan into
+    the other kind of save, which the clan is saved with from then on. Going back to
+    json removes clan.db, going to sqlite leaves the json files as they are.
+    :return: False if the clan already uses that kind of save
+    """
+    global _save_backend
+    source = get_save_backend(clanname)
+    if isinstance(source, SqliteSaveBackend) == to_sqlite:
+        return False
+    target = SqliteSaveBackend(clanname) if to_sqlite else JsonSaveBackend(clanname)
+
+    for cat_ID in source.faded_cat_IDs():
+        record = source.load_faded_cat(cat_ID)
+        if record is not None:
+            target.save_faded_cat(cat_ID, record)
+    target.flush_faded_cats()
+
+    for cat in cat_class.all_cats.values():
+        # histories that aren't loaded are copied without loading them
+        if cat._history is not None:
+            history = cat.history.make_dict()
+        else:
+            history = source.load_history(cat.ID)
+            if history is None:
+                continue
+        history_text = ujson.dumps(history)
+        target.add_history(cat.ID, history_text)
+        save_cache.histories[cat.ID] = history_text
+    target.flush_histories()
+
+    records = {
+        cat.ID: ujson.dumps(cat.get_save_dict(), indent=4)
+        for cat in cat_class.all_cats.values()
+    }
+    save_cache.shards_on_disk.clear()
+    target.save_cat_records(records, set(records))
+    save_cache.records = records
+
+    target.save_relationships(cat_class.all_cats.values())
+
+    # everything that was read from the old save is copied now
+    save_writer.wait()
+    source.close()
+    if not to_sqlite:
+        safe_remove(get_db_path(clanname))
+    _save_backend = target
+    return True
@@ -1,19 +1,341 @@
 import logging
 import traceback
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 import pygame
 
+import scripts.game_structure.screen_settings
 from scripts.cat.enums import CatAge, CatGroup
 from scripts.cat.sprites.load_sprites import sprites
 from scripts.clan_package.settings import get_clan_setting
 from scripts.game_structure import constants, image_cache
 from scripts.game_structure.game import game_setting_get
+from scripts.housekeeping.profiling import profiled
+from scripts.ui.masks import inflate_mask
 from scripts.ui.scale import ui_scale_dimensions
 from scripts.cat.pelts import Pelt
 
 logger = logging.getLogger(__name__)
 
+CLICK_MASK_PADDING = 5
+"""How much bigger than a cat's sprite its click mask is on each side."""
+CLICK_MASK_GROW = 3
+"""How many pixels around a cat's sprite still count as clicking it."""
+_click_masks: "WeakKeyDictionary[pygame.Surface, Tuple[float, pygame.Mask]]" = (
+    WeakKeyDictionary()
+)
 
+SPRITE_CACHE_SIZE = 512
+"""Maximum number of finished cat sprites kept in memory at once."""
+COAT_CACHE_SIZE = 256
+"""Maximum number of coats (a cat's sprite up to its eyes) kept in memory at once."""
+LINEART_CACHE_SIZE = 1024
+"""Maximum number of accessories and scars with recolored lineart kept in memory at once."""
+
+
+class SpriteCache:
+    """
+    Least recently used cache of composited surfaces, keyed by everything that decides
+    how they look. Cats that look alike share one surface, so a surface from the cache
+    must be copied before anything is drawn on it.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self._generation = sprites.generation
+
+    def get(self, key: tuple) -> Optional[pygame.Surface]:
+        if self._generation != sprites.generation:
+            # the spritesheets were reloaded, so everything here is outdated
+            self._surfaces.clear()
+            self._generation = sprites.generation
+
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._surfaces.move_to_end(key)
+        return surface
+
+    def put(self, key: tuple, surface: pygame.Surface):
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+
+    def clear(self):
+        """Empties the cache and resets its counters."""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        :return: hit/miss counters and current size of the cache
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._surfaces),
+            "max_size": self.max_size,
+        }
+
+
+sprite_cache = SpriteCache(SPRITE_CACHE_SIZE)
+coat_cache = SpriteCache(COAT_CACHE_SIZE)
+lineart_cache = SpriteCache(LINEART_CACHE_SIZE)
+
+
+def clear_sprite_caches():
+    sprite_cache.clear()
+    coat_cache.clear()
+    lineart_cache.clear()
+
+
+def get_sprite_cache_info() -> Dict[str, Dict[str, int]]:
+    """
+    :return: the counters of the finished sprite, coat and recolored lineart caches
+    """
+    return {
+        "sprites": sprite_cache.info(),
+        "coats": coat_cache.info(),
+        "lineart": lineart_cache.info(),
+    }
+
+
+def recolor_lineart(
+    sprite_name: str,
+    color: Optional[pygame.Color] = None,
+    source_name: Optional[str] = None,
+) -> pygame.Surface:
+    """
+    Recolors the black lineart of an accessory or missing part scar for a dead cat. Each
+    recolored sprite is only made once, later calls share it, so don't draw on it.
+
+    :param sprite_name: name of the sprite to recolor
+    :param color: color to give all lineart pixels
+    :param source_name: name of a sprite of the same size to take the lineart pixels
+        from instead, used for Unknown Residence's gradient
+    :return: the recolored sprite
+    """
+    if color is None and source_name is None:
+        raise ValueError(
+            "Must provide either `color` or `source_name` for recolor_lineart"
+        )
+
+    key = (sprite_name, None if source_name else tuple(color), source_name)
+    cached = lineart_cache.get(key)
+    if cached is not None:
+        return cached
+
+    sprite = sprites.sprites[sprite_name]
+    out = sprite.copy()
+    if source_name is None:
+        pixel_array = pygame.PixelArray(out)
+        pixel_array.replace((0, 0, 0), color, distance=0)
+        del pixel_array
+    else:
+        # opaque black pixels are lineart, those are copied over from the source
+        lineart = pygame.mask.from_threshold(sprite, (0, 0, 0), (1, 1, 1, 255))
+        lineart = lineart.overlap_mask(
+            pygame.mask.from_surface(sprite, threshold=254), (0, 0)
+        )
+        lineart.to_surface(
+            out, setsurface=sprites.sprites[source_name], unsetcolor=None
+        )
+
+    lineart_cache.put(key, out)
+    return out
+
+
+def _coat_key(pelt: Pelt, cat_sprite: str) -> tuple:
+    """Everything generate_coat draws from, the pose included."""
+    if pelt.name in ["Tortie", "Calico"]:
+        tortie = (
+            pelt.tortie_base,
+            pelt.tortie_pattern,
+            pelt.tortie_colour,
+            pelt.tortie_marking,
+        )
+    else:
+        tortie = None
+    return (
+        cat_sprite,
+        pelt.name,
+        pelt.colour,
+        tortie,
+        pelt.tint,
+        pelt.white_patches,
+        pelt.white_patches_tint,
+        pelt.points,
+        pelt.vitiligo,
+        pelt.eye_colour,
+        pelt.eye_colour2,
+    )
+
+
+def generate_coat(cat, cat_sprite: str) -> pygame.Surface:
+    """
+    Draws a cat's coat: its pelt, tints, white patches, points, vitiligo and eyes. These
+    don't change with scars, accessories or the cat dying, so coats are cached
+    separately from the finished sprite.
+
+    :param cat_sprite: index of the pose to draw, as a string
+    :return: the coat, shared with alike cats, don't draw on it
+    """
+    key = _coat_key(cat.pelt, cat_sprite)
+    cached = coat_cache.get(key)
+    if cached is not None:
+        return cached
+
+    new_sprite = pygame.Surface(
+        (sprites.size, sprites.size), pygame.HWSURFACE | pygame.SRCALPHA
+    )
+
+    if cat.pelt.name not in ["Tortie", "Calico"]:
+        new_sprite.blit(
+            sprites.sprites[cat.pelt.get_sprites_name() + cat.pelt.colour + cat_sprite],
+            (0, 0),
+        )
+    else:
+        # Base Coat
+        sprite_name = f"colours_{cat.pelt.tortie_base}{cat.pelt.colour}{cat_sprite}"
+        new_sprite.blit(
+            sprites.sprites[sprite_name],
+            (0, 0),
+        )
+
+        # Create the patch image
+        if cat.pelt.tortie_pattern == "Single":
+            tortie_pattern = "SingleColour"
+        else:
+            tortie_pattern = cat.pelt.tortie_pattern
+
+        sprite_name = f"colours_{tortie_pattern}{cat.pelt.tortie_colour}{cat_sprite}"
+        patches = sprites.sprites[sprite_name].copy()
+        sprite_name = (
+            f"{sprites.TORTIE_DATA['spritesheet']}{cat.pelt.tortie_marking}{cat_sprite}"
+        )
+        patches.blit(
+            sprites.sprites[sprite_name],
+            (0, 0),
+            special_flags=pygame.BLEND_RGBA_MULT,
+        )
+
+        # Add patches onto cat.
+        new_sprite.blit(patches, (0, 0))
+
+    # TINTS
+    if cat.pelt.tint is not None and cat.pelt.tint in sprites.cat_tints["tint_colours"]:
+        # Multiply with alpha does not work as you would expect - it just lowers the alpha of the
+        # entire surface. To get around this, we first blit the tint onto a white background to dull it,
+        # then blit the surface onto the sprite with pygame.BLEND_RGB_MULT
+        tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
+        tint.fill(tuple(sprites.cat_tints["tint_colours"][cat.pelt.tint]))
+        new_sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+    if (
+        cat.pelt.tint is not None
+        and cat.pelt.tint in sprites.cat_tints["dilute_tint_colours"]
+    ):
+        tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
+        tint.fill(tuple(sprites.cat_tints["dilute_tint_colours"][cat.pelt.tint]))
+        new_sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+
+    # draw white patches
+    if cat.pelt.white_patches is not None:
+        patch = cat.pelt.white_patches
+        if patch in cat.pelt.mostly_white or patch == "FULLWHITE":
+            spritesheet = sprites.WHITE_MOSTLY_DATA["spritesheet"]
+        elif patch in cat.pelt.high_white:
+            spritesheet = sprites.WHITE_HIGH_DATA["spritesheet"]
+        elif patch in cat.pelt.mid_white:
+            spritesheet = sprites.WHITE_MID_DATA["spritesheet"]
+        else:
+            spritesheet = sprites.WHITE_LITTLE_DATA["spritesheet"]
+
+        sprite_name = f"{spritesheet}{patch}{cat_sprite}"
+        white_patches = sprites.sprites[sprite_name].copy()
+
+        # Apply tint to white patches.
+        if (
+            cat.pelt.white_patches_tint is not None
+            and cat.pelt.white_patches_tint
+            in sprites.white_patches_tints["tint_colours"]
+        ):
+            tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
+            tint.fill(
+                tuple(
+                    sprites.white_patches_tints["tint_colours"][
+                        cat.pelt.white_patches_tint
+                    ]
+                )
+            )
+            white_patches.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+
+        new_sprite.blit(white_patches, (0, 0))
+
+    # draw vit & points
+
+    if cat.pelt.points:
+        sprite_name = (
+            f"{sprites.WHITE_POINT_DATA['spritesheet']}{cat.pelt.points}{cat_sprite}"
+        )
+
+        points = sprites.sprites[sprite_name].copy()
+        if (
+            cat.pelt.white_patches_tint is not None
+            and cat.pelt.white_patches_tint
+            in sprites.white_patches_tints["tint_colours"]
+        ):
+            tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
+            tint.fill(
+                tuple(
+                    sprites.white_patches_tints["tint_colours"][
+                        cat.pelt.white_patches_tint
+                    ]
+                )
+            )
+            points.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        new_sprite.blit(points, (0, 0))
+
+    if cat.pelt.vitiligo:
+        sprite_name = f"{sprites.WHITE_VITILIGO_DATA['spritesheet']}{cat.pelt.vitiligo}{cat_sprite}"
+
+        new_sprite.blit(
+            sprites.sprites[sprite_name],
+            (0, 0),
+        )
+
+    # draw eyes & scars1
+    sprite_name = (
+        f"{sprites.EYE_DATA['spritesheet'][0]}{cat.pelt.eye_colour}{cat_sprite}"
+    )
+    eyes = sprites.sprites[sprite_name].copy()
+    new_sprite.blit(eyes, (0, 0))
+    if cat.pelt.eye_colour2 != None:
+        heterochromia_name = (
+            f"{sprites.EYE_DATA['spritesheet'][0]}{cat.pelt.eye_colour2}{cat_sprite}"
+        )
+        eyes2 = sprites.sprites[heterochromia_name].copy()
+        eyes2.blit(
+            sprites.sprites["heterochromiamask" + cat_sprite],
+            (0, 0),
+            special_flags=pygame.BLEND_RGBA_MULT,
+        )
+
+        # Add eye onto cat
+        new_sprite.blit(eyes2, (0, 0))
+
+    coat_cache.put(key, new_sprite)
+    return new_sprite
+
+
+@profiled()
 def generate_sprite(
     cat,
     life_state=None,
@@ -31,6 +353,7 @@ def generate_sprite(
     :param always_living: If True, always show the cat with living lineart
     :param disable_sick_sprite: If true, never use the not_working lineart.
                     If false, use the cat.not_working() to determine the no_working art.
+    :return: the sprite, shared with cats that look the same, so don't draw on it
     """
     poses: list = sprites.POSE_DATA["poses"]
     sprite_poses = {x: str(poses.index(x)) for x in poses}
@@ -73,146 +396,39 @@ def generate_sprite(
         else:
             cat_sprite = sprite_poses[cat.pelt.cat_sprites[age]]
 
-    new_sprite = pygame.Surface(
-        (sprites.size, sprites.size), pygame.HWSURFACE | pygame.SRCALPHA
-    )
+    fade_stage = None
+    if (
+        cat.pelt.opacity <= 97
+        and not cat.prevent_fading
+        and get_clan_setting("fading")
+        and dead
+    ):
+        fade_stage = "0"
+        if 80 >= cat.pelt.opacity > 45:
+            # Stage 1
+            fade_stage = "1"
+        elif cat.pelt.opacity <= 45:
+            # Stage 2
+            fade_stage = "2"
 
     # generating the sprite
     try:
-        if cat.pelt.name not in ["Tortie", "Calico"]:
-            new_sprite.blit(
-                sprites.sprites[
-                    cat.pelt.get_sprites_name() + cat.pelt.colour + cat_sprite
-                ],
-                (0, 0),
-            )
-        else:
-            # Base Coat
-            sprite_name = f"colours_{cat.pelt.tortie_base}{cat.pelt.colour}{cat_sprite}"
-            new_sprite.blit(
-                sprites.sprites[sprite_name],
-                (0, 0),
-            )
-
-            # Create the patch image
-            if cat.pelt.tortie_pattern == "Single":
-                tortie_pattern = "SingleColour"
-            else:
-                tortie_pattern = cat.pelt.tortie_pattern
-
-            sprite_name = (
-                f"colours_{tortie_pattern}{cat.pelt.tortie_colour}{cat_sprite}"
-            )
-            patches = sprites.sprites[sprite_name].copy()
-            sprite_name = f"{sprites.TORTIE_DATA['spritesheet']}{cat.pelt.tortie_marking}{cat_sprite}"
-            patches.blit(
-                sprites.sprites[sprite_name],
-                (0, 0),
-                special_flags=pygame.BLEND_RGBA_MULT,
-            )
-
-            # Add patches onto cat.
-            new_sprite.blit(patches, (0, 0))
-
-        # TINTS
-        if (
-            cat.pelt.tint is not None
-            and cat.pelt.tint in sprites.cat_tints["tint_colours"]
-        ):
-            # Multiply with alpha does not work as you would expect - it just lowers the alpha of the
-            # entire surface. To get around this, we first blit the tint onto a white background to dull it,
-            # then blit the surface onto the sprite with pygame.BLEND_RGB_MULT
-            tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
-            tint.fill(tuple(sprites.cat_tints["tint_colours"][cat.pelt.tint]))
-            new_sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
-        if (
-            cat.pelt.tint is not None
-            and cat.pelt.tint in sprites.cat_tints["dilute_tint_colours"]
-        ):
-            tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
-            tint.fill(tuple(sprites.cat_tints["dilute_tint_colours"][cat.pelt.tint]))
-            new_sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
-
-        # draw white patches
-        if cat.pelt.white_patches is not None:
-            patch = cat.pelt.white_patches
-            if patch in cat.pelt.mostly_white or patch == "FULLWHITE":
-                spritesheet = sprites.WHITE_MOSTLY_DATA["spritesheet"]
-            elif patch in cat.pelt.high_white:
-                spritesheet = sprites.WHITE_HIGH_DATA["spritesheet"]
-            elif patch in cat.pelt.mid_white:
-                spritesheet = sprites.WHITE_MID_DATA["spritesheet"]
-            else:
-                spritesheet = sprites.WHITE_LITTLE_DATA["spritesheet"]
-
-            sprite_name = f"{spritesheet}{patch}{cat_sprite}"
-            white_patches = sprites.sprites[sprite_name].copy()
-
-            # Apply tint to white patches.
-            if (
-                cat.pelt.white_patches_tint is not None
-                and cat.pelt.white_patches_tint
-                in sprites.white_patches_tints["tint_colours"]
-            ):
-                tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
-                tint.fill(
-                    tuple(
-                        sprites.white_patches_tints["tint_colours"][
-                            cat.pelt.white_patches_tint
-                        ]
-                    )
-                )
-                white_patches.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
-
-            new_sprite.blit(white_patches, (0, 0))
-
-        # draw vit & points
-
-        if cat.pelt.points:
-            sprite_name = f"{sprites.WHITE_POINT_DATA['spritesheet']}{cat.pelt.points}{cat_sprite}"
-
-            points = sprites.sprites[sprite_name].copy()
-            if (
-                cat.pelt.white_patches_tint is not None
-                and cat.pelt.white_patches_tint
-                in sprites.white_patches_tints["tint_colours"]
-            ):
-                tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
-                tint.fill(
-                    tuple(
-                        sprites.white_patches_tints["tint_colours"][
-                            cat.pelt.white_patches_tint
-                        ]
-                    )
-                )
-                points.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
-            new_sprite.blit(points, (0, 0))
-
-        if cat.pelt.vitiligo:
-            sprite_name = f"{sprites.WHITE_VITILIGO_DATA['spritesheet']}{cat.pelt.vitiligo}{cat_sprite}"
-
-            new_sprite.blit(
-                sprites.sprites[sprite_name],
-                (0, 0),
-            )
-
-        # draw eyes & scars1
-        sprite_name = (
-            f"{sprites.EYE_DATA['spritesheet'][0]}{cat.pelt.eye_colour}{cat_sprite}"
+        key = (
+            _coat_key(cat.pelt, cat_sprite),
+            dead,
+            cat.status.group if dead else None,
+            game_setting_get("shaders") and not dead,
+            cat.pelt.skin,
+            () if scars_hidden else tuple(cat.pelt.scars),
+            () if acc_hidden or not cat.pelt.accessory else tuple(cat.pelt.accessory),
+            fade_stage,
+            cat.pelt.reverse,
         )
-        eyes = sprites.sprites[sprite_name].copy()
-        new_sprite.blit(eyes, (0, 0))
-        if cat.pelt.eye_colour2 != None:
-            heterochromia_name = f"{sprites.EYE_DATA['spritesheet'][0]}{cat.pelt.eye_colour2}{cat_sprite}"
-            eyes2 = sprites.sprites[heterochromia_name].copy()
-            eyes2.blit(
-                sprites.sprites["heterochromiamask" + cat_sprite],
-                (0, 0),
-                special_flags=pygame.BLEND_RGBA_MULT,
-            )
+        cached = sprite_cache.get(key)
+        if cached is not None:
+            return cached
 
-            # Add eye onto cat
-            new_sprite.blit(eyes2, (0, 0))
+        new_sprite = generate_coat(cat, cat_sprite).copy()
 
         if not scars_hidden:
             for scar in cat.pelt.scars:
@@ -236,44 +452,21 @@ def generate_sprite(
             else None
         )
 
-        gradient_surface = (
-            sprites.sprites["line_ur_gradient" + cat_sprite]
+        gradient_name = (
+            "line_ur_gradient" + cat_sprite
             if dead and cat.status.group == CatGroup.UNKNOWN_RESIDENCE
             else None
         )
 
-        def _recolor_lineart(
-            sprite, color=None, source: pygame.Surface = None
-        ) -> pygame.Surface:
+        def _recolor_lineart(sprite_name: str) -> pygame.Surface:
             """
             Helper function to set the appropriate lineart color for the living status of the cat
-            :param sprite: lineart to recolor
-            :param color: color to apply to all pixels
-            :param source: source surface of same size as sprite to use instead of color
-            :return:
+            :param sprite_name: name of the sprite whose lineart to recolor
+            :return: the sprite, recolored if the cat is dead
             """
             if not dead:
-                return sprite
-
-            if color is None and source is None:
-                raise ValueError(
-                    "Must provide either `color` or `source` for _recolor_lineart"
-                )
-
-            out = sprite.copy()
-            if color:
-                pixel_array = pygame.PixelArray(out)
-                pixel_array.replace((0, 0, 0), color, distance=0)
-                del pixel_array
-                return out
-
-            width, height = sprite.get_size()
-            for x in range(width):
-                for y in range(height):
-                    if sprite.get_at((x, y)) == pygame.Color(0, 0, 0):
-                        color = source.get_at((x, y))
-                        sprite.set_at((x, y), color)
-            return out
+                return sprites.sprites[sprite_name]
+            return recolor_lineart(sprite_name, lineart_color, gradient_name)
 
         # draw line art
         if game_setting_get("shaders") and not dead:
@@ -305,11 +498,7 @@ def generate_sprite(
                 if scar in cat.pelt.missing_part_scars:
                     sprite_name = f"{sprites.SCAR_MISSING_PART_DATA['spritesheet']}{scar}{cat_sprite}"
                     new_sprite.blit(
-                        _recolor_lineart(
-                            sprites.sprites[sprite_name],
-                            lineart_color,
-                            gradient_surface,
-                        ),
+                        _recolor_lineart(sprite_name),
                         (0, 0),
                         special_flags=blendmode,
                     )
@@ -331,48 +520,25 @@ def generate_sprite(
                         if accessory in cat.pelt.plant_accessories:
                             sprite_name = f"{sprites.PLANT_DATA['spritesheet']}{accessory}{cat_sprite}"
                             new_sprite.blit(
-                                _recolor_lineart(
-                                    sprites.sprites[sprite_name],
-                                    lineart_color,
-                                    gradient_surface,
-                                ),
+                                _recolor_lineart(sprite_name),
                                 (0, 0),
                             )
                         elif accessory in cat.pelt.wild_accessories:
                             sprite_name = f"{sprites.WILD_DATA['spritesheet']}{accessory}{cat_sprite}"
                             new_sprite.blit(
-                                _recolor_lineart(
-                                    sprites.sprites[sprite_name],
-                                    lineart_color,
-                                    gradient_surface,
-                                ),
+                                _recolor_lineart(sprite_name),
                                 (0, 0),
                             )
                         elif accessory in cat.pelt.collar_accessories:
                             sprite_name = f"{sprites.COLLAR_DATA['spritesheet']}{accessory}{cat_sprite}"
                             new_sprite.blit(
-                                _recolor_lineart(
-                                    sprites.sprites[sprite_name],
-                                    lineart_color,
-                                    gradient_surface,
-                                ),
+                                _recolor_lineart(sprite_name),
                                 (0, 0),
                             )
 
         # Apply fading fog
-        if (
-            cat.pelt.opacity <= 97
-            and not cat.prevent_fading
-            and get_clan_setting("fading")
-            and dead
-        ):
-            stage = "0"
-            if 80 >= cat.pelt.opacity > 45:
-                # Stage 1
-                stage = "1"
-            elif cat.pelt.opacity <= 45:
-                # Stage 2
-                stage = "2"
+        if fade_stage is not None:
+            stage = fade_stage
 
             new_sprite.blit(
                 sprites.sprites["fademask" + stage + cat_sprite],
@@ -439,6 +605,8 @@ def generate_sprite(
         if cat.pelt.reverse:
             new_sprite = pygame.transform.flip(new_sprite, True, False)
 
+        sprite_cache.put(key, new_sprite)
+
     except (TypeError, KeyError):
         traceback.print_exc()
         logger.exception("Failed to load sprite")
@@ -463,30 +631,20 @@ def update_sprite(cat):
     cat.all_cats[cat.ID] = cat
 
 
-def update_mask(cat):
-    if cat.faded or cat.dead:
-        # should never need a mask since they can't appear on the Clan screen
-        cat.sprite_mask = None
-        return
+def get_click_mask(sprite: pygame.Surface) -> pygame.Mask:
+    """
+    The area of a cat's sprite that can be clicked on the Clan screen: the sprite scaled
+    to the UI, grown by a few pixels. Masks are kept per sprite until the UI scale
+    changes, and cats that look alike share their sprite, so they share the mask too.
+    """
+    scale = scripts.game_structure.screen_settings.screen_scale
+    cached = _click_masks.get(sprite)
+    if cached is not None and cached[0] == scale:
+        return cached[1]
 
     val = pygame.mask.from_surface(
-        pygame.transform.scale(cat.sprite, ui_scale_dimensions((50, 50))), threshold=250
-    )
-
-    inflated_mask = pygame.Mask(
-        (
-            val.get_size()[0] + 10,
-            val.get_size()[1] + 10,
-        )
+        pygame.transform.scale(sprite, ui_scale_dimensions((50, 50))), threshold=250
     )
-    inflated_mask.draw(val, (5, 5))
-    for _ in range(3):
-        outline = inflated_mask.outline()
-        for point in outline:
-            for dx in range(-1, 2):
-                for dy in range(-1, 2):
-                    try:
-                        inflated_mask.set_at((point[0] + dx, point[1] + dy), 1)
-                    except IndexError:
-                        continue
-    cat.sprite_mask = inflated_mask
+    mask = inflate_mask(val, CLICK_MASK_PADDING, grow=CLICK_MASK_GROW)
+    _click_masks[sprite] = (scale, mask)
+    return mask
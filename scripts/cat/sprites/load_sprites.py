@@ -1,11 +1,15 @@
 import logging
 import os
+from collections.abc import MutableMapping
 from copy import copy
+from functools import partial
+from typing import Callable, Dict, Iterator
 
 import pygame
 import ujson
 
 from scripts.cat.enums import CatGroup
+from scripts.cat.sprites import sprite_atlas
 from scripts.game_structure import constants, image_cache
 from scripts.game_structure.game.settings import game_setting_get
 from scripts.special_dates import SpecialDate, is_today
@@ -13,6 +17,57 @@ from scripts.special_dates import SpecialDate, is_today
 logger = logging.getLogger(__name__)
 
 
+class LazySprites(MutableMapping):
+    """
+    Sprite name -> sprite, where every sprite is only sliced from its spritesheet (or
+    made from the sprite atlas) the first time it's used. A clan only ever shows a
+    small part of all the sprites there are.
+    """
+
+    def __init__(self):
+        self._sprites: Dict[str, pygame.Surface] = {}
+        self._sources: Dict[str, Callable[[], pygame.Surface]] = {}
+
+    def add_source(self, name: str, make_sprite: Callable[[], pygame.Surface]):
+        """Registers how to make a sprite, for when it's first used."""
+        self._sprites.pop(name, None)
+        self._sources[name] = make_sprite
+
+    def __getitem__(self, name: str) -> pygame.Surface:
+        try:
+            return self._sprites[name]
+        except KeyError:
+            sprite = self._sources.pop(name)()
+            self._sprites[name] = sprite
+            return sprite
+
+    def __setitem__(self, name: str, sprite: pygame.Surface):
+        self._sources.pop(name, None)
+        self._sprites[name] = sprite
+
+    def __delitem__(self, name: str):
+        if self._sources.pop(name, None) is None:
+            del self._sprites[name]
+
+    def __contains__(self, name) -> bool:
+        return name in self._sprites or name in self._sources
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._sprites
+        yield from list(self._sources)
+
+    def __len__(self) -> int:
+        return len(self._sprites) + len(self._sources)
+
+    def clear(self):
+        self._sprites.clear()
+        self._sources.clear()
+
+    def loaded_count(self) -> int:
+        """:return: how many sprites were made so far"""
+        return len(self._sprites)
+
+
 class Sprites:
     cat_tints = {}
     white_patches_tints = {}
@@ -99,8 +154,13 @@ class Sprites:
         self.symbol_dict = None
         self.size = None
         self.spritesheets = {}
+        self._spritesheet_files = {}
+        self._palette_maps = {}
         self.images = {}
-        self.sprites = {}
+        self.sprites = LazySprites()
+        self.generation = 0
+        """Counts how often the sprites were (re)loaded, so composited sprites made
+        from older ones can be told apart."""
 
         # Shared empty sprite for placeholders
         self.blank_sprite = None
@@ -126,13 +186,23 @@ class Sprites:
 
     def spritesheet(self, a_file, name):
         """
-        Add spritesheet called name from a_file.
+        Add spritesheet called name from a_file. The file is only loaded once a sprite
+        on it is used.
 
         Parameters:
         a_file -- Path to the file to create a spritesheet from.
         name -- Name to call the new spritesheet.
         """
-        self.spritesheets[name] = pygame.image.load(a_file).convert_alpha()
+        self.spritesheets.pop(name, None)
+        self._spritesheet_files[name] = a_file
+
+    def get_spritesheet(self, name) -> pygame.Surface:
+        """Returns the spritesheet called name, loading it if it isn't yet."""
+        if name not in self.spritesheets:
+            self.spritesheets[name] = pygame.image.load(
+                self._spritesheet_files[name]
+            ).convert_alpha()
+        return self.spritesheets[name]
 
     def make_group(
         self,
@@ -164,7 +234,7 @@ class Sprites:
         group_y_ofs = pos[1] * sprites_y * self.size
         i = 0
 
-        # splitting group into singular sprites and storing into self.sprites section
+        # splitting group into singular sprites, which are sliced once they're used
         for y in range(sprites_y):
             for x in range(sprites_x):
                 if no_index:
@@ -172,40 +242,75 @@ class Sprites:
                 else:
                     full_name = f"{name}{i}"
 
-                try:
-                    new_sprite = pygame.Surface.subsurface(
-                        self.spritesheets[spritesheet],
-                        group_x_ofs + x * self.size,
-                        group_y_ofs + y * self.size,
-                        self.size,
-                        self.size,
-                    )
-
-                except ValueError:
-                    # Fallback for non-existent sprites
-                    print(f"WARNING: nonexistent sprite - {full_name}")
-                    if not self.blank_sprite:
-                        self.blank_sprite = pygame.Surface(
-                            (self.size, self.size), pygame.HWSURFACE | pygame.SRCALPHA
-                        )
-                    new_sprite = self.blank_sprite
-
+                rect = (
+                    group_x_ofs + x * self.size,
+                    group_y_ofs + y * self.size,
+                    self.size,
+                    self.size,
+                )
                 if palettes:
-                    self.apply_palettes(i, name, new_sprite, palettes)
+                    self.apply_palettes(i, name, spritesheet, rect, palettes)
                 else:
-                    self.sprites[full_name] = new_sprite
+                    self.sprites.add_source(
+                        full_name, partial(self.slice, spritesheet, rect, full_name)
+                    )
                 i += 1
 
+    def slice(self, spritesheet, rect, full_name) -> pygame.Surface:
+        """
+        Cuts a single sprite out of a spritesheet
+        :param spritesheet: Name of spritesheet file
+        :param rect: (x, y, width, height) of the sprite on the spritesheet, in pixels
+        :param full_name: Name of the sprite, for the warning if it doesn't exist
+        """
+        try:
+            return pygame.Surface.subsurface(self.get_spritesheet(spritesheet), rect)
+        except ValueError:
+            # Fallback for non-existent sprites
+            print(f"WARNING: nonexistent sprite - {full_name}")
+            if not self.blank_sprite:
+                self.blank_sprite = pygame.Surface(
+                    (self.size, self.size), pygame.HWSURFACE | pygame.SRCALPHA
+                )
+            return self.blank_sprite
+
     def apply_palettes(
-        self, sprite_index: int, name: str, new_sprite, palette_names: list
+        self, sprite_index: int, name: str, spritesheet, rect, palette_names: list
     ):
         """
-        Creates sprites for each color palette variation
+        Registers sprites for each color palette variation. They're recolored once
+        they're used.
         :param sprite_index: index of sprite
         :param name: name of sprite
-        :param new_sprite: the sprite object to create variations of
+        :param spritesheet: Name of the spritesheet the sprite is on
+        :param rect: (x, y, width, height) of the sprite on the spritesheet, in pixels
         :param palette_names: list of palette names
         """
+        for color_name in palette_names:
+            full_name = f"{name}_{color_name}{sprite_index}"
+            self.sprites.add_source(
+                full_name,
+                partial(
+                    self.recolor_palette,
+                    spritesheet,
+                    rect,
+                    full_name,
+                    name,
+                    palette_names,
+                    color_name,
+                ),
+            )
+
+    def get_palettes(self, name: str, palette_names: list) -> dict:
+        """
+        Reads the palette map of a sprite group, once
+        :param name: name of the sprite group, its map is sprites/palettes/{name}_palette.png
+        :param palette_names: list of palette names, in the order of the map's rows
+        :return: palette name -> list of colors, with the original colors as "BASE"
+        """
+        if name in self._palette_maps:
+            return self._palette_maps[name]
+
         # first we create an array of our palette map
         full_map = pygame.image.load(f"sprites/palettes/{name}_palette.png")
         map_array = pygame.PixelArray(full_map)
@@ -220,25 +325,37 @@ class Sprites:
             color_palettes.update(
                 {color_name: [full_map.unmap_rgb(px) for px in map_array[::, row]]}
             )
+        map_array.close()
 
-        base_palette = color_palettes["BASE"]
+        self._palette_maps[name] = color_palettes
+        return color_palettes
 
-        # now we recolor the sprite
-        for color_name, palette in color_palettes.items():
-            if color_name == "BASE":
-                continue
-            recolor_sprite = pygame.PixelArray(new_sprite.copy())
-            # we replace each base_palette color with it's matching index from the color_palette
-            for color_i, color in enumerate(palette):
-                recolor_sprite.replace(base_palette[color_i], color)
-            # convert back into a surface
-            _sprite = recolor_sprite.make_surface()
-            # add it to our sprite dict!
-            self.sprites[f"{name}_{color_name}{sprite_index}"] = _sprite
-            # close the pixel array now that we're done
-            recolor_sprite.close()
+    def recolor_palette(
+        self, spritesheet, rect, full_name, name, palette_names, color_name
+    ) -> pygame.Surface:
+        """
+        Slices a sprite and gives it one of its group's color palettes
+        :param spritesheet: Name of the spritesheet the sprite is on
+        :param rect: (x, y, width, height) of the sprite on the spritesheet, in pixels
+        :param full_name: Name of the recolored sprite
+        :param name: name of the sprite group
+        :param palette_names: list of palette names
+        :param color_name: name of the palette to use
+        """
+        color_palettes = self.get_palettes(name, palette_names)
+        base_palette = color_palettes["BASE"]
 
-        map_array.close()
+        recolor_sprite = pygame.PixelArray(
+            self.slice(spritesheet, rect, full_name).copy()
+        )
+        # we replace each base_palette color with it's matching index from the color_palette
+        for color_i, color in enumerate(color_palettes[color_name]):
+            recolor_sprite.replace(base_palette[color_i], color)
+        # convert back into a surface
+        _sprite = recolor_sprite.make_surface()
+        # close the pixel array now that we're done
+        recolor_sprite.close()
+        return _sprite
 
     def load_all(self):
         # get the width and height of the spritesheet
@@ -262,6 +379,22 @@ class Sprites:
 
         del width, height  # unneeded
 
+        april_fools = constants.CONFIG["fun"]["april_fools"] or is_today(
+            SpecialDate.APRIL_FOOLS
+        )
+        self.sprites.clear()
+        self.spritesheets.clear()
+        self._spritesheet_files.clear()
+        self._palette_maps.clear()
+
+        atlas_key = sprite_atlas.source_key(april_fools)
+        atlas = sprite_atlas.load_atlas(atlas_key, self.size)
+        if atlas is not None:
+            self.add_atlas(atlas)
+            self.load_symbols(make_groups=False)
+            self.generation += 1
+            return
+
         data_jsons = (
             self.EYE_DATA,
             self.PELT_DATA,
@@ -305,10 +438,7 @@ class Sprites:
                 spritesheets.append(data["spritesheet"])
 
         for x in spritesheets:
-            if "lineart" in x and (
-                constants.CONFIG["fun"]["april_fools"]
-                or is_today(SpecialDate.APRIL_FOOLS)
-            ):
+            if "lineart" in x and april_fools:
                 self.spritesheet(f"sprites/{x}_aprilfools.png", x)
             else:
                 self.spritesheet(f"sprites/{x}.png", x)
@@ -352,6 +482,21 @@ class Sprites:
 
         self.load_symbols()
 
+        # saving the atlas slices every sprite, afterwards they're made from the atlas
+        # again, so only the ones that get used are kept around
+        sprite_atlas.save_atlas(atlas_key, self.size, self.sprites)
+        atlas = sprite_atlas.load_atlas(atlas_key, self.size)
+        if atlas is not None:
+            self.sprites.clear()
+            self.spritesheets.clear()
+            self.add_atlas(atlas)
+        self.generation += 1
+
+    def add_atlas(self, atlas: sprite_atlas.SpriteAtlas):
+        """Makes the sprites of the atlas available, they're made once they're used."""
+        for name in atlas.names():
+            self.sprites.add_source(name, partial(atlas.make_sprite, name))
+
     def load_sheet(self, spritesheet: str, sprite_names: list[list[str]]):
         """
         Loads sheet data and creates sprite groups.
@@ -366,9 +511,10 @@ class Sprites:
                     name=f"{spritesheet}{sprite}",
                 )
 
-    def load_symbols(self):
+    def load_symbols(self, make_groups=True):
         """
         loads clan symbols
+        :param make_groups: default True, set False if the symbol sprites are already loaded
         """
 
         if os.path.exists("resources/dicts/clan_symbols.json"):
@@ -427,6 +573,8 @@ class Sprites:
                         x_pos += -1
 
                     self.clan_symbols.append(f"symbol{symbol.upper()}{variant_index}")
+                    if not make_groups:
+                        continue
                     self.make_group(
                         "symbols",
                         (x_pos, y_pos),
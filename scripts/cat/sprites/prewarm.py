@@ -0,0 +1,117 @@
+"""
+Rebuilds outdated cat sprites in the spare time at the end of frames, so opening the Clan
+or a list screen after a moon skip doesn't have to rebuild them all at once.
+
+A moon changes the sprites of many cats (they age, get scars and accessories), but a sprite
+is only rebuilt when something reads Cat.sprite. events.one_moon stops the prewarmer
+while it runs and calls schedule() when it's done, and from then on the main loop gives the prewarmer whatever is left of each
+frame. Camp cats go first, then the cats on the list page that was last shown, then
+everyone else.
+"""
+
+from collections import deque
+from time import perf_counter
+from typing import Callable, Deque, Iterable, List
+
+from scripts.cat.cats import Cat
+from scripts.cat.sprites.display_sprites import get_click_mask
+from scripts.game_structure import game
+
+FRAME_SHARE = 0.8
+"""How much of a frame may be used before the prewarmer stops for that frame."""
+COST_SMOOTHING = 0.2
+"""How quickly the estimated time per cat follows the measured one."""
+
+
+class SpritePrewarmer:
+    def __init__(self):
+        self._scheduled = False
+        self._stopped = False
+        self._queue: Deque[str] = deque()
+        self._priority_sources: List[Callable[[], Iterable[Cat]]] = []
+        self.cost = 0.002
+        """estimated seconds to rebuild one cat's sprite"""
+        self.warmed = 0
+        """sprites rebuilt since the last schedule()"""
+
+    def stop(self):
+        """
+        Stops prewarming until the next schedule(), while the moon skip thread is
+        changing the cats.
+        """
+        self._stopped = True
+
+    def schedule(self):
+        """
+        Queues every outdated sprite before the next frame's prewarming. Safe to call from
+        the moon skip thread, the cats are only looked at from the main loop.
+        """
+        self._stopped = False
+        self._scheduled = True
+
+    def add_priority_source(self, source: Callable[[], Iterable[Cat]]):
+        """
+        :param source: gives the cats a screen shows first. Sources are asked in the
+            order they were added, after the camp cats.
+        """
+        self._priority_sources.append(source)
+
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def _fill_queue(self):
+        self._queue.clear()
+        self.warmed = 0
+        queued = set()
+
+        def add(cats: Iterable[Cat]):
+            for cat in cats:
+                if cat.ID not in queued and cat.sprite_outdated:
+                    queued.add(cat.ID)
+                    self._queue.append(cat.ID)
+
+        if game.clan:
+            add(
+                Cat.all_cats[i]
+                for i in game.clan.clan_cats
+                if i in Cat.all_cats and Cat.all_cats[i].status.alive_in_player_clan
+            )
+        for source in self._priority_sources:
+            add(source())
+        add(list(Cat.all_cats.values()))
+
+    def update(self, frame_start: float, fps: int):
+        """
+        Rebuilds queued sprites until the frame has used its share of the time one frame
+        may take at this fps. A sprite isn't started unless it's expected to be done in
+        time.
+        :param frame_start: perf_counter() at the start of the frame
+        :param fps: the frame rate the game runs at
+        """
+        if self._stopped:
+            return
+        if self._scheduled:
+            self._scheduled = False
+            self._fill_queue()
+        if not self._queue:
+            return
+
+        deadline = frame_start + FRAME_SHARE / fps
+        start = perf_counter()
+        while self._queue and not self._stopped and start + self.cost < deadline:
+            cat = Cat.all_cats.get(self._queue.popleft())
+            if cat is None or not cat.sprite_outdated:
+                continue
+            # reading the sprite rebuilds it
+            sprite = cat.sprite
+            if cat.status.alive_in_player_clan:
+                # camp cats will need their click mask too
+                get_click_mask(sprite)
+            self.warmed += 1
+
+            end = perf_counter()
+            self.cost += (end - start - self.cost) * COST_SMOOTHING
+            start = end
+
+
+sprite_prewarmer = SpritePrewarmer()
@@ -0,0 +1,175 @@
+"""
+Keeps the sliced and palette-swapped cat sprites in an atlas in the cache folder, so later
+launches don't have to decode every spritesheet and recolor the collars again.
+
+The atlas is two files: sprite_atlas.bin holds the raw pixels of every distinct sprite,
+cropped to the part that isn't plain background, and sprite_atlas.json says where each
+sprite's pixels are. The index is keyed by a hash of everything the sprites are made
+from, so changing a spritesheet, palette or sprite json (or April Fools starting) makes
+the next launch slice the spritesheets again and replace the atlas.
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+from glob import glob
+from typing import Dict, Iterable, Mapping, Optional
+
+import pygame
+import ujson
+
+from scripts.housekeeping.datadir import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+ATLAS_VERSION = 1
+"""Bump this when the way sprites are sliced or stored changes."""
+ATLAS_FILE = "sprite_atlas.bin"
+INDEX_FILE = "sprite_atlas.json"
+
+SOURCE_PATTERNS = (
+    "sprites/*.png",
+    "sprites/palettes/*.png",
+    "sprites/dicts/*.json",
+)
+
+
+def source_key(april_fools: bool) -> str:
+    """
+    :param april_fools: whether the April Fools lineart is used
+    :return: a hash of every file the sprites are made from
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{ATLAS_VERSION} {pygame.version.ver} {april_fools}".encode())
+    for pattern in SOURCE_PATTERNS:
+        for path in sorted(glob(pattern)):
+            digest.update(path.encode())
+            with open(path, "rb") as read_file:
+                digest.update(read_file.read())
+    return digest.hexdigest()
+
+
+def _changed_rect(surface: pygame.Surface, background: pygame.Color) -> pygame.Rect:
+    """The smallest rect that holds every pixel that isn't the background colour."""
+    if background.a:
+        return surface.get_rect()
+    differs = pygame.mask.from_threshold(surface, background, (1, 1, 1, 255))
+    differs.invert()
+    differs.draw(pygame.mask.from_surface(surface, threshold=0), (0, 0))
+    rects = differs.get_bounding_rects()
+    if not rects:
+        return pygame.Rect(0, 0, 0, 0)
+    return rects[0].unionall(rects[1:])
+
+
+def save_atlas(key: str, size: int, sprites: Mapping[str, pygame.Surface]):
+    """
+    Writes the sprites to the atlas, replacing the old one.
+    :param key: the source_key the sprites were made with
+    :param size: width and height of a sprite
+    :param sprites: sprite name -> sprite
+    """
+    cache_dir = get_cache_dir()
+    entries = {}
+    offsets = {}
+    offset = 0
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(f"{cache_dir}/{ATLAS_FILE}.tmp", "wb") as write_file:
+            for name, surface in sprites.items():
+                background = surface.get_at((0, 0))
+                rect = _changed_rect(surface, background)
+                pixels = (
+                    pygame.image.tobytes(surface.subsurface(rect), "BGRA")
+                    if rect.w
+                    else b""
+                )
+                # identical sprites are only stored once
+                if pixels not in offsets:
+                    offsets[pixels] = offset
+                    write_file.write(pixels)
+                    offset += len(pixels)
+                entries[name] = [offsets[pixels], *rect, *background]
+
+        with open(f"{cache_dir}/{INDEX_FILE}.tmp", "w", encoding="utf-8") as write_file:
+            write_file.write(
+                ujson.dumps({"key": key, "size": size, "sprites": entries})
+            )
+        # the index goes last, so it never points at another atlas
+        os.replace(f"{cache_dir}/{ATLAS_FILE}.tmp", f"{cache_dir}/{ATLAS_FILE}")
+        os.replace(f"{cache_dir}/{INDEX_FILE}.tmp", f"{cache_dir}/{INDEX_FILE}")
+    except OSError:
+        logger.exception("Couldn't save the sprite atlas")
+
+
+class SpriteAtlas:
+    """
+    The sprites of a saved atlas. A sprite is only made from the atlas' pixels the first
+    time it's asked for.
+    """
+
+    def __init__(self, entries: Dict[str, list], atlas: mmap.mmap, size: int):
+        self.size = size
+        self._entries = entries
+        self._atlas = atlas
+        self._pixels = memoryview(atlas)
+        self._made: Dict[tuple, pygame.Surface] = {}
+
+    def names(self) -> Iterable[str]:
+        return self._entries.keys()
+
+    def make_sprite(self, name: str) -> pygame.Surface:
+        entry = tuple(self._entries[name])
+        # identical sprites are only made once
+        sprite = self._made.get(entry)
+        if sprite is not None:
+            return sprite
+
+        offset, x, y, width, height, *background = entry
+        sprite = pygame.Surface(
+            (self.size, self.size), pygame.HWSURFACE | pygame.SRCALPHA
+        )
+        if any(background) and (width, height) != (self.size, self.size):
+            sprite.fill(background)
+        if width:
+            part = pygame.image.frombuffer(
+                self._pixels[offset : offset + width * height * 4],
+                (width, height),
+                "BGRA",
+            )
+            # copies the pixels as they are, transparent ones included
+            part.set_alpha(None)
+            sprite.blit(part, (x, y))
+            del part
+        self._made[entry] = sprite
+        return sprite
+
+
+def load_atlas(key: str, size: int) -> Optional[SpriteAtlas]:
+    """
+    :param key: the source_key of the current spritesheets
+    :param size: width and height of a sprite
+    :return: the atlas, or None if there's no whole atlas of these spritesheets
+    """
+    cache_dir = get_cache_dir()
+    try:
+        with open(f"{cache_dir}/{INDEX_FILE}", "r", encoding="utf-8") as read_file:
+            index = ujson.loads(read_file.read())
+        if index["key"] != key or index["size"] != size:
+            return None
+        with open(f"{cache_dir}/{ATLAS_FILE}", "rb") as read_file:
+            atlas = mmap.mmap(read_file.fileno(), 0, access=mmap.ACCESS_READ)
+        entries = index["sprites"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+    # the sprites are made later, so check now that all of them are in the atlas
+    if any(
+        offset + width * height * 4 > len(atlas)
+        for offset, _, _, width, height, *_ in entries.values()
+    ):
+        logger.warning("The sprite atlas is damaged, slicing the spritesheets")
+        atlas.close()
+        return None
+    return SpriteAtlas(entries, atlas, size)
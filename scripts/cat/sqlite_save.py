@@ -0,0 +1,298 @@
+"""
+Saving a clan's cats, faded cats, histories and relationships in a single sqlite file.
+
+Everything lives in clan.db inside the clan's folder, in four tables keyed by cat ID
+(relationships by the pair of IDs). A faded cat or a history is looked up by its key
+instead of opening a file of its own.
+
+Inside SqliteSaveBackend.saving(), which save_cats uses, the writes of every stage are
+collected and run as one transaction when the save ends, so a save is either fully on
+disk or not at all. Writes outside of it (converting a save, for one) are a transaction
+each.
+
+Writes go through run_file_operation like every other save file, so they keep their
+order with background saves. Each transaction opens its own connection.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+import ujson
+
+from scripts.cat.save_backend import SaveBackend
+from scripts.cat_relations.relationship_save import SavedRow
+from scripts.game_structure.game.save_load import run_file_operation, save_writer
+from scripts.housekeeping.datadir import get_save_dir
+
+if TYPE_CHECKING:
+    from scripts.cat.cats import Cat
+
+DB_FILE = "clan.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cats (ID TEXT PRIMARY KEY, record TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS faded_cats (ID TEXT PRIMARY KEY, record TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS histories (ID TEXT PRIMARY KEY, history TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS relationships (
+    cat_from TEXT NOT NULL,
+    cat_to TEXT NOT NULL,
+    mates INTEGER NOT NULL,
+    family INTEGER NOT NULL,
+    romance INTEGER NOT NULL,
+    "like" INTEGER NOT NULL,
+    respect INTEGER NOT NULL,
+    trust INTEGER NOT NULL,
+    comfort INTEGER NOT NULL,
+    log TEXT NOT NULL,
+    PRIMARY KEY (cat_from, cat_to)
+) WITHOUT ROWID;
+"""
+
+UPSERT_RELATIONSHIP = (
+    "INSERT OR REPLACE INTO relationships VALUES (?,?,?,?,?,?,?,?,?,?)"
+)
+
+Statements = List[Tuple[str, list]]
+"""sql, and the parameters to run it with (executemany)"""
+
+
+def get_db_path(clanname: str) -> Path:
+    return Path(get_save_dir()) / clanname / DB_FILE
+
+
+def has_sqlite_save(clanname: str) -> bool:
+    return get_db_path(clanname).exists()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _run_transaction(path: Path, statements: Statements):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = _connect(path)
+    try:
+        with connection:
+            for sql, parameters in statements:
+                connection.executemany(sql, parameters)
+    finally:
+        connection.close()
+
+
+def _relationship_parameters(cat_from_ID: str, cat_to_ID: str, row) -> tuple:
+    mates, family, values, log = row
+    return (cat_from_ID, cat_to_ID, int(mates), int(family), *values, ujson.dumps(log))
+
+
+class SqliteSaveBackend(SaveBackend):
+    name = "sqlite"
+
+    def __init__(self, clanname: str):
+        super().__init__(clanname)
+        self.path = get_db_path(clanname)
+        self._reader: Optional[sqlite3.Connection] = None
+        self._pending_histories: Dict[str, str] = {}
+        self._unwritten_histories: Dict[str, str] = {}
+        self._relationship_IDs: Optional[Set[str]] = None
+        """IDs of the cats whose relationships are saved, None until known"""
+        self._batch: Optional[Statements] = None
+        """statements of the save being made, None outside of saving()"""
+
+    def close(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def _query(self, sql: str, parameters: tuple = ()) -> list:
+        # reads have to see everything that was queued for writing
+        save_writer.wait()
+        if self._reader is None:
+            if not self.path.exists():
+                return []
+            self._reader = _connect(self.path)
+        return self._reader.execute(sql, parameters).fetchall()
+
+    def forget_saved_state(self):
+        super().forget_saved_state()
+        self._pending_histories = {
+            **self._unwritten_histories,
+            **self._pending_histories,
+        }
+        self._unwritten_histories = {}
+        self._relationship_IDs = None
+
+    @contextmanager
+    def saving(self):
+        self._batch = []
+        try:
+            yield
+            batch = self._batch
+        finally:
+            # a save that failed halfway writes nothing
+            self._batch = None
+        if batch:
+            run_file_operation(_run_transaction, self.path, batch)
+
+    def _write(self, statements: Statements):
+        statements = [(sql, rows) for sql, rows in statements if rows]
+        if not statements:
+            return
+        if self._batch is not None:
+            self._batch.extend(statements)
+        else:
+            run_file_operation(_run_transaction, self.path, statements)
+
+    # ---------------------------------------------------------------------------- #
+    #                                     cats                                     #
+    # ---------------------------------------------------------------------------- #
+
+    def load_cat_records(self) -> list:
+        if not self.path.exists():
+            raise FileNotFoundError(self.path)
+        return [ujson.loads(row[0]) for row in self._query("SELECT record FROM cats")]
+
+    def save_cat_records(self, records: Dict[str, str], changed_IDs: Set[str]) -> int:
+        written = [(i, records[i]) for i in changed_IDs if i in records]
+        removed = [(i,) for i in changed_IDs if i not in records]
+        self._write(
+            [
+                ("DELETE FROM cats WHERE ID = ?", removed),
+                ("INSERT OR REPLACE INTO cats VALUES (?, ?)", written),
+            ]
+        )
+        return len(written) + len(removed)
+
+    # ---------------------------------------------------------------------------- #
+    #                                  faded cats                                  #
+    # ---------------------------------------------------------------------------- #
+
+    def faded_cat_IDs(self) -> List[str]:
+        return [row[0] for row in self._query("SELECT ID FROM faded_cats")]
+
+    def _read_faded_cat(self, cat_ID: str) -> Optional[dict]:
+        rows = self._query("SELECT record FROM faded_cats WHERE ID = ?", (cat_ID,))
+        return ujson.loads(rows[0][0]) if rows else None
+
+    def _write_faded_cats(self, records: Dict[str, dict]):
+        self._write(
+            [
+                (
+                    "INSERT OR REPLACE INTO faded_cats VALUES (?, ?)",
+                    [(i, ujson.dumps(record)) for i, record in records.items()],
+                )
+            ]
+        )
+
+    # ---------------------------------------------------------------------------- #
+    #                                   histories                                  #
+    # ---------------------------------------------------------------------------- #
+
+    def load_history(self, cat_ID: str) -> Optional[dict]:
+        text = self._pending_histories.get(cat_ID)
+        if text is None:
+            text = self._unwritten_histories.get(cat_ID)
+        if text is None:
+            rows = self._query("SELECT history FROM histories WHERE ID = ?", (cat_ID,))
+            if not rows:
+                return None
+            text = rows[0][0]
+        return ujson.loads(text)
+
+    def add_history(self, cat_ID: str, history_text: str):
+        self._pending_histories[cat_ID] = history_text
+
+    def flush_histories(self):
+        if not self._pending_histories:
+            return
+        pending, self._pending_histories = self._pending_histories, {}
+        self._write(
+            [("INSERT OR REPLACE INTO histories VALUES (?, ?)", list(pending.items()))]
+        )
+        self._unwritten_histories = pending
+
+    # ---------------------------------------------------------------------------- #
+    #                                 relationships                                #
+    # ---------------------------------------------------------------------------- #
+
+    def has_relationships(self) -> bool:
+        if self._relationship_IDs is None:
+            self._relationship_IDs = {
+                row[0]
+                for row in self._query("SELECT DISTINCT cat_from FROM relationships")
+            }
+        return True
+
+    def take_relationship_rows(self, cat_ID: str) -> Optional[List[SavedRow]]:
+        rows = self._query(
+            'SELECT cat_to, mates, family, romance, "like", respect, trust, comfort,'
+            " log FROM relationships WHERE cat_from = ?",
+            (cat_ID,),
+        )
+        if not rows:
+            return None
+        return [
+            (
+                cat_to_ID,
+                bool(mates),
+                bool(family),
+                (romance, like, respect, trust, comfort),
+                ujson.loads(log),
+            )
+            for cat_to_ID, mates, family, romance, like, respect, trust, comfort, log in rows
+        ]
+
+    def save_relationships(self, cats: Iterable["Cat"]):
+        living = [cat for cat in cats if not cat.dead]
+        living_IDs = {cat.ID for cat in living}
+        # without knowing what's saved, everything has to be written again
+        full = self._relationship_IDs is None
+        saved_IDs = self._relationship_IDs or set()
+
+        cleared = [] if full else [(i,) for i in saved_IDs - living_IDs]
+        removed = []
+        upserts = []
+        for cat in living:
+            store = cat.relationships
+            reset, changed_IDs = store.pending_changes()
+            if full or reset or cat.ID not in saved_IDs:
+                if not full:
+                    cleared.append((cat.ID,))
+                upserts.extend(
+                    _relationship_parameters(cat.ID, cat_to_ID, row)
+                    for cat_to_ID, row in store.iter_save_rows()
+                )
+                continue
+
+            for cat_to_ID in changed_IDs:
+                row = store.save_row(cat_to_ID)
+                if row is None:
+                    removed.append((cat.ID, cat_to_ID))
+                else:
+                    upserts.append(_relationship_parameters(cat.ID, cat_to_ID, row))
+            for relationship in store.dirty_relationships(skip=changed_IDs):
+                cat_to_ID = relationship.cat_to.ID
+                upserts.append(
+                    _relationship_parameters(
+                        cat.ID, cat_to_ID, store.save_row(cat_to_ID)
+                    )
+                )
+
+        statements = [
+            ("DELETE FROM relationships WHERE cat_from = ?", cleared),
+            ("DELETE FROM relationships WHERE cat_from = ? AND cat_to = ?", removed),
+            (UPSERT_RELATIONSHIP, upserts),
+        ]
+        if full:
+            statements.insert(0, ("DELETE FROM relationships", [()]))
+        self._write(statements)
+
+        self._relationship_IDs = {
+            cat.ID for cat in living if len(cat.relationships) > 0
+        }
+        for cat in living:
+            cat.relationships.mark_saved()
@@ -1,8 +1,9 @@
 from collections import defaultdict
-from itertools import groupby
 from random import choice, choices
-from typing import TypedDict, Optional, List, Dict
+from typing import TypedDict, Optional, List, Dict, Tuple
 
+from scripts.cat.cat_pool import CatPool
+from scripts.cat.clan_roster import clan_roster
 from scripts.cat.enums import CatRank, CatSocial, CatStanding, CatAge, CatGroup
 from scripts.game_structure import game
 
@@ -10,6 +11,17 @@ from scripts.game_structure import game
 class Status:
     """Holds all status information for a cat (group affiliations, ranks, location relative to others)"""
 
+    __slots__ = (
+        "group_history",
+        "standing_history",
+        "cat_ID",
+        "_rank",
+        "_group_ID",
+        "_socials",
+        "_rank_tally",
+        "_group_tally",
+    )
+
     social_lookup = {
         CatRank.NEWBORN: CatSocial.CLANCAT,
         CatRank.KITTEN: CatSocial.CLANCAT,
@@ -28,6 +40,9 @@ class Status:
     }
     """A dict of ranks and their corresponding social status"""
 
+    group_pools: Dict[Optional[str], CatPool] = clan_roster.groups
+    """IDs of every registered cat, keyed by the group_ID they currently belong to"""
+
     def __init__(
         self,
         group_history: list = None,
@@ -46,7 +61,19 @@ class Status:
 
         self.group_history = group_history if group_history else []
         """List of dicts containing the keys: group, rank, and moons_as. A new dict is added whenever group or rank are
-        changed."""
+        changed. Only modify it through this class, the properties below are cached from it."""
+
+        self._rank: Optional[CatRank] = None
+        self._group_ID: Optional[str] = None
+        self._socials: List[List] = []
+        """[social, entries] runs of consecutive group_history entries with the same social"""
+        self._rank_tally: Dict[CatRank, List[int]] = {}
+        """rank -> [entries, moons_as], in order of first appearance"""
+        self._group_tally: Dict[Optional[str], List[int]] = {}
+        """group_ID -> [entries, moons_as], in order of first appearance"""
+
+        self.cat_ID: Optional[str] = None
+        """ID of the cat this status belongs to, set once the cat registers itself in the clan roster"""
 
         self.standing_history = standing_history if standing_history else []
         """List of dicts containing the keys: group, standing, and near. Standing is a chronological list of the cat's 
@@ -57,6 +84,7 @@ class Status:
             self._convert_old_group_saves(entry)
             # converting strs to enums
             entry["rank"] = CatRank(entry["rank"])
+        self._tally_history()
 
         for entry in self.standing_history:
             self._convert_old_group_saves(entry)
@@ -221,6 +249,7 @@ class Status:
                 new_history["rank"] = choice(possible_ranks)
 
         self.group_history = [new_history]
+        self._tally_history()
 
     def _start_standing(self):
         """
@@ -241,80 +270,178 @@ class Status:
                 }
             ]
 
+    # CACHED HISTORY
+    def _tally_history(self):
+        """
+        Recalculates the cached current rank and group and the history totals from the full group_history.
+        """
+        self._rank = None
+        self._group_ID = None
+        self._socials = []
+        self._rank_tally = {}
+        self._group_tally = {}
+        for entry in self.group_history:
+            self._tally_entry(entry)
+
+    def _tally_entry(self, entry: dict):
+        """
+        Adds a new group_history entry to the cached values. The entry must already be the last in group_history.
+        """
+        entry["rank"] = rank = CatRank(entry["rank"])
+        group_ID = entry["group"]
+        moons_as = entry["moons_as"]
+        self._rank = rank
+        self._group_ID = group_ID
+
+        social = self.social_lookup[rank]
+        if self._socials and self._socials[-1][0] == social:
+            self._socials[-1][1] += 1
+        else:
+            self._socials.append([social, 1])
+
+        for tally, key in ((self._rank_tally, rank), (self._group_tally, group_ID)):
+            counts = tally.setdefault(key, [0, 0])
+            counts[0] += 1
+            counts[1] += moons_as
+
+    def _untally_last_entry(self):
+        """
+        Removes the last group_history entry from the cached values. Call before removing the entry itself.
+        """
+        entry = self.group_history[-1]
+        run = self._socials[-1]
+        run[1] -= 1
+        if not run[1]:
+            self._socials.pop()
+
+        for tally, key in (
+            (self._rank_tally, entry["rank"]),
+            (self._group_tally, entry["group"]),
+        ):
+            counts = tally[key]
+            counts[0] -= 1
+            counts[1] -= entry["moons_as"]
+            if not counts[0]:
+                del tally[key]
+
+        previous = self.group_history[-2] if len(self.group_history) > 1 else None
+        self._rank = previous["rank"] if previous else None
+        self._group_ID = previous["group"] if previous else None
+
+    def _append_history(self, entry: dict):
+        self.group_history.append(entry)
+        self._tally_entry(entry)
+
+    def _add_current_moons_as(self, moons: int):
+        entry = self.group_history[-1]
+        entry["moons_as"] += moons
+        self._rank_tally[entry["rank"]][1] += moons
+        self._group_tally[entry["group"]][1] += moons
+
+    def moons_in_groups(self, group_IDs: Tuple[Optional[str], ...]) -> int:
+        """
+        Returns the total moons the cat has spent in any of the given groups.
+        """
+        return sum(
+            self._group_tally[group_ID][1]
+            for group_ID in group_IDs
+            if group_ID in self._group_tally
+        )
+
+    # CLAN ROSTER
+    def register(self, cat_ID: str):
+        """
+        Files the owning cat in the clan roster under their current group and rank. Group and rank changes made
+        through this status will keep the roster up to date from then on.
+        """
+        self.unregister()
+        self.cat_ID = cat_ID
+        clan_roster.file_status(cat_ID, self.group_ID, self.rank)
+
+    def unregister(self):
+        """
+        Removes the owning cat from the clan roster, used when a cat is removed from the game entirely.
+        """
+        if self.cat_ID is None:
+            return
+        clan_roster.remove(self.cat_ID)
+        self.cat_ID = None
+
+    def _update_roster(self):
+        """
+        Refiles the owning cat in the clan roster if their group or rank has changed.
+        """
+        if self.cat_ID is None:
+            return
+        clan_roster.file_status(self.cat_ID, self.group_ID, self.rank)
+
+    @staticmethod
+    def clear_group_pools():
+        """
+        Empties the clan roster, used when every cat is being unloaded.
+        """
+        clan_roster.clear()
+
     # PROPERTIES
     @property
     def social(self) -> CatSocial:
         """
         Returns the cat's current social category, aka what the cat is considered by other cats within the world
         """
-        return self.all_socials[-1]
+        return self._socials[-1][0]
 
     @property
     def all_socials(self) -> list:
         """
         Returns a list of all social classes the cat has been part of or is currently part of.
         """
-        social_history_dupes = [
-            self.social_lookup[record["rank"]] for record in self.group_history
-        ]
-        social_groups = [k for k, g in groupby(social_history_dupes)]
-
-        return social_groups
+        return [social for social, _ in self._socials]
 
     @property
     def group(self) -> CatGroup:
         """
         Returns the group type that a cat is currently affiliated with.
         """
-        group = game.used_group_IDs.get(self.group_ID)
-        if not group:
-            group = CatGroup.NONE
-        return group
+        # group types are looked up each time, since loading a clan can reassign the group IDs
+        return game.used_group_IDs.get(self._group_ID) or CatGroup.NONE
 
     @property
     def group_ID(self) -> str:
         """
         Return the ID of the group this cat belongs to.
         """
-        return self.group_history[-1]["group"]
+        return self._group_ID
 
     @property
     def all_groups(self) -> list[str]:
         """
         Returns a list of IDs for all groups the cat has been a part of or is currently a part of.
         """
-        groups = []
-        for record in self.group_history:
-            if record["group"] not in groups:
-                groups.append(record["group"])
-
-        return groups
+        return list(self._group_tally)
 
     @property
     def rank(self) -> CatRank:
         """
         Returns the rank that a cat currently holds within their group.
         """
-        return CatRank(self.group_history[-1]["rank"])
+        return self._rank
 
     @property
     def all_ranks(self) -> dict:
         """
         Returns a dict of past held ranks. Key is rank, value is moons spent as that rank.
         """
-        history = defaultdict(int)
-
-        for record in self.group_history:
-            history[record["rank"]] += record["moons_as"]
-
-        return history
+        return defaultdict(
+            int, {rank: moons for rank, (_, moons) in self._rank_tally.items()}
+        )
 
     @property
     def alive_in_player_clan(self) -> bool:
         """
         Returns True if the cat is currently part of the player clan.
         """
-        return self.group == CatGroup.PLAYER_CLAN
+        # the player clan's ID never changes
+        return self._group_ID == CatGroup.PLAYER_CLAN_ID
 
     @property
     def is_outsider(self) -> bool:
@@ -355,7 +482,7 @@ class Status:
 
     @property
     def is_leader(self) -> bool:
-        return self.rank == CatRank.LEADER
+        return self._rank == CatRank.LEADER
 
     @property
     def did_join_group_this_moon(self) -> bool:
@@ -407,13 +534,13 @@ class Status:
         created cat's value to give the illusion that they have existed in the world for longer. If you want to
         increment their current moons_as by 1, use increase_current_moons_as()
         """
-        self.group_history[-1].update({"moons_as": new_moons_as})
+        self._add_current_moons_as(new_moons_as - self.group_history[-1]["moons_as"])
 
     def increase_current_moons_as(self):
         """
         Use to increment their current group/rank moons_as by 1
         """
-        self.group_history[-1]["moons_as"] += 1
+        self._add_current_moons_as(1)
 
     def _modify_group(
         self,
@@ -434,9 +561,8 @@ class Status:
         if standing_with_past_group:
             self.change_standing(standing_with_past_group, forced_old_group_ID)
 
-        self.group_history.append(
-            {"group": new_group_ID, "rank": new_rank, "moons_as": 0}
-        )
+        self._append_history({"group": new_group_ID, "rank": new_rank, "moons_as": 0})
+        self._update_roster()
 
         # add member standing for new group
         self.change_standing(CatStanding.MEMBER)
@@ -614,12 +740,15 @@ class Status:
             if len(self.group_history) > 1 and last_entry["moons_as"] == 0:
                 if self.group_ID == last_entry["group"]:
                     saved_group = last_entry["group"]
-                self.group_history.remove(last_entry)
+                self._untally_last_entry()
+                self.group_history.pop()
                 last_entry = self.group_history[-1]
             if last_entry["group"] == self.group_ID and last_entry["rank"] == new_rank:
+                self._update_roster()
                 return
         group_ID = self.group_ID if not saved_group else saved_group
-        self.group_history.append({"group": group_ID, "rank": new_rank, "moons_as": 0})
+        self._append_history({"group": group_ID, "rank": new_rank, "moons_as": 0})
+        self._update_roster()
 
     def change_group_nearness(self, group_ID: str):
         """
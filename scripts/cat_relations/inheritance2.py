@@ -1,8 +1,12 @@
-from typing import TypedDict, Dict, List, Set, Tuple
+from typing import TypedDict, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 from enum import StrEnum
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+import i18n
+
+from scripts.events_module.text_adjust import adjust_list_text
+
 
 class RelationType(StrEnum):
     """An enum representing the possible relationships of a cat"""
@@ -15,6 +19,13 @@ class RelationType(StrEnum):
     RELATED = "blood_related"  # related by blood (different mates only)
 
 
+BLOOD_RELATIVE_TYPES = (
+    RelationType.BLOOD,
+    RelationType.HALF_BLOOD,
+    RelationType.RELATED,
+)
+
+
 class FamilyRelationLink(TypedDict):
     relation_type: RelationType
     cat_id: str
@@ -27,6 +38,23 @@ class FamilyRelations:
     mates: List[FamilyRelationLink] = field(default_factory=lambda: [])
 
 
+@dataclass(frozen=True)
+class Kinship:
+    """The relatives of a cat that kinship checks need, see InheritanceDb._kinship"""
+
+    siblings: FrozenSet[str]
+    cousins: FrozenSet[str]
+    close_relatives: FrozenSet[str]
+    """everyone get_relatives finds without cousins"""
+
+
+KINSHIP_REACH = 4
+"""
+How many parent or child links away a cat can be and still change another cat's
+relatives: cousins are up, up, down and down again.
+"""
+
+
 class InheritanceDb:
     def __init__(self):
         self._cat_to_rels: Dict[
@@ -35,6 +63,11 @@ class InheritanceDb:
         ] = defaultdict(FamilyRelations)
         self._cat_to_litter: Dict[str, Tuple] = {}
         self._saved_family_rels: Dict[str, FamilyRelations] = {}
+        self._kinship_index: Dict[str, Kinship] = {}
+        """
+        cat ID -> their relatives, made the first time they're needed. Changing a cat's
+        parents only forgets the cats near them, see _forget_kinship_near.
+        """
 
     def __getitem__(self, arg: str):
         return self._cat_to_rels.get(arg)
@@ -106,12 +139,15 @@ class InheritanceDb:
         :get_faded_ids: (Optional) A function that will return a list of all faded IDs.
         """
         self._cat_to_rels = defaultdict(FamilyRelations)
+        self._kinship_index.clear()
         for cat in Cat.all_cats_list:
             self._load_inheritance(cat)
 
         if get_faded_ids:
             for cat_id in get_faded_ids():
-                cat = Cat.fetch_cat(cat_id)
+                # cats that faded since the last save are still loaded, the others
+                # only need their saved record
+                cat = Cat.all_cats.get(cat_id) or Cat.fetch_faded_record(cat_id)
                 if not cat:
                     continue
                 # "save" the inheritances of faded cats bc they're static
@@ -120,6 +156,92 @@ class InheritanceDb:
             for cat_id, saved_family_rel in self._saved_family_rels.items():
                 self._cat_to_rels[cat_id] = saved_family_rel
 
+    def update_inheritance(self, cat):
+        """
+        Reloads the parents and mates of one cat, after a birth, an adoption or a change
+        of mates, without reloading every cat.
+
+        :param Cat cat: the cat whose parents or mates changed
+        """
+        self._forget_kinship_near(cat.ID)
+        rels = self._cat_to_rels[cat.ID]
+        for link in rels.parents:
+            parent_rels = self._cat_to_rels.get(link["cat_id"])
+            if parent_rels:
+                parent_rels.children = [
+                    c for c in parent_rels.children if c["cat_id"] != cat.ID
+                ]
+        rels.parents = []
+        rels.mates = []
+        # the litter keeps the age stored with its littermates' entries, unless the
+        # cat's blood parents changed
+        litter = self._cat_to_litter.pop(cat.ID, None)
+
+        self._load_inheritance(cat)
+        if litter and litter[0] == frozenset((cat.parent1, cat.parent2)):
+            self._cat_to_litter[cat.ID] = litter
+        self._forget_kinship_near(cat.ID)
+
+    def _forget_kinship_near(self, cat_id: str):
+        """
+        Forgets the relatives of every cat whose relatives may change when the parents
+        of this cat change.
+        """
+        seen = {cat_id}
+        border = [cat_id]
+        for _ in range(KINSHIP_REACH):
+            next_border = []
+            for near_id in border:
+                rels = self._cat_to_rels.get(near_id)
+                if rels is None:
+                    continue
+                for link in rels.parents + rels.children:
+                    if link["cat_id"] not in seen:
+                        seen.add(link["cat_id"])
+                        next_border.append(link["cat_id"])
+            border = next_border
+        for near_id in seen:
+            self._kinship_index.pop(near_id, None)
+
+    def _kinship(self, cat_id: str) -> Kinship:
+        kinship = self._kinship_index.get(cat_id)
+        if kinship is None:
+            kinship = Kinship(
+                siblings=frozenset(self._find_siblings(cat_id)),
+                cousins=frozenset(self._find_cousins(cat_id)),
+                close_relatives=frozenset(self._find_relatives(cat_id, True)),
+            )
+            self._kinship_index[cat_id] = kinship
+        return kinship
+
+    def check_kinship_index(self, cat_ids: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Compares the remembered relatives of cats to finding them again, for testing
+        and debugging the incremental updates.
+
+        :param cat_ids: the cats to check, defaults to every cat that has remembered
+            relatives
+        :return: a line for every difference, empty if there are none
+        """
+        if cat_ids is None:
+            cat_ids = list(self._kinship_index)
+        differences = []
+        for cat_id in cat_ids:
+            kinship = self._kinship(cat_id)
+            found = {
+                "siblings": self._find_siblings(cat_id),
+                "cousins": self._find_cousins(cat_id),
+                "close_relatives": self._find_relatives(cat_id, True),
+            }
+            for name, cat_set in found.items():
+                remembered = getattr(kinship, name)
+                if remembered != cat_set:
+                    differences.append(
+                        f"{cat_id} {name}: remembered {sorted(remembered)},"
+                        f" found {sorted(cat_set)}"
+                    )
+        return differences
+
     def get_parents(self, cat_id: str) -> Set[str]:
         return {p["cat_id"] for p in self._cat_to_rels[cat_id].parents}
 
@@ -130,6 +252,9 @@ class InheritanceDb:
         return {k["cat_id"] for k in self._cat_to_rels[cat_id].children}
 
     def get_siblings(self, cat_id: str) -> Set[str]:
+        return set(self._kinship(cat_id).siblings)
+
+    def _find_siblings(self, cat_id: str) -> Set[str]:
         siblings = set()
         for p in self.get_parents(cat_id):
             siblings.update(self.get_children(p))
@@ -151,7 +276,7 @@ class InheritanceDb:
 
     def get_siblings_mates(self, cat_id: str) -> Set[str]:
         siblings_mates = set()
-        for s in self.get_siblings(cat_id):
+        for s in self._find_siblings(cat_id):
             siblings_mates.update(self.get_mates(s))
         return siblings_mates
 
@@ -163,17 +288,20 @@ class InheritanceDb:
 
     def get_siblings_children(self, cat_id: str) -> Set[str]:
         siblings_children = set()
-        for s in self.get_siblings(cat_id):
+        for s in self._find_siblings(cat_id):
             siblings_children.update(self.get_children(s))
         return siblings_children
 
     def get_parents_siblings(self, cat_id: str) -> Set[str]:
         parents_siblings = set()
         for p in self.get_parents(cat_id):
-            parents_siblings.update(self.get_siblings(p))
+            parents_siblings.update(self._find_siblings(p))
         return parents_siblings
 
     def get_cousins(self, cat_id: str) -> Set[str]:
+        return set(self._kinship(cat_id).cousins)
+
+    def _find_cousins(self, cat_id: str) -> Set[str]:
         cousins = set()
         for ps in self.get_parents_siblings(cat_id):
             cousins.update(self.get_children(ps))
@@ -182,10 +310,16 @@ class InheritanceDb:
         return cousins
 
     def get_relatives(self, cat_id: str, exclude_cousins: bool) -> Set[str]:
+        kinship = self._kinship(cat_id)
+        if exclude_cousins:
+            return set(kinship.close_relatives)
+        return kinship.close_relatives | kinship.cousins
+
+    def _find_relatives(self, cat_id: str, exclude_cousins: bool) -> Set[str]:
         get_relative_functions = (
             self.get_parents,
             self.get_children,
-            self.get_siblings,
+            self._find_siblings,
             self.get_grandparents,
             self.get_grandchildren,
             self.get_siblings_children,
@@ -199,13 +333,17 @@ class InheritanceDb:
         if exclude_cousins:
             return relatives
         else:
-            relatives.update(self.get_cousins(cat_id))
+            relatives.update(self._find_cousins(cat_id))
         return relatives
 
     def is_related(self, cat_a: str, cat_b: str, exclude_cousins) -> bool:
-        return cat_b in self.get_relatives(
-            cat_a, exclude_cousins
-        ) or cat_a in self.get_relatives(cat_b, exclude_cousins)
+        kinship_a = self._kinship(cat_a)
+        kinship_b = self._kinship(cat_b)
+        if cat_b in kinship_a.close_relatives or cat_a in kinship_b.close_relatives:
+            return True
+        return not exclude_cousins and (
+            cat_b in kinship_a.cousins or cat_a in kinship_b.cousins
+        )
 
     def is_grandparent(self, maybe_grandparent: str, cat_a: str) -> bool:
         return maybe_grandparent in self.get_grandparents(cat_a)
@@ -214,13 +352,13 @@ class InheritanceDb:
         return maybe_parent in self.get_parents(cat_a)
 
     def is_sibling(self, cat_a: str, cat_b: str) -> bool:
-        return cat_b in self.get_siblings(cat_a)
+        return cat_b in self._kinship(cat_a).siblings
 
     def is_uncle_aunt(self, maybe_uncle_aunt: str, cat_a: str) -> bool:
         return cat_a in self.get_siblings_children(maybe_uncle_aunt)
 
     def is_cousin(self, cat_a: str, cat_b: str) -> bool:
-        return cat_b in self.get_cousins(cat_a)
+        return cat_b in self._kinship(cat_a).cousins
 
     def is_littermate(self, cat_a: str, cat_b: str) -> bool:
         try:
@@ -228,74 +366,222 @@ class InheritanceDb:
         except KeyError:
             return False
 
-    def compare_to_inheritance(self, cat_id: str, inheritance):
+    def get_blood_parents(self, cat_id: str) -> Set[str]:
+        return {
+            p["cat_id"]
+            for p in self._cat_to_rels[cat_id].parents
+            if p["relation_type"] == RelationType.BLOOD
+        }
+
+    def get_blood_children(self, cat_id: str) -> Set[str]:
+        return {
+            k["cat_id"]
+            for k in self._cat_to_rels[cat_id].children
+            if k["relation_type"] == RelationType.BLOOD
+        }
+
+    def get_blood_relatives(self, cat_id: str) -> Set[str]:
+        """
+        :return: the relatives get_relatives finds, cousins included, who are only
+            linked to the cat through blood parents and kits
+        """
+        parents = self.get_blood_parents(cat_id)
+        children = self.get_blood_children(cat_id)
+        siblings = set()
+        grandparents = set()
+        for p in parents:
+            siblings.update(self.get_blood_children(p))
+            grandparents.update(self.get_blood_parents(p))
+        siblings.discard(cat_id)
+        parents_siblings = set()
+        for g in grandparents:
+            parents_siblings.update(self.get_blood_children(g))
+        parents_siblings -= parents
+
+        relatives = parents | children | siblings | grandparents | parents_siblings
+        for relative in children | siblings | parents_siblings:
+            relatives.update(self.get_blood_children(relative))
+        relatives.discard(cat_id)
+        return relatives
+
+    def is_blood_related(self, cat_a: str, cat_b: str) -> bool:
+        return cat_b in self.get_blood_relatives(cat_a)
+
+    def get_parent_type(self, cat_id: str, parent_id: str) -> Optional[RelationType]:
+        """:return: BLOOD or ADOPTIVE, None if they aren't the cat's parent"""
+        if parent_id in self.get_blood_parents(cat_id):
+            return RelationType.BLOOD
+        if parent_id in self.get_parents(cat_id):
+            return RelationType.ADOPTIVE
+        return None
+
+    def get_sibling_type(self, cat_a: str, cat_b: str) -> Optional[RelationType]:
+        """
+        :return: BLOOD if they have the same blood parents, HALF_BLOOD if they share
+            one of them, ADOPTIVE if they only share an adoptive parent, None if they
+            aren't siblings
         """
-        This is a helper function for testing `inheritance2` by comparing it to the
-        previous `Inheritance` code. It's not used anywhere, but you can call/modify
-        it if you want to compare `inheritance2` data to old `Inheritance` data.
-
-        Currently, it checks that `inheritance2` contains all the cats that
-        corresponding `Inheritance` does
-            (i.e. that `Inheritance` data is a subset of `inheritance2` data).
-        Note that this does NOT mean that they are equal!
-        For example, `inheritance2` can also contain cats that AREN'T in `Inheritance`.
-        If this happens, a warning message will be printed to console, and you can evaluate
-        it really is an error or not.
-
-        `FamilyTreeScreen.py` is a good place to use this, since it still
-        uses the `Inheritance` code due to `inheritance2` not yet implementing
-        some data that's displayed on that screen.
-
-        This function should be removed when the original `Inheritance`
-        code is phased out.
-
-        Example Usage:
-        ```
-        from scripts.cat_relations.inheritance2 import inheritance_db
-        # ...
-
-        cat.create_inheritance_new_cat() # cat is a Cat
-        if not inheritance_db.compare_to_inheritance(cat.ID, cat.inheritance):
-            print(f"inheritance_db is not a subset of Inheritance for {cat.ID}!")
-        ```
-
-        :param inheritance: The `Inheritance` data you want to compare.
-        :param cat_id: The ID of the cat whose `Inheritance` it is.
-        :return bool: If the `inheritance2` data contains all the
-                      `Inheritance` data. This does NOT mean they are equal!
+        if not self.is_sibling(cat_a, cat_b):
+            return None
+        parents_a = self.get_blood_parents(cat_a)
+        parents_b = self.get_blood_parents(cat_b)
+        shared = parents_a & parents_b
+        if not shared:
+            return RelationType.ADOPTIVE
+        if parents_a == parents_b:
+            return RelationType.BLOOD
+        return RelationType.HALF_BLOOD
+
+    def get_cat_info(self, cat, relative_id: str) -> dict:
         """
+        Describes how a relative is related to the cat, for the tooltips of the family
+        tree and the offspring of the mate screen.
 
-        inheritance_db_to_inheritance_functions = [
-            (inheritance.get_parents, self.get_parents),
-            (inheritance.get_children, self.get_children),
-            (inheritance.get_siblings, self.get_siblings),
-            (inheritance.get_parents_siblings, self.get_parents_siblings),
-            (inheritance.get_cousins, self.get_cousins),
-            (inheritance.get_grandparents, self.get_grandparents),
-            (inheritance.get_grand_kits, self.get_grandchildren),
-            (inheritance.get_siblings_kits, self.get_siblings_children),
-            (inheritance.get_mates, self.get_mates),
-        ]
-
-        for t in inheritance_db_to_inheritance_functions:
-            original = set(t[0]())
-            sequel = t[1](cat_id)
-            if original != sequel:
-                print(
-                    f"WARNING: inheritance.{t[0].__name__} differs from inheritance_db.{t[1].__name__} for cat {cat_id}!"
+        :param Cat cat: the cat whose family it is, its fetch_cat is used for names
+        :param relative_id: the relative to describe
+        :return: {"type": [RelationType, ...], "additional": [str, ...]}, a type and
+            notes for every way they are related
+        """
+        info = {
+            "additional": [],
+            "type": [],
+        }
+        cat_id = cat.ID
+
+        def names(cat_ids) -> List[str]:
+            found = (cat.fetch_cat(i) for i in sorted(cat_ids))
+            return [str(c.name) for c in found if c]
+
+        def add(rel_type: RelationType, additional: Iterable[str] = ()):
+            info["type"].append(rel_type)
+            info["additional"].extend(additional)
+
+        def mate_type() -> RelationType:
+            if self.is_blood_related(cat_id, relative_id):
+                return RelationType.RELATED
+            return RelationType.NOT_BLOOD
+
+        def child_of(parent_ids) -> List[str]:
+            parent_names = names(parent_ids)
+            if not parent_names:
+                return []
+            return [
+                i18n.t(
+                    "inheritance.child_of_inter", name=adjust_list_text(parent_names)
+                )
+            ]
+
+        parents = self.get_parents(cat_id)
+        children = self.get_children(cat_id)
+        siblings = self.get_siblings(cat_id)
+        relatives_parents = self.get_parents(relative_id)
+
+        if relative_id in parents:
+            add(self.get_parent_type(cat_id, relative_id))
+
+        if relative_id in children:
+            blood_parents = self.get_blood_parents(relative_id)
+            if cat_id in blood_parents:
+                blood_parents.discard(cat_id)
+                add(
+                    RelationType.BLOOD,
+                    [
+                        i18n.t("inheritance.second_parent", name=name)
+                        for name in names(blood_parents)
+                    ],
                 )
-                print(f"    inheritance.{t[0].__name__}: {original}")
-                print(f"    inheritance_db.{t[1].__name__}: {sequel}")
-            if not original.issubset(sequel):
-                return False
+            elif blood_parents:
+                blood_names = names(blood_parents)
+                add(
+                    RelationType.ADOPTIVE,
+                    [
+                        i18n.t(
+                            "inheritance.blood_parent",
+                            count=len(blood_names),
+                            name=adjust_list_text(blood_names),
+                        )
+                    ],
+                )
+            else:
+                add(RelationType.ADOPTIVE)
+
+        if relative_id in siblings:
+            rel_type = self.get_sibling_type(cat_id, relative_id)
+            if rel_type == RelationType.BLOOD and self.is_littermate(
+                cat_id, relative_id
+            ):
+                add(rel_type, [i18n.t("inheritance.littermates")])
+            else:
+                add(rel_type)
+
+        if relative_id in self.get_parents_siblings(cat_id):
+            grandparents = self.get_grandparents(cat_id) & relatives_parents
+            add(RelationType.BLOOD, child_of(grandparents))
+
+        if relative_id in self.get_cousins(cat_id):
+            add(RelationType.BLOOD, child_of(relatives_parents))
+
+        if relative_id in self.get_grandparents(cat_id):
+            blood = any(
+                relative_id in self.get_blood_parents(p)
+                for p in self.get_blood_parents(cat_id)
+            )
+            add(
+                RelationType.BLOOD if blood else RelationType.NOT_BLOOD,
+                [
+                    i18n.t("inheritance.parent_of_inter", name=name)
+                    for name in names(parents & self.get_children(relative_id))
+                ],
+            )
 
-        if not set(inheritance.all_involved).issubset(self.get_relatives(cat_id, True)):
-            return False
-        if not set(inheritance.all_but_cousins).issubset(
-            self.get_relatives(cat_id, False)
-        ):
-            return False
-        return True
+        if relative_id in self.get_grandchildren(cat_id):
+            blood = any(
+                relative_id in self.get_blood_children(k)
+                for k in self.get_blood_children(cat_id)
+            )
+            add(
+                RelationType.BLOOD if blood else RelationType.NOT_BLOOD,
+                child_of(relatives_parents),
+            )
+
+        siblings_parents = siblings & relatives_parents
+        if siblings_parents:
+            if any(
+                relative_id in self.get_blood_children(s)
+                and self.get_sibling_type(cat_id, s) in BLOOD_RELATIVE_TYPES
+                for s in siblings_parents
+            ):
+                rel_type = RelationType.BLOOD
+            elif siblings_parents - self.get_blood_parents(relative_id):
+                rel_type = RelationType.ADOPTIVE
+            else:
+                rel_type = RelationType.NOT_BLOOD
+            add(rel_type, child_of(relatives_parents))
+
+        relatives_mates = self.get_mates(relative_id)
+        for group in (siblings, children):
+            mated = group & relatives_mates
+            if mated:
+                add(
+                    mate_type(),
+                    [
+                        i18n.t("inheritance.mate_of_inter", name=name)
+                        for name in names(mated)
+                    ],
+                )
+
+        if relative_id in self.get_mates(cat_id):
+            add(
+                mate_type(),
+                [
+                    i18n.t(
+                        "inheritance.current_mate"
+                        if relative_id in cat.mate
+                        else "inheritance.prev_mate"
+                    )
+                ],
+            )
+        return info
 
 
 inheritance_db = InheritanceDb()
@@ -19,7 +19,9 @@ from scripts.events_module.event_filters import (
 )
 from scripts.game_structure import game
 from scripts.events_module.text_adjust import process_text
+from scripts.housekeeping.profiling import profiled
 import scripts.cat_relations.interaction as interactions
+import scripts.cat_relations.relationship_matrix as relationship_matrix
 
 
 # ---------------------------------------------------------------------------- #
@@ -47,8 +49,8 @@ class Relationship:
         self.chosen_interaction = None
         self.cat_from = cat_from
         self.cat_to = cat_to
-        self.mates = mates
-        self.family = family
+        self._mates = mates
+        self._family = family
         self.opposite_relationship = (
             None  # link to opposite relationship will be created later
         )
@@ -74,6 +76,11 @@ class Relationship:
         self._trust = min(max(trust, -100), 100)
         self._comfort = min(max(comfort, -100), 100)
 
+        self.dirty = False
+        """Whether the values changed since the relationship was last saved"""
+        self.saved_log_length = 0
+        """How much of the log has been saved already"""
+
     def to_dict(self):
         return {
             "cat_from_id": self.cat_from.ID,
@@ -99,6 +106,7 @@ class Relationship:
             self.cat_to.relationships[self.cat_from.ID] = relation
             self.opposite_relationship = relation
 
+    @profiled()
     def start_interaction(self) -> None:
         """This function handles the simple interaction of this relationship."""
         # such interactions are only allowed for living Clan members
@@ -589,6 +597,24 @@ class Relationship:
             and self.respect_tier.is_neutral
         )
 
+    @property
+    def mates(self) -> bool:
+        return self._mates
+
+    @mates.setter
+    def mates(self, value: bool):
+        self._mates = value
+        self.dirty = True
+
+    @property
+    def family(self) -> bool:
+        return self._family
+
+    @family.setter
+    def family(self, value: bool):
+        self._family = value
+        self.dirty = True
+
     @property
     def romance(self) -> int:
         """0-100 scale, 0 is no romantic interest and 100 is full romantic interest"""
@@ -601,6 +627,7 @@ class Relationship:
         elif value < 0:
             value = 0
         self._romance = value
+        self._value_changed(RelType.ROMANCE, self._romance)
 
     @property
     def romance_tier(self) -> Optional[RelTier]:
@@ -634,6 +661,8 @@ class Relationship:
         if RelType.LIKE not in self.no_longer_neutral and not self.like_tier.is_neutral:
             self.no_longer_neutral.append(RelType.LIKE)
 
+        self._value_changed(RelType.LIKE, self._like)
+
     @property
     def like_tier(self) -> Optional[RelTier]:
         group = self._get_tier_group(self.like)
@@ -674,6 +703,8 @@ class Relationship:
         ):
             self.no_longer_neutral.append(RelType.RESPECT)
 
+        self._value_changed(RelType.RESPECT, self._respect)
+
     @property
     def respect_tier(self) -> Optional[RelTier]:
         group = self._get_tier_group(self.respect)
@@ -714,6 +745,8 @@ class Relationship:
         ):
             self.no_longer_neutral.append(RelType.COMFORT)
 
+        self._value_changed(RelType.COMFORT, self._comfort)
+
     @property
     def comfort_tier(self) -> Optional[RelTier]:
         group = self._get_tier_group(self.comfort)
@@ -754,6 +787,8 @@ class Relationship:
         ):
             self.no_longer_neutral.append(RelType.TRUST)
 
+        self._value_changed(RelType.TRUST, self._trust)
+
     @property
     def trust_tier(self) -> Optional[RelTier]:
         group = self._get_tier_group(self.trust)
@@ -773,6 +808,17 @@ class Relationship:
         else:
             return RelTier.CONFIDES_IN
 
+    def _value_changed(self, rel_type: RelType, value: int):
+        """
+        Marks the relationship as changed for saving, and keeps the active relationship
+        matrix, if there is one, in step with it.
+        """
+        self.dirty = True
+        if relationship_matrix.active_matrix is not None:
+            relationship_matrix.active_matrix.set_value(
+                self.cat_from.ID, self.cat_to.ID, rel_type, value
+            )
+
     @staticmethod
     def _get_tier_group(rel_type) -> Optional[str]:
         """
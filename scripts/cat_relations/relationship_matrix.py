@@ -0,0 +1,204 @@
+"""
+Optional columnar storage for relationship values.
+
+When NumPy is installed, a RelationshipMatrix keeps one int8 matrix per RelType, indexed
+by a dense per-cat index (row = cat_from, column = cat_to). Relationship setters and the
+RelationshipStore write through to the active matrix, so questions like "which cats
+like X at least 40" become a single vectorized comparison over a column instead of a
+Python loop over Relationship objects.
+
+Without NumPy nothing is enabled and callers fall back to looping over relationships.
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from scripts.cat_relations.enums import RelType
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from scripts.cat.cats import Cat
+    from scripts.cat_relations.relationship import Relationship
+
+REL_TYPES = (
+    RelType.ROMANCE,
+    RelType.LIKE,
+    RelType.RESPECT,
+    RelType.TRUST,
+    RelType.COMFORT,
+)
+
+active_matrix: Optional["RelationshipMatrix"] = None
+"""The matrix relationship changes are currently written to, if any"""
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+class RelationshipMatrix:
+    """
+    Dense int8 matrices of relationship values, one per RelType.
+    Cats are assigned an index the first time a value involving them is written, and
+    the matrices grow by doubling, so adding a cat is amortized O(N).
+    """
+
+    def __init__(self, capacity: int = 64):
+        if np is None:
+            raise RuntimeError("RelationshipMatrix requires numpy")
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._capacity = max(capacity, 1)
+        self._values = {
+            rel_type: np.zeros((self._capacity, self._capacity), dtype=np.int8)
+            for rel_type in REL_TYPES
+        }
+
+    @classmethod
+    def from_cats(cls, cats: Iterable["Cat"]) -> "RelationshipMatrix":
+        """Builds a matrix holding the current relationships of the given cats."""
+        cats = list(cats)
+        matrix = cls(capacity=len(cats))
+        for cat in cats:
+            matrix.index_of(cat.ID)
+        for cat in cats:
+            for cat_to_ID, values in cat.relationships.iter_value_rows():
+                matrix.set_values(cat.ID, cat_to_ID, values)
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, cat_ID: str) -> bool:
+        return cat_ID in self._index
+
+    def index_of(self, cat_ID: str) -> int:
+        """Returns the dense index of the cat, assigning one if needed."""
+        try:
+            return self._index[cat_ID]
+        except KeyError:
+            pass
+        index = len(self._ids)
+        if index >= self._capacity:
+            self._grow(self._capacity * 2)
+        self._index[cat_ID] = index
+        self._ids.append(cat_ID)
+        return index
+
+    def _grow(self, capacity: int):
+        for rel_type, values in self._values.items():
+            grown = np.zeros((capacity, capacity), dtype=np.int8)
+            grown[: self._capacity, : self._capacity] = values
+            self._values[rel_type] = grown
+        self._capacity = capacity
+
+    def set_value(self, cat_from_ID: str, cat_to_ID: str, rel_type: RelType, value):
+        # index first, assigning an index may replace the matrices with bigger ones
+        row = self.index_of(cat_from_ID)
+        column = self.index_of(cat_to_ID)
+        self._values[rel_type][row, column] = value
+
+    def set_values(self, cat_from_ID: str, cat_to_ID: str, values: Iterable[int]):
+        """
+        :param values: the romance, like, respect, trust and comfort values, in the
+            order of REL_TYPES
+        """
+        row = self.index_of(cat_from_ID)
+        column = self.index_of(cat_to_ID)
+        for rel_type, value in zip(REL_TYPES, values):
+            self._values[rel_type][row, column] = value
+
+    def clear_row(self, cat_from_ID: str):
+        """Resets every value the given cat holds towards others."""
+        row = self._index.get(cat_from_ID)
+        if row is None:
+            return
+        for values in self._values.values():
+            values[row, :] = 0
+
+    def set_relationship(self, relationship: "Relationship"):
+        self.set_values(
+            relationship.cat_from.ID,
+            relationship.cat_to.ID,
+            (
+                relationship.romance,
+                relationship.like,
+                relationship.respect,
+                relationship.trust,
+                relationship.comfort,
+            ),
+        )
+
+    def get_value(self, cat_from_ID: str, cat_to_ID: str, rel_type: RelType) -> int:
+        row = self._index.get(cat_from_ID)
+        column = self._index.get(cat_to_ID)
+        if row is None or column is None:
+            return 0
+        return int(self._values[rel_type][row, column])
+
+    def _select(self, line, minimum: Optional[int], maximum: Optional[int]):
+        mask = np.ones(len(self._ids), dtype=bool)
+        if minimum is not None:
+            mask &= line >= minimum
+        if maximum is not None:
+            mask &= line <= maximum
+        return [self._ids[i] for i in np.flatnonzero(mask)]
+
+    def cats_towards(
+        self,
+        cat_to_ID: str,
+        rel_type: RelType,
+        minimum: Optional[int] = None,
+        maximum: Optional[int] = None,
+    ) -> List[str]:
+        """
+        IDs of all cats whose rel_type value towards the given cat lies within
+        [minimum, maximum], e.g. every cat whose like towards X is at least 40.
+        """
+        column = self._index.get(cat_to_ID)
+        if column is None:
+            return []
+        line = self._values[rel_type][: len(self._ids), column]
+        return [
+            cat_ID
+            for cat_ID in self._select(line, minimum, maximum)
+            if cat_ID != cat_to_ID
+        ]
+
+    def cats_from(
+        self,
+        cat_from_ID: str,
+        rel_type: RelType,
+        minimum: Optional[int] = None,
+        maximum: Optional[int] = None,
+    ) -> List[str]:
+        """
+        IDs of all cats the given cat holds a rel_type value within [minimum, maximum]
+        towards.
+        """
+        row = self._index.get(cat_from_ID)
+        if row is None:
+            return []
+        line = self._values[rel_type][row, : len(self._ids)]
+        return [
+            cat_ID
+            for cat_ID in self._select(line, minimum, maximum)
+            if cat_ID != cat_from_ID
+        ]
+
+
+def enable(cats: Iterable["Cat"]):
+    """Builds a matrix from the given cats and starts writing relationship changes to it."""
+    global active_matrix
+    if np is None:
+        active_matrix = None
+        return
+    active_matrix = RelationshipMatrix.from_cats(cats)
+
+
+def disable():
+    global active_matrix
+    active_matrix = None
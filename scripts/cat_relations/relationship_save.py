@@ -0,0 +1,555 @@
+"""
+Packed, incrementally written relationship saves.
+
+A clan's relationships are kept in three files inside its relationships folder:
+
+- ids.txt: every cat ID that appears in a relationship, one per line, append-only.
+- values.bin: a header (see HEADER) followed by fixed-size rows (see ROW), one per
+  relationship that isn't neutral, plus one per saved cat that marks its relationships
+  as saved. A saved cat is neutral towards every cat it has no row for.
+- logs.jsonl: append-only log store. Each line holds new log entries for one
+  relationship, or a full replacement of its log.
+
+A save only writes what changed. New IDs and log lines are appended to their files,
+each save ending its part with a line that holds its generation. The changed rows are
+written to values.journal first and, once that is complete, into values.bin in place
+along with the new generation in its header. A save interrupted before the journal is
+complete leaves values.bin as it was, one interrupted after it is finished from the
+journal the next time the save is opened. Lines past the header's generation belong to
+a save that didn't finish and are cut off. If ids.txt or logs.jsonl don't reach that
+generation at all, the files don't belong together and the save isn't used.
+
+Compacting writes the three files anew next to the old ones and moves them into place
+once all of them are complete, which compact.journal marks.
+
+The old format (one {ID}_relations.json file per cat) is still read when there is no
+packed save yet, and is replaced by it on the next save.
+"""
+
+import logging
+import os
+import struct
+from pathlib import Path
+from time import time_ns
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import ujson
+
+from scripts.game_structure.game.save_load import (
+    run_file_operation,
+    safe_remove,
+    save_writer,
+)
+
+if TYPE_CHECKING:
+    from scripts.cat.cats import Cat
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CGRL"
+VERSION = 2
+HEADER = struct.Struct("<4sHHQI")
+"""magic, version, row size, generation, row count"""
+HEADER_V1 = struct.Struct("<4sHH")
+"""magic, version, row size. Version 1 saves had no generations and kept neutral rows"""
+ROW = struct.Struct("<IIB5b")
+"""from index, to index, flags, romance, like, respect, trust, comfort"""
+
+FLAG_MATES = 1
+FLAG_FAMILY = 2
+FLAG_DELETED = 4
+FLAG_CAT = 8
+"""The row only marks that the from cat's relationships are saved"""
+
+IDS_FILE = "ids.txt"
+VALUES_FILE = "values.bin"
+LOGS_FILE = "logs.jsonl"
+
+JOURNAL_FILE = "values.journal"
+JOURNAL_MAGIC = b"CGRJ"
+JOURNAL_HEADER = struct.Struct("<4sQI")
+"""magic, generation, row count, followed by a JOURNAL_SLOT and a ROW per changed row"""
+JOURNAL_SLOT = struct.Struct("<I")
+
+COMPACT_FILE = "compact.journal"
+NEW_SUFFIX = ".new"
+
+COMPACT_MIN_ROWS = 1000
+"""Below this many rows, deleted rows are never worth compacting away"""
+
+SavedRow = Tuple[str, bool, bool, Tuple[int, ...], list]
+"""cat_to ID, mates, family, (romance, like, respect, trust, comfort), log"""
+
+
+def has_packed_save(directory: Union[str, Path]) -> bool:
+    directory = Path(directory)
+    return (directory / VALUES_FILE).exists() and (directory / IDS_FILE).exists()
+
+
+def is_neutral_row(row) -> bool:
+    """Whether a RelationshipStore.save_row holds nothing but the defaults"""
+    mates, family, values, log = row
+    return not (mates or family or log or any(values))
+
+
+def _pack_row(from_index: int, to_index: int, row) -> bytes:
+    mates, family, values = row[0], row[1], row[2]
+    flags = (FLAG_MATES if mates else 0) | (FLAG_FAMILY if family else 0)
+    return ROW.pack(from_index, to_index, flags, *values)
+
+
+def _cat_row(index: int) -> bytes:
+    return ROW.pack(index, index, FLAG_CAT, 0, 0, 0, 0, 0)
+
+
+def _ids_marker(generation: int) -> str:
+    return f"#{generation}\n"
+
+
+def _logs_marker(generation: int) -> str:
+    return ujson.dumps({"generation": generation}) + "\n"
+
+
+class RelationshipPack:
+    """
+    In-memory index of a clan's packed relationship save: which row of values.bin
+    belongs to which pair of cats, and which rows are dead.
+    """
+
+    def __init__(self):
+        self.directory: Optional[Path] = None
+        self._generation: Optional[int] = None
+        """generation of the open save, None if it has to be written anew"""
+        self._ids: List[str] = []
+        self._id_index: Dict[str, int] = {}
+        self._slots: Dict[str, Dict[str, int]] = {}
+        self._row_count = 0
+        self._garbage = 0
+        self._logged_pairs: Set[Tuple[str, str]] = set()
+        self._loaded_rows: Dict[str, List[SavedRow]] = {}
+
+    def close(self):
+        """Forgets the currently opened save."""
+        self.__init__()
+
+    # ---------------------------------------------------------------------------- #
+    #                                    loading                                   #
+    # ---------------------------------------------------------------------------- #
+
+    def open(self, directory: Union[str, Path]) -> bool:
+        """
+        Reads the packed save in directory, if it isn't the one already open.
+        :return: whether there is a packed save to load relationships from
+        """
+        directory = Path(directory)
+        if directory == self.directory:
+            return True
+        self.close()
+        # the files have to be complete before they can be checked
+        save_writer.wait()
+        try:
+            _recover(directory)
+            if not has_packed_save(directory):
+                return False
+            self._read(directory)
+        except (OSError, ValueError, struct.error):
+            logger.exception("Could not read packed relationships in %s", directory)
+            self.close()
+            return False
+        self.directory = directory
+        return True
+
+    def _read(self, directory: Path):
+        with open(directory / VALUES_FILE, "rb") as read_file:
+            data = read_file.read()
+        magic, version, row_size = HEADER_V1.unpack_from(data)
+        if magic != MAGIC or version not in (1, VERSION) or row_size != ROW.size:
+            raise ValueError(f"Unsupported relationship save in {directory}")
+        if version == VERSION:
+            _, _, _, generation, row_count = HEADER.unpack_from(data)
+            body = memoryview(data)[HEADER.size :]
+        else:
+            # the next save writes it anew in the current version
+            generation = None
+            body = memoryview(data)[HEADER_V1.size :]
+            row_count = len(body) // ROW.size
+        row_count = min(row_count, len(body) // ROW.size)
+
+        ids_text = _read_committed(directory / IDS_FILE, generation, _ids_marker)
+        self._ids = [line for line in ids_text.splitlines() if line[:1] != "#"]
+        self._id_index = {cat_ID: i for i, cat_ID in enumerate(self._ids)}
+
+        logs: Dict[Tuple[str, str], list] = {}
+        logs_text = _read_committed(directory / LOGS_FILE, generation, _logs_marker)
+        for line in logs_text.splitlines():
+            if not line.strip():
+                continue
+            entry = ujson.loads(line)
+            if "generation" in entry:
+                continue
+            key = (entry["from"], entry["to"])
+            if entry.get("replace") or key not in logs:
+                logs[key] = list(entry["log"])
+            else:
+                logs[key].extend(entry["log"])
+        self._logged_pairs = set(logs)
+
+        rows_by_cat: Dict[str, Dict[str, SavedRow]] = {}
+        for slot, row in enumerate(ROW.iter_unpack(body[: row_count * ROW.size])):
+            from_index, to_index, flags, *values = row
+            if flags & FLAG_DELETED:
+                self._garbage += 1
+                continue
+            from_ID = self._ids[from_index]
+            to_ID = self._ids[to_index]
+            slots = self._slots.setdefault(from_ID, {})
+            if to_ID in slots:
+                # an older row for the same pair, the newer one wins
+                self._garbage += 1
+            slots[to_ID] = slot
+            saved_rows = rows_by_cat.setdefault(from_ID, {})
+            if flags & FLAG_CAT:
+                continue
+            saved_rows[to_ID] = (
+                to_ID,
+                bool(flags & FLAG_MATES),
+                bool(flags & FLAG_FAMILY),
+                tuple(values),
+                logs.get((from_ID, to_ID), []),
+            )
+        self._loaded_rows = {
+            from_ID: list(rows.values()) for from_ID, rows in rows_by_cat.items()
+        }
+        self._row_count = row_count
+        self._generation = generation
+
+    def take_rows(self, cat_ID: str) -> Optional[List[SavedRow]]:
+        """
+        Hands out the saved relationships of a cat that aren't neutral, once.
+        :return: the rows, or None if the save has nothing for this cat
+        """
+        return self._loaded_rows.pop(cat_ID, None)
+
+    # ---------------------------------------------------------------------------- #
+    #                                    saving                                    #
+    # ---------------------------------------------------------------------------- #
+
+    def save(self, directory: Union[str, Path], cats: Iterable["Cat"]):
+        """
+        Saves the relationships of all living cats. Only writes what changed since the
+        last save, unless there's no packed save to add to or it's due for compaction.
+        """
+        directory = Path(directory)
+        living = [cat for cat in cats if not cat.dead]
+        self._loaded_rows.clear()
+
+        # files are written in the background during autosaves, so whether there is
+        # something to add to is tracked here rather than checked on disk
+        if (
+            directory != self.directory
+            or self._generation is None
+            or (
+                self._row_count > COMPACT_MIN_ROWS
+                and self._garbage * 2 > self._row_count
+            )
+        ):
+            self._write_full(directory, living)
+        else:
+            self._write_changes(directory, living)
+
+        for cat in living:
+            cat.relationships.mark_saved()
+
+    def _index_of(self, cat_ID: str, new_ids: List[str]) -> int:
+        try:
+            return self._id_index[cat_ID]
+        except KeyError:
+            index = len(self._ids)
+            self._ids.append(cat_ID)
+            self._id_index[cat_ID] = index
+            new_ids.append(cat_ID)
+            return index
+
+    def _write_full(self, directory: Path, living: List["Cat"]):
+        self.close()
+        directory.mkdir(parents=True, exist_ok=True)
+        # the files this replaces can't have a generation this high
+        generation = time_ns()
+        new_ids = []
+        rows = []
+        logs = []
+        for cat in living:
+            from_index = self._index_of(cat.ID, new_ids)
+            slots = self._slots.setdefault(cat.ID, {})
+            slots[cat.ID] = len(rows)
+            rows.append(_cat_row(from_index))
+            for cat_to_ID, row in cat.relationships.iter_save_rows(skip_neutral=True):
+                if is_neutral_row(row):
+                    continue
+                slots[cat_to_ID] = len(rows)
+                rows.append(
+                    _pack_row(from_index, self._index_of(cat_to_ID, new_ids), row)
+                )
+                if row[3]:
+                    self._logged_pairs.add((cat.ID, cat_to_ID))
+                    logs.append(
+                        ujson.dumps({"from": cat.ID, "to": cat_to_ID, "log": row[3]})
+                    )
+        self._row_count = len(rows)
+        self._generation = generation
+
+        run_file_operation(
+            _write_pack,
+            directory,
+            {
+                IDS_FILE: "".join(f"{i}\n" for i in self._ids)
+                + _ids_marker(generation),
+                LOGS_FILE: "".join(f"{line}\n" for line in logs)
+                + _logs_marker(generation),
+                VALUES_FILE: HEADER.pack(
+                    MAGIC, VERSION, ROW.size, generation, len(rows)
+                )
+                + b"".join(rows),
+            },
+        )
+        self.directory = directory
+
+        # the old format is fully migrated now
+        for old_file in directory.glob("*_relations.json"):
+            safe_remove(old_file)
+
+    def _write_changes(self, directory: Path, living: List["Cat"]):
+        new_ids = []
+        writes: Dict[int, bytes] = {}
+        appends: List[bytes] = []
+        logs: List[str] = []
+
+        def append(slots: dict, cat_to_ID: str, packed: bytes):
+            slots[cat_to_ID] = self._row_count + len(appends)
+            appends.append(packed)
+
+        def put(from_index: int, cat_to_ID: str, row, slots: dict):
+            slot = slots.get(cat_to_ID)
+            if is_neutral_row(row):
+                # neutral relationships aren't stored
+                if slot is not None:
+                    delete(slots.pop(cat_to_ID))
+                return
+            packed = _pack_row(from_index, self._index_of(cat_to_ID, new_ids), row)
+            if slot is None:
+                append(slots, cat_to_ID, packed)
+            else:
+                writes[slot] = packed
+
+        def delete(slot: int):
+            writes[slot] = ROW.pack(0, 0, FLAG_DELETED, 0, 0, 0, 0, 0)
+            self._garbage += 1
+
+        def write_log(from_ID: str, cat_to_ID: str, log: list, replace: bool):
+            key = (from_ID, cat_to_ID)
+            if not log and (not replace or key not in self._logged_pairs):
+                return
+            self._logged_pairs.add(key)
+            entry = {"from": from_ID, "to": cat_to_ID, "log": log}
+            if replace:
+                entry["replace"] = True
+            logs.append(ujson.dumps(entry))
+
+        living_IDs = {cat.ID for cat in living}
+        for from_ID in [i for i in self._slots if i not in living_IDs]:
+            for slot in self._slots.pop(from_ID).values():
+                delete(slot)
+
+        for cat in living:
+            store = cat.relationships
+            from_index = self._index_of(cat.ID, new_ids)
+            reset, changed_IDs = store.pending_changes()
+            if reset or cat.ID not in self._slots:
+                for slot in self._slots.pop(cat.ID, {}).values():
+                    delete(slot)
+                changed_IDs = store.keys()
+                append(self._slots.setdefault(cat.ID, {}), cat.ID, _cat_row(from_index))
+            slots = self._slots[cat.ID]
+
+            for cat_to_ID in changed_IDs:
+                row = store.save_row(cat_to_ID)
+                if row is None:
+                    slot = slots.pop(cat_to_ID, None)
+                    if slot is not None:
+                        delete(slot)
+                    continue
+                put(from_index, cat_to_ID, row, slots)
+                write_log(cat.ID, cat_to_ID, row[3], replace=True)
+
+            for relationship in store.dirty_relationships(skip=changed_IDs):
+                cat_to_ID = relationship.cat_to.ID
+                if relationship.dirty:
+                    put(from_index, cat_to_ID, store.save_row(cat_to_ID), slots)
+                saved_length = relationship.saved_log_length
+                if len(relationship.log) > saved_length:
+                    write_log(
+                        cat.ID,
+                        cat_to_ID,
+                        relationship.log[saved_length:],
+                        replace=False,
+                    )
+                elif len(relationship.log) < saved_length:
+                    write_log(cat.ID, cat_to_ID, relationship.log, replace=True)
+
+        if not (new_ids or writes or appends or logs):
+            return
+
+        for packed in appends:
+            writes[self._row_count] = packed
+            self._row_count += 1
+        self._generation += 1
+        run_file_operation(
+            _write_increment,
+            directory,
+            "".join(f"{i}\n" for i in new_ids) + _ids_marker(self._generation),
+            "".join(f"{line}\n" for line in logs) + _logs_marker(self._generation),
+            self._generation,
+            self._row_count,
+            writes,
+        )
+
+
+def _read_committed(path: Path, generation: Optional[int], marker) -> str:
+    """
+    Reads an append-only file up to the line that ends the given generation, and cuts
+    off what a save that didn't finish appended after it.
+    :raises ValueError: if the file doesn't reach that generation
+    """
+    if generation is None:
+        if not path.exists():
+            return ""
+        with open(path, "r", encoding="utf-8") as read_file:
+            return read_file.read()
+
+    with open(path, "rb") as read_file:
+        data = read_file.read()
+
+    end_line = marker(generation).encode("utf-8")
+    if data.startswith(end_line):
+        end = len(end_line)
+    else:
+        end = data.rfind(b"\n" + end_line)
+        if end == -1:
+            raise ValueError(f"{path} doesn't match generation {generation}")
+        end += len(end_line) + 1
+    if end < len(data):
+        with open(path, "r+b") as write_file:
+            write_file.truncate(end)
+    return data[:end].decode("utf-8")
+
+
+def _recover(directory: Path):
+    """Finishes a compaction or a journaled save that was interrupted."""
+    names = (IDS_FILE, LOGS_FILE, VALUES_FILE)
+    if (directory / COMPACT_FILE).exists():
+        for name in names:
+            new_path = directory / (name + NEW_SUFFIX)
+            if new_path.exists():
+                os.replace(new_path, directory / name)
+        os.remove(directory / COMPACT_FILE)
+    else:
+        # a compaction that didn't get to write all of its files
+        for name in names:
+            new_path = directory / (name + NEW_SUFFIX)
+            if new_path.exists():
+                os.remove(new_path)
+
+    if (directory / JOURNAL_FILE).exists():
+        _apply_journal(directory)
+
+
+def _write_pack(directory: Path, files: Dict[str, Union[str, bytes]]):
+    """Replaces the files of a packed save, all of them or, if interrupted, none."""
+    for name, data in files.items():
+        _write_synced(directory / (name + NEW_SUFFIX), data)
+    # a journal left by a save that failed doesn't belong to the new files
+    if (directory / JOURNAL_FILE).exists():
+        os.remove(directory / JOURNAL_FILE)
+    _replace_file(directory / COMPACT_FILE, "")
+    for name in files:
+        os.replace(directory / (name + NEW_SUFFIX), directory / name)
+    os.remove(directory / COMPACT_FILE)
+
+
+def _write_increment(
+    directory: Path,
+    ids_text: str,
+    logs_text: str,
+    generation: int,
+    row_count: int,
+    writes: Dict[int, bytes],
+):
+    """Appends to ids.txt and logs.jsonl, then writes the rows through the journal."""
+    _append_file(directory / IDS_FILE, ids_text)
+    _append_file(directory / LOGS_FILE, logs_text)
+    _replace_file(
+        directory / JOURNAL_FILE,
+        JOURNAL_HEADER.pack(JOURNAL_MAGIC, generation, row_count)
+        + b"".join(JOURNAL_SLOT.pack(slot) + writes[slot] for slot in sorted(writes)),
+    )
+    _apply_journal(directory)
+
+
+def _apply_journal(directory: Path):
+    """
+    Writes the rows in values.journal into values.bin in place, if the journal is the
+    save after the one in values.bin, and removes the journal.
+    """
+    journal_path = directory / JOURNAL_FILE
+    with open(journal_path, "rb") as read_file:
+        journal = read_file.read()
+    magic, generation, row_count = JOURNAL_HEADER.unpack_from(journal)
+
+    with open(directory / VALUES_FILE, "r+b") as write_file:
+        _, version, _, current, _ = HEADER.unpack(write_file.read(HEADER.size))
+        # a journal that was already written in is written again, nothing changes
+        if (
+            magic == JOURNAL_MAGIC
+            and version == VERSION
+            and generation in (current, current + 1)
+        ):
+            entry_size = JOURNAL_SLOT.size + ROW.size
+            for offset in range(JOURNAL_HEADER.size, len(journal), entry_size):
+                (slot,) = JOURNAL_SLOT.unpack_from(journal, offset)
+                write_file.seek(HEADER.size + slot * ROW.size)
+                write_file.write(
+                    journal[offset + JOURNAL_SLOT.size : offset + entry_size]
+                )
+            write_file.seek(0)
+            write_file.write(
+                HEADER.pack(MAGIC, VERSION, ROW.size, generation, row_count)
+            )
+            write_file.flush()
+            os.fsync(write_file.fileno())
+    os.remove(journal_path)
+
+
+def _write_synced(path: Path, data: Union[str, bytes]):
+    if isinstance(data, str):
+        # written as bytes, so the generation lines are found byte for byte
+        data = data.encode("utf-8")
+    with open(path, "wb") as write_file:
+        write_file.write(data)
+        write_file.flush()
+        os.fsync(write_file.fileno())
+
+
+def _replace_file(path: Path, data: Union[str, bytes]):
+    temp_path = path.with_name(path.name + ".tmp")
+    _write_synced(temp_path, data)
+    os.replace(temp_path, path)
+
+
+def _append_file(path: Path, data: str):
+    with open(path, "ab") as write_file:
+        write_file.write(data.encode("utf-8"))
+        write_file.flush()
+        os.fsync(write_file.fileno())
+
+
+relationship_pack = RelationshipPack()
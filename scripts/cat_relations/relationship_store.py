@@ -0,0 +1,395 @@
+"""
+Sparse, lazily materialized storage for a cat's relationships.
+
+Most relationships in a large clan are never looked at in detail, so building a full
+Relationship object for every ordered pair wastes memory and load time. A
+RelationshipStore keeps pairs that haven't been looked at yet as either a bare
+reference to the other cat (neutral relationships) or a small slotted record, and only
+builds the real Relationship the first time it's accessed.
+"""
+
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set
+from typing import Tuple, Union
+
+import scripts.cat_relations.relationship_matrix as relationship_matrix
+from scripts.cat_relations.enums import RelType
+from scripts.cat_relations.relationship import Relationship
+
+if TYPE_CHECKING:
+    from scripts.cat.cats import Cat
+
+
+class RelationshipRecord:
+    """Compact stand-in for a non-neutral Relationship that hasn't been materialized yet."""
+
+    __slots__ = (
+        "cat_to",
+        "mates",
+        "family",
+        "romance",
+        "like",
+        "respect",
+        "trust",
+        "comfort",
+        "log",
+    )
+
+    def __init__(
+        self, cat_to, mates, family, romance, like, respect, trust, comfort, log
+    ):
+        self.cat_to = cat_to
+        self.mates = mates
+        self.family = family
+        self.romance = romance
+        self.like = like
+        self.respect = respect
+        self.trust = trust
+        self.comfort = comfort
+        self.log = log
+
+
+_NEUTRAL = (0, 0, 0, 0, 0)
+
+
+def _clamp(value: int, lowest: int) -> int:
+    return min(max(value, lowest), 100)
+
+
+def _record_values(record: RelationshipRecord) -> Tuple[int, ...]:
+    return (
+        record.romance,
+        record.like,
+        record.respect,
+        record.trust,
+        record.comfort,
+    )
+
+
+class RelationshipStore(MutableMapping):
+    """
+    Dict-like mapping of cat ID -> Relationship. Relationships that haven't been accessed
+    yet are kept as a Cat reference (neutral) or a RelationshipRecord, and are turned
+    into full Relationship objects on first access.
+    """
+
+    __slots__ = ("cat", "_relationships", "_records", "_changed_IDs", "_reset")
+
+    def __init__(self, cat: "Cat", relationships: Optional[dict] = None):
+        self.cat = cat
+        self._relationships: Dict[str, Relationship] = {}
+        self._records: Dict[str, Union["Cat", RelationshipRecord]] = {}
+        # IDs whose relationship was added, replaced or removed since the last save
+        self._changed_IDs: Set[str] = set()
+        # whether everything has to be saved again
+        self._reset = relationships is not None
+        if relationships is None:
+            return
+        self._relationships.update(relationships)
+        # this replaces whatever the cat had before
+        matrix = relationship_matrix.active_matrix
+        if matrix is not None:
+            matrix.clear_row(cat.ID)
+            for relationship in relationships.values():
+                matrix.set_relationship(relationship)
+
+    def __getitem__(self, cat_ID: str) -> Relationship:
+        try:
+            return self._relationships[cat_ID]
+        except KeyError:
+            record = self._records.pop(cat_ID)
+            relationship = self._materialize(record)
+            self._relationships[cat_ID] = relationship
+            return relationship
+
+    def __setitem__(self, cat_ID: str, relationship: Relationship):
+        self._records.pop(cat_ID, None)
+        self._relationships[cat_ID] = relationship
+        self._changed_IDs.add(cat_ID)
+        if relationship_matrix.active_matrix is not None:
+            relationship_matrix.active_matrix.set_relationship(relationship)
+
+    def __delitem__(self, cat_ID: str):
+        if self._records.pop(cat_ID, None) is None:
+            del self._relationships[cat_ID]
+        self._changed_IDs.add(cat_ID)
+        if relationship_matrix.active_matrix is not None:
+            relationship_matrix.active_matrix.set_values(self.cat.ID, cat_ID, _NEUTRAL)
+
+    def __contains__(self, cat_ID) -> bool:
+        return cat_ID in self._relationships or cat_ID in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._relationships
+        # materializing during iteration would change _records, so iterate a snapshot
+        yield from tuple(self._records)
+
+    def __len__(self) -> int:
+        return len(self._relationships) + len(self._records)
+
+    def __repr__(self):
+        return (
+            f"RelationshipStore({self.cat.ID}: {len(self._relationships)} materialized,"
+            f" {len(self._records)} sparse)"
+        )
+
+    def get(self, cat_ID: str, default=None):
+        if cat_ID in self:
+            return self[cat_ID]
+        return default
+
+    def clear(self):
+        self._relationships.clear()
+        self._records.clear()
+        self._changed_IDs.clear()
+        self._reset = True
+        if relationship_matrix.active_matrix is not None:
+            relationship_matrix.active_matrix.clear_row(self.cat.ID)
+
+    @property
+    def materialized_count(self) -> int:
+        """How many of the relationships currently exist as full Relationship objects."""
+        return len(self._relationships)
+
+    def add_record(
+        self,
+        cat_to: "Cat",
+        mates: bool = False,
+        family: bool = False,
+        romance: int = 0,
+        like: int = 0,
+        respect: int = 0,
+        trust: int = 0,
+        comfort: int = 0,
+        log: list = None,
+    ):
+        """
+        Adds a relationship towards cat_to without building a Relationship object. Takes
+        the same values as Relationship.__init__. Replaces any existing relationship.
+        """
+        self._relationships.pop(cat_to.ID, None)
+        self._changed_IDs.add(cat_to.ID)
+        if not (
+            mates or family or romance or like or respect or trust or comfort or log
+        ):
+            self._records[cat_to.ID] = cat_to
+            if relationship_matrix.active_matrix is not None:
+                relationship_matrix.active_matrix.set_values(
+                    self.cat.ID, cat_to.ID, _NEUTRAL
+                )
+            return
+        record = RelationshipRecord(
+            cat_to,
+            mates,
+            family,
+            _clamp(romance, 0),
+            _clamp(like, -100),
+            _clamp(respect, -100),
+            _clamp(trust, -100),
+            _clamp(comfort, -100),
+            log if log else None,
+        )
+        self._records[cat_to.ID] = record
+        if relationship_matrix.active_matrix is not None:
+            relationship_matrix.active_matrix.set_values(
+                self.cat.ID, cat_to.ID, _record_values(record)
+            )
+
+    def non_neutral_values(self) -> Iterator[Relationship]:
+        """
+        Yields every relationship that isn't known to be neutral, without materializing
+        the neutral ones. Use this when the caller would skip neutral relationships anyway.
+        """
+        yield from tuple(self._relationships.values())
+        for cat_ID, record in tuple(self._records.items()):
+            if isinstance(record, RelationshipRecord):
+                yield self[cat_ID]
+
+    def iter_value_rows(self) -> Iterator[Tuple[str, Tuple[int, ...]]]:
+        """
+        Yields (cat ID, values) for every relationship without materializing anything.
+        The values are ordered like relationship_matrix.REL_TYPES.
+        """
+        for cat_ID, relationship in self._relationships.items():
+            yield cat_ID, (
+                relationship.romance,
+                relationship.like,
+                relationship.respect,
+                relationship.trust,
+                relationship.comfort,
+            )
+        for cat_ID, record in self._records.items():
+            if isinstance(record, RelationshipRecord):
+                yield cat_ID, _record_values(record)
+            else:
+                yield cat_ID, _NEUTRAL
+
+    def ids_within(
+        self,
+        rel_type: RelType,
+        minimum: Optional[int] = None,
+        maximum: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Returns the IDs of the cats whose rel_type value lies within [minimum, maximum],
+        without materializing any relationship. Uses a vectorized scan of the active
+        relationship matrix if there is one.
+        """
+        matrix = relationship_matrix.active_matrix
+        if matrix is not None and self.cat.ID in matrix:
+            return [
+                cat_ID
+                for cat_ID in matrix.cats_from(self.cat.ID, rel_type, minimum, maximum)
+                if cat_ID in self
+            ]
+
+        position = relationship_matrix.REL_TYPES.index(rel_type)
+        return [
+            cat_ID
+            for cat_ID, values in self.iter_value_rows()
+            if (minimum is None or values[position] >= minimum)
+            and (maximum is None or values[position] <= maximum)
+        ]
+
+    def values_within(
+        self,
+        rel_type: RelType,
+        minimum: Optional[int] = None,
+        maximum: Optional[int] = None,
+    ) -> List[Relationship]:
+        """
+        Returns the relationships whose rel_type value lies within [minimum, maximum].
+        Only the relationships that match are materialized.
+        """
+        return [self[cat_ID] for cat_ID in self.ids_within(rel_type, minimum, maximum)]
+
+    def save_row(
+        self, cat_ID: str
+    ) -> Optional[Tuple[bool, bool, Tuple[int, ...], list]]:
+        """
+        :return: mates, family, (romance, like, respect, trust, comfort) and log of the
+            relationship towards the given cat, or None if there is none
+        """
+        relationship = self._relationships.get(cat_ID)
+        if relationship is not None:
+            return (
+                relationship.mates,
+                relationship.family,
+                (
+                    relationship.romance,
+                    relationship.like,
+                    relationship.respect,
+                    relationship.trust,
+                    relationship.comfort,
+                ),
+                relationship.log,
+            )
+        record = self._records.get(cat_ID)
+        if record is None:
+            return None
+        if isinstance(record, RelationshipRecord):
+            return (
+                record.mates,
+                record.family,
+                _record_values(record),
+                record.log if record.log else [],
+            )
+        return False, False, _NEUTRAL, []
+
+    def iter_save_rows(self, skip_neutral: bool = False) -> Iterator[Tuple[str, tuple]]:
+        """
+        Yields (cat ID, save_row) for every relationship. With skip_neutral, the ones
+        that aren't materialized and known to be neutral are left out.
+        """
+        for cat_ID in self._relationships:
+            yield cat_ID, self.save_row(cat_ID)
+        for cat_ID, record in tuple(self._records.items()):
+            if not skip_neutral or isinstance(record, RelationshipRecord):
+                yield cat_ID, self.save_row(cat_ID)
+
+    def pending_changes(self) -> Tuple[bool, Set[str]]:
+        """
+        :return: whether the whole store has to be saved again, and the IDs whose
+            relationship was added, replaced or removed since the last save
+        """
+        return self._reset, self._changed_IDs
+
+    def dirty_relationships(self, skip: Iterable[str] = ()) -> Iterator[Relationship]:
+        """
+        Yields the materialized relationships that changed or got new log entries
+        since the last save, leaving out the IDs in skip.
+        """
+        for cat_ID, relationship in self._relationships.items():
+            if cat_ID in skip:
+                continue
+            if relationship.dirty or len(relationship.log) != (
+                relationship.saved_log_length
+            ):
+                yield relationship
+
+    def mark_changed(self, cat_IDs: Iterable[str]):
+        """Makes the next save write (or remove) the relationships towards these cats."""
+        self._changed_IDs.update(cat_IDs)
+
+    def mark_saved(self):
+        """Marks everything in the store as saved."""
+        self._reset = False
+        self._changed_IDs.clear()
+        for relationship in self._relationships.values():
+            relationship.dirty = False
+            relationship.saved_log_length = len(relationship.log)
+
+    def iter_save_dicts(self) -> Iterator[dict]:
+        """
+        Yields the save dict of every relationship, building dicts for sparse entries
+        directly instead of materializing them.
+        """
+        for relationship in self._relationships.values():
+            yield relationship.to_dict()
+        for cat_ID, record in self._records.items():
+            if isinstance(record, RelationshipRecord):
+                yield {
+                    "cat_from_id": self.cat.ID,
+                    "cat_to_id": cat_ID,
+                    "mates": record.mates,
+                    "family": record.family,
+                    "romance": record.romance,
+                    "like": record.like,
+                    "respect": record.respect,
+                    "comfort": record.comfort,
+                    "trust": record.trust,
+                    "log": record.log if record.log else [],
+                    "no_longer_neutral": [],
+                }
+            else:
+                yield {
+                    "cat_from_id": self.cat.ID,
+                    "cat_to_id": cat_ID,
+                    "mates": False,
+                    "family": False,
+                    "romance": 0,
+                    "like": 0,
+                    "respect": 0,
+                    "comfort": 0,
+                    "trust": 0,
+                    "log": [],
+                    "no_longer_neutral": [],
+                }
+
+    def _materialize(self, record: Union["Cat", RelationshipRecord]) -> Relationship:
+        if not isinstance(record, RelationshipRecord):
+            return Relationship(self.cat, record)
+        relationship = Relationship(
+            cat_from=self.cat,
+            cat_to=record.cat_to,
+            mates=record.mates,
+            family=record.family,
+            romance=record.romance,
+            like=record.like,
+            respect=record.respect,
+            trust=record.trust,
+            comfort=record.comfort,
+            log=record.log,
+        )
+        relationship.saved_log_length = len(relationship.log)
+        return relationship
@@ -332,6 +332,8 @@ class Clan:
         if Cat.all_cats[ID] in Cat.all_cats_list:
             Cat.all_cats_list.remove(Cat.all_cats[ID])
 
+        Cat.all_cats[ID].status.unregister()
+
         if ID in Cat.all_cats:
             Cat.all_cats.pop(ID)
 
@@ -1,4 +1,8 @@
-from typing import Union, Type, TYPE_CHECKING, Tuple, List
+from typing import Union, Type, TYPE_CHECKING, Tuple, List, Iterable
+
+from scripts.cat.clan_roster import clan_roster
+from scripts.cat.enums import CatGroup
+from scripts.cat_relations.enums import RelType
 
 if TYPE_CHECKING:
     from scripts.cat.cats import Cat
@@ -59,11 +63,7 @@ def find_alive_cats_with_rank(
     :param bool sort: default False, set to True if you would like list sorted by descending moon age
     """
 
-    alive_cats = [
-        i
-        for i in Cat.all_cats.values()
-        if i.status.rank in ranks and i.status.alive_in_player_clan
-    ]
+    alive_cats = _fetch_cats(Cat, clan_roster.with_rank(CatGroup.PLAYER_CLAN_ID, ranks))
 
     if working:
         alive_cats = [i for i in alive_cats if not i.not_working()]
@@ -74,17 +74,26 @@ def find_alive_cats_with_rank(
     return alive_cats
 
 
+def get_alive_clan_cats(Cat: Union["Cat", Type["Cat"]]) -> list:
+    """
+    returns a list of cat objects for all living cats within the Clan
+    :param Cat Cat: Cat class
+    """
+    return _fetch_cats(Cat, clan_roster.in_group(CatGroup.PLAYER_CLAN_ID))
+
+
 def get_living_clan_cat_count(Cat):
     """
     Returns the int of all living cats within the Clan
     :param Cat: Cat class
     """
-    count = 0
-    for the_cat in Cat.all_cats.values():
-        if not the_cat.status.alive_in_player_clan:
-            continue
-        count += 1
-    return count
+    return len(get_alive_clan_cats(Cat))
+
+
+def _fetch_cats(Cat: Union["Cat", Type["Cat"]], cat_IDs: Iterable[str]) -> list:
+    """Fetches the cats of the clan roster's IDs, skipping any that were unloaded without it"""
+    all_cats = Cat.all_cats
+    return [all_cats[i] for i in cat_IDs if i in all_cats]
 
 
 def get_cats_same_age(Cat, cat_to_match, age_range=10):
@@ -95,9 +104,7 @@ def get_cats_same_age(Cat, cat_to_match, age_range=10):
     :param int age_range: The allowed age difference between the two cats, default 10
     """
     cats = []
-    for inter_cat in Cat.all_cats.values():
-        if not inter_cat.status.alive_in_player_clan:
-            continue
+    for inter_cat in get_alive_clan_cats(Cat):
         if inter_cat.ID == cat_to_match.ID:
             continue
 
@@ -126,9 +133,8 @@ def get_possible_mates(cat) -> Tuple[List["Cat"], List["Cat"]]:
     """
     possible_mates = []
     existing_romance_mates = []
-    for inter_cat in cat.all_cats.values():
-        if not inter_cat.status.alive_in_player_clan:
-            continue
+    romantic_IDs = set(cat.relationships.ids_within(RelType.ROMANCE, minimum=1))
+    for inter_cat in get_alive_clan_cats(cat):
         if inter_cat.ID == cat.ID:
             continue
 
@@ -139,7 +145,7 @@ def get_possible_mates(cat) -> Tuple[List["Cat"], List["Cat"]]:
             continue
 
         if inter_cat.is_potential_mate(cat, for_love_interest=True):
-            if cat.relationships[inter_cat.ID].romance > 0:
+            if inter_cat.ID in romantic_IDs:
                 existing_romance_mates.append(inter_cat)
             possible_mates.append(inter_cat)
     return possible_mates, existing_romance_mates
@@ -8,7 +8,10 @@ from scripts.cat.enums import CatRank
 from scripts.cat.skills import SkillPath
 from scripts.game_structure import constants
 from scripts.clan_package.settings import get_clan_setting
-from scripts.clan_package.get_clan_cats import get_alive_clan_queens
+from scripts.clan_package.get_clan_cats import (
+    get_alive_clan_cats,
+    get_alive_clan_queens,
+)
 
 
 class Nutrition:
@@ -239,9 +242,7 @@ class FreshkillPile:
 
         :return int|float needed_prey: The amount of prey the Clan needs
         """
-        living_cats = [
-            cat for cat in Cat.all_cats.values() if cat.status.alive_in_player_clan
-        ]
+        living_cats = get_alive_clan_cats(Cat)
         self._update_needed_food(living_cats)
         return self.needed_prey
 
@@ -10,6 +10,8 @@ from scripts.debug_commands.help import HelpCommand
 from scripts.debug_commands.settings import ToggleCommand, SetCommand, GetCommand
 from scripts.debug_commands.clan import ClanCommand
 from scripts.debug_commands.biome import BiomeCommand
+from scripts.debug_commands.sprites import SpritesCommand
+from scripts.debug_commands.profile import ProfileCommand
 
 commandList: List[Command] = [
     ToggleCommand(),
@@ -22,6 +24,8 @@ commandList: List[Command] = [
     ClanCommand(),
     PregnanciesCommand(),
     RelationshipsCommand(),
+    SpritesCommand(),
+    ProfileCommand(),
 ]
 
 helpCommand = HelpCommand(commandList)
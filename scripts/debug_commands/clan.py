@@ -1,7 +1,12 @@
 from typing import List
 
 from scripts.cat.cats import Cat
-from scripts.cat.save_load import save_cats
+from scripts.cat.save_load import (
+    convert_save_backend,
+    get_save_backend,
+    save_cache,
+    save_cats,
+)
 from scripts.debug_commands.command import Command
 from scripts.debug_commands.utils import add_output_line_to_log
 from scripts.game_structure.game.settings import game_settings_save
@@ -39,12 +44,54 @@ class ReloadClanCommand(Command):
             )
 
 
+class SaveStatsCommand(Command):
+    name = "savestats"
+    description = "Show how long each stage of the last cat save took."
+    aliases = ["ss"]
+
+    def callback(self, args: List[str]):
+        stats = save_cache.last_stats
+        if not stats:
+            add_output_line_to_log("The clan hasn't been saved since it was loaded.")
+            return
+        for stage, info in stats.items():
+            counts = ", ".join(
+                f"{key}: {value}" for key, value in info.items() if key != "seconds"
+            )
+            add_output_line_to_log(
+                f"{stage}: {info['seconds'] * 1000:.1f} ms"
+                + (f" ({counts})" if counts else "")
+            )
+
+
+class SaveBackendCommand(Command):
+    name = "savebackend"
+    description = "Show or change how the current clan's cats are saved."
+    aliases = ["sb"]
+    usage = "<json|sqlite>"
+
+    def callback(self, args: List[str]):
+        clanname = switch_get_value(Switch.clan_name)
+        if len(args) == 0:
+            add_output_line_to_log(
+                f"The clan is saved as {get_save_backend(clanname).name}."
+            )
+            return
+        if args[0] not in ("json", "sqlite"):
+            add_output_line_to_log("Unknown save kind, use json or sqlite.")
+            return
+        if convert_save_backend(clanname, Cat, to_sqlite=args[0] == "sqlite"):
+            add_output_line_to_log(f"The clan is now saved as {args[0]}.")
+        else:
+            add_output_line_to_log(f"The clan is already saved as {args[0]}.")
+
+
 class ClanCommand(Command):
     name = "clan"
     description = "Manage current loaded clan"
     aliases = ["clan", "cl"]
 
-    sub_commands = [ReloadClanCommand()]
+    sub_commands = [ReloadClanCommand(), SaveStatsCommand(), SaveBackendCommand()]
 
     def callback(self, args: List[str]):
         add_output_line_to_log("Please specify a subcommand")
@@ -0,0 +1,82 @@
+from typing import List
+
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import add_output_line_to_log
+from scripts.housekeeping import profiling
+
+
+class ProfileStartCommand(Command):
+    name = "start"
+    description = (
+        "Start timing moon skips from scratch. Add cprofile to run cProfile too."
+    )
+    usage = "[cprofile]"
+
+    def callback(self, args: List[str]):
+        cprofile = bool(args) and args[0].lower() == "cprofile"
+        profiling.start(cprofile=cprofile)
+        add_output_line_to_log(
+            "Profiling started" + (" with cProfile" if cprofile else "")
+        )
+
+
+class ProfileStopCommand(Command):
+    name = "stop"
+    description = "Stop timing, the timings are kept for report and dump."
+
+    def callback(self, args: List[str]):
+        profiling.stop()
+        add_output_line_to_log("Profiling stopped")
+
+
+class ProfileReportCommand(Command):
+    name = "report"
+    description = "Show the calls and times of every timer, in milliseconds."
+
+    def callback(self, args: List[str]):
+        if not profiling.timers:
+            add_output_line_to_log("Nothing has been timed yet")
+            return
+        for line in profiling.report():
+            add_output_line_to_log(line)
+
+
+class ProfileDumpCommand(Command):
+    name = "dump"
+    description = (
+        "Write the timers to a .json file for speedscope,"
+        " or the cProfile stats to any other file for pstats."
+    )
+    usage = "<file>"
+
+    def callback(self, args: List[str]):
+        if len(args) != 1:
+            add_output_line_to_log("Please specify a file")
+            return
+        try:
+            if args[0].endswith(".json"):
+                profiling.dump_speedscope(args[0])
+            else:
+                profiling.dump_pstats(args[0])
+        except (OSError, RuntimeError) as e:
+            add_output_line_to_log(f"Couldn't write {args[0]}: {e}")
+            return
+        add_output_line_to_log(f"Written to {args[0]}")
+
+
+class ProfileCommand(Command):
+    name = "profile"
+    description = "Time the stages of moon skips and other slow spots"
+
+    sub_commands = [
+        ProfileStartCommand(),
+        ProfileStopCommand(),
+        ProfileReportCommand(),
+        ProfileDumpCommand(),
+    ]
+
+    def callback(self, args: List[str]):
+        add_output_line_to_log(
+            f"Profiling is {'on' if profiling.is_enabled() else 'off'},"
+            f" {len(profiling.timers)} timers recorded"
+        )
@@ -0,0 +1,41 @@
+from typing import List
+
+from scripts.cat.sprites.display_sprites import (
+    clear_sprite_caches,
+    get_sprite_cache_info,
+)
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import add_output_line_to_log
+
+
+class SpriteCacheStatsCommand(Command):
+    name = "stats"
+    description = "Show how often composited cat sprites were reused."
+
+    def callback(self, args: List[str]):
+        for cache, info in get_sprite_cache_info().items():
+            lookups = info["hits"] + info["misses"]
+            hit_rate = info["hits"] / lookups * 100 if lookups else 0
+            add_output_line_to_log(
+                f"{cache}: {info['hits']}/{lookups} hits ({hit_rate:.1f}%),"
+                f" {info['size']}/{info['max_size']} cached"
+            )
+
+
+class SpriteCacheClearCommand(Command):
+    name = "clear"
+    description = "Empty the composited cat sprite caches."
+
+    def callback(self, args: List[str]):
+        clear_sprite_caches()
+        add_output_line_to_log("Sprite caches cleared")
+
+
+class SpritesCommand(Command):
+    name = "sprites"
+    description = "Inspect the cat sprite caches"
+
+    sub_commands = [SpriteCacheStatsCommand(), SpriteCacheClearCommand()]
+
+    def callback(self, args: List[str]):
+        add_output_line_to_log("Please specify a subcommand")
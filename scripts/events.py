@@ -16,6 +16,7 @@ from math import floor
 import i18n
 
 from scripts.cat.cats import Cat, cat_class, BACKSTORIES
+from scripts.cat.clan_roster import clan_roster
 from scripts.cat.enums import (
     CatAge,
     CatRank,
@@ -26,6 +27,8 @@ from scripts.cat.enums import (
 )
 from scripts.cat.names import Name
 from scripts.cat.save_load import save_cats, add_cat_to_fade_id
+from scripts.cat.sprites.prewarm import sprite_prewarmer
+from scripts.game_structure.game.save_load import background_save
 from scripts.cat.skills import SkillPath
 from scripts.clan_package.settings import get_clan_setting, set_clan_setting
 from scripts.clan_resources.freshkill import FRESHKILL_EVENT_ACTIVE
@@ -50,6 +53,7 @@ from scripts.game_structure.game.switches import (
 )
 from scripts.game_structure import game
 from scripts.game_structure.localization import load_lang_resource
+from scripts.housekeeping.profiling import profiled, timer
 from scripts.ui.windows.save_error import SaveErrorWindow
 from scripts.events_module.text_adjust import (
     ongoing_event_text_adjust,
@@ -66,6 +70,7 @@ from scripts.clan_package.cotc import (
 )
 from scripts.clan_package.get_clan_cats import (
     find_alive_cats_with_rank,
+    get_alive_clan_cats,
     get_living_clan_cat_count,
 )
 
@@ -82,6 +87,7 @@ war_lang = None
 ceremony_id_by_tag = {}
 
 
+@profiled("one_moon")
 def one_moon():
     """
     Handles the moon skipping of the whole Clan.
@@ -89,6 +95,7 @@ def one_moon():
 
     global new_cat_invited
 
+    sprite_prewarmer.stop()
     game.cur_events_list = []
     game.herb_events_list = []
     game.freshkill_event_list = []
@@ -110,21 +117,23 @@ def one_moon():
     # age up the clan, set current season
     game.clan.age += 1
 
-    update_afterlife_temper()
-    Pregnancy_Events.handle_pregnancy_age(game.clan)
-    check_war()
+    with timer("one_moon.clan"):
+        update_afterlife_temper()
+        Pregnancy_Events.handle_pregnancy_age(game.clan)
+        check_war()
 
     if game.clan.game_mode in ("expanded", "cruel season") and game.clan.freshkill_pile:
-        # feed the cats and update the nutrient status
-        relevant_cats = list(
-            filter(
-                lambda _cat: _cat.status.alive_in_player_clan,
-                Cat.all_cats.values(),
+        with timer("one_moon.freshkill"):
+            # feed the cats and update the nutrient status
+            relevant_cats = list(
+                filter(
+                    lambda _cat: _cat.status.alive_in_player_clan,
+                    Cat.all_cats.values(),
+                )
             )
-        )
-        game.clan.freshkill_pile.time_skip(relevant_cats, game.freshkill_event_list)
-        # get the moonskip freshkill
-        get_moon_freshkill()
+            game.clan.freshkill_pile.time_skip(relevant_cats, game.freshkill_event_list)
+            # get the moonskip freshkill
+            get_moon_freshkill()
 
     # Adding in any potential lead den events that have been saved
     if get_clan_setting("lead_den_interaction"):
@@ -138,18 +147,106 @@ def one_moon():
     trigger_future_events()
 
     # Calling of "one_moon" functions.
-    other_clan_cats = [c for c in Cat.all_cats_list if c.status.is_other_clancat]
-    for cat in Cat.all_cats_list.copy():
-        if cat.status.alive_in_player_clan or cat.status.group.is_afterlife():
-            one_moon_cat(cat)
-        elif not cat.status.group or cat.status.is_other_clancat:
-            one_moon_outside_cat(cat, other_clan_cats)
+    with timer("one_moon.cats"):
+        other_clan_cats = [c for c in Cat.all_cats_list if c.status.is_other_clancat]
+        for cat in Cat.all_cats_list.copy():
+            if cat.status.alive_in_player_clan or cat.status.group.is_afterlife():
+                one_moon_cat(cat)
+            elif not cat.status.group or cat.status.is_other_clancat:
+                one_moon_outside_cat(cat, other_clan_cats)
 
     # keeping this commented out till disasters are more polished
     # note: when we actually use this, import scripts.events_module.ongoing.disaster_events
     # disaster_events.handle_disasters()
 
-    # Handle grief events.
+    if not handle_grief():
+        # there's no one left in the Clan
+        sprite_prewarmer.schedule()
+        return
+
+    if game.clan.game_mode in ("expanded", "cruel season") and game.clan.freshkill_pile:
+        # make a notification if the Clan does not have enough prey
+        if (
+            FRESHKILL_EVENT_ACTIVE
+            and not game.clan.freshkill_pile.clan_has_enough_food()
+        ):
+            event_string = i18n.t("defaults.warn_low_freshkill")
+            game.cur_events_list.insert(0, Single_Event(event_string))
+            game.freshkill_event_list.append(event_string)
+
+    handle_focus()
+
+    # handle the herb supply for the moon
+    with timer("one_moon.herbs"):
+        game.clan.herb_supply.handle_moon(
+            clan_size=get_living_clan_cat_count(Cat),
+            clan_cats=get_alive_clan_cats(Cat),
+            med_cats=find_alive_cats_with_rank(
+                Cat,
+                ranks=[CatRank.MEDICINE_CAT, CatRank.MEDICINE_APPRENTICE],
+                working=True,
+            ),
+        )
+
+    if game.clan.game_mode in ("expanded", "cruel season"):
+        amount_per_med = get_amount_cat_for_one_medic(game.clan)
+        med_fulfilled = medicine_cats_can_cover_clan(
+            get_alive_clan_cats(Cat), amount_per_med
+        )
+
+        if not med_fulfilled:
+            string = i18n.t("defaults.warn_low_medcats")
+            game.cur_events_list.insert(0, Single_Event(string, "health"))
+    else:
+        has_med = bool(
+            find_alive_cats_with_rank(
+                Cat, [CatRank.MEDICINE_CAT, CatRank.MEDICINE_APPRENTICE]
+            )
+        )
+        if not has_med:
+            string = i18n.t("defaults.warn_no_medcats")
+            game.cur_events_list.insert(0, Single_Event(string, "health"))
+
+    # Clear the list of cats that died this moon.
+    game.just_died.clear()
+
+    # Promote leader and deputy, if needed.
+    with timer("one_moon.promotions"):
+        check_and_promote_leader()
+        check_and_promote_deputy()
+
+    # Resort
+    if switch_get_value(Switch.sort_type) != "id":
+        with timer("one_moon.sort"):
+            Cat.sort_cats()
+
+    # Clear all the loaded event dicts.
+    GenerateEvents.clear_loaded_events()
+
+    # autosave
+    if get_clan_setting("autosave") and game.clan.age % 5 == 0:
+        try:
+            # gather everything now, but write the files on the save writer thread.
+            # errors while writing are shown from the main loop.
+            with timer("one_moon.autosave"), background_save():
+                save_cats(switch_get_value(Switch.clan_name), Cat, game)
+                game.clan.save_clan()
+                game.clan.save_pregnancy(game.clan)
+                game.save_events()
+        except:
+            SaveErrorWindow(traceback.format_exc())
+
+    # rebuild the sprites this moon changed while the player reads the events
+    sprite_prewarmer.schedule()
+
+
+@profiled("one_moon.grief")
+def handle_grief() -> bool:
+    """
+    Turns the grief of the moon into thoughts and events, and shakes up the Clan if
+    many cats died at once.
+    :return: False if there's no living cat left in the Clan
+    """
     if game.clan.grief_strings:
         # Grab all the dead or outside cats, who should not have grief text
         for ID in game.clan.grief_strings.copy():
@@ -194,16 +291,12 @@ def one_moon():
             )
 
             if len(ghost_names) > 2:
-                alive_cats = [
-                    kitty
-                    for kitty in Cat.all_cats.values()
-                    if kitty.status.alive_in_player_clan
-                ]
+                alive_cats = get_alive_clan_cats(Cat)
 
                 # finds a percentage of the living Clan to become shaken
 
                 if len(alive_cats) == 0:
-                    return
+                    return False
                 else:
                     shaken_cats = random.sample(
                         alive_cats,
@@ -252,70 +345,7 @@ def one_moon():
             )
         game.dead_cats_to_grieve.clear()
 
-    if game.clan.game_mode in ("expanded", "cruel season") and game.clan.freshkill_pile:
-        # make a notification if the Clan does not have enough prey
-        if (
-            FRESHKILL_EVENT_ACTIVE
-            and not game.clan.freshkill_pile.clan_has_enough_food()
-        ):
-            event_string = i18n.t("defaults.warn_low_freshkill")
-            game.cur_events_list.insert(0, Single_Event(event_string))
-            game.freshkill_event_list.append(event_string)
-
-    handle_focus()
-
-    # handle the herb supply for the moon
-    game.clan.herb_supply.handle_moon(
-        clan_size=get_living_clan_cat_count(Cat),
-        clan_cats=[c for c in Cat.all_cats_list if c.status.alive_in_player_clan],
-        med_cats=find_alive_cats_with_rank(
-            Cat,
-            ranks=[CatRank.MEDICINE_CAT, CatRank.MEDICINE_APPRENTICE],
-            working=True,
-        ),
-    )
-
-    if game.clan.game_mode in ("expanded", "cruel season"):
-        amount_per_med = get_amount_cat_for_one_medic(game.clan)
-        med_fulfilled = medicine_cats_can_cover_clan(
-            Cat.all_cats.values(), amount_per_med
-        )
-
-        if not med_fulfilled:
-            string = i18n.t("defaults.warn_low_medcats")
-            game.cur_events_list.insert(0, Single_Event(string, "health"))
-    else:
-        has_med = any(
-            cat.status.rank.is_any_medicine_rank() and cat.status.alive_in_player_clan
-            for cat in Cat.all_cats.values()
-        )
-        if not has_med:
-            string = i18n.t("defaults.warn_no_medcats")
-            game.cur_events_list.insert(0, Single_Event(string, "health"))
-
-    # Clear the list of cats that died this moon.
-    game.just_died.clear()
-
-    # Promote leader and deputy, if needed.
-    check_and_promote_leader()
-    check_and_promote_deputy()
-
-    # Resort
-    if switch_get_value(Switch.sort_type) != "id":
-        Cat.sort_cats()
-
-    # Clear all the loaded event dicts.
-    GenerateEvents.clear_loaded_events()
-
-    # autosave
-    if get_clan_setting("autosave") and game.clan.age % 5 == 0:
-        try:
-            save_cats(switch_get_value(Switch.clan_name), Cat, game)
-            game.clan.save_clan()
-            game.clan.save_pregnancy(game.clan)
-            game.save_events()
-        except:
-            SaveErrorWindow(traceback.format_exc())
+    return True
 
 
 def update_afterlife_temper():
@@ -360,6 +390,7 @@ def update_afterlife_temper():
     game.updated_afterlife_cats.clear()
 
 
+@profiled("one_moon.future_events")
 def trigger_future_events():
     """
     Handles aging and triggering future events.
@@ -390,6 +421,7 @@ def trigger_future_events():
             game.clan.future_events.remove(event)
 
 
+@profiled("one_moon.lead_den")
 def handle_lead_den_event():
     """
     Handles the events that are chosen in the leaders den the previous moon and resets the relevant clan settings
@@ -630,6 +662,7 @@ def get_moon_freshkill():
     game.clan.freshkill_pile.add_freshkill(prey_amount)
 
 
+@profiled("one_moon.focus")
 def handle_focus():
     """
     This function should be called late in the 'one_moon' function and handles all focuses which are possible to handle here:
@@ -656,23 +689,18 @@ def handle_focus():
         return
     elif get_clan_setting("hunting"):
         # handle warrior
-        healthy_warriors = [
-            cat
-            for cat in Cat.all_cats.values()
-            if cat.status.rank.is_any_adult_warrior_like_rank()
-            and cat.available_to_work()
-        ]
+        healthy_warriors = find_alive_cats_with_rank(
+            Cat, [CatRank.WARRIOR, CatRank.DEPUTY, CatRank.LEADER], working=True
+        )
 
         warrior_amount = len(healthy_warriors) * get_config(
             game.clan, f"focus.hunting.{CatRank.WARRIOR}"
         )
 
         # handle apprentices
-        healthy_apprentices = [
-            cat
-            for cat in Cat.all_cats.values()
-            if cat.status.rank == CatRank.APPRENTICE and cat.available_to_work()
-        ]
+        healthy_apprentices = find_alive_cats_with_rank(
+            Cat, [CatRank.APPRENTICE], working=True
+        )
 
         app_amount = len(healthy_apprentices) * get_config(
             game.clan, f"focus.hunting.{CatRank.APPRENTICE}"
@@ -823,6 +851,7 @@ def handle_focus():
         game.cur_events_list.insert(0, Single_Event(focus_text, "misc"))
 
 
+@profiled("one_moon.lost_cats")
 def handle_lost_cats_return(predetermined_cat_IDs: list = None):
     """
     TODO: DOCS
@@ -945,6 +974,7 @@ def handle_fading(cat):
             cat.set_faded()
 
 
+@profiled()
 def one_moon_outside_cat(cat, other_clan_cats: list = None):
     """
     exiled cat events
@@ -987,6 +1017,7 @@ def one_moon_outside_cat(cat, other_clan_cats: list = None):
         OutsiderEvents.killing_outsiders(cat)
 
 
+@profiled()
 def one_moon_cat(cat):
     """
     Triggers various moon events for a cat.
@@ -1005,20 +1036,22 @@ def one_moon_cat(cat):
         return
 
     if cat.dead:
-        cat.get_new_thought(CatThought.WHILE_DEAD)
-        if cat.ID in game.just_died and cat.status.rank != CatRank.NEWBORN:
-            # newborns are exempt from this bc if we increase the moons, they become a kitten without actually gaining the kitten rank
-            cat.moons += 1
-        else:
-            cat.status.increase_current_moons_as()
-        handle_fading(cat)  # Deal with fading.
+        with timer("one_moon_cat.dead"):
+            cat.get_new_thought(CatThought.WHILE_DEAD)
+            if cat.ID in game.just_died and cat.status.rank != CatRank.NEWBORN:
+                # newborns are exempt from this bc if we increase the moons, they become a kitten without actually gaining the kitten rank
+                cat.moons += 1
+            else:
+                cat.status.increase_current_moons_as()
+            handle_fading(cat)  # Deal with fading.
         return
 
     cat.status.increase_current_moons_as()
 
     # all actions, which do not trigger an event display and
     # are connected to cats are located in there
-    cat.one_moon()
+    with timer("one_moon_cat.cat_one_moon"):
+        cat.one_moon()
 
     if constants.CONFIG["event_generation"]["debug_type_override"]:
         debug_type_override = constants.CONFIG["event_generation"][
@@ -1037,39 +1070,44 @@ def one_moon_cat(cat):
     # handle nutrition amount
     # (CARE: the cats have to be fed before this happens - should be handled in "one_moon" function)
     if game.clan.game_mode in ("expanded", "cruel season") and game.clan.freshkill_pile:
-        Condition_Events.handle_nutrient(cat, game.clan.freshkill_pile.nutrition_info)
+        with timer("one_moon_cat.nutrition"):
+            Condition_Events.handle_nutrient(
+                cat, game.clan.freshkill_pile.nutrition_info
+            )
 
         if cat.dead:
             return
 
     # prevent injured or sick cats from unrealistic Clan events
     if cat.is_ill() or cat.is_injured():
-        if cat.is_ill() and cat.is_injured():
-            if random.getrandbits(1):
-                triggered_death = Condition_Events.handle_injuries(cat)
-                if not triggered_death:
-                    Condition_Events.handle_illnesses(cat)
+        with timer("one_moon_cat.conditions"):
+            if cat.is_ill() and cat.is_injured():
+                if random.getrandbits(1):
+                    triggered_death = Condition_Events.handle_injuries(cat)
+                    if not triggered_death:
+                        Condition_Events.handle_illnesses(cat)
+                else:
+                    triggered_death = Condition_Events.handle_illnesses(cat)
+                    if not triggered_death:
+                        Condition_Events.handle_injuries(cat)
+            elif cat.is_ill():
+                Condition_Events.handle_illnesses(cat)
             else:
-                triggered_death = Condition_Events.handle_illnesses(cat)
-                if not triggered_death:
-                    Condition_Events.handle_injuries(cat)
-        elif cat.is_ill():
-            Condition_Events.handle_illnesses(cat)
-        else:
-            Condition_Events.handle_injuries(cat)
-        switch_set_value(Switch.skip_conditions, [])
-        if cat.dead:
-            return
-        handle_outbreaks(cat)
+                Condition_Events.handle_injuries(cat)
+            switch_set_value(Switch.skip_conditions, [])
+            if cat.dead:
+                return
+            handle_outbreaks(cat)
 
     # newborns don't do much
     if cat.status.rank == CatRank.NEWBORN:
         return
 
-    handle_apprentice_EX(cat)  # This must be before perform_ceremonies!
-    # this HAS TO be before the cat.is_disabled() so that disabled kits can choose a med cat or mediator position
-    perform_ceremonies(cat)
-    cat.skills.progress_skill(cat)  # This must be done after ceremonies.
+    with timer("one_moon_cat.ceremonies"):
+        handle_apprentice_EX(cat)  # This must be before perform_ceremonies!
+        # this HAS TO be before the cat.is_disabled() so that disabled kits can choose a med cat or mediator position
+        perform_ceremonies(cat)
+        cat.skills.progress_skill(cat)  # This must be done after ceremonies.
 
     # check for death/reveal/risks/retire caused by permanent conditions
     if cat.is_disabled():
@@ -1078,41 +1116,45 @@ def one_moon_cat(cat):
             return
 
     coming_out(cat)
-    Pregnancy_Events.handle_having_kits(cat, clan=game.clan)
+    with timer("one_moon_cat.kits"):
+        Pregnancy_Events.handle_having_kits(cat, clan=game.clan)
     # Stop the timeskip if the cat died in childbirth
     if cat.dead:
         return
 
     # relationships have to be handled separately, because of the ceremony name change
     if cat.status.alive_in_player_clan:
-        cat.relationship_interaction()
-        Relation_Events.handle_relationships(cat)
+        with timer("one_moon_cat.relationships"):
+            cat.relationship_interaction()
+            Relation_Events.handle_relationships(cat)
 
     # now we make sure ill and injured cats don't get interactions they shouldn't
     if cat.is_ill() or cat.is_injured():
         return
 
-    invite_new_cats(cat)
-    other_interactions(cat)
-    gain_accessories(cat)
-
-    # switches between the two death handles
-    if random.getrandbits(1):
-        triggered_death = handle_injuries_or_general_death(cat)
-        if not triggered_death:
-            handle_illnesses_or_illness_deaths(cat)
-        else:
-            switch_set_value(Switch.skip_conditions, [])
-            return
-    else:
-        triggered_death = handle_illnesses_or_illness_deaths(cat)
-        if not triggered_death:
-            handle_injuries_or_general_death(cat)
+    with timer("one_moon_cat.interactions"):
+        invite_new_cats(cat)
+        other_interactions(cat)
+        gain_accessories(cat)
+
+    with timer("one_moon_cat.deaths"):
+        # switches between the two death handles
+        if random.getrandbits(1):
+            triggered_death = handle_injuries_or_general_death(cat)
+            if not triggered_death:
+                handle_illnesses_or_illness_deaths(cat)
+            else:
+                switch_set_value(Switch.skip_conditions, [])
+                return
         else:
-            switch_set_value(Switch.skip_conditions, [])
-            return
+            triggered_death = handle_illnesses_or_illness_deaths(cat)
+            if not triggered_death:
+                handle_injuries_or_general_death(cat)
+            else:
+                switch_set_value(Switch.skip_conditions, [])
+                return
 
-    handle_murder(cat)
+        handle_murder(cat)
 
     switch_set_value(Switch.skip_conditions, [])
 
@@ -1424,11 +1466,9 @@ def _is_suitable_medcat_app(cat) -> bool:
     chance = constants.CONFIG["roles"]["base_medicine_app_chance"]  # 41
     logger.info("Medcat app %s starting chance: %d", str(cat.name), chance)
 
-    med_cat_list = [
-        i
-        for i in Cat.all_cats_list
-        if i.status.rank.is_any_medicine_rank() and i.status.alive_in_player_clan
-    ]
+    med_cat_list = find_alive_cats_with_rank(
+        Cat, [CatRank.MEDICINE_CAT, CatRank.MEDICINE_APPRENTICE]
+    )
 
     num_medcats = len(med_cat_list)
 
@@ -2169,7 +2209,6 @@ def handle_injuries_or_general_death(cat):
 
 def handle_murder(cat):
     """Handles murder"""
-    relationships = cat.relationships.values()
     targets = []
 
     if cat.age.is_baby():
@@ -2188,7 +2227,7 @@ def handle_murder(cat):
     if random.getrandbits(max(1, int(random_murder_chance))) == 1:
         targets = [
             i
-            for i in relationships
+            for i in cat.relationships.non_neutral_values()
             if i.total_relationship_value < 0
             and Cat.fetch_cat(i.cat_to).status.alive_in_player_clan
         ]
@@ -2225,7 +2264,7 @@ def handle_murder(cat):
     # If random murder is not triggered, targets can only be those they have some mid/extreme neg for
     negative_relation = [
         i
-        for i in relationships
+        for i in cat.relationships.non_neutral_values()
         if (i.has_mid_negative or i.has_extreme_negative)
         and Cat.fetch_cat(i.cat_to).status.alive_in_player_clan
     ]
@@ -2319,21 +2358,13 @@ def handle_outbreaks(cat):
         return
 
     # check how many kitties are already ill
-    already_sick = list(
-        filter(
-            lambda kitty: (kitty.status.alive_in_player_clan and kitty.is_ill()),
-            Cat.all_cats.values(),
-        )
-    )
+    already_sick = set(clan_roster.ill(CatGroup.PLAYER_CLAN_ID))
     already_sick_count = len(already_sick)
 
     # round up the living kitties
-    alive_cats = list(
-        filter(
-            lambda kitty: (kitty.status.alive_in_player_clan and not kitty.is_ill()),
-            Cat.all_cats.values(),
-        )
-    )
+    alive_cats = [
+        kitty for kitty in get_alive_clan_cats(Cat) if kitty.ID not in already_sick
+    ]
     alive_count = len(alive_cats)
 
     # if large amount of the population is already sick, stop spreading
@@ -2370,14 +2401,8 @@ def handle_outbreaks(cat):
 
             if illness == "kittencough":
                 # adjust alive cats list to only include kittens
-                alive_cats = list(
-                    filter(
-                        lambda kitty: (
-                            kitty.status.rank.is_baby()
-                            and kitty.status.alive_in_player_clan
-                        ),
-                        Cat.all_cats.values(),
-                    )
+                alive_cats = find_alive_cats_with_rank(
+                    Cat, [CatRank.NEWBORN, CatRank.KITTEN]
                 )
                 alive_count = len(alive_cats)
 
@@ -16,6 +16,7 @@ from scripts.cat.enums import (
 from scripts.cat.names import names
 from scripts.cat_relations.enums import RelType
 from scripts.cat_relations.inheritance2 import inheritance_db
+from scripts.clan_package.get_clan_cats import get_alive_clan_cats
 from scripts.clan_package.settings import get_clan_setting
 from scripts.game_structure import game, constants
 from scripts.cat.constants import BACKSTORIES, PERMANENT
@@ -404,8 +405,6 @@ def create_new_cat_block(
                 if n_c == inter_cat or n_c.ID in inter_cat.mate:
                     continue
 
-                # this is some duplicate work, since this triggers inheritance re-calcs
-                # TODO: optimize
                 n_c.set_mate(inter_cat)
 
             # LITTERMATES
@@ -466,7 +465,7 @@ def create_new_cat_block(
                 n_c.relationships[par.ID] = start_relation
 
             # UPDATE INHERITANCE
-        inheritance_db.load_inheritances(Cat)
+            inheritance_db.update_inheritance(n_c)
 
     return new_cats
 
@@ -758,7 +757,6 @@ def create_new_cat(
         new_cat.create_relationships_new_cat()
         # Note - we always update inheritance after the cats are generated, to
         # allow us to add parents.
-        # new_cat.create_inheritance_new_cat()
 
     return created_cats
 
@@ -778,7 +776,7 @@ def gather_cat_objects(
     :return: list of cat objects
     """
 
-    clan_cats = [x for x in Cat.all_cats_list if x.status.alive_in_player_clan]
+    clan_cats = get_alive_clan_cats(Cat)
     out_set = set()
 
     for abbr in abbr_list:
@@ -1120,22 +1120,20 @@ def get_highest_romantic_relation(
     relationships, exclude_mate=False, potential_mate=False
 ):
     """Returns the relationship with the highest romantic value."""
-    max_love_value = 0
-    current_max_relationship = None
-    for rel in relationships:
-        if rel.romance < 0:
-            continue
+    # check the most romantic relationships first, so the more expensive mate checks
+    # stop at the first relationship that qualifies
+    for rel in sorted(relationships, key=lambda rel: rel.romance, reverse=True):
+        if rel.romance <= 0:
+            break
         if exclude_mate and rel.cat_from.ID in rel.cat_to.mate:
             continue
         if potential_mate and not rel.cat_to.is_potential_mate(
             rel.cat_from, for_love_interest=True
         ):
             continue
-        if rel.romance > max_love_value:
-            current_max_relationship = rel
-            max_love_value = rel.romance
+        return rel
 
-    return current_max_relationship
+    return None
 
 
 def check_relationship_value(cat_from, cat_to, rel_value=None):
@@ -3,6 +3,7 @@ from random import randint
 from typing import Optional
 
 from scripts.cat.cats import Cat
+from scripts.clan_package.get_clan_cats import get_alive_clan_cats
 from scripts.events_module.event_filters import cat_for_event
 from scripts.events_module.future.future_event import FutureEvent
 from scripts.game_structure import game
@@ -61,9 +62,7 @@ def _collect_involved_cats(cat_dict: dict, future_info: dict) -> Optional[dict]:
         future_info["involved_cats"]["r_c"] = {}
 
     # we're just keeping this to living cats within the clan for now, more complexity can come later
-    possible_cats = [
-        kitty for kitty in Cat.all_cats.values() if kitty.status.alive_in_player_clan
-    ]
+    possible_cats = get_alive_clan_cats(Cat)
 
     for new_role, cat_involved in future_info["involved_cats"].items():
         # grab any cats that need to be newly gathered
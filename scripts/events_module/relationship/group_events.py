@@ -1,5 +1,4 @@
 import os
-from copy import deepcopy
 from random import choice, shuffle
 
 import i18n.config
@@ -24,6 +23,77 @@ from scripts.events_module.event_filters import (
 from scripts.events_module.text_adjust import process_text
 from scripts.events_module.consequences import change_relationship_values
 from scripts.game_structure.localization import load_lang_resource
+from scripts.housekeeping.profiling import profiled
+
+# the cat attributes each kind of constraint checks, and how it is checked
+_CONSTRAINT_KINDS = {
+    "age": (lambda cat: cat.age, _check_cat_age),
+    "status": (
+        lambda cat: (cat.status.rank, cat.status.is_lost()),
+        _check_cat_status,
+    ),
+    "skill": (
+        lambda cat: (
+            *(
+                (skill.path, skill.tier) if skill else None
+                for skill in (cat.skills.primary, cat.skills.secondary)
+            ),
+            cat.skills.hidden,
+        ),
+        _check_cat_skills,
+    ),
+    "trait": (lambda cat: cat.personality.trait, _check_cat_trait),
+}
+
+# (kind, constraint, attributes) -> whether cats with these attributes fulfill the constraint
+_constraint_results = {}
+
+
+class _CatPartitions:
+    """
+    The cats open to a group interaction as bitsets, bit i being the i-th cat. For each kind of constraint, the
+    cats are split by the attributes it checks, so a constraint only has to be checked once per distinct value.
+    """
+
+    def __init__(self, cats: list):
+        self.cats = cats
+        self.all_cats = (1 << len(cats)) - 1
+        self._partitions = {}
+        self._matching = {}
+
+    def _partition(self, kind: str) -> dict:
+        """:return: attributes -> [a cat with them, mask of all cats with them]"""
+        partition = self._partitions.get(kind)
+        if partition is None:
+            partition = self._partitions[kind] = {}
+            get_key = _CONSTRAINT_KINDS[kind][0]
+            for i, cat in enumerate(self.cats):
+                key = get_key(cat)
+                if key in partition:
+                    partition[key][1] |= 1 << i
+                else:
+                    partition[key] = [cat, 1 << i]
+        return partition
+
+    def matching(self, kind: str, constraint: list) -> int:
+        """:return: the mask of the cats that fulfill the constraint"""
+        constraint_key = (kind, tuple(constraint))
+        mask = self._matching.get(constraint_key)
+        if mask is not None:
+            return mask
+
+        check = _CONSTRAINT_KINDS[kind][1]
+        mask = 0
+        for key, (cat, key_mask) in self._partition(kind).items():
+            result = _constraint_results.get((constraint_key, key))
+            if result is None:
+                result = _constraint_results[(constraint_key, key)] = check(
+                    cat, constraint
+                )
+            if result:
+                mask |= key_mask
+        self._matching[constraint_key] = mask
+        return mask
 
 
 class GroupEvents:
@@ -53,6 +123,7 @@ class GroupEvents:
                 )
 
     @staticmethod
+    @profiled()
     def start_interaction(cat: Cat, interact_cats: list) -> list:
         """Start to define the possible group interactions.
 
@@ -288,94 +359,49 @@ class GroupEvents:
         """
         cat_abbreviations_counter = {}
         possibilities = {}
-        # prepare how the base dictionary should look,
-        # this depends on the chosen cat amount -> which abbreviation are needed
-        base_dictionary = {}
-        for integer in range(amount):
-            new_key = "r_c" + str(integer + 1)
-            base_dictionary[new_key] = []
+        # which abbreviations are needed depends on the chosen cat amount
+        abbreviations = ["r_c" + str(integer + 1) for integer in range(amount)]
+
+        cat_ids = [cat.ID for cat in interact_cats]
+        partitions = _CatPartitions(interact_cats)
+        # masks of the cats possible for each abbreviation, and in how many interactions
+        masks_per_abbreviation = {abbreviation: {} for abbreviation in abbreviations}
+        ids_per_mask = {}
 
         # iterate over all interactions and checks for each abbreviation, which cat is possible
         for interact in interactions:
-            dictionary = deepcopy(base_dictionary)
-
-            for abbreviation in dictionary:
-                dictionary[abbreviation] = []
-
-                # if the abbreviation has a age constraint, check in details
-                if abbreviation in interact.age_constraint:
-                    # if the cat status is in the age constraint, add the id to the list
-                    age_ids = [
-                        cat.ID
-                        for cat in interact_cats
-                        if _check_cat_age(cat, interact.age_constraint[abbreviation])
-                    ]
-                else:
-                    # if there is no constraint, add all ids to the list
-                    age_ids = [cat.ID for cat in interact_cats]
-
-                # if the abbreviation has a status constraint, check in details
-                if abbreviation in interact.status_constraint:
-                    # if the cat status is in the status constraint, add the id to the list
-                    status_ids = [
-                        cat.ID
-                        for cat in interact_cats
-                        if _check_cat_status(
-                            cat, interact.status_constraint[abbreviation]
-                        )
-                    ]
-                else:
-                    # if there is no constraint, add all ids to the list
-                    status_ids = [cat.ID for cat in interact_cats]
-
-                # same as status
-                if abbreviation in interact.skill_constraint:
-                    skill_ids = [
-                        cat.ID
-                        for cat in interact_cats
-                        if _check_cat_skills(
-                            cat, interact.skill_constraint[abbreviation]
-                        )
-                    ]
-                else:
-                    skill_ids = [cat.ID for cat in interact_cats]
-
-                if abbreviation in interact.trait_constraint:
-                    trait_ids = [
-                        cat.ID
-                        for cat in interact_cats
-                        if _check_cat_trait(
-                            cat, interact.trait_constraint[abbreviation]
-                        )
+            dictionary = {}
+
+            for abbreviation in abbreviations:
+                # a cat is only possible if it fulfills all constraints of the abbreviation
+                mask = partitions.all_cats
+                for kind, constraint in (
+                    ("age", interact.age_constraint),
+                    ("status", interact.status_constraint),
+                    ("skill", interact.skill_constraint),
+                    ("trait", interact.trait_constraint),
+                ):
+                    if abbreviation in constraint:
+                        mask &= partitions.matching(kind, constraint[abbreviation])
+
+                if mask not in ids_per_mask:
+                    ids_per_mask[mask] = [
+                        cat_id for i, cat_id in enumerate(cat_ids) if mask >> i & 1
                     ]
-                else:
-                    trait_ids = [cat.ID for cat in interact_cats]
-
-                # only add the id if it is in all other lists
-                for cat_id in (cat.ID for cat in interact_cats):
-                    if (
-                        cat_id in status_ids
-                        and cat_id in skill_ids
-                        and cat_id in trait_ids
-                        and cat_id in age_ids
-                    ):
-                        dictionary[abbreviation].append(cat_id)
-
-                        if (
-                            cat_id in cat_abbreviations_counter
-                            and abbreviation in cat_abbreviations_counter[cat_id]
-                        ):
-                            cat_abbreviations_counter[cat_id][abbreviation] += 1
-                        elif (
-                            cat_id in cat_abbreviations_counter
-                            and abbreviation not in cat_abbreviations_counter[cat_id]
-                        ):
-                            cat_abbreviations_counter[cat_id][abbreviation] = 1
-                        else:
-                            cat_abbreviations_counter[cat_id] = {}
-                            cat_abbreviations_counter[cat_id][abbreviation] = 1
+                dictionary[abbreviation] = ids_per_mask[mask]
+
+                mask_counts = masks_per_abbreviation[abbreviation]
+                mask_counts[mask] = mask_counts.get(mask, 0) + 1
 
             possibilities[interact.id] = dictionary
+
+        # count for each cat how many interactions it is possible for, per abbreviation
+        for abbreviation, mask_counts in masks_per_abbreviation.items():
+            for mask, count in mask_counts.items():
+                for cat_id in ids_per_mask[mask]:
+                    counter = cat_abbreviations_counter.setdefault(cat_id, {})
+                    counter[abbreviation] = counter.get(abbreviation, 0) + count
+
         return possibilities, cat_abbreviations_counter
 
     @staticmethod
@@ -33,7 +33,10 @@ from scripts.events_module.event_filters import (
     get_highest_romantic_relation,
     get_personality_compatibility,
 )
-from scripts.clan_package.get_clan_cats import find_alive_cats_with_rank
+from scripts.clan_package.get_clan_cats import (
+    find_alive_cats_with_rank,
+    get_living_clan_cat_count,
+)
 
 
 class Pregnancy_Events:
@@ -76,9 +79,7 @@ class Pregnancy_Events:
     def biggest_family_is_big():
         """Returns if the current biggest family is big enough to 'activates' additional inbreeding counters."""
 
-        living_cats = len(
-            [i for i in Cat.all_cats.values() if i.status.alive_in_player_clan]
-        )
+        living_cats = get_living_clan_cat_count(Cat)
         return len(Pregnancy_Events.biggest_family) > (living_cats / 10)
 
     @staticmethod
@@ -793,7 +794,9 @@ class Pregnancy_Events:
         """
 
         highest_romantic_relation = get_highest_romantic_relation(
-            cat.relationships.values(), exclude_mate=True, potential_mate=True
+            cat.relationships.values_within(RelType.ROMANCE, minimum=1),
+            exclude_mate=True,
+            potential_mate=True,
         )
 
         if mate and highest_romantic_relation:
@@ -1069,7 +1072,8 @@ class Pregnancy_Events:
                             cats_to=[kit],
                             **parent_to_kit,
                         )
-        inheritance_db.load_inheritances(Cat)
+        for kit in all_kitten:
+            inheritance_db.update_inheritance(kit)
 
         # check for more extended family members to create relationships with
         all_relatives: list = all_kitten[
@@ -1317,9 +1321,7 @@ class Pregnancy_Events:
 
         # CURRENT CAT AMOUNT
         # - increase the inverse chance if the clan is bigger
-        living_cats = len(
-            [i for i in Cat.all_cats.values() if i.status.alive_in_player_clan]
-        )
+        living_cats = get_living_clan_cat_count(Cat)
         if living_cats < 10:
             inverse_chance = int(inverse_chance * 0.5)
         elif living_cats > 30:
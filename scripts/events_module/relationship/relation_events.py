@@ -12,6 +12,7 @@ from scripts.events_module.relationship.romantic_events import RomanticEvents
 from scripts.events_module.relationship.welcoming_events import Welcoming_Events
 from scripts.events_module.event_filters import filter_relationship_type
 from scripts.clan_package.get_clan_cats import (
+    get_alive_clan_cats,
     get_cats_same_age,
     get_possible_mates,
 )
@@ -234,9 +235,7 @@ class Relation_Events:
                 new_cat,
                 min(constants.CONFIG["mates"]["age_range"], int(new_cat.moons * 0.4)),
             )
-            alive_cats = [
-                i for i in new_cat.all_cats.values() if i.status.alive_in_player_clan
-            ]
+            alive_cats = get_alive_clan_cats(new_cat)
             number = constants.CONFIG["new_cat"]["cat_amount_welcoming"]
 
             if len(alive_cats) == 0:
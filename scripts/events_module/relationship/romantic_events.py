@@ -13,6 +13,7 @@ from scripts.event_class import Single_Event
 from scripts.game_structure import constants
 from scripts.game_structure import game
 from scripts.game_structure.localization import load_lang_resource
+from scripts.housekeeping.profiling import profiled
 from scripts.events_module.text_adjust import process_text, event_text_adjust
 from scripts.events_module.consequences import change_relationship_values
 from scripts.events_module.event_filters import (
@@ -142,6 +143,7 @@ class RomanticEvents:
             cls.ROMANTIC_INTERACTIONS["negative"].extend(dictionary["decrease"])
 
     @staticmethod
+    @profiled()
     def start_interaction(cat_from, cat_to):
         """
         Filters and triggers events which are connected to romance between these two cats.
@@ -524,7 +526,8 @@ class RomanticEvents:
         """
 
         # get the highest romantic love relationships and
-        rel_list = cat_from.relationships.values()
+        # only relationships with some romance can be the highest romantic relation
+        rel_list = cat_from.relationships.values_within(RelType.ROMANCE, minimum=1)
         highest_romantic_relation = get_highest_romantic_relation(
             rel_list, exclude_mate=True
         )
@@ -24,7 +24,10 @@ from scripts.events_module.consequences import (
     change_relationship_values,
 )
 from scripts.clan_package.cotc import change_clan_reputation, change_clan_relations
-from scripts.clan_package.get_clan_cats import find_alive_cats_with_rank
+from scripts.clan_package.get_clan_cats import (
+    find_alive_cats_with_rank,
+    get_alive_clan_cats,
+)
 
 from scripts.cat.enums import CatAge, CatRank
 from scripts.cat.personality import Personality
@@ -609,7 +612,7 @@ class ShortEvent:
         cats that will die are added to self.dead_cats
         """
         # gather living clan cats except leader bc leader lives would be frustrating to handle in these
-        alive_cats = [i for i in Cat.all_cats.values() if i.status.alive_in_player_clan]
+        alive_cats = get_alive_clan_cats(Cat)
 
         # make sure all cats in the pool fit the event requirements
         requirements = self.m_c
@@ -28,6 +28,7 @@ from scripts.events_module.event_filters import (
 from scripts.events_module.short.short_event import ShortEvent
 from scripts.game_structure import constants, game
 from scripts.game_structure.game.switches import switch_get_value, Switch
+from scripts.housekeeping.profiling import profiled
 from scripts.clan_package.cotc import get_warring_clan
 from scripts.clan_package.get_clan_cats import (
     get_living_clan_cat_count,
@@ -326,6 +327,7 @@ def generate_event_objects(event_triggered, biome, frequency) -> list:
         return []
 
 
+@profiled()
 def filter_events(
     possible_events,
     main_cat,
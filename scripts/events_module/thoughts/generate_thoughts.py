@@ -1,18 +1,20 @@
 import traceback
 from random import choice, getrandbits
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
 
 import i18n
 
 from scripts.cat.enums import CatGroup, CatThought, CatAge
+from scripts.cat.status import Status
 from scripts.events_module.event_filters import (
     event_for_cat,
     event_for_location,
     event_for_season,
 )
 from scripts.game_structure import game
-from scripts.game_structure.localization import load_lang_resource
+from scripts.housekeeping.profiling import profiled
 from scripts.events_module.event_filters import filter_relationship_type
+from scripts.events_module.thoughts.thought_index import THOUGHT_INDEX
 
 if TYPE_CHECKING:
     from scripts.cat.cats import Cat
@@ -28,55 +30,86 @@ random_cat_constraints = [
 ]
 
 
+MAX_OTHER_CAT_ATTEMPTS = 101
+"""How many random cats are drawn before giving up on finding a subject for a thought"""
+
+
 def get_other_cat_for_thought(
-    cat_list: list["Cat"], main_cat: "Cat"
+    cat_list: Optional[Sequence["Cat"]], main_cat: "Cat"
 ) -> Optional["Cat"]:
     """
-    Returns a cat object selected from the given cat_list. This will be a cat acceptable as the subject of main_cat's thought.
+    Returns a cat object acceptable as the subject of main_cat's thought. Candidates are drawn at random and
+    unsuitable ones are simply redrawn, so nothing gets copied and cat_list is never modified.
+    :param cat_list: The cats to pick from. If None, afterlife cats pick from all cats, while everyone else picks
+    from the pool of cats sharing their group.
+    :param main_cat: The cat having the thought
     """
-    if main_cat in cat_list:
-        cat_list.remove(main_cat)
-
-    if not cat_list:
-        return None
-
-    other_cat = choice(cat_list)
-
     # sometimes cats can think about a dead cat
     thinking_of_dead_cat = getrandbits(4) == 1
 
     # dead cats think of anyone
-    if main_cat.status.group.is_afterlife():
-        return other_cat
+    is_afterlife = main_cat.status.group.is_afterlife()
 
+    pool = None
+    if cat_list is not None:
+        draw_from = cat_list
+    elif is_afterlife:
+        draw_from = main_cat.all_cats_list
     else:
-        # count and give up if we don't find a suitable cat within 100 checks
-        i = 0
-        while cat_list and (
-            (
-                other_cat.dead and not thinking_of_dead_cat
-            )  # dead and thought isn't about dead cat
-            or not main_cat.relationships.get(
-                other_cat.ID
-            )  # no existing relationship at all
-            or (
-                main_cat.relationships.get(other_cat.ID)
-                and main_cat.relationships[other_cat.ID].total_relationship_value == 0
-            )  # the main_cat has an empty relationship toward other_cat
-            or other_cat.status.is_lost()  # other cat is lost
-            or other_cat.status.group_ID
-            != main_cat.status.group_ID  # must have matching group
+        # only cats in the same group can be chosen, so there's no need to look anywhere else
+        pool = Status.group_pools.get(main_cat.status.group_ID)
+        draw_from = pool
+    if not draw_from:
+        return None
+
+    def draw() -> Optional["Cat"]:
+        if pool is not None:
+            return main_cat.all_cats.get(pool.random_ID())
+        return choice(draw_from)
+
+    # count and give up if we don't find a suitable cat within the allowed attempts
+    for _ in range(MAX_OTHER_CAT_ATTEMPTS):
+        other_cat = draw()
+        if other_cat is None or other_cat.ID == main_cat.ID:
+            continue
+        if is_afterlife or _is_thought_subject(
+            main_cat, other_cat, thinking_of_dead_cat
         ):
-            cat_list.remove(other_cat)
+            return other_cat
+
+    if cat_list is not None or is_afterlife:
+        return None
+
+    # the main_cat knows few of the cats in their group, so look through who they do know instead
+    candidates = []
+    for other_ID in main_cat.relationships:
+        other_cat = main_cat.all_cats.get(other_ID)
+        if other_cat and _is_thought_subject(main_cat, other_cat, thinking_of_dead_cat):
+            candidates.append(other_cat)
+
+    return choice(candidates) if candidates else None
+
 
-            i += 1
-            if i > 100 or not cat_list:
-                other_cat = None
-                break
+def _is_thought_subject(
+    main_cat: "Cat", other_cat: "Cat", thinking_of_dead_cat: bool
+) -> bool:
+    """
+    Returns True if a living main_cat can think about the other_cat.
+    """
+    # dead and thought isn't about dead cat
+    if other_cat.dead and not thinking_of_dead_cat:
+        return False
 
-            other_cat = choice(cat_list)
+    # no existing relationship at all, or the main_cat has an empty relationship toward other_cat
+    relationship = main_cat.relationships.get(other_cat.ID)
+    if not relationship or relationship.total_relationship_value == 0:
+        return False
 
-    return other_cat
+    # other cat is lost, or isn't in a matching group
+    return (
+        not other_cat.status.is_lost()
+        and other_cat.status.group_ID == main_cat.status.group_ID
+    )
 
 
 def _filter_list(inter_list: list, main_cat: "Cat", other_cat: "Cat") -> list:
@@ -94,50 +127,58 @@ def _load_group(thought_type: CatThought, main_cat: "Cat", other_cat: "Cat"):
     """
     Loads and returns thoughts appropriate for the given args.
     """
+    return THOUGHT_INDEX.select(
+        _get_thought_paths(thought_type, main_cat), main_cat, other_cat
+    )
+
+
+def _get_thought_paths(thought_type: CatThought, main_cat: "Cat") -> Tuple[str, ...]:
+    """
+    Returns the thought files the main_cat can draw from, in load order. This doubles as the
+    key of the cat's bucket within THOUGHT_INDEX.
+    """
     # get rank
     rank = main_cat.status.rank
     rank = rank.replace(" ", "_")
 
     start_path = f"thoughts/{thought_type}"
     new_path = start_path
-    thoughts = []
+    paths = []
 
     # GUIDES
     if thought_type == CatThought.IS_GUIDE:
-        thoughts = load_lang_resource(f"{start_path}/{main_cat.status.group}.json")
+        paths.append(f"{start_path}/{main_cat.status.group}.json")
 
     # DEAD CATS
     elif thought_type == CatThought.WHILE_DEAD:
         new_path = f"{start_path}/{main_cat.status.group}"
-        thoughts = load_lang_resource(f"{new_path}/{rank}.json")
-        thoughts.extend(_load_exiled_and_former(main_cat, new_path))
-        thoughts.extend(_load_general(main_cat, new_path))
+        paths.append(f"{new_path}/{rank}.json")
+        paths.extend(_get_exiled_and_former_paths(main_cat, new_path))
+        paths.extend(_get_general_paths(main_cat, new_path))
 
     # LIVING CATS
     elif thought_type == CatThought.WHILE_ALIVE:
         if main_cat.age == CatAge.NEWBORN:  # accounting for non-clan newborns
-            thoughts = load_lang_resource(f"{new_path}/newborn.json")
+            paths.append(f"{new_path}/newborn.json")
         else:
-            thoughts = load_lang_resource(f"{new_path}/{rank}.json")
+            paths.append(f"{new_path}/{rank}.json")
 
         # make sure lost thoughts are included
         if main_cat.status.is_lost(CatGroup.PLAYER_CLAN_ID):
             prior_rank = main_cat.status.find_prior_clan_rank(CatGroup.PLAYER_CLAN_ID)
             if prior_rank:
                 prior_rank = prior_rank.replace(" ", "_")
-                thoughts.extend(
-                    load_lang_resource(f"{start_path}/while_lost/{prior_rank}.json")
-                )
+                paths.append(f"{start_path}/while_lost/{prior_rank}.json")
 
         else:
-            thoughts.extend(_load_general(main_cat, new_path))
-            thoughts.extend(_load_exiled_and_former(main_cat, new_path))
-            thoughts.extend(_load_clancat(main_cat, new_path))
+            paths.extend(_get_general_paths(main_cat, new_path))
+            paths.extend(_get_exiled_and_former_paths(main_cat, new_path))
+            paths.extend(_get_clancat_paths(main_cat, new_path))
 
     # CATS WHO JUST CHANGED RANK
     elif thought_type == CatThought.ON_RANK_CHANGE:
-        thoughts = load_lang_resource(f"{new_path}/{rank}.json")
-        thoughts.extend(_load_general(main_cat, new_path))
+        paths.append(f"{new_path}/{rank}.json")
+        paths.extend(_get_general_paths(main_cat, new_path))
 
     # CATS WHO JUST DIED
     elif thought_type == CatThought.ON_DEATH:
@@ -150,25 +191,25 @@ def _load_group(thought_type: CatThought, main_cat: "Cat", other_cat: "Cat"):
             new_path = f"{start_path}/{main_cat.status.group}"
 
         if not is_leader:
-            thoughts = load_lang_resource(f"{new_path}/general.json")
+            paths.append(f"{new_path}/general.json")
         else:
             # leader dies fully
             if leader_death:
-                thoughts = load_lang_resource(f"{new_path}/leader_death.json")
+                paths.append(f"{new_path}/leader_death.json")
             # leader only loses a life
             else:
-                thoughts = load_lang_resource(f"{new_path}/leader_life.json")
+                paths.append(f"{new_path}/leader_life.json")
 
     # PARENTAL REACTION TO BIRTH
     elif thought_type == CatThought.ON_BIRTH:
-        thoughts = load_lang_resource(f"{new_path}/parent.json")
+        paths.append(f"{new_path}/parent.json")
 
     # ON NEW CAT ENCOUNTER
     elif thought_type == CatThought.ON_MEETING:
         if main_cat.status.is_clancat:
-            thoughts = load_lang_resource(f"{new_path}/clancat.json")
+            paths.append(f"{new_path}/clancat.json")
         else:
-            thoughts = load_lang_resource(f"{new_path}/outsider.json")
+            paths.append(f"{new_path}/outsider.json")
 
     # thought types with just a general path
     elif thought_type in (
@@ -178,56 +219,54 @@ def _load_group(thought_type: CatThought, main_cat: "Cat", other_cat: "Cat"):
         CatThought.ON_GRIEF_TOWARD_BODY,
         CatThought.ON_GRIEF_NO_BODY,
     ):
-        thoughts = load_lang_resource(f"{new_path}/general.json")
+        paths.append(f"{new_path}/general.json")
 
     # ON CHANGING AFTERLIFE
     elif thought_type == CatThought.ON_AFTERLIFE_CHANGE:
-        thoughts = load_lang_resource(f"{new_path}/{main_cat.status.group}.json")
-        pass
-
-    final_thoughts = _filter_list(thoughts, main_cat, other_cat)
+        paths.append(f"{new_path}/{main_cat.status.group}.json")
 
-    return final_thoughts
+    return tuple(paths)
 
 
-def _load_exiled_and_former(main_cat: "Cat", path) -> list:
+def _get_exiled_and_former_paths(main_cat: "Cat", path) -> list:
     """
-    Checks if cat needs exiled or former clancat thoughts and returns loaded resources
+    Checks if cat needs exiled or former clancat thoughts and returns their paths
     """
-    thoughts = []
+    paths = []
     # make sure exiled thoughts are included
     if main_cat.status.is_exiled(CatGroup.PLAYER_CLAN):
-        thoughts.extend(load_lang_resource(f"{path}/exiled.json"))
+        paths.append(f"{path}/exiled.json")
 
     # former clancat thoughts
     if main_cat.status.is_former_clancat:
-        thoughts.extend(load_lang_resource(f"{path}/former_clancat.json"))
+        paths.append(f"{path}/former_clancat.json")
 
-    return thoughts
+    return paths
 
 
-def _load_general(main_cat: "Cat", path) -> list:
+def _get_general_paths(main_cat: "Cat", path) -> list:
     """
-    Returns general thoughts if the cat is not a newborn
+    Returns the general thoughts path if the cat is not a newborn
     """
     # newborns don't receive general thoughts
     if main_cat.age != CatAge.NEWBORN:
-        return load_lang_resource(f"{path}/general.json")
+        return [f"{path}/general.json"]
 
     return []
 
 
-def _load_clancat(main_cat: "Cat", path) -> list:
+def _get_clancat_paths(main_cat: "Cat", path) -> list:
     """
-    Returns clancat thoughts if the cat is a clancat
+    Returns the clancat thoughts path if the cat is a clancat
     """
     # newborns don't receive general thoughts
     if main_cat.status.is_clancat and main_cat.age != CatAge.NEWBORN:
-        return load_lang_resource(f"{path}/clancat.json")
+        return [f"{path}/clancat.json"]
 
     return []
 
 
+@profiled()
 def new_thought(thought_type: CatThought, main_cat: "Cat", other_cat: "Cat"):
     """
     Finds a thought appropriate for the given args.
@@ -264,18 +303,12 @@ def new_death_thought(
     THOUGHTS: []
     try:
         if main_cat.status.is_leader and lives_left > 0:
-            loaded_thoughts = load_lang_resource(
-                f"thoughts/on_death/{afterlife}/leader_life.json"
-            )
+            path = f"thoughts/on_death/{afterlife}/leader_life.json"
         elif main_cat.status.is_leader and lives_left == 0:
-            loaded_thoughts = load_lang_resource(
-                f"thoughts/on_death/{afterlife}/leader_death.json"
-            )
+            path = f"thoughts/on_death/{afterlife}/leader_death.json"
         else:
-            loaded_thoughts = load_lang_resource(
-                f"thoughts/on_death/{afterlife}/general.json"
-            )
-        thought_group = choice(_filter_list(loaded_thoughts, main_cat, other_cat))
+            path = f"thoughts/on_death/{afterlife}/general.json"
+        thought_group = choice(THOUGHT_INDEX.select((path,), main_cat, other_cat))
         chosen_thought = choice(thought_group["thoughts"])
         return chosen_thought
 
@@ -0,0 +1,399 @@
+"""
+Precompiled thought pools.
+
+Thought files are loaded and compiled once per locale. Every thought group becomes a
+CompiledThought holding its constraints in a ready-to-check form, and the groups are
+bucketed by the set of files a cat would draw from (which is decided by thought type,
+group, rank, age and the clancat/exiled/former/lost flags of the main cat). Picking a
+thought then only means walking one bucket and running the precompiled checks.
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+import i18n
+
+from scripts.cat.enums import CatAge, CatGroup
+from scripts.events_module.event_filters import (
+    ALL_TRAITS_LIST,
+    _check_for_exclusionary_value,
+    event_for_cat,
+    event_for_location,
+    event_for_season,
+    filter_relationship_type,
+)
+from scripts.game_structure.localization import load_lang_resource
+
+if TYPE_CHECKING:
+    from scripts.cat.cats import Cat
+
+RANDOM_CAT_CONSTRAINTS = frozenset(
+    (
+        "random_backstory_constraint",
+        "random_status_constraint",
+        "random_age_constraint",
+        "random_trait_constraint",
+        "random_skill_constraint",
+        "random_living_status",
+        "random_outside_status",
+    )
+)
+
+_INFO_KEYS = (
+    ("status", "status_constraint"),
+    ("status_history", "status_history"),
+    ("age", "age_constraint"),
+    ("trait", "trait_constraint"),
+    ("skill", "skill_constraint"),
+    ("backstory", "backstory_constraint"),
+)
+
+_MISSING = object()
+
+CatCheck = Callable[["Cat"], bool]
+
+
+def _compile_status_check(statuses: list) -> Optional[CatCheck]:
+    """Precompiled equivalent of event_filters._check_cat_status"""
+    if not statuses or "any" in statuses:
+        return None
+
+    is_exclusionary = _check_for_exclusionary_value(statuses)
+    allowed = frozenset(statuses)
+    excluded = frozenset(x.replace("-", "") for x in statuses)
+    allowed_lost = "lost" in allowed
+    excluded_lost = "lost" in excluded
+
+    def check(cat: "Cat") -> bool:
+        rank = cat.status.rank
+        if rank in allowed or (allowed_lost and cat.status.is_lost()):
+            return True
+        if is_exclusionary and (
+            rank in excluded or (excluded_lost and cat.status.is_lost())
+        ):
+            return False
+        return is_exclusionary
+
+    return check
+
+
+def _compile_age_check(ages: list) -> CatCheck:
+    """Precompiled equivalent of event_filters._check_cat_age"""
+    allows_newborn = bool(ages) and CatAge.NEWBORN in ages
+    if not ages or "any" in ages:
+        return lambda cat: allows_newborn or cat.age != CatAge.NEWBORN
+
+    is_exclusionary = _check_for_exclusionary_value(ages)
+    if is_exclusionary:
+        ages = [x.replace("-", "") for x in ages]
+    enum_ages = frozenset(CatAge(age) for age in ages)
+
+    def check(cat: "Cat") -> bool:
+        if cat.age == CatAge.NEWBORN and not allows_newborn:
+            return False
+        if cat.age in enum_ages:
+            return not is_exclusionary
+        return is_exclusionary
+
+    return check
+
+
+def _compile_trait_check(traits: list) -> Optional[CatCheck]:
+    """Precompiled equivalent of event_filters._check_cat_trait"""
+    if not traits or "any" in traits:
+        return None
+
+    is_exclusionary = _check_for_exclusionary_value(traits)
+    if is_exclusionary:
+        traits = [x.replace("-", "") for x in traits]
+    traits = frozenset(traits)
+    if not traits.issubset(ALL_TRAITS_LIST):
+        raise ValueError(f"Unrecognized trait: {traits - ALL_TRAITS_LIST}")
+
+    return lambda cat: (cat.personality.trait in traits) != is_exclusionary
+
+
+_CHECK_COMPILERS = {
+    "status": _compile_status_check,
+    "age": _compile_age_check,
+    "trait": _compile_trait_check,
+}
+
+
+def _compile_cat_info(cat_info: dict) -> Tuple[Tuple[CatCheck, ...], dict]:
+    """
+    Turns the parts of an event_for_cat info dict that have a precompiled equivalent into
+    checks. Anything that can't be precompiled is handed back to go through event_for_cat.
+    :return: the compiled checks and the residual info dict
+    """
+    checks = []
+    residual = {}
+    for key, value in cat_info.items():
+        compiler = _CHECK_COMPILERS.get(key)
+        if compiler is None:
+            residual[key] = value
+            continue
+        try:
+            check = compiler(value)
+        except ValueError:
+            # let event_for_cat raise its detailed error if this ever gets checked
+            residual[key] = value
+            continue
+        if check is not None:
+            checks.append(check)
+    return tuple(checks), residual
+
+
+class CompiledThought:
+    """
+    A single thought group with its constraints unpacked ahead of time.
+    """
+
+    __slots__ = (
+        "group",
+        "biome",
+        "season",
+        "not_working",
+        "needs_random_cat",
+        "relationship_constraint",
+        "main_checks",
+        "main_info",
+        "random_checks",
+        "random_info",
+        "random_living_status",
+        "random_outside_status",
+        "main_injuries",
+        "random_injuries",
+        "main_perm_conditions",
+        "random_perm_conditions",
+        "main_born_with",
+        "random_born_with",
+    )
+
+    def __init__(self, group: dict):
+        self.group = group
+        self.biome = group.get("biome")
+        self.season = group.get("season")
+        self.not_working = group.get("not_working", _MISSING)
+
+        self.needs_random_cat = bool(
+            RANDOM_CAT_CONSTRAINTS.intersection(group)
+            or any("r_c" in thought for thought in group["thoughts"])
+        )
+        self.relationship_constraint = group.get("relationship_constraint")
+
+        self.main_checks, self.main_info = _compile_cat_info(
+            {
+                info_key: group[f"main_{thought_key}"]
+                for info_key, thought_key in _INFO_KEYS
+                if f"main_{thought_key}" in group
+            }
+        )
+        self.random_checks, self.random_info = _compile_cat_info(
+            {
+                info_key: group[f"random_{thought_key}"]
+                for info_key, thought_key in _INFO_KEYS
+                if f"random_{thought_key}" in group
+            }
+        )
+
+        self.random_living_status = group.get("random_living_status")
+        self.random_outside_status = group.get("random_outside_status")
+
+        injuries = group.get("has_injuries", {})
+        self.main_injuries = injuries.get("m_c")
+        self.random_injuries = injuries.get("r_c")
+
+        perm_conditions = group.get("perm_conditions", {})
+        self.main_perm_conditions = perm_conditions.get("m_c")
+        self.random_perm_conditions = perm_conditions.get("r_c")
+        born_with = perm_conditions.get("born_with", {})
+        self.main_born_with = born_with.get("m_c")
+        self.random_born_with = born_with.get("r_c")
+
+    def fulfilled(self, main_cat: "Cat", random_cat: Optional["Cat"]) -> bool:
+        """
+        Checks the thought's constraints against the given cats. Gives the same answer as
+        generate_thoughts._constraints_fulfilled, but main cat checks run first so the
+        relationship-dependent checks only run for groups that are still possible.
+        """
+        if self.biome is not None and not event_for_location(self.biome):
+            return False
+
+        if self.season is not None and not event_for_season(self.season):
+            return False
+
+        if self.not_working is not _MISSING and (
+            self.not_working != main_cat.not_working()
+        ):
+            return False
+
+        if not random_cat and self.needs_random_cat:
+            return False
+
+        for check in self.main_checks:
+            if not check(main_cat):
+                return False
+
+        if self.main_info and not event_for_cat(self.main_info, main_cat):
+            return False
+
+        if self.main_injuries is not None and not _has_condition(
+            main_cat, self.main_injuries
+        ):
+            return False
+
+        if self.main_perm_conditions is not None and not _has_perm_condition(
+            main_cat, self.main_perm_conditions, self.main_born_with
+        ):
+            return False
+
+        if not random_cat:
+            return True
+
+        # residual checks that depend on the other cat
+        for check in self.random_checks:
+            if not check(random_cat):
+                return False
+
+        if self.random_info and not event_for_cat(self.random_info, random_cat):
+            return False
+
+        if self.random_living_status is not None:
+            if random_cat.dead:
+                if random_cat.status.group == CatGroup.DARK_FOREST:
+                    living_status = "darkforest"
+                else:
+                    living_status = "starclan"
+            else:
+                living_status = "living"
+            if living_status not in self.random_living_status:
+                return False
+
+        if self.random_outside_status is not None:
+            if random_cat.status.is_lost():
+                outside_status = "lost"
+            elif random_cat.status.is_outsider:
+                outside_status = "outside"
+            else:
+                outside_status = "clancat"
+            if outside_status not in self.random_outside_status:
+                return False
+
+        if self.random_injuries is not None and not _has_condition(
+            random_cat, self.random_injuries
+        ):
+            return False
+
+        if self.random_perm_conditions is not None and not _has_perm_condition(
+            random_cat, self.random_perm_conditions, self.random_born_with
+        ):
+            return False
+
+        if self.relationship_constraint is not None and not filter_relationship_type(
+            group=[main_cat, random_cat],
+            filter_types=self.relationship_constraint,
+        ):
+            return False
+
+        return True
+
+
+def _has_condition(cat: "Cat", allowed: list) -> bool:
+    """
+    Checks if the cat has one of the allowed injuries or illnesses, or any at all if
+    "any" is allowed.
+    """
+    if not cat.injuries and not cat.illnesses:
+        return False
+    if "any" in allowed:
+        return True
+    return any(i in allowed for i in cat.injuries) or any(
+        i in allowed for i in cat.illnesses
+    )
+
+
+def _has_perm_condition(cat: "Cat", allowed: list, born_with) -> bool:
+    """
+    Checks if the cat has one of the allowed permanent conditions, optionally also
+    requiring that condition to be congenital.
+    """
+    if not cat.permanent_condition:
+        return False
+
+    valid_conditions = [
+        value for key, value in cat.permanent_condition.items() if key in allowed
+    ]
+    if not valid_conditions and "any" not in allowed:
+        return False
+
+    if born_with and not any(
+        condition["born_with"] == born_with for condition in valid_conditions
+    ):
+        return False
+
+    return True
+
+
+class ThoughtIndex:
+    """
+    Holds compiled thought groups for the current locale, bucketed by the tuple of
+    thought files a cat draws from. Rebuilds itself when the locale changes.
+    """
+
+    def __init__(self):
+        self.locale: Optional[Tuple[str, str]] = None
+        self._files: Dict[str, List[CompiledThought]] = {}
+        self._buckets: Dict[Tuple[str, ...], List[CompiledThought]] = {}
+
+    def clear(self):
+        self._files.clear()
+        self._buckets.clear()
+
+    def _check_locale(self):
+        locale = (i18n.config.get("locale"), i18n.config.get("fallback"))
+        if locale != self.locale:
+            self.clear()
+            self.locale = locale
+
+    def get_file(self, path: str) -> List[CompiledThought]:
+        """
+        :param path: lang resource location of a thought file
+        :return: the compiled thought groups within that file
+        """
+        self._check_locale()
+        try:
+            return self._files[path]
+        except KeyError:
+            compiled = [CompiledThought(group) for group in load_lang_resource(path)]
+            self._files[path] = compiled
+            return compiled
+
+    def get_bucket(self, paths: Tuple[str, ...]) -> List[CompiledThought]:
+        """
+        :param paths: the lang resource locations a cat draws thoughts from, in order
+        :return: the compiled thought groups of all those files
+        """
+        self._check_locale()
+        try:
+            return self._buckets[paths]
+        except KeyError:
+            bucket = []
+            for path in paths:
+                bucket.extend(self.get_file(path))
+            self._buckets[paths] = bucket
+            return bucket
+
+    def select(
+        self, paths: Tuple[str, ...], main_cat: "Cat", other_cat: Optional["Cat"]
+    ) -> list:
+        """
+        :return: the raw thought groups from the bucket whose constraints are fulfilled
+        """
+        return [
+            compiled.group
+            for compiled in self.get_bucket(paths)
+            if compiled.fulfilled(main_cat, other_cat)
+        ]
+
+
+THOUGHT_INDEX = ThoughtIndex()
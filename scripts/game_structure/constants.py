@@ -19,6 +19,7 @@ MENU_SCREENS = [
 ]
 
 EVENTS_PER_PAGE = 10
+LIST_CATS_PER_PAGE = 20
 
 BIOME_TYPES = ["Forest", "Plains", "Mountainous", "Beach", "Wetlands", "Desert"]
 
@@ -1,5 +1,9 @@
 from scripts.game_structure.game.save_load.save_load import (
     safe_save,
+    safe_remove,
+    run_file_operation,
+    background_save,
+    save_writer,
     save_clanlist,
     read_clans,
 )
@@ -1,13 +1,117 @@
 import os
+import threading
+import traceback
+from contextlib import contextmanager
 from pathlib import Path
 from shutil import move as shutil_move
-from typing import Union, List
+from typing import Callable, Optional, Union, List
 
 import ujson
 
+from scripts.game_structure.propagating_thread import PropagatingThread
 from scripts.housekeeping.datadir import get_temp_dir, get_save_dir
 
 
+class BackgroundSaveWriter:
+    """
+    Writes save files on a worker thread. Each submitted batch of file operations runs
+    on its own PropagatingThread that first waits for the batch before it, so saves
+    land on disk in the order they were made.
+    """
+
+    def __init__(self):
+        self._thread: Optional[PropagatingThread] = None
+        self._errors: List[str] = []
+        self._lock = threading.Lock()
+        self.failures = 0
+        """how many submitted saves have failed so far"""
+
+    def submit(self, operations: List[Callable[[], None]]):
+        if not operations:
+            return
+        self._thread = PropagatingThread(
+            target=self._run,
+            args=(self._thread, operations),
+            name="save_writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self, previous: Optional[PropagatingThread], operations):
+        if previous is not None:
+            previous.join()
+        try:
+            for operation in operations:
+                operation()
+        except Exception:
+            with self._lock:
+                self._errors.append(traceback.format_exc())
+                self.failures += 1
+
+    def is_busy(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self):
+        """Blocks until every submitted save has been written."""
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def poll_error(self) -> Optional[str]:
+        """
+        :return: the traceback of a background save that failed since the last call,
+            or None
+        """
+        with self._lock:
+            errors, self._errors = self._errors, []
+        return "\n".join(errors) if errors else None
+
+
+save_writer = BackgroundSaveWriter()
+
+_capture = threading.local()
+
+
+@contextmanager
+def background_save():
+    """
+    Within this context, safe_save and run_file_operation on the current thread only
+    serialize their data and queue the actual writing, which happens on the save
+    writer thread once the context exits.
+    """
+    operations = []
+    _capture.operations = operations
+    try:
+        yield
+    finally:
+        _capture.operations = None
+        # even a failed save has to keep the order of what it already queued
+        save_writer.submit(operations)
+
+
+def run_file_operation(operation: Callable, *args):
+    """
+    Runs a file operation that's part of saving. It's queued behind the current
+    background save if one is being made, and otherwise runs once earlier background
+    saves have finished, so nothing can overtake them.
+    """
+    operations = getattr(_capture, "operations", None)
+    if operations is not None:
+        operations.append(lambda: operation(*args))
+        return
+    save_writer.wait()
+    operation(*args)
+
+
+def safe_remove(path: Union[str, Path]):
+    """Removes a save file, if it exists, in order with other save operations."""
+    run_file_operation(_remove_file, path)
+
+
+def _remove_file(path: Union[str, Path]):
+    if os.path.exists(path):
+        os.remove(path)
+
+
 def safe_save(
     path: Union[str, Path], write_data, check_integrity=False, max_attempts: int = 15
 ):
@@ -15,7 +119,9 @@ def safe_save(
     in json format. If check_integrity is true, it will read back the file
     to check that the correct data has been written to the file.
     If not, it will simply write the data to the file with no other
-    checks."""
+    checks.
+
+    Inside background_save(), the data is serialized right away but written later."""
 
     # If write_data is not a string,
     if type(write_data) is not str:
@@ -23,6 +129,10 @@ def safe_save(
     else:
         _data = write_data
 
+    run_file_operation(_write_file, path, _data, check_integrity, max_attempts)
+
+
+def _write_file(path: Union[str, Path], _data: str, check_integrity, max_attempts):
     dir_name, file_name = os.path.split(path)
 
     if check_integrity:
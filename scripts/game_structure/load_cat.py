@@ -7,12 +7,19 @@ import i18n
 import ujson
 
 from scripts.cat.cats import Cat, BACKSTORIES
-from scripts.cat.save_load import load_faded_cat_ids
+from scripts.cat.save_load import (
+    load_faded_cat_ids,
+    load_cat_records,
+    get_condition_file_IDs,
+    save_cache,
+    close_save_backend,
+)
+from scripts.game_structure.game.save_load import save_writer
 from scripts.cat_relations.inheritance2 import inheritance_db
+from scripts.cat_relations import relationship_matrix
 from scripts.cat.save_load import get_faded_ids
 from ..cat.enums import CatGroup, CatRank
 from scripts.cat.pelts import Pelt
-from scripts.cat_relations.inheritance import Inheritance
 from scripts.game_structure.game.switches import (
     switch_get_value,
     switch_set_value,
@@ -24,7 +31,7 @@ from scripts.game_structure import constants
 from scripts.game_structure import game
 from ..cat.personality import Personality
 from ..cat.skills import CatSkills
-from ..cat.status import StatusDict
+from ..cat.status import Status, StatusDict
 from ..clan_resources.point_of_interest import (
     clear_pois,
     generate_and_add_new_poi,
@@ -36,6 +43,9 @@ logger = logging.getLogger(__name__)
 
 
 def load_cats():
+    # a background autosave of the previous clan may still be writing
+    save_writer.wait()
+    close_save_backend()
     load_faded_cat_ids(switch_get_value(Switch.clan_name))
     try:
         json_load()
@@ -51,6 +61,8 @@ def load_cats():
 def json_load():
     Cat.all_cats.clear()
     Cat.all_cats_list.clear()
+    Status.clear_group_pools()
+    relationship_matrix.disable()
 
     all_cats = []
     clanname = switch_get_value(Switch.clan_list)[0]
@@ -60,8 +72,7 @@ def json_load():
     ) as read_file:
         convert = ujson.loads(read_file.read())
     try:
-        with open(clan_cats_json_path, "r", encoding="utf-8") as read_file:
-            cat_data = ujson.loads(read_file.read())
+        cat_data = load_cat_records(clanname)
     except PermissionError as e:
         switch_set_value(Switch.error_message, f"Can\t open {clan_cats_json_path}!")
         switch_set_value(Switch.traceback, e)
@@ -324,6 +335,10 @@ def json_load():
             switch_set_value(Switch.traceback, e)
             raise
 
+    # dead cats never have their conditions saved, so list which cats have a file
+    # rather than looking for one per cat
+    condition_file_IDs = get_condition_file_IDs(clanname)
+
     # replace cat ids with cat objects and add other needed variables
     for cat in all_cats:
         if cat.status.rank in (CatRank.LEADER, CatRank.DEPUTY, CatRank.MEDICINE_CAT):
@@ -332,7 +347,10 @@ def json_load():
             elif cat.status.group == CatGroup.DARK_FOREST:
                 game.dark_forest.adjust_facets_by_cat(cat)
 
-        cat.load_conditions()
+        if cat.ID in condition_file_IDs:
+            cat.load_conditions()
+        else:
+            save_cache.conditions[cat.ID] = None
 
         # this is here to handle paralyzed cats in old saves
         if cat.pelt.paralyzed and "paralyzed" not in cat.permanent_condition:
@@ -363,6 +381,7 @@ def json_load():
 
     inheritance_db.clear_stored_data()
     inheritance_db.load_inheritances(Cat, get_faded_ids)
+    relationship_matrix.enable(Cat.all_cats.values())
 
 
 def csv_load(all_cats):
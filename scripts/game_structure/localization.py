@@ -1,15 +1,26 @@
 import os.path
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 import i18n
 import ujson
 
+from scripts.housekeeping.profiling import profiled
+
 lang_config: Optional[Dict] = None
 _lang_config_directory = os.path.join("resources", "lang", "{locale}", "config.json")
 _directory_changed: bool = False
 
 additional_lang_list: Optional[Dict] = None
 
+RESOURCE_CACHE_SIZE = 256
+"""Maximum number of parsed lang resources kept in memory at once."""
+
+_resource_cache: "OrderedDict[Tuple[str, str, str, str], Any]" = OrderedDict()
+_resource_cache_locale: Optional[Tuple[str, str]] = None
+_resource_cache_hits: int = 0
+_resource_cache_misses: int = 0
+
 
 def get_default_adj():
     """
@@ -19,6 +30,7 @@ def get_default_adj():
     return get_lang_config()["pronouns"]["adj_default"]
 
 
+@profiled()
 def load_lang_resource(location: str, *, root_directory=None):
     """
     Get a resource from the resources/lang folder for the loaded language
@@ -27,14 +39,51 @@ def load_lang_resource(location: str, *, root_directory=None):
     :param root_directory: for testing only.
     :return: Whatever resource was there, from either the locale or fallback
     :exception FileNotFoundError: If requested resource doesn't exist in selected locale or fallback
+
+    Parsed resources are cached per (locale, fallback, location). The top-level container
+    handed back is a fresh shallow copy, so it's safe to extend or append to it, but the
+    nested dicts/lists are shared between callers and must be treated as read-only.
     """
+    global _resource_cache_locale, _resource_cache_hits, _resource_cache_misses
+
     location = os.path.normpath(location)
+    location = location.lstrip("\\/")  # just in case someone is an egg and does add it
     locale, fallback = str(i18n.config.get("locale")), str(i18n.config.get("fallback"))
     if root_directory is None:
         root_directory = os.path.join("resources", "lang")
+
+    if _resource_cache_locale != (locale, fallback):
+        # drop resources belonging to the previous language so they can be freed
+        _resource_cache.clear()
+        _resource_cache_locale = (locale, fallback)
+
+    key = (locale, fallback, os.path.normpath(root_directory), location)
+    try:
+        resource = _resource_cache[key]
+    except KeyError:
+        _resource_cache_misses += 1
+        resource = _read_lang_resource(location, locale, fallback, root_directory)
+        _resource_cache[key] = resource
+        if len(_resource_cache) > RESOURCE_CACHE_SIZE:
+            _resource_cache.popitem(last=False)
+    else:
+        _resource_cache_hits += 1
+        _resource_cache.move_to_end(key)
+
+    return resource.copy() if isinstance(resource, (list, dict)) else resource
+
+
+def _read_lang_resource(location: str, locale: str, fallback: str, root_directory):
+    """
+    Reads and parses a resource straight from disk, bypassing the cache.
+    :param location: normalised relative location of the resource
+    :param locale: the current locale
+    :param fallback: the fallback locale
+    :param root_directory: the lang folder to look in
+    :return: the parsed resource
+    """
     resource_directory = os.path.join(root_directory, locale)
     fallback_directory = os.path.join(root_directory, fallback)
-    location = location.lstrip("\\/")  # just in case someone is an egg and does add it
     try:
         with open(
             os.path.join(resource_directory, location.replace("{lang}", locale)),
@@ -87,3 +136,28 @@ def set_lang_config_directory(directory: str):
     global _lang_config_directory, _directory_changed
     _lang_config_directory = directory
     _directory_changed = True
+    clear_resource_cache()
+
+
+def clear_resource_cache():
+    """
+    Empties the parsed lang resource cache and resets its counters.
+    :return: Nothing
+    """
+    global _resource_cache_locale, _resource_cache_hits, _resource_cache_misses
+    _resource_cache.clear()
+    _resource_cache_locale = None
+    _resource_cache_hits = 0
+    _resource_cache_misses = 0
+
+
+def get_resource_cache_info() -> Dict[str, int]:
+    """
+    :return: hit/miss counters and current size of the parsed lang resource cache
+    """
+    return {
+        "hits": _resource_cache_hits,
+        "misses": _resource_cache_misses,
+        "size": len(_resource_cache),
+        "max_size": RESOURCE_CACHE_SIZE,
+    }
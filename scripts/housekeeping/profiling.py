@@ -0,0 +1,284 @@
+"""
+Timers for finding out where moon skips and the screens spend their time, read through
+the debug console's profile command.
+
+Wrap a stage in `with timer("one_moon.herbs"):` or decorate a function with
+`@profiled()`. While profiling is off, timer() hands back the same empty context manager
+every time and profiled functions only check a flag before calling through, so the
+timers can stay in hot code. While it's on, every timer counts its calls, adds up its
+time (with and without the timers inside it) and keeps its latest durations for
+percentiles.
+
+start(cprofile=True) also runs cProfile, but only while a timer is running, so that it
+follows the moon skip thread. The timers can be written out for speedscope and the
+cProfile stats for pstats.
+"""
+
+import cProfile
+import threading
+from collections import deque
+from contextlib import nullcontext
+from functools import wraps
+from math import ceil
+from time import perf_counter
+from typing import Callable, Deque, Dict, List, Optional
+
+import ujson
+
+SAMPLES_KEPT = 2048
+"""Durations kept per timer for the percentiles, older ones are dropped."""
+EVENTS_KEPT = 1_000_000
+"""Timer starts and ends kept for speedscope. Later timers are still counted."""
+
+_enabled = False
+_started_at = 0.0
+_events: List[tuple] = []
+"""(thread, True when the timer started, timer name, perf_counter())"""
+_local = threading.local()
+_thread_names: Dict[int, str] = {}
+_null_timer = nullcontext()
+
+_profiler: Optional[cProfile.Profile] = None
+_profiler_lock = threading.Lock()
+_profiling = False
+_profiler_thread: Optional[int] = None
+
+
+class TimerStats:
+    __slots__ = ("calls", "total", "own", "samples")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        """seconds, the timers inside this one included"""
+        self.own = 0.0
+        """seconds, without the timers inside this one"""
+        self.samples: Deque[float] = deque(maxlen=SAMPLES_KEPT)
+
+    def percentile(self, percent: float) -> float:
+        """:return: the duration that percent of the kept durations don't exceed"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[max(0, ceil(len(ordered) * percent / 100) - 1)]
+
+
+timers: Dict[str, TimerStats] = {}
+
+
+def _claim_profiler() -> Optional[cProfile.Profile]:
+    """
+    Runs cProfile in this thread, if it's wanted and no other thread has it.
+    :return: the profiler to release afterwards, if it was claimed
+    """
+    global _profiler_thread
+    with _profiler_lock:
+        if not _profiling or _profiler_thread is not None:
+            return None
+        try:
+            _profiler.enable()
+        except ValueError:
+            # another profiler is running
+            return None
+        _profiler_thread = threading.get_ident()
+        return _profiler
+
+
+def _release_profiler(profiler: cProfile.Profile):
+    global _profiler_thread
+    with _profiler_lock:
+        profiler.disable()
+        _profiler_thread = None
+
+
+class _Timer:
+    __slots__ = ("name", "start", "inner", "recorded", "profiler")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+            _thread_names[threading.get_ident()] = threading.current_thread().name
+        self.inner = 0.0
+        self.profiler = None if stack else _claim_profiler()
+        self.recorded = len(_events) < EVENTS_KEPT
+        stack.append(self)
+        self.start = perf_counter()
+        if self.recorded:
+            _events.append((threading.get_ident(), True, self.name, self.start))
+        return self
+
+    def __exit__(self, *exc):
+        end = perf_counter()
+        stack = _local.stack
+        stack.pop()
+        duration = end - self.start
+        if stack:
+            stack[-1].inner += duration
+
+        stats = timers.get(self.name)
+        if stats is None:
+            stats = timers.setdefault(self.name, TimerStats())
+        stats.calls += 1
+        stats.total += duration
+        stats.own += duration - self.inner
+        stats.samples.append(duration)
+
+        if self.recorded:
+            _events.append((threading.get_ident(), False, self.name, end))
+        if self.profiler is not None:
+            _release_profiler(self.profiler)
+        return False
+
+
+def timer(name: str):
+    """
+    :param name: what the time is added up under, dots group stages, like
+        "one_moon.herbs"
+    :return: a context manager that times its block while profiling is on
+    """
+    if not _enabled:
+        return _null_timer
+    return _Timer(name)
+
+
+def profiled(name: Optional[str] = None) -> Callable:
+    """
+    Times every call of the decorated function while profiling is on.
+    :param name: the timer's name, defaults to the function's qualified name
+    """
+
+    def decorator(function: Callable) -> Callable:
+        timer_name = name or function.__qualname__
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            with _Timer(timer_name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """Forgets every timing and the cProfile stats."""
+    global _profiler
+    timers.clear()
+    _events.clear()
+    if not _profiling:
+        _profiler = None
+
+
+def start(cprofile: bool = False):
+    """
+    Starts profiling from scratch.
+    :param cprofile: also run cProfile while the timers run
+    """
+    global _enabled, _started_at, _profiler, _profiling
+    stop()
+    reset()
+    if cprofile:
+        _profiler = cProfile.Profile()
+        _profiling = True
+    _started_at = perf_counter()
+    _enabled = True
+
+
+def stop():
+    """Stops profiling. The timings are kept until the next start() or reset()."""
+    global _enabled, _profiling
+    _enabled = False
+    _profiling = False
+
+
+def report() -> List[str]:
+    """:return: a line per timer, the slowest first, with the times in milliseconds"""
+    lines = [
+        f"{'timer':<36} {'calls':>7} {'total':>10} {'own':>10} {'mean':>8}"
+        f" {'p50':>8} {'p95':>8} {'p99':>8}"
+    ]
+    for name, stats in sorted(
+        list(timers.items()), key=lambda item: item[1].total, reverse=True
+    ):
+        lines.append(
+            f"{name:<36} {stats.calls:>7} {stats.total * 1000:>10.1f}"
+            f" {stats.own * 1000:>10.1f} {stats.total / stats.calls * 1000:>8.3f}"
+            f" {stats.percentile(50) * 1000:>8.3f} {stats.percentile(95) * 1000:>8.3f}"
+            f" {stats.percentile(99) * 1000:>8.3f}"
+        )
+    return lines
+
+
+def dump_pstats(path: str):
+    """
+    Writes the cProfile stats in the format pstats and snakeviz read.
+    :exception RuntimeError: if cProfile didn't run, or is running right now
+    """
+    if _profiler is None:
+        raise RuntimeError("cProfile wasn't started, use start(cprofile=True)")
+    if _profiler_thread is not None:
+        raise RuntimeError("cProfile is running, stop profiling first")
+    _profiler.dump_stats(path)
+
+
+def dump_speedscope(path: str):
+    """
+    Writes every recorded timer in speedscope's evented format, one profile per thread.
+    Timers still running are ended at the last recorded time.
+    """
+    frames: Dict[str, int] = {}
+    by_thread: Dict[int, list] = {}
+    for thread, started, name, at in list(_events):
+        by_thread.setdefault(thread, []).append((started, name, at - _started_at))
+
+    profiles = []
+    for thread, thread_events in by_thread.items():
+        events = []
+        running = []
+        for started, name, at in thread_events:
+            frame = frames.setdefault(name, len(frames))
+            if started:
+                running.append(frame)
+                events.append({"type": "O", "frame": frame, "at": at})
+            elif running and running[-1] == frame:
+                running.pop()
+                events.append({"type": "C", "frame": frame, "at": at})
+            # otherwise it started before the events were cleared
+        if not events:
+            continue
+        end = thread_events[-1][2]
+        for frame in reversed(running):
+            events.append({"type": "C", "frame": frame, "at": end})
+        profiles.append(
+            {
+                "type": "evented",
+                "name": _thread_names.get(thread, f"thread {thread}"),
+                "unit": "seconds",
+                "startValue": events[0]["at"],
+                "endValue": end,
+                "events": events,
+            }
+        )
+
+    with open(path, "w", encoding="utf-8") as write_file:
+        write_file.write(
+            ujson.dumps(
+                {
+                    "$schema": "https://www.speedscope.app/file-format-schema.json",
+                    "shared": {"frames": [{"name": name} for name in frames]},
+                    "profiles": profiles,
+                    "name": "clangen timers",
+                    "exporter": "clangen",
+                }
+            )
+        )
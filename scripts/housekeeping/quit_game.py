@@ -3,6 +3,7 @@ from sys import exit as sys_exit
 import pygame
 
 from scripts.game_structure import game
+from scripts.game_structure.game.save_load import save_writer
 from scripts.game_structure.game.settings import game_settings_save
 
 
@@ -10,6 +11,8 @@ def quit_game(savesettings=False, clearevents=False):
     """
     Quits the game, avoids a bunch of repeated lines
     """
+    # don't cut off an autosave that's still being written
+    save_writer.wait()
     if savesettings:
         game_settings_save(None)
     if clearevents:
@@ -568,17 +568,21 @@ class ChooseMateScreen(Screens):
         i = 0
         for _off in display_cats:
             info_text = f"{str(_off.name)}"
-            additional_info = self.the_cat.inheritance.get_cat_info(_off.ID)
+            additional_info = inheritance_db.get_cat_info(self.the_cat, _off.ID)
             if len(additional_info["type"]) > 0:  # types is always real
-                rel_types = [
-                    str(rel_type.value) for rel_type in additional_info["type"]
-                ]
+                rel_types = [str(rel_type.name) for rel_type in additional_info["type"]]
                 rel_types = set(rel_types)  # remove duplicates
-                if "" in rel_types:
-                    rel_types.remove("")  # removes empty
+                if "NOT_BLOOD" in rel_types and len(rel_types) > 1:
+                    # in the edge case of a cat being not related and also related in some way
+                    # (usually from adoption shenanigans), make blood relation have priority
+                    rel_types.remove("NOT_BLOOD")
+                if "BLOOD" in rel_types:
+                    rel_types.remove("BLOOD")  # direct blood relation, needs no label
                 if len(rel_types) > 0:
                     info_text += "\n"
-                    info_text += ", ".join(rel_types)
+                    info_text += ", ".join(
+                        i18n.t(f"general.relation_{rel}") for rel in rel_types
+                    )
                 if len(additional_info["additional"]) > 0:
                     add_info = set(additional_info["additional"])  # remove duplicates
                     info_text += "\n"
@@ -797,7 +801,6 @@ class ChooseMateScreen(Screens):
         """Updates all elements with the current cat, as well as the selected cat.
         Called when the screen switched, and whenever the focused cat is switched"""
         self.the_cat = Cat.all_cats[switch_get_value(Switch.cat)]
-        self.the_cat.create_inheritance_new_cat()
 
         (
             self.next_cat,
@@ -5,6 +5,7 @@ import pygame.transform
 import pygame_gui.elements
 
 from scripts.cat.cats import Cat
+from scripts.cat_relations.inheritance2 import inheritance_db
 from scripts.game_structure import image_cache
 from ..ui.elements.sprite_button import UISpriteButton
 from ..ui.elements.image_button import UIImageButton
@@ -338,19 +339,18 @@ class FamilyTreeScreen(Screens):
         x_dim = 80
         y_dim = 90
 
-        self.the_cat.create_inheritance_new_cat()
-
-        self.parents = self.the_cat.inheritance.get_parents()
-        self.mates = self.the_cat.inheritance.get_mates()
-        self.kits = self.the_cat.inheritance.get_children()
-        self.kits_mates = self.the_cat.inheritance.get_kits_mates()
-        self.siblings = self.the_cat.inheritance.get_siblings()
-        self.siblings_mates = self.the_cat.inheritance.get_siblings_mates()
-        self.siblings_kits = self.the_cat.inheritance.get_siblings_kits()
-        self.parents_siblings = self.the_cat.inheritance.get_parents_siblings()
-        self.cousins = self.the_cat.inheritance.get_cousins()
-        self.grandparents = self.the_cat.inheritance.get_grandparents()
-        self.grandkits = self.the_cat.inheritance.get_grand_kits()
+        cat_id = self.the_cat.ID
+        self.parents = sorted(inheritance_db.get_parents(cat_id))
+        self.mates = sorted(inheritance_db.get_mates(cat_id))
+        self.kits = sorted(inheritance_db.get_children(cat_id))
+        self.kits_mates = sorted(inheritance_db.get_childrens_mates(cat_id))
+        self.siblings = sorted(inheritance_db.get_siblings(cat_id))
+        self.siblings_mates = sorted(inheritance_db.get_siblings_mates(cat_id))
+        self.siblings_kits = sorted(inheritance_db.get_siblings_children(cat_id))
+        self.parents_siblings = sorted(inheritance_db.get_parents_siblings(cat_id))
+        self.cousins = sorted(inheritance_db.get_cousins(cat_id))
+        self.grandparents = sorted(inheritance_db.get_grandparents(cat_id))
+        self.grandkits = sorted(inheritance_db.get_grandchildren(cat_id))
 
         # collect grandparents
         if self.parents:
@@ -559,7 +559,7 @@ class FamilyTreeScreen(Screens):
         for kitty in display_cats:
             _kitty = Cat.fetch_cat(kitty)
             info_text = f"{str(_kitty.name)}"
-            additional_info = self.the_cat.inheritance.get_cat_info(kitty)
+            additional_info = inheritance_db.get_cat_info(self.the_cat, kitty)
             if len(additional_info["type"]) > 0:  # types is always real
                 rel_types = [str(rel_type.name) for rel_type in additional_info["type"]]
                 rel_types = set(rel_types)  # remove duplicates
@@ -7,6 +7,7 @@ import pygame_gui
 from pygame_gui.core import ObjectID
 
 from scripts.cat.cats import Cat
+from scripts.cat.sprites.prewarm import sprite_prewarmer
 from scripts.clan_package.settings import switch_clan_setting
 from scripts.clan_package.settings.clan_settings import (
     set_clan_setting,
@@ -19,7 +20,7 @@ from scripts.game_structure.game.switches import (
     Switch,
 )
 from scripts.cat.enums import CatGroup
-from scripts.game_structure import game
+from scripts.game_structure import constants, game
 from scripts.game_structure.screen_settings import game_screen_size, MANAGER
 from scripts.ui.elements.dropdown import UIDropDown
 from scripts.ui.elements.cat_list_display import UICatListDisplay
@@ -85,6 +86,7 @@ class ListScreen(Screens):
         self.full_cat_list = []
         self.current_listed_cats = []
         self.temper_message = None
+        sprite_prewarmer.add_priority_source(self.get_page_cats)
 
         self.list_screen_container = None
 
@@ -598,8 +600,8 @@ class ListScreen(Screens):
             self.current_listed_cats = self.full_cat_list.copy()
 
         self.all_pages = (
-            int(ceil(len(self.current_listed_cats) / 20.0))
-            if len(self.current_listed_cats) > 20
+            int(ceil(len(self.current_listed_cats) / constants.LIST_CATS_PER_PAGE))
+            if len(self.current_listed_cats) > constants.LIST_CATS_PER_PAGE
             else 1
         )
         if self.current_page > self.all_pages:
@@ -634,7 +636,7 @@ class ListScreen(Screens):
                 object_id="#cat_list_display",
                 starting_height=1,
                 cat_list=self.current_listed_cats,
-                cats_displayed=20,
+                cats_displayed=constants.LIST_CATS_PER_PAGE,
                 x_px_between=ui_scale_value(240),
                 y_px_between=ui_scale_value(200),
                 columns=5,
@@ -680,6 +682,13 @@ class ListScreen(Screens):
 
         self.set_bg_and_heading()
 
+    def get_page_cats(self) -> list:
+        """The cats on the page that was shown last."""
+        per_page = constants.LIST_CATS_PER_PAGE
+        return self.current_listed_cats[
+            (self.current_page - 1) * per_page : self.current_page * per_page
+        ]
+
     def set_bg_and_heading(self):
         """
         sets the background and heading according to current group
@@ -0,0 +1,164 @@
+"""
+Skips moons of a saved clan without showing anything, for balance testing and for
+catching regressions in the moon events.
+
+    python -m scripts.simulate --clan <name> --moons 500 --seed 1
+
+Every moon prints one line of json with how long the moon took and what happened to
+the clan, and a summary line follows the last moon. The clan is loaded the same way the
+game loads it, but sprites are never made: only the names of the clan symbols are read,
+which new other clans need. Autosave is turned off, so the save itself isn't changed.
+
+The same seed gives the same moons, as long as PYTHONHASHSEED is the same too, since
+the order of sets of cat IDs depends on it. If it isn't set, the simulation restarts
+itself with PYTHONHASHSEED=0.
+"""
+
+import os
+import sys
+
+if __name__ == "__main__" and os.environ.get("PYTHONHASHSEED") is None:
+    os.environ["PYTHONHASHSEED"] = "0"
+    os.execv(sys.executable, [sys.executable, "-m", "scripts.simulate", *sys.argv[1:]])
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import random
+from collections import Counter
+from contextlib import redirect_stdout
+from time import perf_counter
+from typing import Dict, Optional, Set, TextIO
+
+import ujson
+
+from scripts import events
+from scripts.cat.cats import Cat
+from scripts.cat.sprites.load_sprites import sprites
+from scripts.clan import Afterlife, clan_class
+from scripts.clan_package.settings import set_clan_setting
+from scripts.game_structure import game
+from scripts.game_structure.game.save_load import read_clans
+from scripts.game_structure.game.switches import Switch, switch_set_value
+from scripts.game_structure.load_cat import load_cats, version_convert
+
+
+def load_clan(clan_name: str):
+    """Loads a saved clan like main.load_data does, without the sprites."""
+    sprites.load_symbols(make_groups=False)
+
+    switch_set_value(Switch.clan_list, [clan_name])
+    switch_set_value(Switch.clan_name, clan_name)
+    game.starclan = Afterlife()
+    game.dark_forest = Afterlife()
+    load_cats()
+    version_convert(clan_class.load_clan())
+    game.load_events()
+    set_clan_setting("autosave", False)
+
+
+def _living_clan_IDs() -> Set[str]:
+    return {i for i, cat in Cat.all_cats.items() if cat.status.alive_in_player_clan}
+
+
+def simulate_moon() -> Dict:
+    """
+    Skips one moon.
+    :return: how long it took and what changed in the clan
+    """
+    before = _living_clan_IDs()
+    start = perf_counter()
+    events.one_moon()
+    seconds = perf_counter() - start
+    after = _living_clan_IDs()
+
+    gone = [Cat.all_cats.get(i) for i in before - after]
+    joined = [Cat.all_cats[i] for i in after - before]
+    return {
+        "moon": game.clan.age,
+        "seconds": round(seconds, 4),
+        "population": len(after),
+        "born": sum(cat.moons == 0 for cat in joined),
+        "joined": sum(cat.moons != 0 for cat in joined),
+        "deaths": sum(cat is None or cat.dead for cat in gone),
+        "left": sum(cat is not None and not cat.dead for cat in gone),
+        "events": len(game.cur_events_list),
+        "event_types": dict(
+            Counter(t for event in game.cur_events_list for t in event.types)
+        ),
+    }
+
+
+def simulate(
+    clan_name: str,
+    moons: int,
+    rng_seed: Optional[int],
+    output: Optional[TextIO] = None,
+) -> Dict:
+    """
+    Loads the clan and skips moons, writing one json line per moon and a summary.
+    Anything the game prints goes to stderr instead, to keep the output readable.
+    :param output: where the json lines go, defaults to stdout
+    :return: the summary
+    """
+    output = output or sys.stdout
+    with redirect_stdout(sys.stderr):
+        return _simulate(clan_name, moons, rng_seed, output)
+
+
+def _simulate(clan_name: str, moons: int, rng_seed: Optional[int], output: TextIO):
+    random.seed(rng_seed)
+    load_clan(clan_name)
+
+    times = []
+    totals = Counter()
+    start_population = len(_living_clan_IDs())
+    for _ in range(moons):
+        moon = simulate_moon()
+        times.append(moon["seconds"])
+        totals.update(
+            {k: moon[k] for k in ("born", "joined", "deaths", "left", "events")}
+        )
+        output.write(ujson.dumps(moon) + "\n")
+
+    summary = {
+        "summary": True,
+        "clan": clan_name,
+        "seed": rng_seed,
+        "moons": moons,
+        "seconds": round(sum(times), 4),
+        "mean_seconds": round(sum(times) / moons, 4) if moons else 0,
+        "max_seconds": max(times, default=0),
+        "start_population": start_population,
+        "population": len(_living_clan_IDs()),
+        **totals,
+    }
+    output.write(ujson.dumps(summary) + "\n")
+    output.flush()
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m scripts.simulate",
+        description="Skip moons of a saved clan without a display.",
+    )
+    parser.add_argument(
+        "--clan", help="name of the saved clan, defaults to the last loaded one"
+    )
+    parser.add_argument("--moons", type=int, default=100, help="how many moons to skip")
+    parser.add_argument("--seed", type=int, help="seed for the random module")
+    args = parser.parse_args(argv)
+
+    clans = read_clans() or []
+    clan_name = args.clan or (clans[0] if clans else None)
+    if clan_name not in clans:
+        parser.error(f"there's no saved clan called {clan_name}")
+
+    simulate(clan_name, args.moons, args.seed)
+
+
+if __name__ == "__main__":
+    main()
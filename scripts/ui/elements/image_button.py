@@ -8,6 +8,7 @@ from pygame_gui.core.interfaces import IUIManagerInterface
 
 from scripts.game_structure import game
 from scripts.game_structure.screen_settings import screen
+from scripts.ui.masks import inflate_mask
 
 
 class UIImageButton(pygame_gui.elements.UIButton):
@@ -86,26 +87,12 @@ class UIImageButton(pygame_gui.elements.UIButton):
             self.mask_padding = (val.get_size()[0] - self.rect[2]) / 2
         else:
             # if you're looking for the cat's sprite mask, that's
-            # set in utility.py:update_mask
-            val = pygame.mask.from_surface(val, threshold=250)
-
-            inflated_mask = pygame.Mask(
-                (
-                    self.relative_rect[2] + self.mask_padding * 2,
-                    self.relative_rect[3] + self.mask_padding * 2,
-                )
+            # made in display_sprites.py:get_click_mask
+            self._mask = inflate_mask(
+                pygame.mask.from_surface(val, threshold=250),
+                self.mask_padding,
+                (self.relative_rect[2], self.relative_rect[3]),
             )
-            inflated_mask.draw(val, (self.mask_padding, self.mask_padding))
-            for _ in range(self.mask_padding):
-                outline = inflated_mask.outline()
-                for point in outline:
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            try:
-                                inflated_mask.set_at((point[0] + dx, point[1] + dy), 1)
-                            except IndexError:
-                                continue
-            self._mask = inflated_mask
         self.mask_info[0] = (
             self.rect[0] - self.mask_padding,
             self.rect[1] - self.mask_padding,
@@ -0,0 +1,29 @@
+from typing import Optional, Tuple
+
+import pygame
+
+
+def inflate_mask(
+    mask: pygame.Mask,
+    padding: int,
+    size: Optional[Tuple[int, int]] = None,
+    grow: Optional[int] = None,
+) -> pygame.Mask:
+    """
+    Grows a mask outwards, so a click close to its edge still counts.
+    :param mask: the mask to grow
+    :param padding: how much bigger than size the new mask is on each side
+    :param size: size of the area the mask belongs to, defaults to the mask's size
+    :param grow: how many pixels to grow the mask by, defaults to padding
+    :return: the grown mask
+    """
+    width, height = size if size is not None else mask.get_size()
+    padding = int(padding)
+    grow = padding if grow is None else grow
+    inflated_mask = pygame.Mask((width + padding * 2, height + padding * 2))
+    inflated_mask.draw(mask, (padding, padding))
+    # every pixel within grow of a set pixel gets set
+    kernel = pygame.Mask((grow * 2 + 1, grow * 2 + 1), fill=True)
+    return inflated_mask.convolve(
+        kernel, pygame.Mask(inflated_mask.get_size()), (-grow, -grow)
+    )
@@ -5,6 +5,7 @@ import i18n
 import pygame
 import pygame_gui
 
+from scripts.cat.save_load import close_save_backend
 from scripts.ui.elements.text_box_tweaked import UITextBoxTweaked
 from scripts.ui.elements.surface_image_button import UISurfaceImageButton
 from scripts.housekeeping.datadir import get_save_dir
@@ -56,6 +57,8 @@ class CheckDeletionWindow(GameWindow):
         if event.type == pygame_gui.UI_BUTTON_START_PRESS:
             if event.ui_element == self.delete_it_button:
                 rempath = get_save_dir() + "/" + self.clan_name
+                # files the save backend keeps open would be locked on Windows
+                close_save_backend()
                 shutil.rmtree(rempath)
                 if os.path.exists(rempath + "/clan.json"):
                     os.remove(rempath + "/clan.json")
@@ -9,9 +9,17 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 from scripts.game_structure import game
 
 from scripts.cat.cats import Cat
-from scripts.cat_relations.inheritance2 import inheritance_db
+from scripts.cat.clan_roster import clan_roster
+from scripts.cat_relations.inheritance2 import RelationType, inheritance_db
 from scripts.cat.enums import CatAge, CatRank, CatGroup, CatSocial
+from scripts.cat.status import Status
 from scripts.cat_relations.relationship import Relationship
+from scripts.cat_relations import relationship_matrix
+from scripts.cat_relations.enums import RelType
+from scripts.clan_package.get_clan_cats import (
+    find_alive_cats_with_rank,
+    get_alive_clan_cats,
+)
 
 
 class TestCreationAge(unittest.TestCase):
@@ -93,6 +101,102 @@ class TestRelativesFunction(unittest.TestCase):
         self.assertFalse(kit.is_grandparent(grand_parent))
         self.assertTrue(grand_parent.is_grandparent(kit))
 
+    # test that the remembered relatives follow births and adoptions
+    def test_kinship_index_follows_updates(self):
+        grand_parent = Cat(disable_random=True)
+        sibling1 = Cat(parent1=grand_parent.ID, disable_random=True)
+        sibling2 = Cat(parent1=grand_parent.ID, disable_random=True)
+        kit = Cat(parent1=sibling1.ID, disable_random=True)
+        stranger = Cat(disable_random=True)
+        inheritance_db.load_inheritances(Cat)
+        family = [grand_parent, sibling1, sibling2, kit, stranger]
+        for cat in family:
+            inheritance_db.get_relatives(cat.ID, False)
+        self.assertFalse(kit.is_related(stranger, False))
+
+        # a cousin is born
+        cousin = Cat(parent1=sibling2.ID, disable_random=True)
+        inheritance_db.update_inheritance(cousin)
+        self.assertTrue(kit.is_cousin(cousin))
+        self.assertTrue(kit.is_related(cousin, False))
+        self.assertFalse(kit.is_related(cousin, True))
+
+        # the stranger adopts the kit
+        kit.set_adoptive_parent(stranger)
+        self.assertTrue(kit.is_related(stranger, True))
+        self.assertIn(kit.ID, stranger.get_relatives())
+
+        self.assertEqual(
+            inheritance_db.check_kinship_index([cat.ID for cat in family + [cousin]]),
+            [],
+        )
+
+    # test that littermates stay littermates when one of them gets a mate later on
+    def test_littermates_after_update(self):
+        parent = Cat(disable_random=True)
+        kit1 = Cat(parent1=parent.ID, moons=0, disable_random=True)
+        kit2 = Cat(parent1=parent.ID, moons=0, disable_random=True)
+        mate = Cat(moons=20, disable_random=True)
+        inheritance_db.load_inheritances(Cat)
+        kit1.moons = 20
+        kit2.moons = 20
+
+        kit1.set_mate(mate)
+        self.assertTrue(inheritance_db.is_littermate(kit1.ID, kit2.ID))
+        kit1.unset_mate(mate)
+        self.assertTrue(inheritance_db.is_littermate(kit1.ID, kit2.ID))
+
+    # test the relation types and notes the family tree shows
+    def test_relation_types(self):
+        parent1 = Cat(disable_random=True)
+        parent2 = Cat(disable_random=True)
+        other_parent = Cat(disable_random=True)
+        kit = Cat(parent1=parent1.ID, parent2=parent2.ID, disable_random=True)
+        littermate = Cat(parent1=parent1.ID, parent2=parent2.ID, disable_random=True)
+        half_sibling = Cat(
+            parent1=parent1.ID, parent2=other_parent.ID, disable_random=True
+        )
+        adopted = Cat(disable_random=True)
+        adopted.adoptive_parents.append(parent1.ID)
+        mate = Cat(disable_random=True)
+        littermate.mate.append(mate.ID)
+        mate.mate.append(littermate.ID)
+        inheritance_db.load_inheritances(Cat)
+
+        self.assertEqual(
+            inheritance_db.get_parent_type(kit.ID, parent1.ID), RelationType.BLOOD
+        )
+        self.assertEqual(
+            inheritance_db.get_parent_type(adopted.ID, parent1.ID),
+            RelationType.ADOPTIVE,
+        )
+        self.assertIsNone(inheritance_db.get_parent_type(kit.ID, other_parent.ID))
+        self.assertEqual(
+            inheritance_db.get_sibling_type(kit.ID, littermate.ID), RelationType.BLOOD
+        )
+        self.assertEqual(
+            inheritance_db.get_sibling_type(kit.ID, half_sibling.ID),
+            RelationType.HALF_BLOOD,
+        )
+        self.assertEqual(
+            inheritance_db.get_sibling_type(kit.ID, adopted.ID), RelationType.ADOPTIVE
+        )
+        self.assertTrue(inheritance_db.is_blood_related(kit.ID, half_sibling.ID))
+        self.assertFalse(inheritance_db.is_blood_related(kit.ID, adopted.ID))
+
+        self.assertEqual(
+            inheritance_db.get_cat_info(kit, littermate.ID)["type"],
+            [RelationType.BLOOD],
+        )
+        mate_info = inheritance_db.get_cat_info(kit, mate.ID)
+        self.assertEqual(mate_info["type"], [RelationType.NOT_BLOOD])
+        self.assertEqual(len(mate_info["additional"]), 1)
+        self.assertEqual(inheritance_db.get_siblings_mates(kit.ID), {mate.ID})
+        self.assertEqual(
+            inheritance_db.get_cat_info(parent1, adopted.ID)["type"],
+            [RelationType.ADOPTIVE],
+        )
+
 
 class TestPossibleMateFunction(unittest.TestCase):
     # test that is_potential_mate returns False for cats that are related to each other
@@ -728,3 +832,232 @@ class TestSocialAssignment(unittest.TestCase):
             with self.subTest("outsider social assignment"):
                 cat = Cat(status_dict={"rank": rank}, disable_random=True)
                 self.assertTrue(cat.status.social == social)
+
+
+class TestClanRoster(unittest.TestCase):
+    def test_follows_rank_and_group_changes(self):
+        cat = Cat(status_dict={"rank": CatRank.APPRENTICE}, moons=8)
+        apprentices = clan_roster.with_rank(
+            CatGroup.PLAYER_CLAN_ID, [CatRank.APPRENTICE]
+        )
+        self.assertIn(cat.ID, apprentices)
+        self.assertIn(cat, get_alive_clan_cats(Cat))
+
+        cat.rank_change(CatRank.WARRIOR)
+        self.assertNotIn(
+            cat.ID, clan_roster.with_rank(CatGroup.PLAYER_CLAN_ID, [CatRank.APPRENTICE])
+        )
+        self.assertIn(cat, find_alive_cats_with_rank(Cat, [CatRank.WARRIOR]))
+
+        cat.status.exile_from_group()
+        self.assertNotIn(cat, get_alive_clan_cats(Cat))
+        self.assertNotIn(cat, find_alive_cats_with_rank(Cat, [CatRank.WARRIOR]))
+
+    def test_follows_age(self):
+        cat = Cat(status_dict={"rank": CatRank.KITTEN}, moons=5)
+        self.assertIn(
+            cat.ID, clan_roster.with_age(CatGroup.PLAYER_CLAN_ID, [CatAge.KITTEN])
+        )
+
+        cat.moons = 6
+        self.assertNotIn(
+            cat.ID, clan_roster.with_age(CatGroup.PLAYER_CLAN_ID, [CatAge.KITTEN])
+        )
+        self.assertIn(
+            cat.ID, clan_roster.with_age(CatGroup.PLAYER_CLAN_ID, [CatAge.ADOLESCENT])
+        )
+
+    def test_follows_conditions(self):
+        cat = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=40)
+        self.assertNotIn(cat.ID, clan_roster.injured(CatGroup.PLAYER_CLAN_ID))
+
+        cat.injuries["claw-wound"] = {"severity": "major"}
+        self.assertIn(cat.ID, clan_roster.injured(CatGroup.PLAYER_CLAN_ID))
+        self.assertNotIn(cat, find_alive_cats_with_rank(Cat, [CatRank.WARRIOR], True))
+
+        cat.injuries.pop("claw-wound")
+        self.assertNotIn(cat.ID, clan_roster.unwell(CatGroup.PLAYER_CLAN_ID))
+
+        cat.illnesses = {"running nose": {"severity": "minor"}}
+        self.assertIn(cat.ID, clan_roster.ill(CatGroup.PLAYER_CLAN_ID))
+
+
+class TestStatusCache(unittest.TestCase):
+    def assertMatchesHistory(self, status: Status):
+        fresh = Status(
+            group_history=deepcopy(status.group_history),
+            standing_history=deepcopy(status.standing_history),
+        )
+        self.assertEqual(status.rank, fresh.rank)
+        self.assertEqual(status.group_ID, fresh.group_ID)
+        self.assertEqual(status.social, fresh.social)
+        self.assertEqual(status.all_socials, fresh.all_socials)
+        self.assertEqual(status.all_groups, fresh.all_groups)
+        self.assertEqual(status.all_ranks, fresh.all_ranks)
+
+    def test_follows_changes(self):
+        cat = Cat(status_dict={"rank": CatRank.APPRENTICE}, moons=8)
+        status = cat.status
+        status.increase_current_moons_as()
+        cat.rank_change(CatRank.WARRIOR)
+        status.change_current_moons_as(12)
+        status.exile_from_group()
+        self.assertMatchesHistory(status)
+        self.assertEqual(status.all_ranks[CatRank.WARRIOR], 12)
+        self.assertFalse(status.alive_in_player_clan)
+
+        status.add_to_group(CatGroup.PLAYER_CLAN_ID, age=cat.age)
+        self.assertMatchesHistory(status)
+        self.assertEqual(status.rank, CatRank.WARRIOR)
+        self.assertTrue(status.alive_in_player_clan)
+
+        # a rank change in the same moon replaces the empty history entry
+        status._change_rank(CatRank.MEDIATOR)
+        status._change_rank(CatRank.ELDER)
+        self.assertMatchesHistory(status)
+        self.assertNotIn(CatRank.MEDIATOR, status.all_ranks)
+
+        status.increase_current_moons_as()
+        status.send_to_afterlife(CatGroup.STARCLAN_ID)
+        status.increase_current_moons_as()
+        self.assertMatchesHistory(status)
+        self.assertEqual(status.group, CatGroup.STARCLAN)
+        self.assertEqual(cat.dead_for, 1)
+
+
+class TestRelationshipStore(unittest.TestCase):
+    def test_records_materialize_on_access(self):
+        cat1 = Cat(disable_random=True)
+        cat2 = Cat(disable_random=True)
+        cat3 = Cat(disable_random=True)
+        cat1.relationships.clear()
+
+        cat1.relationships.add_record(cat2)
+        cat1.relationships.add_record(cat3, like=20, trust=150)
+
+        self.assertEqual(len(cat1.relationships), 2)
+        self.assertIn(cat2.ID, cat1.relationships)
+        self.assertEqual(cat1.relationships.materialized_count, 0)
+
+        relation = cat1.relationships[cat3.ID]
+        self.assertIsInstance(relation, Relationship)
+        self.assertEqual(relation.like, 20)
+        self.assertEqual(relation.trust, 100)
+        self.assertIs(cat1.relationships[cat3.ID], relation)
+        self.assertEqual(cat1.relationships.materialized_count, 1)
+
+    def test_non_neutral_values_skip_neutral_records(self):
+        cat1 = Cat(disable_random=True)
+        cat2 = Cat(disable_random=True)
+        cat3 = Cat(disable_random=True)
+        cat1.relationships.clear()
+
+        cat1.relationships.add_record(cat2)
+        cat1.relationships.add_record(cat3, family=True)
+
+        self.assertEqual(
+            [rel.cat_to for rel in cat1.relationships.non_neutral_values()], [cat3]
+        )
+        self.assertEqual(cat1.relationships.materialized_count, 1)
+
+    def test_save_dicts_match_relationship(self):
+        cat1 = Cat(disable_random=True)
+        cat2 = Cat(disable_random=True)
+        cat3 = Cat(disable_random=True)
+        cat1.relationships.clear()
+
+        cat1.relationships.add_record(cat2)
+        cat1.relationships.add_record(
+            cat3, mates=True, romance=30, like=-10, comfort=5, log=["met"]
+        )
+        sparse = list(cat1.relationships.iter_save_dicts())
+        materialized = [rel.to_dict() for rel in cat1.relationships.values()]
+
+        self.assertEqual(sparse, materialized)
+
+    def test_values_within_only_materializes_matches(self):
+        cat1 = Cat(disable_random=True)
+        cat2 = Cat(disable_random=True)
+        cat3 = Cat(disable_random=True)
+        cat1.relationships.clear()
+
+        cat1.relationships.add_record(cat2)
+        cat1.relationships.add_record(cat3, romance=25)
+
+        self.assertEqual(
+            [
+                rel.cat_to
+                for rel in cat1.relationships.values_within(RelType.ROMANCE, minimum=1)
+            ],
+            [cat3],
+        )
+        self.assertEqual(cat1.relationships.materialized_count, 1)
+
+
+@unittest.skipUnless(relationship_matrix.numpy_available(), "numpy is not installed")
+class TestRelationshipMatrix(unittest.TestCase):
+    def setUp(self):
+        self.cat1 = Cat(disable_random=True)
+        self.cat2 = Cat(disable_random=True)
+        self.cat3 = Cat(disable_random=True)
+        for cat in (self.cat1, self.cat2, self.cat3):
+            cat.relationships.clear()
+        self.cat2.relationships.add_record(self.cat1, like=50)
+        self.cat3.relationships.add_record(self.cat1, like=10)
+        relationship_matrix.enable([self.cat1, self.cat2, self.cat3])
+
+    def tearDown(self):
+        relationship_matrix.disable()
+
+    def test_query_towards_cat(self):
+        matrix = relationship_matrix.active_matrix
+        self.assertEqual(
+            matrix.cats_towards(self.cat1.ID, RelType.LIKE, minimum=40), [self.cat2.ID]
+        )
+
+    def test_setters_write_through(self):
+        self.cat3.relationships[self.cat1.ID].like = 45
+        self.cat1.relationships.add_record(self.cat2, romance=30)
+
+        matrix = relationship_matrix.active_matrix
+        self.assertCountEqual(
+            matrix.cats_towards(self.cat1.ID, RelType.LIKE, minimum=40),
+            [self.cat2.ID, self.cat3.ID],
+        )
+        self.assertEqual(
+            matrix.get_value(self.cat1.ID, self.cat2.ID, RelType.ROMANCE), 30
+        )
+        self.assertEqual(
+            [
+                rel.cat_to
+                for rel in self.cat1.relationships.values_within(
+                    RelType.ROMANCE, minimum=1
+                )
+            ],
+            [self.cat2],
+        )
+
+    def test_ids_within_does_not_materialize(self):
+        self.cat1.relationships.add_record(self.cat2, romance=30)
+        self.cat1.relationships.add_record(self.cat3)
+
+        self.assertEqual(
+            self.cat1.relationships.ids_within(RelType.ROMANCE, minimum=1),
+            [self.cat2.ID],
+        )
+        self.assertEqual(self.cat1.relationships.materialized_count, 0)
+
+    def test_new_cats_grow_matrix(self):
+        matrix = relationship_matrix.active_matrix
+        new_cats = [Cat(disable_random=True) for _ in range(70)]
+        for cat in new_cats:
+            cat.relationships.add_record(self.cat1, like=-60)
+
+        self.assertEqual(
+            len(matrix.cats_towards(self.cat1.ID, RelType.LIKE, maximum=-50)), 70
+        )
+
+    def test_set_value_grows_matrix(self):
+        matrix = relationship_matrix.RelationshipMatrix(capacity=1)
+        matrix.set_value(self.cat1.ID, self.cat2.ID, RelType.LIKE, 20)
+        self.assertEqual(matrix.get_value(self.cat1.ID, self.cat2.ID, RelType.LIKE), 20)
@@ -278,6 +278,38 @@ class Abbreviations(unittest.TestCase):
         self.assertEqual(len(abbreviations_possibilities["1"]["r_c1"]), 2)
         self.assertEqual(len(abbreviations_possibilities["2"]["r_c1"]), 1)
 
+    def test_get_abbreviation_possibilities_combined(self):
+        # given
+        warrior = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=30)
+        elder = Cat(status_dict={"rank": CatRank.ELDER}, moons=130)
+        medicine_cat = Cat(status_dict={"rank": CatRank.MEDICINE_CAT}, moons=30)
+
+        interaction1 = GroupInteraction("1")
+        interaction1.status_constraint = {"r_c1": ["-warrior"]}
+        interaction1.age_constraint = {"r_c1": ["young adult"]}
+
+        interaction2 = GroupInteraction("2")
+        interaction2.status_constraint = {"r_c1": ["-warrior"], "r_c2": ["warrior"]}
+
+        # when
+        interaction_cats = [warrior, elder, medicine_cat]
+        (
+            abbreviations_possibilities,
+            cat_abbreviations_counter,
+        ) = GroupEvents().get_abbreviations_possibilities(
+            [interaction1, interaction2], 2, interaction_cats
+        )
+
+        # then
+        self.assertEqual(abbreviations_possibilities["1"]["r_c1"], [medicine_cat.ID])
+        self.assertEqual(
+            abbreviations_possibilities["2"]["r_c1"], [elder.ID, medicine_cat.ID]
+        )
+        self.assertEqual(abbreviations_possibilities["2"]["r_c2"], [warrior.ID])
+        self.assertEqual(cat_abbreviations_counter[medicine_cat.ID]["r_c1"], 2)
+        self.assertEqual(cat_abbreviations_counter[elder.ID], {"r_c1": 1, "r_c2": 1})
+        self.assertEqual(cat_abbreviations_counter[warrior.ID], {"r_c2": 2})
+
     def test_remove_abbreviations_missing_cats(self):
         # given
         abbreviations_possibilities = {
@@ -0,0 +1,118 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import ujson
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat import history_archive as archive_module
+from scripts.cat.history_archive import (
+    ARCHIVE_FILE,
+    INDEX_FILE,
+    HistoryArchive,
+)
+from scripts.game_structure.game.save_load import background_save, save_writer
+
+
+class TestHistoryArchive(unittest.TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        save_writer.wait()
+        shutil.rmtree(self.directory)
+
+    def _reopened(self) -> HistoryArchive:
+        archive = HistoryArchive()
+        archive.open(self.directory)
+        return archive
+
+    def test_round_trip(self):
+        archive = HistoryArchive()
+        archive.add("1", ujson.dumps({"died_by": ["fell"]}))
+        archive.add("2", ujson.dumps({"scar_events": []}))
+        archive.flush(self.directory)
+
+        reopened = self._reopened()
+        self.assertEqual(reopened.read(self.directory, "1"), {"died_by": ["fell"]})
+        self.assertEqual(reopened.read(self.directory, "2"), {"scar_events": []})
+        self.assertIsNone(reopened.read(self.directory, "3"))
+
+    def test_changes_are_appended(self):
+        archive = HistoryArchive()
+        archive.add("1", ujson.dumps({"murder": {}}))
+        archive.add("2", ujson.dumps({"murder": {}}))
+        archive.flush(self.directory)
+        size = (self.directory / ARCHIVE_FILE).stat().st_size
+
+        archive.add("2", ujson.dumps({"murder": {"is_victim": []}}))
+        archive.flush(self.directory)
+
+        self.assertGreater((self.directory / ARCHIVE_FILE).stat().st_size, size)
+        reopened = self._reopened()
+        self.assertEqual(reopened.read(self.directory, "1"), {"murder": {}})
+        self.assertEqual(
+            reopened.read(self.directory, "2"), {"murder": {"is_victim": []}}
+        )
+
+    def test_missing_index_is_rebuilt(self):
+        archive = HistoryArchive()
+        archive.add("1", ujson.dumps({"beginning": {"moon": 1}}))
+        archive.flush(self.directory)
+        archive.add("1", ujson.dumps({"beginning": {"moon": 2}}))
+        archive.flush(self.directory)
+        (self.directory / INDEX_FILE).unlink()
+
+        self.assertEqual(
+            self._reopened().read(self.directory, "1"), {"beginning": {"moon": 2}}
+        )
+
+    def test_legacy_files_are_read_and_migrated(self):
+        legacy_path = self.directory / "7_history.json"
+        with open(legacy_path, "w", encoding="utf-8") as write_file:
+            write_file.write(ujson.dumps({"died_by": ["old"]}, indent=4))
+
+        archive = HistoryArchive()
+        self.assertEqual(archive.read(self.directory, "7"), {"died_by": ["old"]})
+
+        archive.add("7", ujson.dumps({"died_by": ["old", "new"]}))
+        archive.flush(self.directory)
+        self.assertFalse(legacy_path.exists())
+        self.assertEqual(
+            self._reopened().read(self.directory, "7"), {"died_by": ["old", "new"]}
+        )
+
+    def test_garbage_is_compacted(self):
+        archive = HistoryArchive()
+        with patch.object(archive_module, "COMPACT_MIN_BYTES", 0):
+            for i in range(4):
+                archive.add("1", ujson.dumps({"died_by": [i]}))
+                archive.add("2", ujson.dumps({"died_by": []}))
+                archive.flush(self.directory)
+
+        with open(self.directory / ARCHIVE_FILE, "rb") as read_file:
+            self.assertLessEqual(len(read_file.readlines()), 3)
+        self.assertEqual(archive.read(self.directory, "1"), {"died_by": [3]})
+        self.assertEqual(self._reopened().read(self.directory, "1"), {"died_by": [3]})
+
+    def test_read_during_background_save(self):
+        archive = HistoryArchive()
+        archive.add("1", ujson.dumps({"died_by": ["before"]}))
+        archive.flush(self.directory)
+        self.assertEqual(archive.read(self.directory, "1"), {"died_by": ["before"]})
+
+        with background_save():
+            archive.add("1", ujson.dumps({"died_by": ["after"]}))
+            archive.flush(self.directory)
+            # not written yet, but still readable
+            self.assertEqual(archive.read(self.directory, "1"), {"died_by": ["after"]})
+
+        save_writer.wait()
+        self.assertEqual(
+            self._reopened().read(self.directory, "1"), {"died_by": ["after"]}
+        )
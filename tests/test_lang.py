@@ -11,6 +11,9 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 from scripts.cat.cats import Cat
 from scripts.game_structure.localization import (
     set_lang_config_directory,
+    load_lang_resource,
+    clear_resource_cache,
+    get_resource_cache_info,
 )
 from scripts.cat.pronouns import get_new_pronouns, determine_plural_pronouns
 from scripts.events_module.text_adjust import event_text_adjust
@@ -108,3 +111,41 @@ class TestLocalisation(unittest.TestCase):
                     ),
                     value[1]["subject"],
                 )
+
+
+class TestLangResourceCache(unittest.TestCase):
+    def setUp(self):
+        i18n.config.set("locale", "en")
+        clear_resource_cache()
+
+    def tearDown(self):
+        i18n.config.set("locale", "en")
+        clear_resource_cache()
+
+    def test_repeat_loads_hit_cache(self):
+        load_lang_resource("thoughts/on_birth/parent.json")
+        load_lang_resource("thoughts/on_birth/parent.json")
+        info = get_resource_cache_info()
+        self.assertEqual(info["misses"], 1)
+        self.assertEqual(info["hits"], 1)
+
+    def test_extending_result_does_not_corrupt_cache(self):
+        first = load_lang_resource("thoughts/on_birth/parent.json")
+        length = len(first)
+        first.extend(first)
+        self.assertEqual(
+            len(load_lang_resource("thoughts/on_birth/parent.json")), length
+        )
+
+    def test_locale_change_invalidates_cache(self):
+        load_lang_resource("thoughts/on_birth/parent.json")
+        i18n.config.set("locale", "es")
+        load_lang_resource("thoughts/on_birth/parent.json")
+        info = get_resource_cache_info()
+        self.assertEqual(info["misses"], 2)
+        self.assertEqual(info["size"], 1)
+
+    def test_config_directory_change_clears_cache(self):
+        load_lang_resource("thoughts/on_birth/parent.json")
+        set_lang_config_directory("resources/lang/en/config.json")
+        self.assertEqual(get_resource_cache_info()["size"], 0)
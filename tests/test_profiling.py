@@ -0,0 +1,84 @@
+import os
+import pstats
+import tempfile
+import threading
+import unittest
+from time import sleep
+
+import ujson
+
+from scripts.housekeeping import profiling
+
+
+@profiling.profiled("test.outer")
+def _outer():
+    with profiling.timer("test.inner"):
+        sleep(0.01)
+
+
+class TestProfiling(unittest.TestCase):
+    def tearDown(self):
+        profiling.stop()
+        profiling.reset()
+
+    def test_nothing_is_timed_while_off(self):
+        self.assertIs(profiling.timer("a"), profiling.timer("b"))
+        _outer()
+        self.assertEqual(profiling.timers, {})
+
+    def test_timers_count_calls_and_own_time(self):
+        profiling.start()
+        _outer()
+        _outer()
+        profiling.stop()
+
+        outer = profiling.timers["test.outer"]
+        inner = profiling.timers["test.inner"]
+        self.assertEqual(outer.calls, 2)
+        self.assertEqual(inner.calls, 2)
+        self.assertGreaterEqual(inner.total, 0.02)
+        self.assertAlmostEqual(outer.own, outer.total - inner.total, places=6)
+        self.assertEqual(len(outer.samples), 2)
+        self.assertLessEqual(outer.percentile(50), outer.percentile(99))
+        self.assertEqual(len(profiling.report()), 3)
+
+    def test_speedscope_profiles_are_nested_per_thread(self):
+        profiling.start()
+        thread = threading.Thread(target=_outer, name="moon skip")
+        thread.start()
+        _outer()
+        thread.join()
+        profiling.stop()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            profiling.dump_speedscope(path)
+            with open(path, "r", encoding="utf-8") as read_file:
+                document = ujson.loads(read_file.read())
+
+        frames = [frame["name"] for frame in document["shared"]["frames"]]
+        self.assertEqual(sorted(frames), ["test.inner", "test.outer"])
+        self.assertEqual(len(document["profiles"]), 2)
+        self.assertIn("moon skip", [p["name"] for p in document["profiles"]])
+        for profile in document["profiles"]:
+            running = []
+            for event in profile["events"]:
+                if event["type"] == "O":
+                    running.append(event["frame"])
+                else:
+                    self.assertEqual(running.pop(), event["frame"])
+            self.assertEqual(running, [])
+
+    def test_cprofile_stats_can_be_dumped(self):
+        with self.assertRaises(RuntimeError):
+            profiling.dump_pstats("unused.prof")
+
+        profiling.start(cprofile=True)
+        _outer()
+        profiling.stop()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.prof")
+            profiling.dump_pstats(path)
+            functions = [name for _, _, name in pstats.Stats(path).stats]
+        self.assertIn("_outer", functions)
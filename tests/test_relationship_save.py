@@ -0,0 +1,133 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat_relations import relationship_save
+from scripts.cat_relations.relationship_save import (
+    HEADER,
+    IDS_FILE,
+    LOGS_FILE,
+    ROW,
+    VALUES_FILE,
+    RelationshipPack,
+)
+
+
+class TestRelationshipPack(unittest.TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.cats = [Cat(disable_random=True) for _ in range(3)]
+        for cat in self.cats:
+            cat.relationships.clear()
+            for other in self.cats:
+                if other is not cat:
+                    cat.relationships.add_record(other)
+        self.cats[0].relationships.add_record(
+            self.cats[1], mates=True, romance=40, like=30, log=["first"]
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _rows(self, cat):
+        pack = RelationshipPack()
+        self.assertTrue(pack.open(self.directory))
+        return {row[0]: row[1:] for row in pack.take_rows(cat.ID)}
+
+    def _row_count(self):
+        size = (self.directory / VALUES_FILE).stat().st_size
+        return (size - HEADER.size) // ROW.size
+
+    def test_round_trip(self):
+        RelationshipPack().save(self.directory, self.cats)
+
+        rows = self._rows(self.cats[0])
+        self.assertEqual(
+            rows[self.cats[1].ID], (True, False, (40, 30, 0, 0, 0), ["first"])
+        )
+        # neutral relationships aren't stored, only a row per cat that marks it saved
+        self.assertNotIn(self.cats[2].ID, rows)
+        self.assertEqual(self._rows(self.cats[2]), {})
+        self.assertEqual(self._row_count(), len(self.cats) + 1)
+
+    def test_incremental_save_only_rewrites_changes(self):
+        pack = RelationshipPack()
+        pack.save(self.directory, self.cats)
+        row_count = self._row_count()
+
+        relationship = self.cats[0].relationships[self.cats[1].ID]
+        relationship.like = 50
+        relationship.log.append("second")
+        pack.save(self.directory, self.cats)
+
+        self.assertEqual(self._row_count(), row_count)
+        rows = self._rows(self.cats[0])
+        self.assertEqual(
+            rows[self.cats[1].ID], (True, False, (40, 50, 0, 0, 0), ["first", "second"])
+        )
+
+    def test_interrupted_save_keeps_the_previous_one(self):
+        pack = RelationshipPack()
+        pack.save(self.directory, self.cats)
+
+        relationship = self.cats[0].relationships[self.cats[1].ID]
+        relationship.like = 50
+        relationship.log.append("second")
+        with patch("os.replace", side_effect=OSError):
+            with self.assertRaises(OSError):
+                pack.save(self.directory, self.cats)
+
+        rows = self._rows(self.cats[0])
+        self.assertEqual(
+            rows[self.cats[1].ID], (True, False, (40, 30, 0, 0, 0), ["first"])
+        )
+        # what the interrupted save appended is cut off when the save is opened
+        with open(self.directory / LOGS_FILE, "r", encoding="utf-8") as read_file:
+            self.assertNotIn("second", read_file.read())
+
+    def test_save_is_finished_from_the_journal(self):
+        pack = RelationshipPack()
+        pack.save(self.directory, self.cats)
+
+        self.cats[0].relationships[self.cats[1].ID].like = 50
+        self.cats[2].relationships[self.cats[0].ID].trust = 20
+        with patch.object(relationship_save, "_apply_journal"):
+            pack.save(self.directory, self.cats)
+
+        self.assertEqual(self._rows(self.cats[0])[self.cats[1].ID][2][1], 50)
+        self.assertEqual(self._rows(self.cats[2])[self.cats[0].ID][2][3], 20)
+
+    def test_files_of_different_saves_are_not_mixed(self):
+        RelationshipPack().save(self.directory, self.cats)
+        ids_path = self.directory / IDS_FILE
+        with open(ids_path, "r", encoding="utf-8") as read_file:
+            ids = read_file.read()
+        RelationshipPack().save(self.directory, self.cats)
+
+        # ids.txt of the first save next to values.bin of the second
+        with open(ids_path, "w", encoding="utf-8") as write_file:
+            write_file.write(ids)
+        with self.assertLogs(relationship_save.logger):
+            self.assertFalse(RelationshipPack().open(self.directory))
+
+    def test_removed_cats_and_relationships_are_dropped(self):
+        pack = RelationshipPack()
+        pack.save(self.directory, self.cats)
+
+        del self.cats[0].relationships[self.cats[2].ID]
+        # cats[1] is gone from the clan
+        pack.save(self.directory, [self.cats[0], self.cats[2]])
+
+        pack = RelationshipPack()
+        pack.open(self.directory)
+        self.assertIsNone(pack.take_rows(self.cats[1].ID))
+        self.assertNotIn(
+            self.cats[2].ID, {row[0] for row in pack.take_rows(self.cats[0].ID)}
+        )
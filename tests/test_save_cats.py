@@ -0,0 +1,236 @@
+import os
+import shutil
+import tempfile
+import unittest
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+from unittest.mock import patch
+
+import ujson
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat import save_load
+from scripts.cat.history_archive import ARCHIVE_FILE
+from scripts.game_structure import game
+from scripts.game_structure.game.save_load import (
+    background_save,
+    safe_save,
+    save_writer,
+)
+from scripts.game_structure.game.switches import (
+    Switch,
+    switch_get_value,
+    switch_set_value,
+)
+from scripts.housekeeping.datadir import get_save_dir
+
+CLAN_NAME = "unittestShardClan"
+
+
+class TestIncrementalCatSave(unittest.TestCase):
+    def setUp(self):
+        self.directory = Path(get_save_dir()) / CLAN_NAME
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._reset_save_state()
+        self.cats = [Cat(disable_random=True) for _ in range(20)]
+
+    def tearDown(self):
+        save_writer.wait()
+        self._reset_save_state()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @staticmethod
+    def _reset_save_state():
+        # other tests may leave cats to fade or a backend of their own clan behind
+        save_load.close_save_backend()
+        save_load.save_cache.reset()
+        save_load.cat_to_fade.clear()
+        save_load.faded_ids.clear()
+        Cat.all_cats.clear()
+
+    def test_round_trip(self):
+        save_load.save_cats(CLAN_NAME, Cat, game)
+
+        records = save_load.load_cat_records(CLAN_NAME)
+        self.assertCountEqual(
+            [record["ID"] for record in records], [cat.ID for cat in self.cats]
+        )
+
+    def test_only_changed_shards_are_written(self):
+        save_load.save_cats(CLAN_NAME, Cat, game)
+        self.assertEqual(
+            save_load.save_cache.last_stats["cats"]["written"],
+            save_load.CAT_SHARD_COUNT,
+        )
+
+        save_load.save_cats(CLAN_NAME, Cat, game)
+        self.assertEqual(save_load.save_cache.last_stats["cats"]["written"], 0)
+
+        self.cats[3].moons += 1
+        save_load.save_cats(CLAN_NAME, Cat, game)
+        self.assertEqual(save_load.save_cache.last_stats["cats"]["changed"], 1)
+        self.assertEqual(save_load.save_cache.last_stats["cats"]["written"], 1)
+
+        records = {
+            record["ID"]: record for record in save_load.load_cat_records(CLAN_NAME)
+        }
+        self.assertEqual(records[self.cats[3].ID]["moons"], self.cats[3].moons)
+
+    def test_old_single_file_is_read_until_replaced(self):
+        self.directory.mkdir(parents=True)
+        with open(self.directory / "clan_cats.json", "w", encoding="utf-8") as f:
+            f.write('[{"ID": "old"}]')
+
+        self.assertEqual(save_load.load_cat_records(CLAN_NAME), [{"ID": "old"}])
+
+        save_load.save_cats(CLAN_NAME, Cat, game)
+        self.assertFalse((self.directory / "clan_cats.json").exists())
+        self.assertEqual(len(save_load.load_cat_records(CLAN_NAME)), len(self.cats))
+
+    def test_faded_cats_are_read_once(self):
+        # an ID no living cat of the other tests will have
+        faded_ID = "9" * 12
+        record = self.cats[0].get_save_dict(faded=True)
+        record["ID"] = faded_ID
+        backend = save_load.get_save_backend(CLAN_NAME)
+        backend.save_faded_cat(faded_ID, record)
+        backend.flush_faded_cats()
+        save_writer.wait()
+        save_load.close_save_backend()
+
+        backend = save_load.get_save_backend(CLAN_NAME)
+        faded = backend.get_faded_cat(faded_ID)
+        self.assertIs(backend.get_faded_cat(faded_ID), faded)
+        self.assertIsNone(backend.get_faded_cat("901"))
+        with self.assertRaises(FrozenInstanceError):
+            faded.moons = 1
+
+        # faded cats are fetched from the loaded clan, or the first one listed
+        clan, game.clan = game.clan, None
+        clan_list = switch_get_value(Switch.clan_list)
+        switch_set_value(Switch.clan_list, [CLAN_NAME])
+        try:
+            faded_cat = Cat.fetch_cat(faded_ID)
+            self.assertTrue(faded_cat.faded)
+            self.assertIs(Cat.fetch_cat(faded_ID), faded_cat)
+
+            # saving the record again replaces what was read
+            self.assertTrue(
+                save_load.add_faded_offspring_to_faded_cat(CLAN_NAME, faded_ID, "901")
+            )
+            self.assertEqual(backend.get_faded_cat(faded_ID).faded_offspring, ("901",))
+            self.assertEqual(Cat.fetch_cat(faded_ID).faded_offspring, ["901"])
+        finally:
+            switch_set_value(Switch.clan_list, clan_list)
+            game.clan = clan
+
+    def test_faded_cat_without_clan_is_logged(self):
+        clan, game.clan = game.clan, None
+        clan_list = switch_get_value(Switch.clan_list)
+        switch_set_value(Switch.clan_list, [])
+        try:
+            with self.assertLogs("scripts.cat.cats", level="ERROR"):
+                self.assertIsNone(Cat.fetch_faded_record("901"))
+        finally:
+            switch_set_value(Switch.clan_list, clan_list)
+            game.clan = clan
+
+    def test_failed_background_save_is_written_again(self):
+        save_load.save_cats(CLAN_NAME, Cat, game)
+        self.cats[0].moons += 1
+        with patch(
+            "scripts.game_structure.game.save_load.save_load._write_file",
+            side_effect=OSError,
+        ):
+            with background_save():
+                save_load.save_cats(CLAN_NAME, Cat, game)
+            save_writer.wait()
+        self.assertIsNotNone(save_writer.poll_error())
+
+        save_load.save_cats(CLAN_NAME, Cat, game)
+        self.assertEqual(
+            save_load.save_cache.last_stats["cats"]["written"],
+            save_load.CAT_SHARD_COUNT,
+        )
+        records = {
+            record["ID"]: record for record in save_load.load_cat_records(CLAN_NAME)
+        }
+        self.assertEqual(records[self.cats[0].ID]["moons"], self.cats[0].moons)
+
+    def test_neutral_relationships_are_loaded(self):
+        old_clan_name = switch_get_value(Switch.clan_name)
+        switch_set_value(Switch.clan_name, CLAN_NAME)
+        try:
+            cat, friend = self.cats[0], self.cats[1]
+            cat.relationships.clear()
+            for other in self.cats[1:]:
+                cat.relationships.add_record(other)
+            cat.relationships.add_record(friend, like=20)
+            save_load.save_cats(CLAN_NAME, Cat, game)
+            save_load.close_save_backend()
+
+            cat.load_relationship_of_cat()
+            self.assertCountEqual(cat.relationships, [c.ID for c in self.cats[1:]])
+            self.assertEqual(cat.relationships[friend.ID].like, 20)
+            self.assertEqual(cat.relationships[self.cats[2].ID].like, 0)
+        finally:
+            switch_set_value(Switch.clan_name, old_clan_name)
+
+    def test_histories_are_archived(self):
+        old_clan_name = switch_get_value(Switch.clan_name)
+        switch_set_value(Switch.clan_name, CLAN_NAME)
+        try:
+            death = {"involved": None, "text": "fell from a tree", "moon": 3}
+            self.cats[5].history.died_by.append(death)
+            save_load.save_cats(CLAN_NAME, Cat, game)
+            self.assertEqual(save_load.save_cache.last_stats["history"]["written"], 1)
+            self.assertTrue((self.directory / "history" / ARCHIVE_FILE).exists())
+
+            save_load.close_save_backend()
+            self.assertEqual(self.cats[5].history.died_by, [death])
+            self.assertEqual(self.cats[6].history.died_by, [])
+        finally:
+            switch_set_value(Switch.clan_name, old_clan_name)
+
+
+class TestBackgroundSave(unittest.TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        save_writer.wait()
+        save_writer.poll_error()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_later_saves_do_not_overtake_earlier_ones(self):
+        path = self.directory / "data.json"
+        for i in range(5):
+            with background_save():
+                safe_save(path, {"save": i})
+        save_writer.wait()
+
+        with open(path, "r", encoding="utf-8") as read_file:
+            self.assertEqual(ujson.loads(read_file.read()), {"save": 4})
+
+    def test_data_is_snapshotted_when_saving(self):
+        path = self.directory / "data.json"
+        data = {"moons": 1}
+        with background_save():
+            safe_save(path, data)
+            data["moons"] = 2
+        save_writer.wait()
+
+        with open(path, "r", encoding="utf-8") as read_file:
+            self.assertEqual(ujson.loads(read_file.read()), {"moons": 1})
+
+    def test_errors_are_reported(self):
+        with background_save():
+            # the directory itself can't be written to as a file
+            safe_save(self.directory, {})
+        save_writer.wait()
+
+        self.assertIn("IsADirectoryError", save_writer.poll_error())
+        self.assertIsNone(save_writer.poll_error())
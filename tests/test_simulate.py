@@ -0,0 +1,95 @@
+import os
+import shutil
+import subprocess
+import sys
+import unittest
+from io import StringIO
+from pathlib import Path
+from uuid import uuid4
+
+import ujson
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts import simulate
+from scripts.cat.cats import Cat, create_cat
+from scripts.cat.enums import CatRank
+from scripts.cat import save_load
+from scripts.cat.save_load import save_cats
+from scripts.cat.sprites.load_sprites import sprites
+from scripts.clan import Afterlife, Clan
+from scripts.game_structure import game
+from scripts.game_structure.game.save_load import read_clans, save_writer
+from scripts.housekeeping.datadir import get_save_dir
+
+
+class TestSimulate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.clan_name = f"Test_{uuid4()}"
+        cls.clanlist = read_clans()
+        cls.previously_loaded_clan = cls.clanlist[0] if cls.clanlist else None
+
+        if not sprites.clan_symbols:
+            sprites.load_symbols(make_groups=False)
+        game.starclan = Afterlife()
+        game.dark_forest = Afterlife()
+        game.clan = Clan(
+            name=cls.clan_name,
+            displayname="Test",
+            leader=create_cat(CatRank.LEADER),
+            deputy=create_cat(CatRank.DEPUTY),
+            medicine_cat=create_cat(CatRank.MEDICINE_CAT),
+            biome="Forest",
+            camp_bg="camp1",
+            symbol="symbolADDER0",
+            starting_members=[create_cat(CatRank.WARRIOR) for _ in range(6)],
+            starting_season="Newleaf",
+        )
+        # other tests may leave cats to fade behind
+        save_load.cat_to_fade.clear()
+        game.clan.create_clan()
+        save_cats(cls.clan_name, Cat, game)
+        game.clan.save_clan()
+        save_writer.wait()
+
+    @classmethod
+    def tearDownClass(cls):
+        save_writer.wait()
+        shutil.rmtree(Path(get_save_dir()) / cls.clan_name, ignore_errors=True)
+        if cls.previously_loaded_clan:
+            with open(Path(get_save_dir()) / "currentclan.txt", "w") as currentclanfile:
+                currentclanfile.write(str(cls.previously_loaded_clan))
+
+    def _run(self) -> list:
+        output = StringIO()
+        simulate.simulate(self.clan_name, moons=3, rng_seed=5, output=output)
+        return [ujson.loads(line) for line in output.getvalue().splitlines()]
+
+    def test_one_line_per_moon_and_a_summary(self):
+        lines = self._run()
+
+        self.assertEqual(len(lines), 4)
+        self.assertEqual([line["moon"] for line in lines[:3]], [1, 2, 3])
+        summary = lines[-1]
+        self.assertTrue(summary["summary"])
+        self.assertEqual(summary["start_population"], 9)
+        self.assertEqual(summary["population"], lines[2]["population"])
+        self.assertEqual(summary["events"], sum(line["events"] for line in lines[:3]))
+
+    def test_same_seed_same_moons(self):
+        def run():
+            output = subprocess.run(
+                [sys.executable, "-m", "scripts.simulate", "--clan", self.clan_name]
+                + ["--moons", "3", "--seed", "5"],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+            return [
+                {k: v for k, v in ujson.loads(line).items() if "seconds" not in k}
+                for line in output.splitlines()
+            ]
+
+        self.assertEqual(run(), run())
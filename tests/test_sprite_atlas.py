@@ -0,0 +1,104 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+
+from scripts.cat.sprites import sprite_atlas
+from scripts.cat.sprites.load_sprites import LazySprites
+
+SIZE = 8
+
+
+def _sprite(background, pixels=()):
+    sprite = pygame.Surface((SIZE, SIZE), pygame.HWSURFACE | pygame.SRCALPHA)
+    sprite.fill(background)
+    for position, colour in pixels:
+        sprite.set_at(position, colour)
+    return sprite
+
+
+class TestSpriteAtlas(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+        self.directory = tempfile.mkdtemp()
+        patcher = patch.object(
+            sprite_atlas, "get_cache_dir", return_value=self.directory
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sprites = {
+            # transparent pixels keep their colour, blend modes can see it
+            "lineart0": _sprite((255, 255, 255, 0), [((2, 3), (0, 0, 0, 255))]),
+            "lineart1": _sprite((255, 255, 255, 0), [((2, 3), (0, 0, 0, 255))]),
+            "eyes0": _sprite(
+                (0, 0, 0, 0), [((0, 7), (30, 200, 40, 128)), ((6, 1), (1, 2, 3, 0))]
+            ),
+            "blank0": _sprite((0, 0, 0, 0)),
+            "shader0": _sprite((120, 130, 140, 255), [((4, 4), (9, 9, 9, 255))]),
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        sprite_atlas.save_atlas("key", SIZE, self.sprites)
+        atlas = sprite_atlas.load_atlas("key", SIZE)
+
+        self.assertEqual(set(atlas.names()), set(self.sprites))
+        loaded = {name: atlas.make_sprite(name) for name in atlas.names()}
+        for name, sprite in self.sprites.items():
+            self.assertEqual(
+                pygame.image.tobytes(loaded[name], "RGBA"),
+                pygame.image.tobytes(sprite, "RGBA"),
+                name,
+            )
+        # identical sprites are only made once
+        self.assertIs(loaded["lineart0"], loaded["lineart1"])
+
+    def test_other_sources_are_not_loaded(self):
+        sprite_atlas.save_atlas("key", SIZE, self.sprites)
+        self.assertIsNone(sprite_atlas.load_atlas("other key", SIZE))
+        self.assertIsNone(sprite_atlas.load_atlas("key", SIZE * 2))
+
+    def test_missing_or_damaged_atlas(self):
+        self.assertIsNone(sprite_atlas.load_atlas("key", SIZE))
+
+        sprite_atlas.save_atlas("key", SIZE, self.sprites)
+        with open(
+            os.path.join(self.directory, sprite_atlas.ATLAS_FILE), "r+b"
+        ) as atlas:
+            atlas.truncate(4)
+        self.assertIsNone(sprite_atlas.load_atlas("key", SIZE))
+
+    def test_key_follows_the_sources(self):
+        key = sprite_atlas.source_key(april_fools=False)
+        self.assertEqual(key, sprite_atlas.source_key(april_fools=False))
+        self.assertNotEqual(key, sprite_atlas.source_key(april_fools=True))
+
+
+class TestLazySprites(unittest.TestCase):
+    def test_sprites_are_made_when_used(self):
+        made = []
+
+        def make_sprite():
+            made.append(True)
+            return pygame.Surface((SIZE, SIZE))
+
+        sprites = LazySprites()
+        sprites.add_source("lineart0", make_sprite)
+
+        self.assertIn("lineart0", sprites)
+        self.assertEqual(list(sprites), ["lineart0"])
+        self.assertEqual(made, [])
+
+        sprite = sprites["lineart0"]
+        self.assertIs(sprites["lineart0"], sprite)
+        self.assertEqual(len(made), 1)
+        self.assertEqual(sprites.loaded_count(), 1)
+        self.assertIsNone(sprites.get("lineart1"))
@@ -0,0 +1,130 @@
+import os
+import unittest
+from copy import deepcopy
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+
+from scripts.cat.cats import Cat
+from scripts.cat.sprites import display_sprites
+from scripts.cat.sprites.display_sprites import (
+    clear_sprite_caches,
+    generate_sprite,
+    get_sprite_cache_info,
+)
+from scripts.cat.sprites.load_sprites import sprites
+
+
+class TestSpriteCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not sprites.sprites:
+            sprites.load_all()
+
+    def setUp(self):
+        clear_sprite_caches()
+        self.cat = Cat()
+        self.twin = Cat(moons=self.cat.moons)
+        self.twin.pelt = deepcopy(self.cat.pelt)
+
+    def test_alike_cats_share_a_sprite(self):
+        sprite = generate_sprite(self.cat)
+        self.assertIs(generate_sprite(self.twin), sprite)
+        self.assertEqual(get_sprite_cache_info()["sprites"]["hits"], 1)
+
+    def test_accessory_change_reuses_the_coat(self):
+        generate_sprite(self.cat)
+        self.twin.pelt.accessory = ["MAPLE LEAF"]
+        generate_sprite(self.twin)
+
+        info = get_sprite_cache_info()
+        self.assertEqual(info["sprites"]["hits"], 0)
+        self.assertEqual(info["coats"]["hits"], 1)
+
+    def test_cached_sprite_matches_a_fresh_one(self):
+        self.cat.pelt.scars = ["ONE", "LEFTEAR"]
+        sprite = generate_sprite(self.cat)
+        clear_sprite_caches()
+        fresh = generate_sprite(self.cat)
+        self.assertIsNot(fresh, sprite)
+        self.assertEqual(
+            pygame.image.tobytes(fresh, "RGBA"), pygame.image.tobytes(sprite, "RGBA")
+        )
+
+    def test_least_recently_used_is_evicted(self):
+        cache = display_sprites.SpriteCache(2)
+        surface = pygame.Surface((1, 1))
+        for key in ("a", "b"):
+            cache.put((key,), surface)
+        cache.get(("a",))
+        cache.put(("c",), surface)
+
+        self.assertIsNone(cache.get(("b",)))
+        self.assertIs(cache.get(("a",)), surface)
+        self.assertEqual(cache.info()["size"], 2)
+
+    def test_reloading_sprites_empties_the_cache(self):
+        sprite = generate_sprite(self.cat)
+        sprites.generation += 1
+        try:
+            self.assertIsNot(generate_sprite(self.cat), sprite)
+        finally:
+            sprites.generation -= 1
+
+    def test_gradient_lineart_is_copied_from_the_source(self):
+        name = f"{sprites.PLANT_DATA['spritesheet']}MAPLE LEAF0"
+        original = pygame.image.tobytes(sprites.sprites[name], "RGBA")
+
+        recolored = display_sprites.recolor_lineart(
+            name, source_name="line_ur_gradient0"
+        )
+
+        source = sprites.sprites["line_ur_gradient0"]
+        sprite = sprites.sprites[name]
+        width, height = sprite.get_size()
+        for x in range(width):
+            for y in range(height):
+                if sprite.get_at((x, y)) == pygame.Color(0, 0, 0):
+                    expected = source.get_at((x, y))
+                else:
+                    expected = sprite.get_at((x, y))
+                self.assertEqual(recolored.get_at((x, y)), expected)
+        # the sheet's sprite is left alone
+        self.assertEqual(pygame.image.tobytes(sprite, "RGBA"), original)
+
+    def test_click_mask_covers_the_sprite(self):
+        sprite = generate_sprite(self.cat)
+        mask = display_sprites.get_click_mask(sprite)
+        self.assertIs(display_sprites.get_click_mask(sprite), mask)
+
+        padding = display_sprites.CLICK_MASK_PADDING
+        grow = display_sprites.CLICK_MASK_GROW
+        scaled = pygame.mask.from_surface(
+            pygame.transform.scale(sprite, (50, 50)), threshold=250
+        )
+        self.assertEqual(mask.get_size(), (50 + padding * 2, 50 + padding * 2))
+        self.assertEqual(
+            scaled.overlap_area(mask, (-padding, -padding)), scaled.count()
+        )
+        # grown by exactly grow pixels
+        x = min(rect.left for rect in scaled.get_bounding_rects())
+        y = next(y for y in range(50) if scaled.get_at((x, y)))
+        self.assertTrue(mask.get_at((x + padding - grow, y + padding)))
+        self.assertFalse(mask.get_at((x + padding - grow - 1, y + padding)))
+
+    def test_click_mask_is_remade_for_a_new_scale(self):
+        sprite = generate_sprite(self.cat)
+        mask = display_sprites.get_click_mask(sprite)
+        settings = display_sprites.scripts.game_structure.screen_settings
+        old_scale = settings.screen_scale
+        settings.screen_scale = old_scale * 2
+        try:
+            bigger = display_sprites.get_click_mask(sprite)
+        finally:
+            settings.screen_scale = old_scale
+        self.assertEqual(
+            bigger.get_size()[0], 100 + 2 * display_sprites.CLICK_MASK_PADDING
+        )
+        self.assertIsNot(display_sprites.get_click_mask(sprite), mask)
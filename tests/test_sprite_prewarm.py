@@ -0,0 +1,60 @@
+import os
+import unittest
+from time import perf_counter
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat.sprites.load_sprites import sprites
+from scripts.cat.sprites.prewarm import SpritePrewarmer
+
+
+class TestSpritePrewarmer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not sprites.sprites:
+            sprites.load_all()
+
+    def setUp(self):
+        Cat.all_cats.clear()
+        self.cats = [Cat() for _ in range(5)]
+        for cat in self.cats:
+            cat.sprite
+            cat.pelt.rebuild_sprite = True
+        self.prewarmer = SpritePrewarmer()
+
+    def tearDown(self):
+        Cat.all_cats.clear()
+
+    def test_outdated_sprites_are_rebuilt(self):
+        self.prewarmer.schedule()
+        self.prewarmer.update(perf_counter(), fps=1)
+
+        self.assertEqual(self.prewarmer.warmed, 5)
+        self.assertEqual(self.prewarmer.pending(), 0)
+        self.assertFalse(any(cat.sprite_outdated for cat in self.cats))
+
+    def test_nothing_is_rebuilt_without_time_left(self):
+        self.prewarmer.schedule()
+        self.prewarmer.update(perf_counter() - 1, fps=60)
+
+        self.assertEqual(self.prewarmer.warmed, 0)
+        self.assertEqual(self.prewarmer.pending(), 5)
+        self.assertTrue(all(cat.sprite_outdated for cat in self.cats))
+
+    def test_priority_cats_go_first(self):
+        self.prewarmer.add_priority_source(lambda: self.cats[3:])
+        self.prewarmer.schedule()
+        self.prewarmer.update(perf_counter() - 1, fps=60)
+
+        self.assertEqual(
+            list(self.prewarmer._queue),
+            [cat.ID for cat in self.cats[3:] + self.cats[:3]],
+        )
+
+    def test_stopped_while_the_moon_is_skipped(self):
+        self.prewarmer.schedule()
+        self.prewarmer.stop()
+        self.prewarmer.update(perf_counter(), fps=1)
+        self.assertEqual(self.prewarmer.warmed, 0)
@@ -0,0 +1,158 @@
+import os
+import shutil
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat import save_load
+from scripts.cat.sqlite_save import SqliteSaveBackend, get_db_path
+from scripts.game_structure import game
+from scripts.game_structure.game.save_load import save_writer
+from scripts.housekeeping.datadir import get_save_dir
+
+CLAN_NAME = "unittestSqliteClan"
+
+
+class TestSqliteSave(unittest.TestCase):
+    def setUp(self):
+        self.directory = Path(get_save_dir()) / CLAN_NAME
+        shutil.rmtree(self.directory, ignore_errors=True)
+        save_load.close_save_backend()
+        save_load.save_cache.reset()
+        # other tests may leave cats to fade behind
+        save_load.cat_to_fade.clear()
+        save_load.faded_ids.clear()
+        Cat.all_cats.clear()
+        self.cats = [Cat(disable_random=True) for _ in range(5)]
+        for cat in self.cats:
+            cat.relationships.clear()
+            for other in self.cats:
+                if other is not cat:
+                    cat.relationships.add_record(other)
+        self.cats[0].relationships.add_record(
+            self.cats[1], mates=True, romance=40, like=30, log=["first"]
+        )
+        self.cats[2].history.died_by.append(
+            {"involved": None, "text": "drowned", "moon": 4}
+        )
+
+        save_load.save_cats(CLAN_NAME, Cat, game)
+        self.assertTrue(save_load.convert_save_backend(CLAN_NAME, Cat, to_sqlite=True))
+        save_writer.wait()
+
+    def tearDown(self):
+        save_writer.wait()
+        save_load.close_save_backend()
+        shutil.rmtree(self.directory, ignore_errors=True)
+        Cat.all_cats.clear()
+        save_load.save_cache.reset()
+        save_load.cat_to_fade.clear()
+        save_load.faded_ids.clear()
+
+    def _reopened(self) -> SqliteSaveBackend:
+        save_load.close_save_backend()
+        backend = save_load.get_save_backend(CLAN_NAME)
+        self.assertIsInstance(backend, SqliteSaveBackend)
+        return backend
+
+    def _rows(self, backend, cat):
+        self.assertTrue(backend.has_relationships())
+        return {row[0]: row[1:] for row in backend.take_relationship_rows(cat.ID)}
+
+    def test_converted_save_round_trips(self):
+        backend = self._reopened()
+
+        records = backend.load_cat_records()
+        self.assertCountEqual(
+            [record["ID"] for record in records], [cat.ID for cat in self.cats]
+        )
+        self.assertEqual(
+            backend.load_history(self.cats[2].ID)["died_by"],
+            [{"involved": None, "text": "drowned", "moon": 4}],
+        )
+
+        rows = self._rows(backend, self.cats[0])
+        self.assertEqual(len(rows), 4)
+        mates, family, values, log = rows[self.cats[1].ID]
+        self.assertTrue(mates)
+        self.assertFalse(family)
+        self.assertEqual(values, (40, 30, 0, 0, 0))
+        self.assertEqual(log, ["first"])
+
+    def test_only_changes_are_written(self):
+        backend = self._reopened()
+        self.assertTrue(backend.has_relationships())
+
+        self.cats[0].relationships[self.cats[1].ID].like = 55
+        self.cats[0].relationships[self.cats[1].ID].log.append("second")
+        del self.cats[3].relationships[self.cats[4].ID]
+        self.cats[4].moons += 1
+        save_load.save_cats(CLAN_NAME, Cat, game)
+        self.assertEqual(save_load.save_cache.last_stats["cats"]["written"], 1)
+
+        backend = self._reopened()
+        rows = self._rows(backend, self.cats[0])
+        self.assertEqual(rows[self.cats[1].ID][2][1], 55)
+        self.assertEqual(rows[self.cats[1].ID][3], ["first", "second"])
+        self.assertNotIn(self.cats[4].ID, self._rows(backend, self.cats[3]))
+        records = {record["ID"]: record for record in backend.load_cat_records()}
+        self.assertEqual(records[self.cats[4].ID]["moons"], self.cats[4].moons)
+
+    def test_failed_save_writes_nothing(self):
+        moons = self.cats[4].moons
+        self.cats[4].moons += 1
+        with patch.object(
+            SqliteSaveBackend, "save_relationships", side_effect=RuntimeError
+        ):
+            with self.assertRaises(RuntimeError):
+                save_load.save_cats(CLAN_NAME, Cat, game)
+
+        backend = self._reopened()
+        records = {record["ID"]: record for record in backend.load_cat_records()}
+        self.assertEqual(records[self.cats[4].ID]["moons"], moons)
+
+        # the next save doesn't know what's on disk and writes everything
+        save_load.save_cats(CLAN_NAME, Cat, game)
+        backend = self._reopened()
+        records = {record["ID"]: record for record in backend.load_cat_records()}
+        self.assertEqual(records[self.cats[4].ID]["moons"], moons + 1)
+        self.assertEqual(len(self._rows(backend, self.cats[0])), 4)
+
+    def test_faded_cats(self):
+        backend = save_load.get_save_backend(CLAN_NAME)
+        backend.save_faded_cat("900", {"ID": "900", "faded_offspring": []})
+        backend.flush_faded_cats()
+        # readable before and after it's on disk
+        self.assertEqual(backend.load_faded_cat("900")["ID"], "900")
+        self.assertEqual(self._reopened().faded_cat_IDs(), ["900"])
+        self.assertTrue(
+            save_load.add_faded_offspring_to_faded_cat(CLAN_NAME, "900", "901")
+        )
+        save_load.get_save_backend(CLAN_NAME).flush_faded_cats()
+        self.assertEqual(
+            self._reopened().load_faded_cat("900")["faded_offspring"], ["901"]
+        )
+
+    def test_converting_back_to_json(self):
+        self.cats[1].moons += 3
+        save_load.save_cats(CLAN_NAME, Cat, game)
+
+        self.assertTrue(save_load.convert_save_backend(CLAN_NAME, Cat, to_sqlite=False))
+        save_writer.wait()
+        self.assertFalse(get_db_path(CLAN_NAME).exists())
+
+        save_load.close_save_backend()
+        records = {
+            record["ID"]: record for record in save_load.load_cat_records(CLAN_NAME)
+        }
+        self.assertEqual(records[self.cats[1].ID]["moons"], self.cats[1].moons)
+        self.assertEqual(
+            save_load.get_save_backend(CLAN_NAME).load_history(self.cats[2].ID)[
+                "died_by"
+            ],
+            [{"involved": None, "text": "drowned", "moon": 4}],
+        )
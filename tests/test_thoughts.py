@@ -8,6 +8,9 @@ os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat
+from scripts.cat.cat_pool import CatPool
+from scripts.cat.status import Status
+from scripts.game_structure.localization import load_lang_resource
 
 
 class TestNotWorkingThoughts(unittest.TestCase):
@@ -165,3 +168,85 @@ class TestFamilyThoughts(unittest.TestCase):
         # when
 
         # then
+
+
+class TestThoughtIndex(unittest.TestCase):
+    def test_index_matches_raw_filter(self):
+        cats = [
+            Cat(status_dict={"rank": rank}, moons=moons)
+            for rank, moons in (
+                (CatRank.KITTEN, 3),
+                (CatRank.APPRENTICE, 8),
+                (CatRank.WARRIOR, 30),
+                (CatRank.MEDICINE_CAT, 50),
+                (CatRank.ELDER, 130),
+                (CatRank.LONER, 40),
+            )
+        ]
+        cats[2].injuries["test-injury-1"] = {"severity": "major"}
+
+        for main_cat in cats:
+            paths = generate_thoughts._get_thought_paths(
+                CatThought.WHILE_ALIVE, main_cat
+            )
+            raw = []
+            for path in paths:
+                raw.extend(load_lang_resource(path))
+
+            for other_cat in [None] + cats:
+                if other_cat is main_cat:
+                    continue
+                with self.subTest(
+                    main=main_cat.status.rank,
+                    other=other_cat.status.rank if other_cat else None,
+                ):
+                    self.assertEqual(
+                        generate_thoughts._filter_list(raw, main_cat, other_cat),
+                        generate_thoughts._load_group(
+                            CatThought.WHILE_ALIVE, main_cat, other_cat
+                        ),
+                    )
+
+
+class TestOtherCatForThought(unittest.TestCase):
+    def test_picks_cat_with_relationship_in_same_group(self):
+        main = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=40)
+        friend = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=40)
+        stranger = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=40)
+        main.relationships.clear()
+        main.create_one_relationship(friend).like = 20
+        main.create_one_relationship(stranger)
+
+        for _ in range(20):
+            self.assertEqual(
+                generate_thoughts.get_other_cat_for_thought(None, main), friend
+            )
+
+    def test_does_not_modify_given_list(self):
+        main = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=40)
+        cat_list = [main, Cat(status_dict={"rank": CatRank.WARRIOR}, moons=40)]
+        generate_thoughts.get_other_cat_for_thought(cat_list, main)
+        self.assertEqual(len(cat_list), 2)
+
+    def test_group_pool_follows_group_changes(self):
+        cat = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=40)
+        self.assertIn(cat.ID, Status.group_pools[CatGroup.PLAYER_CLAN_ID])
+
+        cat.status.exile_from_group()
+        self.assertNotIn(cat.ID, Status.group_pools[CatGroup.PLAYER_CLAN_ID])
+        self.assertIn(cat.ID, Status.group_pools[None])
+
+
+class TestCatPool(unittest.TestCase):
+    def test_swap_remove(self):
+        pool = CatPool()
+        for cat_ID in "abcd":
+            pool.add(cat_ID)
+        pool.discard("b")
+        pool.discard("z")
+        self.assertEqual(sorted(pool), ["a", "c", "d"])
+        self.assertIn(pool.random_ID(), ("a", "c", "d"))
+        pool.discard("a")
+        pool.discard("c")
+        pool.discard("d")
+        self.assertIsNone(pool.random_ID())